@@ -118,6 +118,126 @@ struct CachedValue {
 typedef CachedValue<double>& CachedScalar;
 typedef CachedValue<vector_fp>& CachedArray;
 
+/*! Cached property values at several recently used states
+ *
+ * While a CachedValue only stores the value of a property at the most recent
+ * state, this class stores the values for up to capacity() different states.
+ * This avoids recomputing the property when an object alternates between a
+ * small number of states, e.g. when a single phase object is used to compute
+ * the properties of several reactors. Once the cache is full, the least
+ * recently used entry is replaced by each new entry. The number of successful
+ * and unsuccessful lookups are counted.
+ *
+ * The cache is disabled by default, i.e. the capacity is zero. The meaning of
+ * the state variables is determined by the function using the cache, in the
+ * same way as for CachedValue.
+ *
+ * An example of how a StateCache can be used together with a CachedValue:
+ * @code
+ * if (!cached.validate(T)) {
+ *     vector_fp* saved = m_stateCache.capacity() ? m_stateCache.find(T) : 0;
+ *     if (saved) {
+ *         m_property = *saved;
+ *     } else {
+ *         m_property = some_expensive_function(T);
+ *         if (m_stateCache.capacity()) {
+ *             m_stateCache.insert(T) = m_property;
+ *         }
+ *     }
+ * }
+ * @endcode
+ */
+template <class T>
+class StateCache
+{
+public:
+    StateCache() :
+        m_capacity(0),
+        m_hits(0),
+        m_misses(0),
+        m_count(0)
+    {
+    }
+
+    //! Set the maximum number of entries. Removes all existing entries and
+    //! resets the counters. A capacity of zero disables the cache.
+    void setCapacity(size_t n) {
+        m_capacity = n;
+        clear();
+        m_hits = 0;
+        m_misses = 0;
+    }
+
+    //! The maximum number of entries
+    size_t capacity() const {
+        return m_capacity;
+    }
+
+    //! Find the value stored for the specified state. Returns a pointer to
+    //! the stored value, or NULL if there is no entry for this state.
+    T* find(double state1, double state2=0.0, int stateNum=0) {
+        for (size_t i = 0; i < m_entries.size(); i++) {
+            CachedValue<T>& entry = m_entries[i];
+            if (entry.state1 == state1 && entry.state2 == state2 &&
+                entry.stateNum == stateNum) {
+                m_lastUsed[i] = ++m_count;
+                m_hits++;
+                return &entry.value;
+            }
+        }
+        m_misses++;
+        return 0;
+    }
+
+    //! Add an entry for the specified state, replacing the least recently
+    //! used entry if the cache is full, and return a reference to its value,
+    //! which should be set by the caller. The capacity must be nonzero.
+    T& insert(double state1, double state2=0.0, int stateNum=0) {
+        size_t i = 0;
+        if (m_entries.size() < m_capacity) {
+            i = m_entries.size();
+            m_entries.emplace_back();
+            m_lastUsed.push_back(0);
+        } else {
+            for (size_t j = 1; j < m_entries.size(); j++) {
+                if (m_lastUsed[j] < m_lastUsed[i]) {
+                    i = j;
+                }
+            }
+        }
+        CachedValue<T>& entry = m_entries[i];
+        entry.state1 = state1;
+        entry.state2 = state2;
+        entry.stateNum = stateNum;
+        m_lastUsed[i] = ++m_count;
+        return entry.value;
+    }
+
+    //! Remove all entries, without resetting the counters
+    void clear() {
+        m_entries.clear();
+        m_lastUsed.clear();
+    }
+
+    //! Number of calls to find() which found an entry
+    size_t hits() const {
+        return m_hits;
+    }
+
+    //! Number of calls to find() which did not find an entry
+    size_t misses() const {
+        return m_misses;
+    }
+
+protected:
+    size_t m_capacity; //!< Maximum number of entries
+    std::vector<CachedValue<T>> m_entries; //!< Stored states and values
+    std::vector<unsigned long> m_lastUsed; //!< Time of last use of each entry
+    size_t m_hits; //!< Number of successful lookups
+    size_t m_misses; //!< Number of unsuccessful lookups
+    unsigned long m_count; //!< Counter used to order the entries by use
+};
+
 /*! Storage for cached values
  *
  * Stores cached values of properties evaluated at a particular thermodynamic
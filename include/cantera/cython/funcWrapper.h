@@ -20,6 +20,8 @@ public:
     {
     }
     const char* what() const throw() {
+        // May be called from C++ code running without the GIL
+        PyGILState_STATE gil = PyGILState_Ensure();
         formattedMessage_ = "\n" + std::string(71, '*') + "\n";
         formattedMessage_ += "Exception raised in Python callback function:\n";
 
@@ -54,6 +56,7 @@ public:
         Py_XDECREF(value_str);
 
         formattedMessage_ += "\n" + std::string(71, '*') + "\n";
+        PyGILState_Release(gil);
         return formattedMessage_.c_str();
     }
 
@@ -80,6 +83,13 @@ public:
         return y;
     }
 
+    // The duplicate refers to the same Python object, which must be kept alive
+    // by the owner of the duplicate, e.g. a Python Func1 created by composing
+    // other Func1 objects.
+    Cantera::Func1& duplicate() const {
+        return *(new Func1Py(m_callback, m_pyobj));
+    }
+
 private:
     callback_wrapper m_callback;
     void* m_pyobj;
@@ -1,10 +1,19 @@
 #include "cantera/base/logger.h"
 #include "cantera/thermo/ThermoPhase.h"
+#include "cantera/thermo/PureFluidPhase.h"
 #include "cantera/transport/TransportBase.h"
 #include "cantera/kinetics/Kinetics.h"
+#include "cantera/kinetics/InterfaceKinetics.h"
+#include "cantera/kinetics/solveSP.h"
+#include "cantera/thermo/SurfPhase.h"
+#include "cantera/equil/ChemEquil.h"
+#include "cantera/equil/MultiPhase.h"
 
 #include "Python.h"
 
+#include <algorithm>
+#include <numeric>
+
 // Wrappers for preprocessor defines
 std::string get_cantera_version()
 {
@@ -16,26 +25,35 @@ int get_sundials_version()
     return SUNDIALS_VERSION;
 }
 
+// The logger may be called by solvers running without holding the global
+// interpreter lock (GIL), so each method acquires it before using the Python
+// API.
 class PythonLogger : public Cantera::Logger
 {
 public:
     virtual void write(const std::string& s) {
+        PyGILState_STATE gil = PyGILState_Ensure();
         // 1000 bytes is the maximum size permitted by PySys_WriteStdout
         static const size_t N = 999;
         for (size_t i = 0; i < s.size(); i+=N) {
             PySys_WriteStdout("%s", s.substr(i, N).c_str());
         }
         std::cout.flush();
+        PyGILState_Release(gil);
     }
 
     virtual void writeendl() {
+        PyGILState_STATE gil = PyGILState_Ensure();
         PySys_WriteStdout("%s", "\n");
         std::cout.flush();
+        PyGILState_Release(gil);
     }
 
     virtual void error(const std::string& msg) {
+        PyGILState_STATE gil = PyGILState_Ensure();
         std::string err = "raise Exception('''"+msg+"''')";
         PyRun_SimpleString(err.c_str());
+        PyGILState_Release(gil);
     }
 };
 
@@ -109,3 +127,316 @@ TRANSPORT_1D(getThermalDiffCoeffs)
 
 TRANSPORT_2D(getMultiDiffCoeffs)
 TRANSPORT_2D(getBinaryDiffCoeffs)
+
+// Helper for evaluating transport properties for N states, given as arrays of
+// temperature, pressure, and mole fractions (N x K, row-major). The states are
+// visited in order of increasing temperature, so that temperature-dependent
+// quantities (e.g. the species viscosities and binary diffusion coefficients)
+// are evaluated only once for each distinct temperature. The original state of
+// the phase is restored when the helper goes out of scope.
+class TransportBatch
+{
+public:
+    TransportBatch(Cantera::Transport* tran, size_t n, const double* T,
+                   const double* P, const double* X)
+        : m_thermo(tran->thermo())
+        , m_T(T)
+        , m_P(P)
+        , m_X(X)
+        , order(n)
+    {
+        m_thermo.saveState(m_state);
+        std::iota(order.begin(), order.end(), 0);
+        std::stable_sort(order.begin(), order.end(),
+            [T](size_t i, size_t j) { return T[i] < T[j]; });
+    }
+
+    ~TransportBatch() {
+        m_thermo.restoreState(m_state);
+    }
+
+    void setState(size_t i) {
+        m_thermo.setState_TPX(m_T[i], m_P[i], m_X + i*m_thermo.nSpecies());
+    }
+
+    Cantera::ThermoPhase& m_thermo;
+    const double* m_T;
+    const double* m_P;
+    const double* m_X;
+    Cantera::vector_fp m_state;
+
+    //! Order in which to visit the states
+    std::vector<size_t> order;
+};
+
+// Function which evaluates a scalar property for N states
+#define TRANSPORT_BATCH_0D(FUNC_NAME) \
+    void tran_batch_ ## FUNC_NAME(Cantera::Transport* tran, size_t n, \
+        double* T, double* P, double* X, double* data) \
+    { \
+        TransportBatch batch(tran, n, T, P, X); \
+        for (size_t i : batch.order) { \
+            batch.setState(i); \
+            data[i] = tran->FUNC_NAME(); \
+        } \
+    }
+
+// Function which evaluates a species property for N states (N x K output)
+#define TRANSPORT_BATCH_1D(FUNC_NAME) \
+    void tran_batch_ ## FUNC_NAME(Cantera::Transport* tran, size_t n, \
+        double* T, double* P, double* X, double* data) \
+    { \
+        TransportBatch batch(tran, n, T, P, X); \
+        size_t nsp = batch.m_thermo.nSpecies(); \
+        for (size_t i : batch.order) { \
+            batch.setState(i); \
+            tran->FUNC_NAME(data + i*nsp); \
+        } \
+    }
+
+// Function which evaluates a species-pair property for N states (N x K x K
+// output)
+#define TRANSPORT_BATCH_2D(FUNC_NAME) \
+    void tran_batch_ ## FUNC_NAME(Cantera::Transport* tran, size_t n, \
+        double* T, double* P, double* X, double* data) \
+    { \
+        TransportBatch batch(tran, n, T, P, X); \
+        size_t nsp = batch.m_thermo.nSpecies(); \
+        for (size_t i : batch.order) { \
+            batch.setState(i); \
+            tran->FUNC_NAME(nsp, data + i*nsp*nsp); \
+        } \
+    }
+
+TRANSPORT_BATCH_0D(viscosity)
+TRANSPORT_BATCH_0D(thermalConductivity)
+TRANSPORT_BATCH_0D(electricalConductivity)
+
+TRANSPORT_BATCH_1D(getMixDiffCoeffs)
+TRANSPORT_BATCH_1D(getMixDiffCoeffsMass)
+TRANSPORT_BATCH_1D(getMixDiffCoeffsMole)
+TRANSPORT_BATCH_1D(getThermalDiffCoeffs)
+
+TRANSPORT_BATCH_2D(getMultiDiffCoeffs)
+TRANSPORT_BATCH_2D(getBinaryDiffCoeffs)
+
+// Equilibrate N states given as arrays of initial temperature, pressure, and
+// mole fractions (N x K, row-major), holding the property pair XY constant. A
+// single ChemEquil solver is used for all states. If warmStart is true, each
+// state after the first is started from the element potentials and
+// temperature of the previous converged state (see EquilOpt::contin) instead
+// of estimating them from scratch, so a sweep over neighboring states should
+// be given in order. States where the element
+// potential solver fails are retried from a cold start, and then (if solver is
+// "auto") with the MultiPhase solvers, as in ThermoPhase::equilibrate. The
+// number of iterations taken by the element potential solver is stored for
+// each state, or -1 if another solver was used. The original state of the
+// phase is restored on exit.
+void thermo_batchEquilibrate(Cantera::ThermoPhase* th, const std::string& XY,
+    const std::string& solver, size_t n, const double* T, const double* P,
+    const double* X, double* Tout, double* Pout, double* Xout,
+    int* iterations, double rtol, int maxsteps, int maxiter, bool warmStart)
+{
+    size_t nsp = th->nSpecies();
+    Cantera::vector_fp state;
+    th->saveState(state);
+    bool useElementPotentials = (solver == "auto" ||
+                                 solver == "element_potential");
+    Cantera::ChemEquil E(*th);
+    E.options.maxIterations = maxsteps;
+    E.options.relTolerance = rtol;
+    bool warm = false;
+    try {
+        for (size_t i = 0; i < n; i++) {
+            iterations[i] = -1;
+            th->setState_TPX(T[i], P[i], X + i*nsp);
+            for (int cold = (warm ? 0 : 1); cold < 2 && useElementPotentials;
+                 cold++) {
+                E.options.contin = !cold;
+                try {
+                    if (E.equilibrate(*th, XY.c_str()) == 0) {
+                        iterations[i] = E.options.iterations;
+                        break;
+                    }
+                } catch (std::exception&) {
+                }
+                th->setState_TPX(T[i], P[i], X + i*nsp);
+            }
+            if (iterations[i] >= 0) {
+                warm = warmStart;
+            } else if (solver == "element_potential") {
+                throw Cantera::CanteraError("thermo_batchEquilibrate",
+                    "ChemEquil solver failed for state {}", i);
+            } else {
+                Cantera::MultiPhase M;
+                M.addPhase(th, 1.0);
+                M.init();
+                M.equilibrate(XY, solver, rtol, maxsteps, maxiter, 0, 0);
+            }
+            Tout[i] = th->temperature();
+            Pout[i] = th->pressure();
+            th->getMoleFractions(Xout + i*nsp);
+        }
+    } catch (...) {
+        th->restoreState(state);
+        throw;
+    }
+    th->restoreState(state);
+}
+
+// Set the state of a PureFluidPhase for N pairs of values (x, y) of the
+// property pair XY, which is the name of one of the PureFluidPhase::setState_XY
+// methods, or "TX" or "PX" for two-phase states. Specific properties are on a
+// mass basis. The temperature, pressure, density, specific enthalpy, specific
+// entropy, and vapor fraction of each state are returned. Each state is found
+// starting from the previous one. The original state of the phase is restored
+// on exit.
+void purefluid_batchSetState(Cantera::PureFluidPhase* fluid,
+    const std::string& XY, size_t n, const double* x, const double* y,
+    double* T, double* P, double* rho, double* h, double* s, double* X)
+{
+    using Cantera::PureFluidPhase;
+    void (PureFluidPhase::*setter)(double, double, double) = nullptr;
+    if (XY == "HP") {
+        setter = &PureFluidPhase::setState_HP;
+    } else if (XY == "SP") {
+        setter = &PureFluidPhase::setState_SP;
+    } else if (XY == "UV") {
+        setter = &PureFluidPhase::setState_UV;
+    } else if (XY == "SV") {
+        setter = &PureFluidPhase::setState_SV;
+    } else if (XY == "ST") {
+        setter = &PureFluidPhase::setState_ST;
+    } else if (XY == "TV") {
+        setter = &PureFluidPhase::setState_TV;
+    } else if (XY == "PV") {
+        setter = &PureFluidPhase::setState_PV;
+    } else if (XY == "UP") {
+        setter = &PureFluidPhase::setState_UP;
+    } else if (XY == "VH") {
+        setter = &PureFluidPhase::setState_VH;
+    } else if (XY == "TH") {
+        setter = &PureFluidPhase::setState_TH;
+    } else if (XY == "SH") {
+        setter = &PureFluidPhase::setState_SH;
+    } else if (XY != "TP" && XY != "TX" && XY != "PX") {
+        throw Cantera::CanteraError("purefluid_batchSetState",
+                                    "Unsupported property pair '{}'", XY);
+    }
+
+    Cantera::vector_fp state;
+    fluid->saveState(state);
+    try {
+        for (size_t i = 0; i < n; i++) {
+            if (setter) {
+                (fluid->*setter)(x[i], y[i], 1e-8);
+            } else if (XY == "TP") {
+                fluid->setState_TP(x[i], y[i]);
+            } else if (XY == "TX") {
+                fluid->setState_Tsat(x[i], y[i]);
+            } else {
+                fluid->setState_Psat(x[i], y[i]);
+            }
+            T[i] = fluid->temperature();
+            P[i] = fluid->pressure();
+            rho[i] = fluid->density();
+            h[i] = fluid->enthalpy_mass();
+            s[i] = fluid->entropy_mass();
+            X[i] = fluid->vaporFraction();
+        }
+    } catch (...) {
+        fluid->restoreState(state);
+        throw;
+    }
+    fluid->restoreState(state);
+}
+
+// Compute the saturation pressure and the densities, specific enthalpies and
+// specific entropies (mass basis) of the saturated liquid and vapor at N
+// temperatures. The outputs are N x 2 arrays (row-major) with the liquid
+// properties in the first column. The saturation state at each temperature is
+// found starting from the one for the previous temperature (see
+// tpx::Substance::setSaturated), so the temperatures should be given in order.
+// The original state of the phase is restored on exit.
+void purefluid_saturationCurve(Cantera::PureFluidPhase* fluid, size_t n,
+    const double* T, double* P, double* rho, double* h, double* s)
+{
+    Cantera::vector_fp state;
+    fluid->saveState(state);
+    tpx::Substance& sub = fluid->TPX_Substance();
+    try {
+        for (size_t i = 0; i < n; i++) {
+            for (int j = 0; j < 2; j++) {
+                // The saturation properties are only computed for j = 0
+                sub.setSaturated(T[i], j, i > 0);
+                fluid->setState_TR(T[i], 1.0/sub.v());
+                rho[2*i+j] = fluid->density();
+                h[2*i+j] = fluid->enthalpy_mass();
+                s[2*i+j] = fluid->entropy_mass();
+            }
+            P[i] = fluid->pressure();
+        }
+    } catch (...) {
+        fluid->restoreState(state);
+        throw;
+    }
+    fluid->restoreState(state);
+}
+
+// Solve for the steady-state coverages of the surface phase of the
+// InterfaceKinetics object for N states of the adjacent phase with index
+// *iphase*, given as arrays of temperature, pressure, and mole fractions
+// (N x K, row-major). The surface phase is held at the same temperature and
+// pressure. Each solution is started from the coverages found for the
+// previous state, so neighboring states should be given consecutively. If
+// this fails, the solution is restarted with a pseudo-transient
+// initialization, which is always used for the first state. The coverages
+// (N x number of surface species) and the net production rates of all species
+// in the kinetics object (N x total number of species) are returned. The
+// original states of all phases are restored on exit.
+void surf_batchSteadyCoverages(Cantera::InterfaceKinetics* kin, size_t iphase,
+    size_t n, const double* T, const double* P, const double* X,
+    double* coverages, double* wdot)
+{
+    Cantera::SurfPhase* surf = dynamic_cast<Cantera::SurfPhase*>(
+        &kin->thermo(kin->reactionPhaseIndex()));
+    if (!surf) {
+        throw Cantera::CanteraError("surf_batchSteadyCoverages",
+            "The reacting phase is not a SurfPhase");
+    }
+    Cantera::ThermoPhase& phase = kin->thermo(iphase);
+    size_t nsurf = surf->nSpecies();
+    size_t nsp = phase.nSpecies();
+    size_t ntot = kin->nTotalSpecies();
+    std::vector<Cantera::vector_fp> states(kin->nPhases());
+    for (size_t m = 0; m < kin->nPhases(); m++) {
+        kin->thermo(m).saveState(states[m]);
+    }
+    try {
+        for (size_t i = 0; i < n; i++) {
+            phase.setState_TPX(T[i], P[i], X + i*nsp);
+            surf->setState_TP(T[i], P[i]);
+            if (i == 0) {
+                // The initial coverages are not a converged solution
+                kin->solvePseudoSteadyStateProblem(SFLUX_INITIALIZE);
+            } else {
+                try {
+                    kin->solvePseudoSteadyStateProblem(SFLUX_RESIDUAL);
+                } catch (Cantera::CanteraError&) {
+                    surf->setCoverages(coverages + (i-1)*nsurf);
+                    kin->solvePseudoSteadyStateProblem(SFLUX_INITIALIZE);
+                }
+            }
+            surf->getCoverages(coverages + i*nsurf);
+            kin->getNetProductionRates(wdot + i*ntot);
+        }
+    } catch (...) {
+        for (size_t m = 0; m < kin->nPhases(); m++) {
+            kin->thermo(m).restoreState(states[m]);
+        }
+        throw;
+    }
+    for (size_t m = 0; m < kin->nPhases(); m++) {
+        kin->thermo(m).restoreState(states[m]);
+    }
+}
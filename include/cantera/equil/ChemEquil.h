@@ -51,6 +51,8 @@ public:
      * Continuation flag. Set true if the calculation should be initialized from
      * the last calculation. Otherwise, the calculation will be started from
      * scratch and the initial composition and element potentials estimated.
+     * The last calculation is the most recent one that converged using the
+     * same ChemEquil object.
      */
     bool contin;
 };
@@ -294,8 +296,13 @@ protected:
     //! species. Equal to -1 if there is no such element id.
     size_t m_eloc;
 
+    //! Converged dimensionless element potentials and temperature from the
+    //! previous call to equilibrate(), used if EquilOpt::contin is set
     vector_fp m_startSoln;
 
+    //! True if #m_startSoln contains a converged solution
+    bool m_haveStartSoln;
+
     vector_fp m_grt;
     vector_fp m_mu_RT;
 
@@ -54,6 +54,11 @@ public:
     virtual bool addReaction(shared_ptr<Reaction> r);
     virtual void modifyReaction(size_t i, shared_ptr<Reaction> rNew);
     virtual void invalidateCache();
+    virtual void setStateCacheSize(size_t n);
+    virtual size_t stateCacheSize() const {
+        return m_stateCache.capacity();
+    }
+    virtual void getStateCacheStats(size_t& hits, size_t& misses) const;
     //@}
 
     void updateROP();
@@ -104,6 +109,14 @@ protected:
     vector_fp concm_falloff_values;
     //!@}
 
+    //! Temperature-dependent rate data at recent states, keyed by temperature
+    //! and, if there are P-log or Chebyshev reactions, pressure, along with
+    //! the Phase::cacheNumber() of the phase, so that the saved equilibrium
+    //! constants are not used after the species thermo data are modified.
+    //! Each entry contains #m_rfn, #m_rfn_low, #m_rfn_high, #falloff_work and
+    //! #m_rkcn. The entries are discarded when a reaction is added.
+    StateCache<vector_fp> m_stateCache;
+
     void processFalloffReactions();
 
     void addThreeBodyReaction(ThreeBodyReaction& r);
@@ -812,6 +812,35 @@ public:
 
     virtual void invalidateCache() {};
 
+    //! Set the number of recent states for which the temperature-dependent
+    //! parts of the rate constants are kept.
+    /*!
+     * By default, the rate constants are only stored for the most recent
+     * state. Keeping them for several states avoids recomputing them when
+     * the phase alternates between a few states, e.g. when the same phase
+     * object is used for several reactors. Setting the size also resets the
+     * counters returned by getStateCacheStats().
+     *
+     * @param n  Number of states. Zero disables the cache.
+     */
+    virtual void setStateCacheSize(size_t n) {
+        throw NotImplementedError("Kinetics::setStateCacheSize");
+    }
+
+    //! The number of recent states for which the rate constants are kept.
+    //! See setStateCacheSize().
+    virtual size_t stateCacheSize() const {
+        return 0;
+    }
+
+    //! Get the number of times the rate constants were found in (`hits`) or
+    //! had to be added to (`misses`) the cache of recent states. See
+    //! setStateCacheSize().
+    virtual void getStateCacheStats(size_t& hits, size_t& misses) const {
+        hits = 0;
+        misses = 0;
+    }
+
     //@}
 
     /**
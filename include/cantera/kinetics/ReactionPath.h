@@ -12,6 +12,8 @@
 #include "Group.h"
 #include "Kinetics.h"
 
+#include <set>
+
 namespace Cantera
 {
 enum flow_t { NetFlow, OneWayFlow };
@@ -94,10 +96,11 @@ public:
 
     /**
      * Add a reaction to the path. Increment the flow from this reaction, the
-     * total flow, and the flow associated with this label.
+     * total flow, and the flow associated with this label. If *reverse* is
+     * true, the flow is due to the reverse direction of the reaction.
      */
     void addReaction(size_t rxnNumber, doublereal value,
-                     const std::string& label = "");
+                     const std::string& label = "", bool reverse = false);
 
     /// Upstream node.
     const SpeciesNode* begin() const {
@@ -141,6 +144,12 @@ public:
         return m_rxn;
     }
 
+    //! True if the flow from reaction number *rxnNumber* in reactionMap() is
+    //! due to the reverse direction of the reaction
+    bool isReverse(size_t rxnNumber) const {
+        return m_reverse.count(rxnNumber) != 0;
+    }
+
     /**
      * Write the label for a path connecting two species, indicating
      * the percent of the total flow due to each reaction.
@@ -151,6 +160,7 @@ protected:
     std::map<std::string, doublereal> m_label;
     SpeciesNode* m_a, *m_b;
     rxn_path_map m_rxn;
+    std::set<size_t> m_reverse; //!< Reaction numbers of reverse contributions
     doublereal m_total;
 };
 
@@ -190,6 +200,30 @@ public:
 
     void writeData(std::ostream& s);
 
+    //! Get the flows between pairs of species as sparse arrays in coordinate
+    //! (COO) format.
+    /*!
+     * For each pair of species connected by a path in either direction, the
+     * species indices *k1* < *k2*, the one-way flow from *k1* to *k2*, and
+     * the one-way flow from *k2* to *k1* are appended to *k1*, *k2*, *fwd*,
+     * and *rev*, respectively. This is the information written by writeData().
+     */
+    void getFlows(std::vector<size_t>& k1, std::vector<size_t>& k2,
+                  vector_fp& fwd, vector_fp& rev);
+
+    //! Get the contributions of individual reactions to the one-way flows as
+    //! sparse arrays in coordinate (COO) format.
+    /*!
+     * For each reaction contributing to the path from species *k1* to species
+     * *k2*, the species indices, the reaction index, the direction of the
+     * reaction (1 for forward, -1 for reverse), and the flow due to the
+     * reaction are appended to *k1*, *k2*, *rxn*, *dir*, and *flow*,
+     * respectively.
+     */
+    void getReactionFlows(std::vector<size_t>& k1, std::vector<size_t>& k2,
+                          std::vector<size_t>& rxn, vector_int& dir,
+                          vector_fp& flow);
+
     /**
      *  Export the reaction path diagram. This method writes to stream
      *  \c s the commands for the 'dot' program in the \c GraphViz
@@ -228,7 +262,7 @@ public:
     }
 
     void linkNodes(size_t k1, size_t k2, size_t rxn, doublereal value,
-                   std::string legend = "");
+                   std::string legend = "", bool reverse = false);
 
     void include(const std::string& aaname) {
         m_include.push_back(aaname);
@@ -299,6 +333,14 @@ public:
     int build(Kinetics& s, const std::string& element, std::ostream& output,
               ReactionPathDiagram& r, bool quiet=false);
 
+    //! Build a reaction path diagram using the given forward and reverse rates
+    //! of progress instead of those computed by the Kinetics object *s*. This
+    //! can be used to build a diagram for rates of progress which have been
+    //! integrated over time or space. See ReactionPathAccumulator.
+    int build(Kinetics& s, const std::string& element, std::ostream& output,
+              ReactionPathDiagram& r, const double* ropf, const double* ropr,
+              bool quiet=false);
+
     //! Analyze a reaction to determine which reactants lead to which products.
     int findGroups(std::ostream& logfile, Kinetics& s);
 
@@ -325,6 +367,86 @@ protected:
     std::map<std::string, size_t> m_enamemap;
 };
 
+//! Integrates the rates of progress of the reactions in a Kinetics object over
+//! time or space, so that reaction path diagrams can be built for the
+//! integrated element fluxes.
+/*!
+ * Samples of the rates of progress at the current state of the Kinetics
+ * object are added using addSample(), and are integrated using the
+ * trapezoidal rule. Since the number of atoms of an element transferred
+ * between two species by each reaction does not depend on the state, the
+ * diagram for the integrated fluxes is obtained by building it using the
+ * integrated rates of progress in place of the instantaneous ones.
+ *
+ * A ReactionPathAccumulator can be attached to a reactor in a ReactorNet
+ * using ReactorNet::addReactionPathAccumulator(), in which case a sample is
+ * added after each internal time step of the integrator.
+ */
+class ReactionPathAccumulator
+{
+public:
+    //! Create an accumulator for the reactions of *kin*
+    explicit ReactionPathAccumulator(Kinetics& kin);
+
+    //! Add a sample of the rates of progress at the current state of the
+    //! Kinetics object.
+    /*!
+     * @param x  The independent variable (e.g. time or position). Must not be
+     *     less than the value for the previous sample.
+     * @param scale  Factor multiplying the rates of progress, e.g. the reactor
+     *     volume or the cross-sectional area of a flow domain
+     */
+    void addSample(double x, double scale=1.0);
+
+    //! Discard all samples
+    void reset();
+
+    //! Number of samples added since the last call to reset()
+    size_t nSamples() const {
+        return m_nsamples;
+    }
+
+    //! Value of the independent variable for the first sample
+    double start() const {
+        return m_x0;
+    }
+
+    //! Value of the independent variable for the last sample
+    double end() const {
+        return m_xlast;
+    }
+
+    //! The Kinetics object
+    Kinetics& kinetics() {
+        return m_kin;
+    }
+
+    //! Get the integrated forward rates of progress. Length nReactions().
+    void getFwdRatesOfProgress(double* ropf) const;
+
+    //! Get the integrated reverse rates of progress. Length nReactions().
+    void getRevRatesOfProgress(double* ropr) const;
+
+    //! Build a reaction path diagram for the integrated fluxes of *element*.
+    //! Returns -1 if the element is not present.
+    int build(const std::string& element, std::ostream& output,
+              ReactionPathDiagram& r, bool quiet=false);
+
+    //! Get the integrated one-way fluxes of *element* between each pair of
+    //! species. On return, `fluxes[k1*nTotalSpecies() + k2]` contains the flux
+    //! from species *k1* to species *k2*.
+    void getElementFluxes(const std::string& element, double* fluxes);
+
+protected:
+    Kinetics& m_kin;
+    ReactionPathBuilder m_builder;
+    vector_fp m_ropf, m_ropr; //!< integrated rates of progress
+    vector_fp m_lastf, m_lastr; //!< rates of progress at the last sample
+    size_t m_nsamples;
+    double m_x0, m_xlast;
+    double m_lastScale;
+};
+
 }
 
 #endif
@@ -74,6 +74,16 @@ public:
         return static_cast<int>(m_np);
     }
     virtual double sensitivity(size_t k, size_t p);
+    virtual void setInitialSensitivities(const double* yS);
+    virtual double currentStepSize() const;
+    virtual IntegratorStats stats() const;
+    virtual void setInitialStepSize(double h0) {
+        m_h0 = h0;
+    }
+    virtual void setAdjoint(bool adjoint) {
+        m_adjoint = adjoint;
+    }
+    virtual void integrateAdjoint(double tB0, double* lambda, double* grad);
 
     //! Returns a string listing the weighted error estimates associated
     //! with each solution component.
@@ -92,6 +102,10 @@ protected:
 private:
     void sensInit(double t0, FuncEval& func);
 
+    //! Initialize or reinitialize the storage of checkpoints for adjoint
+    //! sensitivity analysis
+    void adjointInit();
+
     size_t m_neq;
     void* m_cvode_mem;
     double m_t0;
@@ -107,6 +121,7 @@ private:
     double m_reltolsens, m_abstolsens;
     size_t m_nabs;
     double m_hmax, m_hmin;
+    double m_h0; //!< Initial step size, or 0 to use the CVODES estimate
     int m_maxsteps;
     int m_maxErrTestFails;
     std::unique_ptr<FuncData> m_fdata;
@@ -117,6 +132,19 @@ private:
     //! Indicates whether the sensitivities stored in m_yS have been updated
     //! for at the current integrator time.
     bool m_sens_ok;
+
+    //! True if adjoint sensitivity analysis is enabled. See setAdjoint().
+    bool m_adjoint;
+
+    //! True if the CVODES memory for adjoint sensitivity analysis has been
+    //! allocated
+    bool m_adjointInit;
+
+    //! Identifier of the backward problem, or -1 if it has not been created
+    int m_indexB;
+
+    //! Adjoint variables and quadratures for the backward problem
+    N_Vector m_yB, m_qB;
 };
 
 } // namespace
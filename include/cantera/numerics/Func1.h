@@ -74,7 +74,9 @@ public:
     /*!
      * Two functions are the same if they are the same function. This means
      * that the ID and stored constant is the same. This means that the m_f1
-     * and m_f2 are identical if they are non-null.
+     * and m_f2 are identical if they are non-null. Functions which do not
+     * define an ID, e.g. polynomials or tabulated functions, are only
+     * identical to themselves.
      */
     bool isIdentical(Func1& other) const;
 
@@ -920,6 +922,52 @@ protected:
 };
 
 
+/**
+ * A function given by a table of values, linearly interpolated between the
+ * tabulated points. Outside the range of the table, the function is equal to
+ * the value at the nearest end point.
+ */
+class Tabulated1 : public Func1
+{
+public:
+    //! Constructor.
+    /*!
+     * @param n      Number of tabulated points
+     * @param tvals  Values of the independent variable, in non-decreasing
+     *               order. Length *n*.
+     * @param fvals  Function values at each of the points in *tvals*. Length
+     *               *n*.
+     */
+    Tabulated1(size_t n, const double* tvals, const double* fvals);
+
+    Tabulated1(const Tabulated1& b) :
+        Func1(b) {
+        *this = Tabulated1::operator=(b);
+    }
+
+    Tabulated1& operator=(const Tabulated1& right) {
+        if (&right == this) {
+            return *this;
+        }
+        Func1::operator=(right);
+        m_tvec = right.m_tvec;
+        m_fvec = right.m_fvec;
+        m_parent = 0;
+        return *this;
+    }
+
+    virtual Func1& duplicate() const {
+        Tabulated1* np = new Tabulated1(*this);
+        return *((Func1*)np);
+    }
+
+    virtual doublereal eval(doublereal t) const;
+
+protected:
+    vector_fp m_tvec, m_fvec;
+};
+
+
 /**
  * Sum of Arrhenius terms.
  * \f[
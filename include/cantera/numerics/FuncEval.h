@@ -60,6 +60,67 @@ public:
     virtual size_t nparams() {
         return 0;
     }
+
+    //! Set up the preconditioner used by iterative linear solvers.
+    /*!
+     * Called by the integrator when the problem type includes PRECOND.
+     * Evaluate (if required) and factor an approximation to the matrix
+     * \f$ P = I - \gamma J \f$, where \f$ J = \partial F / \partial y \f$.
+     *
+     * @param[in] t time.
+     * @param[in] y solution vector, length neq()
+     * @param[in] gamma scalar multiplying the Jacobian
+     * @param[in] jacOk if true, the Jacobian data saved from the previous
+     *     call may be reused; only the factorization needs to be updated.
+     * @returns true if the Jacobian data was re-evaluated
+     */
+    virtual bool setupPreconditioner(double t, double* y, double gamma,
+                                     bool jacOk) {
+        throw NotImplementedError("FuncEval::setupPreconditioner");
+    }
+
+    //! Solve the system \f$ P z = r \f$, where *P* is the preconditioner
+    //! set up by the most recent call to setupPreconditioner().
+    virtual void solvePreconditioner(const double* r, double* z) {
+        throw NotImplementedError("FuncEval::solvePreconditioner");
+    }
+
+    //! Number of parameters for adjoint sensitivity analysis. These are
+    //! independent of the sensitivity parameters given by nparams().
+    virtual size_t nAdjointParams() {
+        return 0;
+    }
+
+    //! Evaluate the right-hand-side of the adjoint equations,
+    //! \f$ \dot{\vec{\lambda}} = -J^T \vec{\lambda} \f$, where
+    //! \f$ J = \partial \vec{F} / \partial \vec{y} \f$ is evaluated at
+    //! (*t*, *y*). Called by integrators which support adjoint sensitivity
+    //! analysis.
+    /*!
+     * @param[in] t time.
+     * @param[in] y solution vector, length neq()
+     * @param[in] lambda adjoint variables, length neq()
+     * @param[out] lambdaDot rate of change of the adjoint variables,
+     *     length neq()
+     */
+    virtual void evalAdjoint(double t, double* y, const double* lambda,
+                             double* lambdaDot) {
+        throw NotImplementedError("FuncEval::evalAdjoint");
+    }
+
+    //! Evaluate the integrand of the adjoint sensitivities,
+    //! \f$ \vec{\lambda}^T \partial \vec{F} / \partial p_i \f$, for each of
+    //! the nAdjointParams() parameters \f$ p_i \f$.
+    /*!
+     * @param[in] t time.
+     * @param[in] y solution vector, length neq()
+     * @param[in] lambda adjoint variables, length neq()
+     * @param[out] grad integrand, length nAdjointParams()
+     */
+    virtual void evalAdjointGradient(double t, double* y, const double* lambda,
+                                     double* grad) {
+        throw NotImplementedError("FuncEval::evalAdjointGradient");
+    }
 };
 
 }
@@ -23,6 +23,7 @@ const int NOJAC = 4;
 const int JAC = 8;
 const int GMRES = 16;
 const int BAND = 32;
+const int PRECOND = 64; //!< Use the preconditioner provided by the FuncEval
 
 /**
  * Specifies the method used to integrate the system of equations.
@@ -44,6 +45,46 @@ enum IterType {
     Functional_Iter
 };
 
+//! Counters describing the work done by an Integrator
+/*!
+ * @ingroup odeGroup
+ */
+struct IntegratorStats
+{
+    IntegratorStats() : steps(0), rhsEvals(0), jacEvals(0), linSolveSetups(0),
+        nonlinIters(0), nonlinConvFails(0), errTestFails(0), lastOrder(0),
+        lastStepSize(0.0) {}
+
+    //! Number of internal time steps
+    long int steps;
+
+    //! Number of evaluations of the right hand side of the ODE system,
+    //! including those used to approximate the Jacobian by finite differences
+    long int rhsEvals;
+
+    //! Number of evaluations of the Jacobian matrix, or of the preconditioner
+    //! when using an iterative linear solver
+    long int jacEvals;
+
+    //! Number of calls to the setup function of the linear solver
+    long int linSolveSetups;
+
+    //! Number of nonlinear (Newton) iterations
+    long int nonlinIters;
+
+    //! Number of nonlinear convergence failures
+    long int nonlinConvFails;
+
+    //! Number of local error test failures
+    long int errTestFails;
+
+    //! Order of the method used for the last internal time step
+    int lastOrder;
+
+    //! Size of the last internal time step
+    double lastStepSize;
+};
+
 //!  Abstract base class for ODE system integrators.
 /*!
  *  @ingroup odeGroup
@@ -200,6 +241,71 @@ public:
         return 0.0;
     }
 
+    //! Set the values of the sensitivities at the initial time, replacing
+    //! the zero initial values used by initialize() and reinitialize(). Call
+    //! after one of these methods.
+    /*!
+     * @param yS  Sensitivities of each solution component with respect to
+     *     each parameter, with the sensitivities for parameter `p` in
+     *     `yS[p*nEquations()]` to `yS[(p+1)*nEquations()-1]`.
+     */
+    virtual void setInitialSensitivities(const double* yS) {
+        throw NotImplementedError("Integrator::setInitialSensitivities");
+    }
+
+    //! The step size the integrator will attempt for its next internal time
+    //! step
+    virtual double currentStepSize() const {
+        throw NotImplementedError("Integrator::currentStepSize");
+    }
+
+    //! Counters describing the work done by the integrator since the last
+    //! call to initialize() or reinitialize()
+    virtual IntegratorStats stats() const {
+        throw NotImplementedError("Integrator::stats");
+    }
+
+    //! Set the size of the first internal time step taken after the next
+    //! call to initialize() or reinitialize(). A value of zero (the default)
+    //! lets the integrator estimate a suitable value.
+    virtual void setInitialStepSize(double h0) {
+        throw NotImplementedError("Integrator::setInitialStepSize");
+    }
+
+    //! Enable or disable adjoint sensitivity analysis. When enabled, the
+    //! data needed to integrate the adjoint equations is stored during the
+    //! forward integration by integrate() and step(), starting from the next
+    //! call to initialize() or reinitialize().
+    virtual void setAdjoint(bool adjoint) {
+        throw NotImplementedError("Integrator::setAdjoint");
+    }
+
+    //! Integrate the adjoint equations backward in time.
+    /*!
+     * Integrates \f$ \dot{\vec{\lambda}} = -J^T \vec{\lambda} \f$ (see
+     * FuncEval::evalAdjoint) from time *tB0* back to the initial time
+     * \f$ t_0 \f$ of the forward integration, and computes the adjoint
+     * sensitivities
+     * \f[
+     *   \int_{t_0}^{t_{B0}} \vec{\lambda}^T \frac{\partial \vec{F}}
+     *       {\partial p_i} dt
+     * \f]
+     * for each of the FuncEval::nAdjointParams() parameters \f$ p_i \f$.
+     * Requires that adjoint sensitivity analysis was enabled (see
+     * setAdjoint()) before the forward integration.
+     *
+     * @param tB0 Time at which to start the backward integration, which must
+     *     be within the interval covered by the forward integration.
+     * @param[in,out] lambda On input, the adjoint variables at *tB0*. On
+     *     output, the adjoint variables at the initial time. Length
+     *     nEquations().
+     * @param[out] grad Adjoint sensitivities, length
+     *     FuncEval::nAdjointParams().
+     */
+    virtual void integrateAdjoint(double tB0, double* lambda, double* grad) {
+        throw NotImplementedError("Integrator::integrateAdjoint");
+    }
+
 private:
     doublereal m_dummy;
     void warn(const std::string& msg) const {
@@ -0,0 +1,238 @@
+/**
+ *  @file IsatTable.h
+ *  In situ adaptive tabulation of smooth mappings
+ */
+
+#ifndef CT_ISATTABLE_H
+#define CT_ISATTABLE_H
+
+#include "cantera/base/ct_defs.h"
+#include <list>
+
+namespace Cantera
+{
+
+//! Counters describing the use of an IsatTable
+struct IsatStats
+{
+    IsatStats() : queries(0), retrieves(0), grows(0), adds(0), evictions(0) {}
+
+    //! Number of calls to IsatTable::retrieve()
+    size_t queries;
+
+    //! Number of queries answered using the linear approximation stored in
+    //! the table (hits)
+    size_t retrieves;
+
+    //! Number of directly evaluated points used to grow the region of
+    //! accuracy of an existing record
+    size_t grows;
+
+    //! Number of records added to the table
+    size_t adds;
+
+    //! Number of records removed to keep the table within its memory limit
+    size_t evictions;
+};
+
+//! In situ adaptive tabulation (ISAT) of a smooth mapping \f$ f(x) \f$.
+/*!
+ * This class implements the tabulation algorithm of Pope (Combust. Theory
+ * Modelling 1:41-63, 1997). Each record in the table holds a point
+ * \f$ x_0 \f$, the value \f$ f_0 = f(x_0) \f$, the gradient
+ * \f$ A = \partial f / \partial x \f$ at \f$ x_0 \f$, and an ellipsoid of
+ * accuracy (EOA) \f$ (x - x_0)^T M (x - x_0) \le 1 \f$ within which the
+ * linear approximation \f$ f_0 + A (x - x_0) \f$ is estimated to be accurate
+ * to within the tolerance, measured by the 2-norm of the error. The initial
+ * EOA is the region where the change in \f$ f \f$ predicted by the gradient
+ * is less than the tolerance, bounded by a ball of radius
+ * \f$ \sqrt{\epsilon_{tol}} \f$. It is grown whenever a point outside of it
+ * is found to be approximated accurately.
+ *
+ * The records are the leaves of a binary tree, in which each node holds the
+ * plane bisecting the points of the two records that were split when the
+ * node was created. Queries descend the tree to a single leaf, and if the
+ * query point is not within that record's EOA, the EOAs of the most
+ * recently used records are checked. When the table reaches its memory
+ * limit, the least recently used record is removed to make room for the new
+ * one.
+ *
+ * The table does not evaluate the mapping itself. A typical query is:
+ *
+ *     if (!table.retrieve(x, f)) {
+ *         // evaluate f(x) directly
+ *         if (!table.grow(x, f)) {
+ *             // evaluate the gradient A at x
+ *             table.add(x, f, A);
+ *         }
+ *     }
+ *
+ * Since the accuracy is measured using the 2-norm, the components of `x`
+ * and `f` should be scaled so that errors of the same size in each
+ * component are equally significant.
+ *
+ * @ingroup numerics
+ */
+class IsatTable
+{
+public:
+    //! Constructor
+    /*!
+     * @param nx  Number of inputs
+     * @param nf  Number of outputs
+     * @param tol  Error tolerance
+     * @param maxMemory  Maximum memory used by the records, in megabytes
+     */
+    IsatTable(size_t nx, size_t nf, double tol=1e-4, double maxMemory=100.0);
+
+    //! Number of inputs
+    size_t nInputs() const {
+        return m_nx;
+    }
+
+    //! Number of outputs
+    size_t nOutputs() const {
+        return m_nf;
+    }
+
+    //! Set the error tolerance. Since the existing records were created for
+    //! the previous tolerance, this clears the table.
+    void setTolerance(double tol);
+
+    //! Error tolerance
+    double tolerance() const {
+        return m_tol;
+    }
+
+    //! Set the maximum memory used by the records, in megabytes. Records are
+    //! removed if the table is larger than the new limit.
+    void setMaxMemory(double maxMemory);
+
+    //! The maximum number of records, determined by the memory limit
+    size_t maxRecords() const {
+        return m_maxRecords;
+    }
+
+    //! Number of records in the table
+    size_t nRecords() const {
+        return m_lru.size();
+    }
+
+    //! Approximate memory used by the records, in bytes
+    size_t memory() const {
+        return nRecords() * recordSize();
+    }
+
+    //! Approximate the mapping at a point using the table.
+    /*!
+     * @param x  Query point. Length nInputs().
+     * @param f  On return, the approximate value of the mapping, if one was
+     *     found. Length nOutputs().
+     * @returns true if `x` is within the ellipsoid of accuracy of a record.
+     */
+    bool retrieve(const double* x, double* f);
+
+    //! Grow the ellipsoid of accuracy of the record nearest to a point using
+    //! the directly evaluated value of the mapping at that point.
+    /*!
+     * @param x  Point at which the mapping was evaluated. Length nInputs().
+     * @param f  Value of the mapping at `x`. Length nOutputs().
+     * @returns true if the error of the linear approximation was within the
+     *     tolerance, in which case the ellipsoid of accuracy was grown to
+     *     include `x`.
+     */
+    bool grow(const double* x, const double* f);
+
+    //! Add a record to the table.
+    /*!
+     * @param x  Point at which the mapping was evaluated. Length nInputs().
+     * @param f  Value of the mapping at `x`. Length nOutputs().
+     * @param A  Gradient of the mapping at `x`, as an nOutputs() x nInputs()
+     *     array in row-major order.
+     */
+    void add(const double* x, const double* f, const double* A);
+
+    //! Remove all records. The statistics are not reset.
+    void clear();
+
+    //! Counters describing the use of the table
+    const IsatStats& stats() const {
+        return m_stats;
+    }
+
+    //! Reset the counters returned by stats()
+    void resetStats() {
+        m_stats = IsatStats();
+    }
+
+protected:
+    struct Record {
+        vector_fp x; //!< Tabulation point
+        vector_fp f; //!< Value of the mapping at #x
+        vector_fp A; //!< Gradient, nf x nx in row-major order
+        vector_fp M; //!< Matrix defining the EOA, nx x nx
+        int parent; //!< Parent node, or -1 if this is the only record
+        std::list<size_t>::iterator lru; //!< Position in #m_lru
+    };
+
+    //! A node of the binary tree. Children are encoded as the index of a
+    //! node (if non-negative) or as `-1 - i` for record `i`.
+    struct Node {
+        vector_fp v; //!< Normal of the cutting plane
+        double a; //!< Query points with v.x > a belong to the right child
+        int left;
+        int right;
+        int parent;
+    };
+
+    //! Approximate memory used by each record, in bytes
+    size_t recordSize() const;
+
+    //! Find the record at the leaf of the tree reached by `x`
+    size_t search(const double* x) const;
+
+    //! Value of (x - x0)^T M (x - x0) for record `i`
+    double eoaDistance(size_t i, const double* x) const;
+
+    //! Evaluate the linear approximation of record `i` at `x`
+    void approximate(size_t i, const double* x, double* f) const;
+
+    //! Mark record `i` as the most recently used
+    void touch(size_t i);
+
+    //! Replace child `old` of node `p` (or the root if `p` is -1) with `c`
+    void replaceChild(int p, int old, int c);
+
+    //! Remove the least recently used record
+    void evict();
+
+    size_t m_nx;
+    size_t m_nf;
+    double m_tol;
+    size_t m_maxRecords;
+
+    std::vector<Record> m_records;
+    std::vector<Node> m_nodes;
+    std::vector<size_t> m_freeRecords;
+    std::vector<int> m_freeNodes;
+
+    //! Root of the tree, encoded as for the children of a Node
+    int m_root;
+
+    //! Indices of the records in use, from the most to the least recently
+    //! used
+    std::list<size_t> m_lru;
+
+    //! Number of recently used records checked if a query point is not in
+    //! the EOA of the leaf found by searching the tree
+    size_t m_nRecent;
+
+    IsatStats m_stats;
+
+    //! Work arrays
+    mutable vector_fp m_work, m_work2;
+};
+
+}
+
+#endif
@@ -0,0 +1,98 @@
+/**
+ *  @file LookupTable.h
+ *  Multilinear interpolation in tables of precomputed properties
+ */
+
+#ifndef CT_LOOKUPTABLE_H
+#define CT_LOOKUPTABLE_H
+
+#include "cantera/base/ct_defs.h"
+
+namespace Cantera
+{
+
+//! A table of precomputed quantities on an N-dimensional structured grid,
+//! evaluated at arbitrary points by multilinear interpolation.
+/*!
+ * The grid is defined by a strictly increasing vector of coordinates along
+ * each of the `ndim` axes, which need not be uniformly spaced. At each grid
+ * point, the table holds the values of `nvars` variables. The data is stored
+ * in row-major (C) order, with the variable index varying fastest, i.e. the
+ * value of variable `k` at grid point `(i, j)` of a 2D table with axes of
+ * length `n0` and `n1` is stored at `data[(i*n1 + j)*nvars + k]`.
+ *
+ * The table does not take ownership of the data array, which may for example
+ * be a memory-mapped file. The caller is responsible for keeping it valid for
+ * the lifetime of the LookupTable. Query points outside the range of an axis
+ * are clipped to the nearest end of the axis.
+ *
+ * @ingroup numerics
+ */
+class LookupTable
+{
+public:
+    //! Constructor
+    /*!
+     * @param axes  Coordinates of the grid points along each axis
+     * @param nvars  Number of variables stored at each grid point
+     * @param data  Table data, of length `nvars` times the product of the
+     *     lengths of the axes
+     */
+    LookupTable(const std::vector<vector_fp>& axes, size_t nvars,
+                const double* data);
+
+    //! Number of dimensions of the table
+    size_t nDim() const {
+        return m_axes.size();
+    }
+
+    //! Number of variables stored at each grid point
+    size_t nVars() const {
+        return m_nvars;
+    }
+
+    //! Coordinates of the grid points along axis `n`
+    const vector_fp& axis(size_t n) const {
+        return m_axes[n];
+    }
+
+    //! Interpolate the values of all variables at a single point
+    /*!
+     * @param x  Coordinates of the query point. Length nDim().
+     * @param y  On return, the interpolated values. Length nVars().
+     */
+    void interpolate(const double* x, double* y) const;
+
+    //! Interpolate the values of selected variables at `n` points
+    /*!
+     * @param n  Number of query points
+     * @param x  Coordinates of the query points, as an `n` x nDim() array in
+     *     row-major order
+     * @param nout  Number of variables to interpolate
+     * @param vars  Indices of the variables to interpolate. Length `nout`.
+     * @param y  On return, the interpolated values, as an `n` x `nout` array
+     *     in row-major order
+     */
+    void interpolate(size_t n, const double* x, size_t nout,
+                     const size_t* vars, double* y) const;
+
+protected:
+    //! Find the cell containing each coordinate of `x`, and compute the
+    //! offset of its lower corner in #m_data and the interpolation weights
+    //! along each axis. Returns the offset.
+    size_t locate(const double* x, double* w) const;
+
+    std::vector<vector_fp> m_axes;
+    size_t m_nvars;
+    const double* m_data;
+
+    //! Offset in #m_data between neighboring grid points along each axis
+    std::vector<size_t> m_stride;
+
+    //! Offsets of the 2^nDim() corners of a cell relative to the lower corner
+    std::vector<size_t> m_corner;
+};
+
+}
+
+#endif
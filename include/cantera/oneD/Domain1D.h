@@ -361,6 +361,12 @@ public:
 
     virtual void setJac(MultiJac* jac) {}
 
+    //! Add the CPU time spent in each part of the residual evaluation since
+    //! the last call to this method to the entries of *stats*, which are keyed
+    //! by the name of each part, and reset the timers. Derived classes which
+    //! keep timing information should override this method.
+    virtual void collectTimingStats(std::map<std::string, double>& stats) {}
+
     //! Save the current solution for this domain into an XML_Node
     /*!
      * Base class version of the general domain1D save function. Derived classes
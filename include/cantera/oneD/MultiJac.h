@@ -18,6 +18,17 @@ namespace Cantera
  * residual function supplied by an instance of class OneDim. The residual
  * function may consist of several linked 1D domains, with different variables
  * in each domain.
+ *
+ * Since the residual at each grid point depends only on the solution at that
+ * point and its two neighbors, the Jacobian is block-tridiagonal, with one
+ * block for each grid point. By default, it is factorized as a banded matrix.
+ * If setBlockTridiagonal() is used, it is instead factorized using block
+ * Gaussian elimination (the block Thomas algorithm), which requires less work
+ * and memory when the number of solution components per point is large. The
+ * grid points are eliminated either left-to-right or right-to-left, using
+ * partial pivoting within each diagonal block. If a singular diagonal block
+ * is encountered in both directions (e.g. for some combinations of boundary
+ * conditions), the banded LU factorization is used instead.
  * @ingroup onedim
  */
 class MultiJac : public BandMatrix
@@ -25,6 +36,30 @@ class MultiJac : public BandMatrix
 public:
     MultiJac(OneDim& r);
 
+    using BandMatrix::solve;
+
+    //! Factorize the Jacobian. @see setBlockTridiagonal
+    virtual int factor();
+
+    //! Solve the linear system J*x = b, factorizing the Jacobian first if
+    //! necessary. On return, *b* contains the solution.
+    virtual int solve(doublereal* b, size_t nrhs=1, size_t ldb=0);
+
+    //! Use block-tridiagonal factorization (true) or banded LU factorization
+    //! (false)
+    void setBlockTridiagonal(bool block);
+
+    //! True if the Jacobian is factorized as a block-tridiagonal matrix
+    bool blockTridiagonal() const {
+        return m_block;
+    }
+
+    //! Number of factorizations where block-tridiagonal factorization was
+    //! requested but banded LU factorization had to be used instead
+    int nBandFallbacks() const {
+        return m_nBandFallbacks;
+    }
+
     /**
      * Evaluate the Jacobian at x0. The unperturbed residual function is resid0,
      * which must be supplied on input. The third parameter 'rdt' is the
@@ -83,6 +118,41 @@ protected:
     int m_age;
     size_t m_size;
     size_t m_points;
+
+    //! Block factorization in the given direction. Returns 0 on success or
+    //! the index (plus one) of the first row of a singular diagonal block.
+    int blockFactor(bool leftToRight);
+
+    //! Copy the block of the Jacobian coupling the residuals at point *i* to
+    //! the solution at point *j* into *out* (column-major)
+    void getBlock(size_t i, size_t j, doublereal* out) const;
+
+    bool m_block; //!< true if using block-tridiagonal factorization
+
+    //! Elimination order of the current block factorization: +1 for
+    //! left-to-right, -1 for right-to-left, and 0 if the banded LU
+    //! factorization is being used.
+    int m_blockDir;
+
+    int m_nBandFallbacks;
+
+    //! Offsets of the blocks for each point in #m_diag, #m_lower and
+    //! #m_upper, in elimination order
+    std::vector<size_t> m_diagLoc, m_lowerLoc, m_upperLoc;
+
+    //! LU factors of the diagonal blocks, after subtracting the contributions
+    //! of previously eliminated points
+    vector_fp m_diag;
+
+    //! Blocks coupling each point to the previously eliminated point
+    vector_fp m_lower;
+
+    //! Blocks coupling each point to the next point to be eliminated,
+    //! premultiplied by the inverse of the diagonal block
+    vector_fp m_upper;
+
+    //! Pivots for the LU factorization of each diagonal block
+    vector_int m_blockPivots;
 };
 }
 
@@ -71,6 +71,31 @@ public:
     /// Change the problem size.
     void resize(size_t points);
 
+    //! Number of Newton iterations taken since the last call to resetStats()
+    int nIterations() const {
+        return m_nIters;
+    }
+
+    //! Number of linear solves with the Jacobian since the last call to
+    //! resetStats(). This includes the solves made while searching for a
+    //! damping coefficient.
+    int nLinearSolves() const {
+        return m_nSolves;
+    }
+
+    //! CPU time spent factorizing the Jacobian and solving the linear system
+    //! since the last call to resetStats()
+    doublereal linearSolveTime() const {
+        return m_solveElapsed;
+    }
+
+    //! Reset the iteration and linear solver statistics
+    void resetStats() {
+        m_nIters = 0;
+        m_nSolves = 0;
+        m_solveElapsed = 0.0;
+    }
+
 protected:
     //! Work arrays of size #m_n used in solve().
     vector_fp m_x, m_stp, m_stp1;
@@ -81,6 +106,13 @@ protected:
     size_t m_n;
 
     doublereal m_elapsed;
+
+    //! @name Statistics reset by resetStats()
+    //! @{
+    int m_nIters;
+    int m_nSolves;
+    doublereal m_solveElapsed;
+    //! @}
 };
 }
 
@@ -239,6 +239,16 @@ public:
 
     void setJacAge(int ss_age, int ts_age=-1);
 
+    //! Use block-tridiagonal factorization of the Jacobian (true) or banded
+    //! LU factorization (false) to solve the linear systems in the Newton
+    //! iteration. @see MultiJac
+    void setBlockTridiagonal(bool block);
+
+    //! True if the Jacobian is factorized as a block-tridiagonal matrix
+    bool blockTridiagonal() const {
+        return m_block_tridiag;
+    }
+
     /**
      * Save statistics on function and Jacobian evaluation, and reset the
      * counters. Statistics are saved only if the number of Jacobian
@@ -294,6 +304,54 @@ public:
         return m_timeSteps;
     }
 
+    //! Return number of Newton iterations taken in each call to solve()
+    const vector_int& newtonIterationStats() {
+        saveStats();
+        return m_newtonIters;
+    }
+
+    //! Return number of linear solves with the Jacobian made in each call to
+    //! solve()
+    const vector_int& linearSolveCountStats() {
+        saveStats();
+        return m_linearSolves;
+    }
+
+    //! Return CPU time spent factorizing the Jacobian and solving the linear
+    //! system in each call to solve()
+    const vector_fp& linearSolveTimeStats() {
+        saveStats();
+        return m_linearSolveElapsed;
+    }
+
+    //! Return CPU time spent in Newton iterations on the steady-state problem
+    //! in each call to solve()
+    const vector_fp& steadySolveTimeStats() {
+        saveStats();
+        return m_steadyElapsed;
+    }
+
+    //! Return CPU time spent time stepping in each call to solve()
+    const vector_fp& timeSteppingTimeStats() {
+        saveStats();
+        return m_transientElapsed;
+    }
+
+    //! Return CPU time spent refining the grid after each call to solve()
+    const vector_fp& regridTimeStats() {
+        saveStats();
+        return m_regridElapsed;
+    }
+
+    //! Return CPU time spent in each part of the residual evaluation (for
+    //! example, updating thermodynamic or transport properties) in each call
+    //! to solve(). This includes the residual evaluations made while
+    //! evaluating the Jacobian. @see Domain1D::collectTimingStats
+    const std::vector<std::map<std::string, double>>& residualTimeStats() {
+        saveStats();
+        return m_residualElapsed;
+    }
+
     //! Set a function that will be called every time #eval is called.
     //! Can be used to provide keyboard interrupt support in the high-level
     //! language interfaces.
@@ -301,6 +359,14 @@ public:
         m_interrupt = interrupt;
     }
 
+    //! Set a function that will be called after each successful timestep. The
+    //! function will be called with the size of the timestep as the argument.
+    //! Intended to be used for observing solver progress for debugging or
+    //! profiling purposes.
+    void setTimeStepCallback(Func1* callback) {
+        m_time_step_callback = callback;
+    }
+
 protected:
     void evalSSJacobian(doublereal* x, doublereal* xnew);
 
@@ -315,6 +381,9 @@ protected:
     doublereal m_rdt; //!< reciprocal of time step
     bool m_jac_ok; //!< if true, Jacobian is current
 
+    //! if true, use block-tridiagonal factorization of the Jacobian
+    bool m_block_tridiag;
+
     size_t m_bw; //!< Jacobian bandwidth
     size_t m_size; //!< solution vector size
 
@@ -339,6 +408,12 @@ protected:
     //! Maximum number of timesteps allowed per call to solve()
     int m_nsteps_max;
 
+    //! Function called after each successful timestep
+    Func1* m_time_step_callback;
+
+    //! CPU time spent refining the grid after the current call to solve()
+    doublereal m_regridtime;
+
 private:
     // statistics
     int m_nevals;
@@ -352,6 +427,18 @@ private:
     //! Number of time steps taken in each call to solve() (e.g. for each
     //! successive grid refinement)
     vector_int m_timeSteps;
+
+    //! CPU time spent on the steady-state problem and on time stepping in the
+    //! current call to solve()
+    doublereal m_steadytime, m_transienttime;
+
+    vector_int m_newtonIters;
+    vector_int m_linearSolves;
+    vector_fp m_linearSolveElapsed;
+    vector_fp m_steadyElapsed;
+    vector_fp m_transientElapsed;
+    vector_fp m_regridElapsed;
+    std::vector<std::map<std::string, double>> m_residualElapsed;
 };
 
 }
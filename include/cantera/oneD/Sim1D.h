@@ -23,7 +23,7 @@ public:
      * This constructor is provided to make the class default-constructible, but
      * is not meant to be used in most applications.  Use the next constructor
      */
-    Sim1D() {}
+    Sim1D() : m_steady_callback(0) {}
 
     /**
      * Standard constructor.
@@ -162,6 +162,13 @@ public:
 
     virtual void resize();
 
+    //! Set a function that will be called after each successful steady-state
+    //! solve, before regridding. Intended to be used for observing solver
+    //! progress for debugging or profiling purposes.
+    void setSteadyCallback(Func1* callback) {
+        m_steady_callback = callback;
+    }
+
 protected:
     //! the solution vector
     vector_fp m_x;
@@ -187,6 +194,9 @@ protected:
     //! solution
     vector_int m_steps;
 
+    //! User-supplied function called after a successful steady-state solve.
+    Func1* m_steady_callback;
+
 private:
     /// Calls method _finalize in each domain.
     void finalize();
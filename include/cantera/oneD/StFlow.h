@@ -214,6 +214,12 @@ public:
     virtual void eval(size_t j, doublereal* x, doublereal* r,
                       integer* mask, doublereal rdt);
 
+    //! Add the CPU time spent updating thermodynamic properties ("thermo"),
+    //! computing net production rates ("kinetics"), updating transport
+    //! properties ("transport") and computing diffusive fluxes
+    //! ("diffusive_fluxes") to *stats*, and reset the timers.
+    virtual void collectTimingStats(std::map<std::string, double>& stats);
+
     //! Evaluate all residual components at the right boundary.
     virtual void evalRightBoundary(doublereal* x, doublereal* res,
                                    integer* diag, doublereal rdt) = 0;
@@ -415,6 +421,14 @@ protected:
 
     bool m_dovisc;
 
+    //! @name CPU time spent in each part of the residual evaluation
+    //! @{
+    double m_thermoTime; //!< updating thermodynamic properties
+    double m_kineticsTime; //!< computing net production rates
+    double m_transportTime; //!< updating transport properties
+    double m_fluxTime; //!< computing diffusive mass fluxes
+    //! @}
+
     //! Update the transport properties at grid points in the range from `j0`
     //! to `j1`, based on solution `x`.
     void updateTransport(doublereal* x, size_t j0, size_t j1);
@@ -11,6 +11,7 @@
 
 #include "SpeciesThermo.h"
 #include "SpeciesThermoInterpType.h"
+#include "ThermoPolyTable.h"
 
 namespace Cantera
 {
@@ -22,6 +23,12 @@ namespace Cantera
  * because it recomputes the functions of temperature needed for each species.
  * What it does is to create a vector of SpeciesThermoInterpType objects.
  *
+ * For species using the NASA or Shomate polynomial parameterizations, the
+ * coefficients are also stored in a ThermoPolyTable for each
+ * parameterization, which is used by update() to evaluate the properties of
+ * these species without calling the individual SpeciesThermoInterpType
+ * objects.
+ *
  * @ingroup mgrsrefcalc
  */
 class GeneralSpeciesThermo : public SpeciesThermo
@@ -104,6 +111,11 @@ protected:
     //! Temperature polynomials for each thermo parameterization
     mutable tpoly_map m_tpoly;
 
+    //! Packed coefficient tables for the parameterizations which are supported
+    //! by ThermoPolyTable. `m_tables.at(i)` contains the species in `m_sp[i]`,
+    //! in the same order.
+    std::map<int, ThermoPolyTable> m_tables;
+
     //! Map from species index to location within #m_sp, such that
     //! `m_sp[m_speciesLoc[k].first][m_speciesLoc[k].second]` is the
     //! SpeciesThermoInterpType object for species `k`.
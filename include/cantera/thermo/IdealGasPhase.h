@@ -598,6 +598,13 @@ public:
     virtual bool addSpecies(shared_ptr<Species> spec);
     virtual void setToEquilState(const doublereal* lambda_RT);
 
+    virtual void invalidateCache();
+    virtual void setStateCacheSize(size_t n);
+    virtual size_t stateCacheSize() const {
+        return m_stateCache.capacity();
+    }
+    virtual void getStateCacheStats(size_t& hits, size_t& misses) const;
+
 protected:
     //! Reference state pressure
     /*!
@@ -626,6 +633,10 @@ protected:
     //! Temporary array containing internally calculated partial pressures
     mutable vector_fp m_pp;
 
+    //! Reference state properties at recent temperatures. Each entry contains
+    //! #m_cp0_R, #m_h0_RT, #m_s0_R, #m_g0_RT and #m_logc0.
+    mutable StateCache<vector_fp> m_stateCache;
+
 private:
     //! Update the species reference state thermodynamic functions
     /*!
@@ -97,6 +97,11 @@ public:
 
     virtual void modifyParameters(doublereal* coeffs);
 
+    //! Number of temperature regions
+    size_t nRegions() const {
+        return m_regionPts.size();
+    }
+
 protected:
     //! Lower boundaries of each temperature regions
     vector_fp m_lowerTempBounds;
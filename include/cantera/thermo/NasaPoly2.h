@@ -145,6 +145,13 @@ public:
         h = mnp_high.reportHf298(0);
         hnew = h + delH;
         mnp_high.modifyOneHf298(k, hnew);
+
+        // Keep the coefficients reported by reportParameters() consistent
+        size_t n;
+        int type;
+        double tlow, thigh, pref;
+        mnp_low.reportParameters(n, type, tlow, thigh, pref, &m_coeff[8]);
+        mnp_high.reportParameters(n, type, tlow, thigh, pref, &m_coeff[1]);
     }
 
     void validate(const std::string& name);
@@ -740,6 +740,14 @@ public:
         return m_stateNum;
     }
 
+    //! Return a number that is incremented each time invalidateCache() is
+    //! called, i.e. when species are added or their thermodynamic data are
+    //! modified. Objects which store values computed from the species data
+    //! of this phase can use this to detect that these values are stale.
+    int cacheNumber() const {
+        return m_cacheNum;
+    }
+
     //! Invalidate any cached values which are normally updated only when a
     //! change in state is detected
     virtual void invalidateCache();
@@ -822,6 +830,9 @@ private:
     //! this int is incremented.
     int m_stateNum;
 
+    //! Incremented each time invalidateCache() is called. See cacheNumber().
+    int m_cacheNum;
+
     //! Vector of the species names
     std::vector<std::string> m_speciesNames;
 
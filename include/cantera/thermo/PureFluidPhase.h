@@ -86,6 +86,20 @@ public:
     //! Returns a reference to the substance object
     tpx::Substance& TPX_Substance();
 
+    //! Switch to tabulated mode, where states and saturation properties are
+    //! computed by interpolation in precomputed tables. See
+    //! tpx::Substance::tabulate() for the meaning of the arguments. Returns
+    //! the fraction of the tables which satisfies the error tolerance. The
+    //! tables are not copied to duplicates of this phase.
+    double tabulate(double Tlow, double Thigh, double Plow, double Phigh,
+                    size_t nT=100, size_t nP=100, double rtol=1e-6);
+
+    //! Returns true if the phase is in tabulated mode
+    bool tabulated() const;
+
+    //! Discard the tables created by tabulate()
+    void clearTables();
+
     //@}
     /// @name Properties of the Standard State of the Species in the Solution
     /*!
@@ -329,6 +329,13 @@ public:
         h = msp_high.reportHf298(0);
         hnew = h + delH;
         msp_high.modifyOneHf298(k, hnew);
+
+        // Keep the coefficients reported by reportParameters() consistent
+        size_t n;
+        int type;
+        double tlow, thigh, pref;
+        msp_low.reportParameters(n, type, tlow, thigh, pref, &m_coeff[1]);
+        msp_high.reportParameters(n, type, tlow, thigh, pref, &m_coeff[8]);
     }
 
 protected:
@@ -175,7 +175,7 @@ public:
      */
     virtual void modifyOneHf298SS(const size_t k, const doublereal Hf298New) {
         m_spthermo->modifyOneHf298(k, Hf298New);
-        m_tlast += 0.0001234;
+        invalidateCache();
     }
 
     //! Maximum temperature for which the thermodynamic data for the species
@@ -1539,6 +1539,36 @@ public:
 
     virtual void invalidateCache();
 
+    //! Set the number of recent states for which the species reference state
+    //! properties are kept.
+    /*!
+     * By default, the reference state properties are only stored for the
+     * most recent temperature. Keeping the properties for several states
+     * avoids recomputing them when the phase alternates between a few
+     * states, e.g. when the same phase object is used for several reactors.
+     * Setting the size also resets the counters returned by
+     * getStateCacheStats().
+     *
+     * @param n  Number of states. Zero disables the cache.
+     */
+    virtual void setStateCacheSize(size_t n) {
+        throw NotImplementedError("ThermoPhase::setStateCacheSize");
+    }
+
+    //! The number of recent states for which the species reference state
+    //! properties are kept. See setStateCacheSize().
+    virtual size_t stateCacheSize() const {
+        return 0;
+    }
+
+    //! Get the number of times the species reference state properties were
+    //! found in (`hits`) or had to be added to (`misses`) the cache of recent
+    //! states. See setStateCacheSize().
+    virtual void getStateCacheStats(size_t& hits, size_t& misses) const {
+        hits = 0;
+        misses = 0;
+    }
+
     //! @}
     //! @name  Derivatives of Thermodynamic Variables needed for Applications
     //! @{
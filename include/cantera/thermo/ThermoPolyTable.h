@@ -0,0 +1,147 @@
+/**
+ * @file ThermoPolyTable.h
+ *  Header for a packed table of polynomial coefficients used to evaluate the
+ *  reference state properties of many species at once (see \ref spthermo and
+ *  \link Cantera::ThermoPolyTable ThermoPolyTable\endlink).
+ */
+
+#ifndef CT_THERMOPOLYTABLE_H
+#define CT_THERMOPOLYTABLE_H
+
+#include "cantera/base/ct_defs.h"
+
+namespace Cantera
+{
+
+class SpeciesThermoInterpType;
+
+//! A packed table of the polynomial coefficients for all species in a phase
+//! which use the same parameterization.
+/*!
+ * The coefficients are stored as a "structure of arrays", where the values of
+ * each coefficient in each temperature region are stored contiguously for all
+ * of the species in the table. When the temperature changes, the
+ * coefficients for the region containing the new temperature are gathered
+ * into a set of "active" arrays. This only needs to be done when the
+ * temperature crosses the boundary between two regions for one of the
+ * species, which is rare during a typical simulation. The polynomials are
+ * then evaluated for all species in loops without any branches or virtual
+ * function calls, which the compiler is able to vectorize.
+ *
+ * The supported parameterizations are the 7-coefficient NASA polynomials
+ * (NasaPoly1 and NasaPoly2), the 9-coefficient NASA polynomials (Nasa9Poly1
+ * and Nasa9PolyMultiTempRegion) and the Shomate polynomials (ShomatePoly and
+ * ShomatePoly2). The coefficients are obtained from the individual
+ * SpeciesThermoInterpType objects, which remain responsible for reporting
+ * and modifying the parameters.
+ *
+ * @ingroup spthermo
+ */
+class ThermoPolyTable
+{
+public:
+    //! Create an empty table for species using the parameterization `type`,
+    //! which is one of the constants defined in speciesThermoTypes.h.
+    explicit ThermoPolyTable(int type);
+
+    //! Returns true if species using the parameterization `type` can be
+    //! stored in a ThermoPolyTable.
+    static bool supports(int type);
+
+    //! Add a species to the table
+    /*!
+     * @param k     Index of the species in the phase
+     * @param stit  Parameterization of the reference state properties of the
+     *     species. The coefficients are copied into the table.
+     */
+    void add(size_t k, const SpeciesThermoInterpType& stit);
+
+    //! Replace the coefficients of the `i`th species in the table (that is,
+    //! the `i`th species which was added) with the coefficients of `stit`.
+    void replace(size_t i, const SpeciesThermoInterpType& stit);
+
+    //! Number of species in the table
+    size_t size() const {
+        return m_index.size();
+    }
+
+    //! Compute the reference state properties of all species in the table.
+    /*!
+     * The results are stored at the positions in the output arrays given by
+     * the species indices passed to add(). Other elements of the output
+     * arrays are not modified.
+     *
+     * @param T     Temperature (Kelvin)
+     * @param cp_R  Vector of dimensionless heat capacities.
+     * @param h_RT  Vector of dimensionless enthalpies.
+     * @param s_R   Vector of dimensionless entropies.
+     */
+    void update(double T, double* cp_R, double* h_RT, double* s_R) const;
+
+    //! Compute the reference state properties of all species in the table at
+    //! each of `nT` temperatures.
+    /*!
+     * The properties at temperature `T[j]` are stored in the rows of the
+     * output arrays beginning at `cp_R + j*stride`, `h_RT + j*stride` and
+     * `s_R + j*stride`, in the same way as for update(double, double*,
+     * double*, double*).
+     */
+    void update(size_t nT, const double* T, size_t stride,
+                double* cp_R, double* h_RT, double* s_R) const;
+
+protected:
+    //! Copy the coefficients for the `i`th species from `stit`
+    void setCoeffs(size_t i, const SpeciesThermoInterpType& stit);
+
+    //! Add an empty temperature region for all species
+    void addRegion();
+
+    //! Gather the coefficients for the regions containing the temperature `T`
+    //! into #m_active, if `T` is outside the interval #m_Tvalid
+    void selectRegions(double T) const;
+
+    //! Evaluate the polynomials using the coefficients in #m_active, storing
+    //! the results for the species in the order of the table.
+    void evaluate(double T, double* cp_R, double* h_RT, double* s_R) const;
+
+    //! Parameterization type of the species in the table
+    int m_type;
+
+    //! Number of coefficients in each temperature region
+    size_t m_ncoeff;
+
+    //! Indices in the phase of each species in the table
+    std::vector<size_t> m_index;
+
+    //! True if #m_index is a sequence of consecutive integers, in which case
+    //! results can be written directly to the output arrays
+    bool m_contiguous;
+
+    //! Polynomial coefficients. `m_coeffs[r][j][i]` is coefficient `j` in
+    //! temperature region `r` for the `i`th species in the table.
+    std::vector<std::vector<vector_fp>> m_coeffs;
+
+    //! Lower temperature bounds of each region. `m_bounds[r-1][i]` is the
+    //! lower bound of region `r` (for `r > 0`) for the `i`th species in the
+    //! table. Species with fewer regions are padded with #BigNumber.
+    std::vector<vector_fp> m_bounds;
+
+    //! Coefficients for the current temperature. `m_active[j][i]` is
+    //! coefficient `j` for the `i`th species in the table.
+    mutable std::vector<vector_fp> m_active;
+
+    //! Region for which the coefficients of each species are stored in
+    //! #m_active, or -1 if they need to be updated.
+    mutable std::vector<int> m_region;
+
+    //! Open temperature interval within which the coefficients stored in
+    //! #m_active are valid for all species
+    mutable std::pair<double, double> m_Tvalid;
+
+    //! Work arrays used if the species in the table are not contiguous
+    mutable vector_fp m_cp, m_h, m_s;
+};
+
+}
+
+#endif
@@ -4,6 +4,7 @@
 
 #include "cantera/base/ctexceptions.h"
 #include <algorithm>
+#include <memory>
 
 namespace tpx
 {
@@ -27,6 +28,8 @@ enum type { H, S, U, V, P, T };
 
 const double Undef = 999.1234;
 
+class SubstanceTable;
+
 /*!
  * Base class from which all pure substances are derived
  */
@@ -139,6 +142,11 @@ public:
 
     //! Specific heat at constant pressure [J/kg/K]
     virtual double cp() {
+        if (m_table && !TwoPhase()) {
+            double dPdT, dPdv, dsdT;
+            derivs_Tv(dPdT, dPdv, dsdT);
+            return T*dsdT - T*dPdT*dPdT/dPdv;
+        }
         double Tsave = T, dt = 1.e-4*T;
         double T1 = std::max(Tmin(), Tsave - dt);
         double T2 = std::min(Tmax(), Tsave + dt);
@@ -152,6 +160,11 @@ public:
     }
 
     virtual double thermalExpansionCoeff() {
+        if (m_table && !TwoPhase()) {
+            double dPdT, dPdv, dsdT;
+            derivs_Tv(dPdT, dPdv, dsdT);
+            return -Rho*dPdT/dPdv;
+        }
         double Tsave = T, dt = 1.e-4*T;
         double T1 = std::max(Tmin(), Tsave - dt);
         double T2 = std::min(Tmax(), Tsave + dt);
@@ -165,6 +178,11 @@ public:
     }
 
     virtual double isothermalCompressibility() {
+        if (m_table && !TwoPhase()) {
+            double dPdT, dPdv, dsdT;
+            derivs_Tv(dPdT, dPdv, dsdT);
+            return -Rho/dPdv;
+        }
         double Psave = P(), dp = 1.e-4*Psave;
         Set(PropertyPair::TP, T, Psave - dp);
         double v1 = v();
@@ -216,6 +234,66 @@ public:
     //! second property.
     void Set(PropertyPair::type XY, double x0, double y0);
 
+    //! Set the state to the two-phase state with temperature *t* and vapor
+    //! fraction *x*, as in Set(PropertyPair::TX, t, x).
+    /*!
+     * If *warm* is true, the iterative solution for the saturation pressure
+     * and the densities of the saturated liquid and vapor is started from
+     * the solution for the most recent temperature, rather than from the
+     * correlations for the saturation pressure and liquid density. This is
+     * faster when computing a sequence of states along the saturation curve
+     * in small temperature increments. If the warm-started iteration fails,
+     * the solution is attempted again from the usual starting point.
+     */
+    void setSaturated(double t, double x, bool warm=false);
+
+    //! @name Tabulated mode
+    //!
+    //! In tabulated mode, the saturation properties and the states specified
+    //! by the property pairs TP, HP and SP are computed by interpolation in
+    //! precomputed tables instead of by iteratively solving the equation of
+    //! state. The tables are checked against the equation of state when they
+    //! are constructed, and states which fall in parts of the tables where
+    //! the interpolation error exceeds the specified tolerance (typically
+    //! near the critical point) or outside the tabulated domain are computed
+    //! using the iterative methods. The error is only checked at a few points
+    //! in each cell of the tables (see SubstanceTable), so it may exceed the
+    //! tolerance elsewhere. In tabulated mode, the specific heat at
+    //! constant pressure and the thermal expansion and isothermal
+    //! compressibility coefficients of single-phase states are computed from
+    //! derivatives of the equation of state at constant temperature and
+    //! density.
+    //! @{
+
+    //! Precompute tables for the tabulated mode. See SubstanceTable.
+    /*!
+     * @param Tlow  Lower temperature limit of the tables [K]
+     * @param Thigh  Upper temperature limit of the tables [K]
+     * @param Plow  Lower pressure limit of the tables [Pa]
+     * @param Phigh  Upper pressure limit of the tables [Pa]
+     * @param nT  Number of grid points along the temperature axes
+     * @param nP  Number of grid points along the pressure axis
+     * @param rtol  Relative tolerance for the interpolation error, which is
+     *     checked at a few points in each cell of the tables
+     * @returns the fraction of the tables which satisfies the error
+     *     tolerance
+     */
+    double tabulate(double Tlow, double Thigh, double Plow, double Phigh,
+                    size_t nT=100, size_t nP=100, double rtol=1e-6);
+
+    //! Discard the tables created by tabulate() and return to computing all
+    //! states iteratively.
+    void clearTables() {
+        m_table.reset();
+        Tslast = Undef;
+    }
+
+    //! Returns true if the substance is in tabulated mode
+    bool tabulated() const {
+        return bool(m_table);
+    }
+    //! @}
+
 protected:
     double T, Rho;
     double Tslast, Rhf, Rhv;
@@ -248,8 +326,23 @@ protected:
     //! 0 if not, in which case state not set.
     int Lever(int itp, double sat, double val, propertyFlag::type ifunc);
 
-    //! Update saturated liquid and vapor densities and saturation pressure
-    void update_sat();
+    //! Update saturated liquid and vapor densities and saturation pressure.
+    //! If *warm* is true, start from the last saturation state computed. See
+    //! setSaturated().
+    void update_sat(bool warm=false);
+
+    //! Tables used in tabulated mode
+    std::shared_ptr<const SubstanceTable> m_table;
+
+    //! Set the state with pressure *P* where the property *ifx* is equal to
+    //! *x* using #m_table. Returns false if the table cannot be used.
+    bool setFromTable(propertyFlag::type ifx, double x, double P);
+
+    //! Derivatives of the equation of state for a single-phase state:
+    //! (dP/dT) at constant v, (dP/dv) at constant T, and (ds/dT) at constant v
+    void derivs_Tv(double& dPdT, double& dPdv, double& dsdT);
+
+    friend class SubstanceTable;
 
 private:
     void set_Rho(double r0);
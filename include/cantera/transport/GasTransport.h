@@ -13,6 +13,128 @@ namespace Cantera
 
 class MMCollisionInt;
 
+//! Collision parameters and polynomial fits to the transport properties
+//! computed by GasTransport::setupMM().
+/*!
+ * These depend only on the species transport and reference-state thermo data,
+ * the temperature range of the phase, and the mode, and are shared by all
+ * GasTransport objects created from the same inputs.
+ */
+struct GasTransportFits
+{
+    //! This is the reduced mass of the interaction between species i and j
+    /*!
+     *  reducedMass(i,j) =  mw[i] * mw[j] / (Avogadro * (mw[i] + mw[j]));
+     *
+     *  Units are kg (note, no kmol -> this is a per molecule amount)
+     *
+     *  Length nsp * nsp. This is a symmetric matrix
+     */
+    DenseMatrix reducedMass;
+
+    //! hard-sphere diameter for (i,j) collision
+    /*!
+     *  diam(i,j) = 0.5*(sigma[i] + sigma[j]);
+     *  Units are m (note, no kmol -> this is a per molecule amount)
+     *
+     *  Length nsp * nsp. This is a symmetric matrix.
+     */
+    DenseMatrix diam;
+
+    //! The effective well depth for (i,j) collisions
+    /*!
+     *     epsilon(i,j) = sqrt(eps[i]*eps[j]);
+     *     Units are Joules (note, no kmol -> this is a per molecule amount)
+     *
+     * Length nsp * nsp. This is a symmetric matrix.
+     */
+    DenseMatrix epsilon;
+
+    //! The effective dipole moment for (i,j) collisions
+    /*!
+     *    dipole(i,j) = sqrt(dipole[i] * dipole[j]);
+     *  (note, no kmol -> this is a per molecule amount)
+     *
+     *  Length nsp * nsp. This is a symmetric matrix.
+     */
+    DenseMatrix dipole;
+
+    //! Reduced dipole moment of the interaction between two species
+    /*!
+     *  This is the reduced dipole moment of the interaction between two species
+     *       0.5 * dipole(i,j)^2 / (4 * Pi * epsilon_0 * epsilon(i,j) * d^3);
+     *
+     *  Length nsp * nsp .This is a symmetric matrix
+     */
+    DenseMatrix delta;
+
+    //! Indices for the (i,j) interaction in collision integral fits
+    /*!
+     *  poly[i][j] contains the index for (i,j) interactions in
+     *  #omega22_poly, #astar_poly, #bstar_poly, and #cstar_poly.
+     */
+    std::vector<vector_int> poly;
+
+    //! Fit for omega22 collision integral
+    /*!
+     * omega22_poly[poly[i][j]] is the vector of polynomial coefficients
+     * (length degree+1) for the collision integral fit for the species pair
+     * (i,j).
+     */
+    std::vector<vector_fp> omega22_poly;
+
+    //! Fit for astar collision integral
+    /*!
+     * astar_poly[poly[i][j]] is the vector of polynomial coefficients
+     * (length degree+1) for the collision integral fit for the species pair
+     * (i,j).
+     */
+    std::vector<vector_fp> astar_poly;
+
+    //! Fit for bstar collision integral
+    /*!
+     * bstar_poly[poly[i][j]] is the vector of polynomial coefficients
+     * (length degree+1) for the collision integral fit for the species pair
+     * (i,j).
+     */
+    std::vector<vector_fp> bstar_poly;
+
+    //! Fit for cstar collision integral
+    /*!
+     * cstar_poly[poly[i][j]] is the vector of polynomial coefficients
+     * (length degree+1) for the collision integral fit for the species pair
+     * (i,j).
+     */
+    std::vector<vector_fp> cstar_poly;
+
+    //! Polynomial fits to the viscosity of each species. visccoeffs[k] is
+    //! the vector of polynomial coefficients for species k that fits the
+    //! viscosity as a function of temperature.
+    std::vector<vector_fp> visccoeffs;
+
+    //! temperature fits of the heat conduction
+    /*!
+     *  Dimensions are number of species (nsp) polynomial order of the collision
+     *  integral fit (degree+1).
+     */
+    std::vector<vector_fp> condcoeffs;
+
+    //! Polynomial fits to the binary diffusivity of each species
+    /*!
+     * diffcoeffs[ic] is vector of polynomial coefficients for species i
+     * species j that fits the binary diffusion coefficient. The relationship
+     * between i j and ic is determined from the following algorithm:
+     *
+     *      int ic = 0;
+     *      for (i = 0; i < m_nsp; i++) {
+     *         for (j = i; j < m_nsp; j++) {
+     *           ic++;
+     *         }
+     *      }
+     */
+    std::vector<vector_fp> diffcoeffs;
+};
+
 //! Class GasTransport implements some functions and properties that are
 //! shared by the MixTransport and MultiTransport classes.
 //! @ingroup tranprops
@@ -109,6 +231,21 @@ public:
 
     virtual void init(thermo_t* thermo, int mode=0, int log_level=0);
 
+    //! CPU time [s] spent in setupMM() when this object was initialized.
+    /*!
+     * This is the time needed to compute the collision integral and
+     * transport property fits, or, if the fits for the same species data,
+     * temperature range and mode were already computed for another object
+     * in this process, the time needed to retrieve them from the cache.
+     */
+    double setupTime() const {
+        return m_setupTime;
+    }
+
+    //! Remove all entries from the cache of transport property fits shared
+    //! by GasTransport objects. Called by appdelete().
+    static void clearFitCache();
+
 protected:
     GasTransport(ThermoPhase* thermo=0);
 
@@ -147,7 +284,13 @@ protected:
     //! Prepare to build a new kinetic-theory-based transport manager for
     //! low-density gases
     /*!
-     *  Uses polynomial fits to Monchick & Mason collision integrals.
+     * Uses polynomial fits to Monchick & Mason collision integrals. The fits
+     * depend only on the species transport and reference-state thermo data,
+     * the temperature range of the phase, and the mode, so they are computed
+     * once per process for each distinct set of inputs and stored in a cache
+     * shared by all GasTransport objects. This makes it inexpensive to create
+     * several transport managers for the same mechanism, or to switch
+     * between the mixture-averaged and multicomponent models.
      */
     void setupMM();
 
@@ -177,8 +320,10 @@ protected:
     //! Generate polynomial fits to collision integrals
     /*!
      * @param integrals interpolator for the collision integrals
+     * @param fits      object where the fits are stored
      */
-    void fitCollisionIntegrals(MMCollisionInt& integrals);
+    void fitCollisionIntegrals(MMCollisionInt& integrals,
+                               GasTransportFits& fits);
 
     //! Generate polynomial fits to the viscosity, conductivity, and
     //! the binary diffusion coefficients
@@ -201,8 +346,9 @@ protected:
      * \f]
      *
      * @param integrals interpolator for the collision integrals
+     * @param fits      object where the fits are stored
      */
-    void fitProperties(MMCollisionInt& integrals);
+    void fitProperties(MMCollisionInt& integrals, GasTransportFits& fits);
 
     //! Second-order correction to the binary diffusion coefficients
     /*!
@@ -265,11 +411,6 @@ protected:
     //! rule to calculate the viscosity of the solution. length = m_kk.
     vector_fp m_visc;
 
-    //! Polynomial fits to the viscosity of each species. m_visccoeffs[k] is
-    //! the vector of polynomial coefficients for species k that fits the
-    //! viscosity as a function of temperature.
-    std::vector<vector_fp> m_visccoeffs;
-
     //! Local copy of the species molecular weights.
     vector_fp m_mw;
 
@@ -319,71 +460,10 @@ protected:
     //! Current value of temperature to the 3/2 power
     doublereal m_t32;
 
-    //! Polynomial fits to the binary diffusivity of each species
-    /*!
-     * m_diffcoeff[ic] is vector of polynomial coefficients for species i
-     * species j that fits the binary diffusion coefficient. The relationship
-     * between i j and ic is determined from the following algorithm:
-     *
-     *      int ic = 0;
-     *      for (i = 0; i < m_nsp; i++) {
-     *         for (j = i; j < m_nsp; j++) {
-     *           ic++;
-     *         }
-     *      }
-     */
-    std::vector<vector_fp> m_diffcoeffs;
-
     //! Matrix of binary diffusion coefficients at the reference pressure and
     //! the current temperature Size is nsp x nsp.
     DenseMatrix m_bdiff;
 
-    //! temperature fits of the heat conduction
-    /*!
-     *  Dimensions are number of species (nsp) polynomial order of the collision
-     *  integral fit (degree+1).
-     */
-    std::vector<vector_fp> m_condcoeffs;
-
-    //! Indices for the (i,j) interaction in collision integral fits
-    /*!
-     *  m_poly[i][j] contains the index for (i,j) interactions in
-     *  #m_omega22_poly, #m_astar_poly, #m_bstar_poly, and #m_cstar_poly.
-     */
-    std::vector<vector_int> m_poly;
-
-    //! Fit for omega22 collision integral
-    /*!
-     * m_omega22_poly[m_poly[i][j]] is the vector of polynomial coefficients
-     * (length degree+1) for the collision integral fit for the species pair
-     * (i,j).
-     */
-    std::vector<vector_fp> m_omega22_poly;
-
-    //! Fit for astar collision integral
-    /*!
-     * m_astar_poly[m_poly[i][j]] is the vector of polynomial coefficients
-     * (length degree+1) for the collision integral fit for the species pair
-     * (i,j).
-     */
-    std::vector<vector_fp> m_astar_poly;
-
-    //! Fit for bstar collision integral
-    /*!
-     * m_bstar_poly[m_poly[i][j]] is the vector of polynomial coefficients
-     * (length degree+1) for the collision integral fit for the species pair
-     * (i,j).
-     */
-    std::vector<vector_fp> m_bstar_poly;
-
-    //! Fit for cstar collision integral
-    /*!
-     * m_bstar_poly[m_poly[i][j]] is the vector of polynomial coefficients
-     * (length degree+1) for the collision integral fit for the species pair
-     * (i,j).
-     */
-    std::vector<vector_fp> m_cstar_poly;
-
     //! Rotational relaxation number for each species
     /*!
      * length is the number of species in the phase. units are dimensionless
@@ -423,54 +503,23 @@ protected:
      */
     vector_fp m_sigma;
 
-    //! This is the reduced mass of the interaction between species i and j
-    /*!
-     *  reducedMass(i,j) =  mw[i] * mw[j] / (Avogadro * (mw[i] + mw[j]));
-     *
-     *  Units are kg (note, no kmol -> this is a per molecule amount)
-     *
-     *  Length nsp * nsp. This is a symmetric matrix
-     */
-    DenseMatrix m_reducedMass;
-
-    //! hard-sphere diameter for (i,j) collision
-    /*!
-     *  diam(i,j) = 0.5*(sigma[i] + sigma[j]);
-     *  Units are m (note, no kmol -> this is a per molecule amount)
-     *
-     *  Length nsp * nsp. This is a symmetric matrix.
-     */
-    DenseMatrix m_diam;
-
-    //! The effective well depth for (i,j) collisions
-    /*!
-     *     epsilon(i,j) = sqrt(eps[i]*eps[j]);
-     *     Units are Joules (note, no kmol -> this is a per molecule amount)
-     *
-     * Length nsp * nsp. This is a symmetric matrix.
-     */
-    DenseMatrix m_epsilon;
-
-    //! The effective dipole moment for (i,j) collisions
+    //! Dipole moment of each species
     /*!
      *  Given `dipoleMoment` in Debye (a Debye is 3.335e-30 C-m):
      *
-     *    dipole(i,i) = 1.e-21 / lightSpeed * dipoleMoment;
-     *    dipole(i,j) = sqrt(dipole(i,i) * dipole(j,j));
+     *    dipole[k] = 1.e-21 / lightSpeed * dipoleMoment;
      *  (note, no kmol -> this is a per molecule amount)
      *
-     *  Length nsp * nsp. This is a symmetric matrix.
+     *  Length is the number of species in the phase.
      */
-    DenseMatrix m_dipole;
+    vector_fp m_dipole;
 
-    //! Reduced dipole moment of the interaction between two species
+    //! Collision parameters and polynomial fits to the transport properties
     /*!
-     *  This is the reduced dipole moment of the interaction between two species
-     *       0.5 * dipole(i,j)^2 / (4 * Pi * epsilon_0 * epsilon(i,j) * d^3);
-     *
-     *  Length nsp * nsp .This is a symmetric matrix
+     *  These are not copied for each object. All GasTransport objects created
+     *  with the same inputs to setupMM() share the same fits.
      */
-    DenseMatrix m_delta;
+    std::shared_ptr<const GasTransportFits> m_fits;
 
     //! Pitzer acentric factor
     /*!
@@ -480,6 +529,9 @@ protected:
 
     //! Level of verbose printing during initialization
     int m_log_level;
+
+    //! CPU time [s] spent in setupMM()
+    double m_setupTime;
 };
 
 } // namespace Cantera
@@ -113,6 +113,41 @@ public:
 
     virtual void init(ThermoPhase* thermo, int mode=0, int log_level=0);
 
+    //! Set the method used to solve the L-matrix equations
+    /*!
+     * The thermal conductivity and thermal diffusion coefficients require the
+     * solution of a linear system with 3K unknowns whenever the temperature or
+     * composition changes. By default, this system is solved directly by LU
+     * factorization at every new state.
+     *
+     * If *maxIterations* is greater than zero, the LU factorization of the L
+     * matrix from an earlier state is kept and used as a preconditioner for
+     * an iterative refinement of the solution at the current state, starting
+     * from the previous solution. The iteration stops when the largest
+     * correction is smaller than *rtol* times the largest element of the
+     * solution. If this is not achieved within *maxIterations* iterations,
+     * the L matrix is factorized at the current state and solved directly.
+     * For sequences of nearby states, such as neighboring grid points in a
+     * 1D flame, this avoids most of the O(K^3) factorizations.
+     *
+     * @param maxIterations  Maximum number of refinement iterations before
+     *                       refactorizing. Zero selects the direct solver.
+     * @param rtol           Relative tolerance for the iterative solver
+     */
+    void setLMatrixSolver(size_t maxIterations, double rtol=1.0e-8);
+
+    //! Number of LU factorizations of the L matrix since the last call to
+    //! setLMatrixSolver()
+    int nLMatrixFactorizations() const {
+        return m_nLfactor;
+    }
+
+    //! Number of iterative refinement steps on the L-matrix equations since
+    //! the last call to setLMatrixSolver()
+    int nLMatrixIterations() const {
+        return m_nLiter;
+    }
+
 protected:
     //! Update basic temperature-dependent quantities if the temperature has
     //! changed.
@@ -197,6 +232,32 @@ protected:
     }
 
     virtual void solveLMatrixEquation();
+
+    //! Refine the solution in #m_a of the L-matrix equations for the current
+    //! state using the factorization stored in #m_Lfactor. Returns `true` if
+    //! the iteration converged.
+    bool refineLMatrixSolution();
+
+    //! LU factorization of the L matrix at an earlier state, used by the
+    //! iterative solver
+    DenseMatrix m_Lfactor;
+
+    //! Residual / correction work vector for the iterative solver
+    vector_fp m_Lresid;
+
+    //! `true` if #m_Lfactor holds a usable factorization
+    bool m_lmatrix_factor_ok;
+
+    //! Maximum number of refinement iterations. Zero selects the direct solver.
+    size_t m_lmatrix_maxiter;
+
+    //! Relative tolerance for the iterative solver
+    double m_lmatrix_rtol;
+
+    //! Counters for L-matrix factorizations and refinement iterations
+    int m_nLfactor;
+    int m_nLiter;
+
     DenseMatrix incl;
     bool m_debug;
 };
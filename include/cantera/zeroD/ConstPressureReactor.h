@@ -43,6 +43,9 @@ public:
     //! the name of a homogeneous phase species, or the name of a surface
     //! species.
     virtual size_t componentIndex(const std::string& nm) const;
+
+protected:
+    virtual void getProductionRateWeights(const double* lambda, double* w);
 };
 
 }
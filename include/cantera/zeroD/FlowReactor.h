@@ -30,6 +30,11 @@ public:
                          doublereal* ydot, doublereal* params);
     virtual void updateState(doublereal* y);
 
+    //! Not implemented for FlowReactor
+    virtual void evalReactionGradient(const double* lambda, double* grad) {
+        throw NotImplementedError("FlowReactor::evalReactionGradient");
+    }
+
     void setMassFlowRate(doublereal mdot) {
         m_rho0 = m_thermo->density();
         m_speed = mdot/m_rho0;
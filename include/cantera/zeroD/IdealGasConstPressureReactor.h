@@ -46,6 +46,8 @@ public:
     virtual size_t componentIndex(const std::string& nm) const;
 
 protected:
+    virtual void getProductionRateWeights(const double* lambda, double* w);
+
     vector_fp m_hk; //!< Species molar enthalpies
 };
 }
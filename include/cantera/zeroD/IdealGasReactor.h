@@ -45,6 +45,8 @@ public:
     virtual size_t componentIndex(const std::string& nm) const;
 
 protected:
+    virtual void getProductionRateWeights(const double* lambda, double* w);
+
     vector_fp m_uk; //!< Species molar internal energies
 };
 
@@ -0,0 +1,194 @@
+//! @file PlugFlowReactor.h
+
+#ifndef CT_PLUGFLOWREACTOR_H
+#define CT_PLUGFLOWREACTOR_H
+
+#include "cantera/numerics/FuncEval.h"
+#include "cantera/numerics/Integrator.h"
+
+namespace Cantera
+{
+
+class ThermoPhase;
+class Kinetics;
+class InterfaceKinetics;
+class SurfPhase;
+class Func1;
+
+//! A steady, isobaric plug flow reactor integrated in the axial direction.
+/*!
+ * The governing equations for the temperature *T*, the mass flow rate
+ * @f$ \dot{m} @f$, the residence time @f$ \tau @f$, and the mass fractions
+ * @f$ Y_k @f$ of the gas species are:
+ *
+ * @f[
+ *     \dot{m} \frac{dY_k}{dz} = (A \dot{\omega}_k + a_s \dot{s}_k) W_k
+ *         - Y_k \frac{d\dot{m}}{dz}
+ * @f]
+ * @f[
+ *     \frac{d\dot{m}}{dz} = a_s \sum_k \dot{s}_k W_k
+ * @f]
+ * @f[
+ *     \dot{m} c_p \frac{dT}{dz} = U (T_w - T)
+ *         - \sum_k \hat{h}_k (A \dot{\omega}_k + a_s \dot{s}_k)
+ * @f]
+ * @f[
+ *     \frac{d\tau}{dz} = \frac{\rho A}{\dot{m}}
+ * @f]
+ *
+ * where *A* is the cross-sectional area, @f$ a_s @f$ is the area of the
+ * reacting surface per unit length, *U* is the heat transfer coefficient per
+ * unit length (i.e. multiplied by the perimeter) and @f$ T_w @f$ is the wall
+ * temperature, each of which may be a function of the axial position *z*.
+ * The coverages of the surface species are assumed to be in steady state at
+ * each point, and are found by solving the pseudo-steady surface problem
+ * whenever the right-hand side is evaluated. The pressure is constant, and
+ * the kinetic energy of the flow is neglected.
+ */
+class PlugFlowReactor : public FuncEval
+{
+public:
+    //! Create a reactor for the gas phase *gas* with homogeneous reactions
+    //! described by *kin*. The current state of *gas* is used as the inlet
+    //! state.
+    PlugFlowReactor(ThermoPhase& gas, Kinetics& kin);
+    virtual ~PlugFlowReactor();
+
+    //! Add a reacting surface, where the reactions are described by *surf*.
+    //! *gas* must be one of the phases of *surf*.
+    void setSurface(InterfaceKinetics& surf);
+
+    //! Use the current state of the gas as the inlet state
+    void setInletState();
+
+    //! Set the mass flow rate at the inlet [kg/s]
+    void setMassFlowRate(double mdot);
+
+    //! Set the cross-sectional area [m^2] as a function of the axial
+    //! position. If *A* is NULL, the area is 1 m^2.
+    void setArea(Func1* A) {
+        m_area = A;
+    }
+
+    //! Set the area of the reacting surface per unit length [m] as a function
+    //! of the axial position. If *a* is NULL, the area is equal to the
+    //! perimeter of a circular cross section.
+    void setSurfaceArea(Func1* a) {
+        m_surfArea = a;
+    }
+
+    //! Set the heat transfer coefficient per unit length [W/m/K] and the wall
+    //! temperature [K] as functions of the axial position. If either is NULL,
+    //! the reactor is adiabatic.
+    void setHeatTransfer(Func1* U, Func1* Tw) {
+        m_U = U;
+        m_Tw = Tw;
+    }
+
+    //! Enable or disable the energy equation. If disabled, the temperature
+    //! is held at its inlet value.
+    void setEnergy(bool energy) {
+        m_energy = energy;
+    }
+
+    bool energyEnabled() const {
+        return m_energy;
+    }
+
+    //! Set the relative and absolute tolerances for the integrator. If the
+    //! integration has already started, it continues from the current
+    //! position with the new tolerances.
+    void setTolerances(double rtol, double atol);
+
+    //! Set the maximum step size [m] of the integrator. If the integration
+    //! has already started, it continues from the current position with the
+    //! new maximum step size.
+    void setMaxStepSize(double maxstep);
+
+    //! Start the integration at the axial position *z0* [m] from the inlet
+    //! state.
+    void initialize(double z0 = 0.0);
+
+    //! Advance the solution to the axial position *z* [m], taking as many
+    //! integrator steps as necessary.
+    void advance(double z);
+
+    //! Take a single integrator step, and return the new axial position.
+    double step();
+
+    //! Integrate from the inlet to each of the *n* axial positions *z*, which
+    //! must be increasing, storing the solution vector at each point in the
+    //! rows of *states* (n x neq(), row-major), and the coverages of the
+    //! surface species (if any) in the rows of *coverages*.
+    void solve(size_t n, const double* z, double* states, double* coverages);
+
+    //! The current axial position [m]
+    double distance() const {
+        return m_z;
+    }
+
+    //! The mass flow rate [kg/s] at the current position
+    double massFlowRate() const {
+        return m_mdot;
+    }
+
+    //! The residence time [s] at the current position
+    double residenceTime() const {
+        return m_tau;
+    }
+
+    //! The velocity [m/s] at the current position
+    double speed() const;
+
+    //! Index of the first gas species in the solution vector
+    static const size_t offset_Y = 3;
+
+    virtual void eval(double z, double* y, double* ydot, double* p);
+    virtual void getState(double* y);
+    virtual size_t neq() {
+        return m_nsp + offset_Y;
+    }
+
+protected:
+    //! Set the state of the gas (and the surface, if any) from the solution
+    //! vector *y* at the position *z*.
+    void updateState(double z, const double* y);
+
+    //! Reinitialize the integrator at the current position from the current
+    //! solution, after the integrator settings or the surface have changed.
+    void reinitialize();
+
+    double area(double z) const;
+    double surfaceArea(double z) const;
+
+    ThermoPhase& m_gas;
+    Kinetics& m_kin;
+    InterfaceKinetics* m_surfkin;
+    SurfPhase* m_surf;
+    size_t m_nsp;
+    size_t m_surfStart; //!< Index of the first gas species in m_surfkin
+
+    Func1* m_area;
+    Func1* m_surfArea;
+    Func1* m_U;
+    Func1* m_Tw;
+    bool m_energy;
+
+    Integrator* m_integ;
+    double m_rtol, m_atol, m_maxstep;
+    bool m_init;
+    bool m_integrator_init; //!< True if integrator initialization is current
+
+    vector_fp m_inlet; //!< Saved inlet state of the gas
+    double m_mdot0; //!< Inlet mass flow rate
+    double m_P; //!< Pressure
+
+    double m_z, m_mdot, m_tau;
+    vector_fp m_wdot; //!< Gas-phase net production rates
+    vector_fp m_sdot; //!< Surface net production rates
+    vector_fp m_hk; //!< Partial molar enthalpies
+};
+
+}
+
+#endif
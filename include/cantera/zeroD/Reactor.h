@@ -6,6 +6,7 @@
 #define CT_REACTOR_H
 
 #include "ReactorBase.h"
+#include "ReactorRhs.h"
 #include "cantera/kinetics/Kinetics.h"
 
 namespace Cantera
@@ -78,6 +79,38 @@ public:
         return m_energy;
     }
 
+    //! Set a user-defined function which modifies the governing equations
+    //! of this reactor.
+    /*!
+     * The function *func* is called each time the governing equations are
+     * evaluated, after the time derivatives have been computed for the
+     * reactor model, and can modify any of them, e.g. to add source terms
+     * or to replace the energy equation. It is passed the state and time
+     * derivatives of the reactor along with the thermodynamic properties and
+     * net production rates at the current state (see ReactorRhsData). Since
+     * these arrays are computed by the reactor without any additional
+     * allocation or copying, a function compiled from C (or Cython) runs at
+     * the same speed as the reactor's built-in equations. Since the Jacobian
+     * used by the integrator is computed by finite differences, the function
+     * should be a smooth function of the state. The function is not used by
+     * FlowReactor. Adjoint sensitivity analysis (see
+     * ReactorNet::adjointSensitivities) cannot be used for networks
+     * containing reactors with such a function.
+     *
+     * @param func  Function to call, or `nullptr` to remove the function
+     * @param userData  Pointer which is passed to *func* as
+     *     ReactorRhsData::userData
+     */
+    void setRhsFunction(ReactorRhsFunction func, void* userData=0) {
+        m_rhsFunc = func;
+        m_rhsData.userData = userData;
+    }
+
+    //! Returns `true` if a function has been set using setRhsFunction()
+    bool hasRhsFunction() const {
+        return m_rhsFunc != 0;
+    }
+
     //! Number of equations (state variables) for this reactor
     virtual size_t neq() {
         return m_nv;
@@ -139,12 +172,39 @@ public:
      */
     std::vector<std::pair<void*, int> > getSensitivityOrder() const;
 
+    //! Number of reactions in the homogeneous phase, which are the parameters
+    //! used for adjoint sensitivity analysis (see
+    //! ReactorNet::adjointSensitivities).
+    size_t nReactions() const {
+        return m_kin ? m_kin->nReactions() : 0;
+    }
+
+    //! Evaluate the derivatives of the governing equations with respect to
+    //! the rate of each reaction in the homogeneous phase, weighted by the
+    //! adjoint variables *lambda*.
+    /*!
+     * Computes \f$ \sum_j \lambda_j \partial \dot{y}_j / \partial p_i \f$
+     * for each reaction *i*, where \f$ p_i \f$ is a factor multiplying the
+     * rate multiplier of reaction *i*, evaluated at \f$ p_i = 1 \f$. Uses the
+     * state of the reactor set by the most recent call to updateState().
+     *
+     * @param[in] lambda adjoint variables for this reactor, length neq()
+     * @param[out] grad  weighted derivatives, length nReactions()
+     */
+    virtual void evalReactionGradient(const double* lambda, double* grad);
+
     //! Return the index in the solution vector for this reactor of the
     //! component named *nm*. Possible values for *nm* are "mass", "volume",
     //! "int_energy", the name of a homogeneous phase species, or the name of a
     //! surface species.
     virtual size_t componentIndex(const std::string& nm) const;
 
+    //! Return the location of the coverages of each surface on the walls of
+    //! this reactor. Each pair contains the index of the coverage of the first
+    //! species of the surface in the solution vector for this reactor and the
+    //! number of species in the surface phase.
+    std::vector<std::pair<size_t, size_t> > surfaceCoverageRanges();
+
 protected:
     //! Set reaction rate multipliers based on the sensitivity variables in
     //! *params*.
@@ -176,6 +236,20 @@ protected:
     //! Get initial conditions for SurfPhase objects attached to this reactor
     virtual void getSurfaceInitialConditions(double* y);
 
+    //! Compute the derivatives of the governing equations with respect to the
+    //! net production rate of each species in the homogeneous phase,
+    //! weighted by the adjoint variables *lambda*, that is
+    //! \f$ w_k = \sum_j \lambda_j \partial \dot{y}_j / \partial \dot{\omega}_k
+    //! \f$. Used by evalReactionGradient().
+    virtual void getProductionRateWeights(const double* lambda, double* w);
+
+    //! Call the function set by setRhsFunction(), if any. Called at the end of
+    //! evalEqs() with the state vector *y* and time derivatives *ydot* of
+    //! this reactor, and the locations of the energy variable and the first
+    //! mass fraction in the state vector.
+    void evalRhsFunction(double t, const double* y, double* ydot,
+                         size_t energyIndex, size_t speciesIndex);
+
     //! Pointer to the homogeneous Kinetics object that handles the reactions
     Kinetics* m_kin;
 
@@ -197,6 +271,16 @@ protected:
     std::vector<size_t> m_pnum;
     std::vector<size_t> m_nsens_wall;
     vector_fp m_mult_save;
+
+    //! Work arrays used by evalReactionGradient()
+    vector_fp m_rateWeights, m_ropNet;
+
+    //! Function set by setRhsFunction() and the data passed to it
+    ReactorRhsFunction m_rhsFunc;
+    ReactorRhsData m_rhsData;
+
+    //! Partial molar enthalpies and internal energies passed to #m_rhsFunc
+    vector_fp m_rhsHk, m_rhsUk;
 };
 }
 
@@ -8,11 +8,41 @@
 #include "Reactor.h"
 #include "cantera/numerics/FuncEval.h"
 #include "cantera/numerics/Integrator.h"
+#include "cantera/numerics/IsatTable.h"
 #include "cantera/base/Array.h"
 
 namespace Cantera
 {
 
+class ReactionPathAccumulator;
+class DenseMatrix;
+
+//! Convergence diagnostics for ReactorNet::solveSteady()
+struct SteadyStateStats
+{
+    SteadyStateStats() : newtonIterations(0), jacobianEvals(0), timeSteps(0),
+        steadyAttempts(0), stepNorm(0.0), residual(0.0) {}
+
+    //! Total number of Newton iterations, including those used for the
+    //! pseudo-transient time steps
+    int newtonIterations;
+
+    //! Number of Jacobian evaluations
+    int jacobianEvals;
+
+    //! Number of successful pseudo-transient time steps
+    int timeSteps;
+
+    //! Number of attempts to solve the steady-state problem directly
+    int steadyAttempts;
+
+    //! Weighted norm of the last Newton step. Less than 1 when converged.
+    double stepNorm;
+
+    //! Maximum absolute value of the time derivatives at the final state
+    double residual;
+};
+
 //! A class representing a network of connected reactors.
 /*!
  *  This class is used to integrate the time-dependent governing equations for
@@ -39,6 +69,52 @@ public:
     //! integrator in a single time step.
     void setMaxErrTestFails(int nmax);
 
+    //! Set the maximum order of the BDF method used by the integrator, in the
+    //! range 1 to 5 (the default).
+    void setMaxOrder(int order);
+
+    //! Maximum order of the integration method
+    int maxOrder() const {
+        return m_maxOrder;
+    }
+
+    //! Set the maximum number of internal time steps the integrator may take
+    //! to reach the output time requested by advance().
+    void setMaxSteps(int nmax);
+
+    //! Maximum number of internal time steps for each call to advance()
+    int maxSteps() const {
+        return m_maxSteps;
+    }
+
+    //! Set the size of the first internal time step taken after the
+    //! integrator is initialized or reinitialized. The default of 0.0 lets
+    //! the integrator estimate a suitable value.
+    void setInitialStepSize(double h0);
+
+    //! Size of the first internal time step, or 0.0 if it is estimated by the
+    //! integrator.
+    double initialStepSize() const {
+        return m_initialStep;
+    }
+
+    //! Set the numbers of diagonals above (*upper*) and below (*lower*) the
+    //! main diagonal included in the approximate Jacobian used by the `band`
+    //! linear solver. A negative value (the default) includes all of them.
+    void setBandwidth(int upper, int lower);
+
+    //! Number of diagonals above the main diagonal used by the `band` linear
+    //! solver, or -1 if all of them are used.
+    int bandwidthUpper() const {
+        return m_bandUpper;
+    }
+
+    //! Number of diagonals below the main diagonal used by the `band` linear
+    //! solver, or -1 if all of them are used.
+    int bandwidthLower() const {
+        return m_bandLower;
+    }
+
     //! Set the relative and absolute tolerances for the integrator.
     void setTolerances(double rtol, double atol);
 
@@ -46,6 +122,39 @@ public:
     //! sensitivity equations.
     void setSensitivityTolerances(double rtol, double atol);
 
+    //! Set the method used to solve the linear systems in the integrator's
+    //! Newton iterations.
+    /*!
+     * - `dense` (default): direct solution using the full Jacobian matrix of
+     *   the network, evaluated by finite differences. The work required grows
+     *   with the square (evaluation) and the cube (factorization) of the
+     *   total number of equations.
+     * - `gmres`: the iterative GMRES solver, preconditioned using the blocks
+     *   of the Jacobian matrix that correspond to each reactor and to
+     *   the connections between reactors made by flow devices and walls. The
+     *   preconditioner is a block Gauss-Seidel sweep in the order in which
+     *   the reactors were added to the network, so it works best if
+     *   reactors are added in the direction of the flow. The work and memory
+     *   required grow linearly with the number of reactors and connections,
+     *   which makes this option suitable for large networks.
+     * - `band`: direct solution using a banded approximation to the Jacobian
+     *   matrix, evaluated by finite differences, with the bandwidths set by
+     *   setBandwidth().
+     * - `diag`: a diagonal approximation to the Jacobian matrix, evaluated
+     *   using a single evaluation of the governing equations. This is
+     *   inexpensive, but is only suitable for problems which are not stiff.
+     *
+     * The steady-state solver (solveSteady()) uses the `gmres` block
+     * Jacobian if that option is selected, and the full Jacobian otherwise.
+     */
+    void setLinearSolverType(const std::string& type);
+
+    //! The method used to solve the linear systems in the integrator's Newton
+    //! iterations. See setLinearSolverType().
+    const std::string& linearSolverType() const {
+        return m_linearSolverType;
+    }
+
     //! Current value of the simulation time.
     doublereal time() {
         return m_time;
@@ -88,6 +197,14 @@ public:
     //! Add the reactor *r* to this reactor network.
     void addReactor(Reactor& r);
 
+    //! Integrate the rates of progress of the reactions in reactor *r* over
+    //! time using *acc*, which must have been created for the Kinetics object
+    //! of *r*. The rates of progress, multiplied by the reactor volume, are
+    //! sampled at the current time and after each internal time step taken by
+    //! advance() or step(), so that the integrated element fluxes (in kmol)
+    //! can be obtained from *acc* at any time.
+    void addReactionPathAccumulator(Reactor& r, ReactionPathAccumulator& acc);
+
     //! Return a reference to the *n*-th reactor in this network. The reactor
     //! indices are determined by the order in which the reactors were added
     //! to the reactor network.
@@ -115,6 +232,86 @@ public:
     //! the values in the solution vector *y*.
     void updateState(doublereal* y);
 
+    //! @name Checkpoints
+    //! @{
+
+    //! Save the state of the network, so that the integration can be
+    //! continued from the current time using restore().
+    /*!
+     * The checkpoint contains the current time, the global state vector, the
+     * sensitivities of the state with respect to the sensitivity parameters,
+     * and the step size the integrator will attempt for its next time step.
+     * It is a compact binary representation of these values (stored using
+     * the native byte order and floating point format) which is intended to
+     * be used by the same version of Cantera on the same machine, for
+     * example to restart a long simulation or to integrate many different
+     * continuations from a common state.
+     *
+     * Other properties of the network, such as the reactors and the devices
+     * connecting them, are not included.
+     */
+    std::string checkpoint();
+
+    //! Restore the state of the network from a checkpoint created by
+    //! checkpoint().
+    /*!
+     * The network must have the same structure (reactors, sensitivity
+     * parameters, and number of equations) as the one used to create the
+     * checkpoint. The state of the reactors is set to the saved state, and
+     * the integrator is reinitialized at the saved time, with the
+     * sensitivities set to their saved values and the first time step set
+     * to the size of the step that would have been taken next when the
+     * checkpoint was created. Since CVODES does not provide a way to restore
+     * its history of previous steps, the integrator restarts with a first
+     * order method, and the solution differs from an uninterrupted
+     * integration by amounts within the integrator tolerances.
+     */
+    void restore(const std::string& data);
+    //! @}
+
+    //! Counters describing the work done by the integrator during the most
+    //! recent call to advance() or step(). See IntegratorStats.
+    const IntegratorStats& integratorStats() const {
+        return m_integStats;
+    }
+
+    //! Solve directly for the steady state of the reactor network.
+    /*!
+     * Uses a damped Newton method to find the state where the time
+     * derivatives of all variables are zero, starting from the current
+     * state. If the Newton iteration does not converge, pseudo-transient
+     * backward Euler time steps are taken to bring the solution closer to
+     * the steady state before trying again, as in the solver used for
+     * 1D problems (see MultiNewton). The Jacobian is evaluated in the same
+     * way as for the integrator, that is as a dense matrix or, if the
+     * linear solver type is `gmres`, as the blocks for each reactor and
+     * each connection, in which case the Newton iterations use the block
+     * Gauss-Seidel approximation to the Jacobian.
+     *
+     * Variables whose time derivatives do not depend on the state of the
+     * network, such as the volume of a reactor without moving walls, are
+     * held at their initial values. Each reactor must have at least one
+     * inlet or outlet, since the steady state of a closed reactor is not
+     * uniquely determined by its governing equations.
+     *
+     * Convergence is determined using the relative and absolute
+     * tolerances set by setTolerances(). On return, the reactors are set to
+     * the steady-state solution and the integrator is reinitialized before
+     * further integration. Diagnostics are available from steadyStats().
+     *
+     * @param loglevel  Amount of diagnostic output written to the log
+     */
+    void solveSteady(int loglevel=0);
+
+    //! Convergence diagnostics for the most recent call to solveSteady()
+    const SteadyStateStats& steadyStats() const {
+        return m_steadyStats;
+    }
+
+    //! Set the maximum number of pseudo-transient time steps, and the size of
+    //! the first step, used by solveSteady().
+    void setSteadyTimeStepping(int maxSteps, double dt0);
+
     //! Return the sensitivity of the *k*-th solution component with respect to
     //! the *p*-th sensitivity parameter.
     /*!
@@ -138,6 +335,132 @@ public:
         return sensitivity(k, p);
     }
 
+    //! @name Adjoint sensitivity analysis
+    //! @{
+
+    //! Integrate to time *tf* and compute the sensitivities of a linear
+    //! function of the state at *tf* with respect to the rates of all
+    //! reactions, using adjoint sensitivity analysis.
+    /*!
+     * Computes the derivatives of \f$ G = \sum_k g_k y_k(t_f) \f$ with
+     * respect to parameters \f$ p_i \f$ which multiply the rate of each
+     * reaction, evaluated at \f$ p_i = 1 \f$. The network is integrated
+     * forward in time, starting from the current state, and then the
+     * adjoint equations are integrated backward in time, so the cost does
+     * not depend on the number of parameters. The parameters are all of the
+     * reactions in the homogeneous phase of each reactor, in the order in
+     * which the reactors were added to the network (see nAdjointParams()).
+     * Parameters added using Reactor::addSensitivityReaction are not used.
+     *
+     * The adjoint equations are derived from the built-in governing
+     * equations of each reactor, so an exception is thrown if any reactor
+     * has a function set using Reactor::setRhsFunction().
+     *
+     * On return, the network is at time *tf*.
+     *
+     * @param tf Final time [s]
+     * @param dgdy Coefficients \f$ g_k \f$ for each component of the global
+     *     state vector. Length neq().
+     * @param[out] sens Sensitivities \f$ dG/dp_i \f$. Length
+     *     nAdjointParams().
+     */
+    void adjointSensitivities(double tf, const vector_fp& dgdy,
+                              vector_fp& sens);
+
+    //! Integrate until component *k* of the global state vector reaches
+    //! *value*, and compute the sensitivities of the time at which this
+    //! happens (for example, an ignition delay time) with respect to the
+    //! rates of all reactions, using adjoint sensitivity analysis.
+    /*!
+     * The time of the event \f$ t_e \f$ is found by linear interpolation
+     * between the integrator time steps before and after component *k*
+     * crosses *value*. Its sensitivities are computed from the
+     * sensitivities of \f$ y_k(t_e) \f$ as
+     * \f$ dt_e/dp_i = -(\partial y_k(t_e)/\partial p_i) / \dot{y}_k(t_e) \f$.
+     * See adjointSensitivities() for the definition of the parameters. As
+     * for adjointSensitivities(), reactors with a function set using
+     * Reactor::setRhsFunction() are not supported.
+     *
+     * On return, the network is at the end of the time step in which the
+     * event occurred.
+     *
+     * @param tmax Time [s] by which the event must occur
+     * @param k Index of the component in the global state vector
+     * @param value Value of component *k* defining the event
+     * @param[out] sens Sensitivities \f$ dt_e/dp_i \f$. Length
+     *     nAdjointParams().
+     * @returns the time of the event [s]
+     */
+    double adjointEventSensitivities(double tmax, size_t k, double value,
+                                     vector_fp& sens);
+
+    //! Number of parameters for adjoint sensitivity analysis, which is the
+    //! total number of homogeneous phase reactions in all reactors.
+    virtual size_t nAdjointParams() {
+        return m_adjStart.empty() ? 0 : m_adjStart.back();
+    }
+
+    virtual void evalAdjoint(double t, double* y, const double* lambda,
+                             double* lambdaDot);
+    virtual void evalAdjointGradient(double t, double* y,
+                                     const double* lambda, double* grad);
+    //! @}
+
+    //! @name In situ adaptive tabulation
+    //! @{
+
+    //! Enable or disable in situ adaptive tabulation (ISAT) for
+    //! advanceTabulated().
+    /*!
+     * The table approximates the mapping from the temperature, pressure and
+     * mass fractions of the reactor and the time step to the temperature,
+     * pressure and mass fractions at the end of the time step, which is
+     * evaluated by direct integration when the table cannot provide an
+     * accurate approximation. See IsatTable for a description of the
+     * algorithm. The inputs are scaled as $ (\ln T, \ln P, \ln \Delta t,
+     * Y_k) $ and the outputs as $ (\ln T, \ln P, Y_k) $, so the
+     * tolerance is approximately a relative error in the temperature and
+     * pressure and an absolute error in the mass fractions.
+     *
+     * The reactor must be added to the network before calling this method.
+     * Any existing table is discarded.
+     *
+     * @param tol Error tolerance. A value of zero disables tabulation.
+     * @param maxMemory Maximum memory used by the table, in megabytes. When
+     *     the table is full, the least recently used records are replaced.
+     */
+    void setTabulation(double tol, double maxMemory=100.0);
+
+    //! Advance the state of the reactor by the time interval *dt*, starting
+    //! from the current contents of the reactor, using the tabulation
+    //! enabled by setTabulation().
+    /*!
+     * This is intended for operator-split calculations, where the same
+     * network is used to integrate the chemistry for many different initial
+     * states, e.g. `reactor.contents().setState_TPY(...)`,
+     * `reactor.syncState()`, `advanceTabulated(dt)`. The network must contain
+     * a single reactor without walls or flow devices, so that the result
+     * depends only on the initial temperature, pressure and composition. If
+     * tabulation is not enabled, the reactor is integrated directly.
+     *
+     * The simulation time is increased by *dt*, and the integrator is
+     * reinitialized before further calls to advance() or step().
+     */
+    void advanceTabulated(double dt);
+
+    //! Counters describing the use of the table since tabulation was
+    //! enabled. See IsatStats.
+    IsatStats tabulationStats() const {
+        return m_isat ? m_isat->stats() : IsatStats();
+    }
+
+    //! The table used by advanceTabulated(), or `nullptr` if tabulation is
+    //! not enabled
+    IsatTable* tabulation() {
+        return m_isat.get();
+    }
+    //! @}
+
     //! Evaluate the Jacobian matrix for the reactor network.
     /*!
      *  @param[in] t Time at which to evaluate the Jacobian
@@ -165,6 +488,10 @@ public:
         return m_ntotpar;
     }
 
+    virtual bool setupPreconditioner(double t, double* y, double gamma,
+                                     bool jacOk);
+    virtual void solvePreconditioner(const double* r, double* z);
+
     //! Return the index corresponding to the component named *component* in the
     //! reactor with index *reactor* in the global state vector for the
     //! reactor network.
@@ -198,7 +525,103 @@ protected:
     //! advance or step is called.
     void initialize();
 
+    //! Set #m_integStats to the work done by the integrator since its
+    //! statistics were equal to *start*
+    void updateIntegratorStats(const IntegratorStats& start);
+
+    //! Determine which reactors are coupled to each other by flow devices and
+    //! walls, and allocate the storage for the blocks of the Jacobian used by
+    //! the preconditioner.
+    void initBlockJacobian();
+
+    //! Add the indices of the reactors whose states determine the mass flow
+    //! rate through *dev* to *coupled*.
+    void addFlowDeviceCoupling(FlowDevice& dev, std::vector<size_t>& coupled);
+
+    //! Evaluate the blocks of the Jacobian used by the preconditioner by
+    //! finite differences. Perturbing the variables of each reactor only
+    //! requires evaluating the equations of the reactors which depend on it.
+    void evalBlockJacobian(double t, double* y);
+
+    //! Perturbation of component *k* of the state vector, which has the
+    //! value *y*, used to compute finite difference Jacobians. The
+    //! perturbations used by solveSteady() are larger than those used for
+    //! the integrator, which depend on the integration tolerances.
+    double jacobianPerturbation(size_t k, double y) const;
+
+    //! Factor the diagonal blocks of the matrix `rdt*I - J`, where *J* is the
+    //! Jacobian evaluated by evalBlockJacobian(). When called from
+    //! solveSteady(), the rows for the constrained variables are replaced
+    //! using applySteadyConstraints().
+    void factorBlockJacobian(double rdt);
+
+    //! Solve `(rdt*I - J) x = b` approximately by block forward substitution,
+    //! using the factorization computed by factorBlockJacobian(). On input,
+    //! *x* contains *b*.
+    void solveBlockJacobian(double* x);
+
+    //! Evaluate the time derivatives *ydot* at the state *y*, using the
+    //! nominal values of the sensitivity parameters.
+    void evalSteadyRates(double* y, double* ydot);
+
+    //! Evaluate the Jacobian used by solveSteady() at the state *y*.
+    void evalSteadyJacobian(double* y);
+
+    //! Factor the matrix `rdt*I - J` using the Jacobian evaluated by
+    //! evalSteadyJacobian().
+    void factorSteadyJacobian(double rdt);
+
+    //! Replace the rows of the square matrix *M* (column-major, size *n*),
+    //! which corresponds to the variables starting at *i0* in the global
+    //! state vector, with the rows for the constraints imposed by
+    //! solveSteady() on the fixed variables and the surface coverages.
+    void applySteadyConstraints(double* M, size_t i0, size_t n);
+
+    //! Compute the undamped Newton step `-(rdt*I - J)^-1 R(y)` for the
+    //! residual of the steady (*rdt* = 0) or pseudo-transient problem.
+    //! Returns false if the residual could not be evaluated.
+    bool steadyNewtonStep(double* y, const double* yprev, double rdt,
+                          double* step);
+
+    //! Weighted norm of *step*, used to test for convergence
+    double steadyNorm(const double* y, const double* step) const;
+
+    //! Solve the steady (*rdt* = 0) or pseudo-transient problem using a
+    //! damped Newton method, starting from *y*. Returns true if the solution
+    //! converged, in which case *y* contains the solution.
+    bool steadyNewton(double* y, const double* yprev, double rdt,
+                      int loglevel);
+
+    //! Restart the integrator from the current state, storing the data
+    //! required for adjoint sensitivity analysis during the following
+    //! forward integration.
+    void startAdjoint();
+
+    //! Throw an exception if adjoint sensitivity analysis, used by the
+    //! function *method*, is not supported for this network
+    void checkAdjoint(const std::string& method);
+
+    //! Integrate the adjoint equations backward from time *tB0*, where the
+    //! adjoint variables have the values *lambda*, and compute the adjoint
+    //! sensitivities *sens*. The integrator must be reinitialized before
+    //! further forward integration.
+    void solveAdjoint(double tB0, vector_fp& lambda, vector_fp& sens);
+
+    //! Integrate the single reactor in the network from the state given by
+    //! the tabulation inputs *x* (see setTabulation()) and compute the
+    //! tabulation outputs *f* at the end of the time step.
+    void evalTabulationMapping(const double* x, double* f);
+
+    //! Add samples at the current time to the reaction path accumulators. If
+    //! *initial* is true, samples are only added to accumulators which have
+    //! no samples.
+    void sampleAccumulators(bool initial=false);
+
     std::vector<Reactor*> m_reactors;
+
+    //! Reaction path accumulators and the reactors they are attached to
+    std::vector<std::pair<Reactor*, ReactionPathAccumulator*> > m_accumulators;
+
     Integrator* m_integ;
     doublereal m_time;
     bool m_init;
@@ -216,6 +639,20 @@ protected:
     doublereal m_maxstep;
 
     int m_maxErrTestFails;
+    int m_maxOrder; //!< Maximum order of the BDF method
+    int m_maxSteps; //!< Maximum number of steps for each call to advance()
+
+    //! Size of the first internal time step. Default of 0.0 means that the
+    //! integrator estimates a value.
+    double m_initialStep;
+
+    //! Bandwidths of the Jacobian used by the `band` linear solver, where -1
+    //! means the full width
+    int m_bandUpper, m_bandLower;
+
+    //! Integrator statistics for the most recent call to advance() or step()
+    IntegratorStats m_integStats;
+
     bool m_verbose;
     size_t m_ntotpar;
     std::vector<size_t> m_nparams;
@@ -233,6 +670,109 @@ protected:
     std::vector<size_t> m_sensIndex;
 
     vector_fp m_ydot;
+
+    //! Linear solver type. See setLinearSolverType().
+    std::string m_linearSolverType;
+
+    //! Index of each reactor in #m_reactors
+    std::map<const ReactorBase*, size_t> m_reactorIndex;
+
+    //! `m_lowerBlocks[n]` lists the reactors `m < n` whose state affects
+    //! the governing equations for reactor `n`, and the location of the
+    //! corresponding block in #m_jacLower.
+    std::vector<std::vector<std::pair<size_t, size_t> > > m_lowerBlocks;
+
+    //! `m_dependents[m]` lists the reactors `n > m` whose governing
+    //! equations depend on the state of reactor `m`.
+    std::vector<std::vector<size_t> > m_dependents;
+
+    //! Diagonal blocks of the Jacobian (column-major). The block for reactor
+    //! `n` starts at `m_diagLoc[n]`.
+    vector_fp m_jacDiag;
+
+    //! LU factorizations of the diagonal blocks of `rdt*I - J`
+    vector_fp m_precDiag;
+    std::vector<size_t> m_diagLoc;
+    vector_int m_precPivots;
+
+    //! Blocks of the Jacobian below the diagonal (column-major)
+    vector_fp m_jacLower;
+
+    //! Value of `gamma` for the current preconditioner
+    double m_gamma;
+
+    //! Work arrays used in evaluating the Jacobian blocks
+    vector_fp m_yjac, m_ydot0;
+
+    //! @name Steady-state solver
+    //! @{
+
+    //! Dense Jacobian and its LU factorization, used by solveSteady() if
+    //! the linear solver type is `dense`
+    std::unique_ptr<DenseMatrix> m_steadyJac, m_steadyLU;
+
+    //! Values of the variables held fixed by solveSteady(), or NaN for
+    //! variables which are solved for
+    vector_fp m_steadyFixed;
+
+    //! Location of the coverages of each surface in the global state vector,
+    //! as the index of the first species and the number of species. For the
+    //! first species, the steady-state equation is replaced by the
+    //! requirement that the coverages sum to one.
+    std::vector<std::pair<size_t, size_t> > m_steadySurfaces;
+
+    //! Typical magnitude of each variable, used to compute the perturbations
+    //! for the finite difference Jacobian evaluated by solveSteady()
+    vector_fp m_steadyScale;
+
+    //! Lower bounds for each variable. Variables which must remain positive
+    //! (mass, volume and temperature) have a bound of zero, and may decrease
+    //! by at most half of their value in one step. Other variables are
+    //! clipped at their lower bounds.
+    vector_fp m_steadyLower;
+
+    //! Number of Newton iterations since the Jacobian was evaluated
+    int m_steadyJacAge;
+
+    //! Maximum number of pseudo-transient time steps
+    int m_steadyMaxSteps;
+
+    //! Initial pseudo-transient time step [s]
+    double m_steadyDt0;
+
+    SteadyStateStats m_steadyStats;
+    //! @}
+
+    //! @name Adjoint sensitivity analysis
+    //! @{
+
+    //! `m_adjStart[n]` is the index of the first parameter for reactor `n`
+    //! used in adjoint sensitivity analysis
+    std::vector<size_t> m_adjStart;
+
+    //! Jacobian of the network evaluated at the state #m_adjY and time
+    //! #m_adjTime, which is reused while evaluating the adjoint equations at
+    //! the same point
+    Array2D m_adjJac;
+    vector_fp m_adjY;
+    double m_adjTime;
+
+    //! Work array for evaluating the Jacobian
+    vector_fp m_adjYdot;
+
+    //! Nominal values of the sensitivity parameters
+    vector_fp m_adjParams;
+    //! @}
+
+    //! @name In situ adaptive tabulation
+    //! @{
+
+    //! Table used by advanceTabulated()
+    std::unique_ptr<IsatTable> m_isat;
+
+    //! Tabulation inputs and outputs, and the gradient of the outputs
+    vector_fp m_isatX, m_isatF, m_isatA;
+    //! @}
 };
 }
 
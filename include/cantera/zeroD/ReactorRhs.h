@@ -0,0 +1,72 @@
+/**
+ * @file ReactorRhs.h
+ * Interface for compiled, user-defined terms in the governing equations of a
+ * Reactor (see Reactor::setRhsFunction). This header can be included from
+ * both C and C++ code.
+ */
+
+#ifndef CT_REACTORRHS_H
+#define CT_REACTORRHS_H
+
+#include <stddef.h>
+
+#ifdef __cplusplus
+namespace Cantera
+{
+#endif
+
+//! Data passed to a user-defined function which modifies the governing
+//! equations of a reactor.
+/*!
+ * The function is called at the end of each evaluation of the governing
+ * equations of the reactor, after the time derivatives have been computed
+ * using the reactor's own model, so the function can add terms to *ydot* or
+ * replace some or all of its values. All of the arrays provided are
+ * computed at the current state of the reactor, and are owned by the
+ * reactor. They remain valid only for the duration of the call.
+ *
+ * The layout of the state vector depends on the type of reactor. The
+ * variable for the energy equation (internal energy, enthalpy or
+ * temperature) is at index *energyIndex*, and the mass fraction of species
+ * `k` is at index `speciesIndex + k`.
+ *
+ * @ingroup ZeroD
+ */
+typedef struct ReactorRhsData {
+    double time; //!< Time [s]
+    const double* y; //!< State vector of the reactor. Length *neq*.
+    double* ydot; //!< Time derivatives of the state vector. Length *neq*.
+    size_t neq; //!< Number of equations for this reactor
+    size_t nsp; //!< Number of species in the reactor's phase
+    size_t energyIndex; //!< Index of the energy variable in *y*
+    size_t speciesIndex; //!< Index of the first mass fraction in *y*
+    double mass; //!< Mass of the reactor contents [kg]
+    double volume; //!< Volume of the reactor [m^3]
+    double temperature; //!< Temperature [K]
+    double pressure; //!< Pressure [Pa]
+    double density; //!< Density [kg/m^3]
+    double cp_mass; //!< Specific heat at constant pressure [J/kg/K]
+    double cv_mass; //!< Specific heat at constant volume [J/kg/K]
+    const double* massFractions; //!< Mass fractions. Length *nsp*.
+    const double* molecularWeights; //!< Molecular weights [kg/kmol]
+    //! Net production rates due to homogeneous reactions [kmol/m^3/s], or
+    //! zero if chemistry is disabled
+    const double* netProductionRates;
+    const double* partialMolarEnthalpies; //!< [J/kmol]
+    const double* partialMolarIntEnergies; //!< [J/kmol]
+    void* userData; //!< Pointer given to Reactor::setRhsFunction
+} ReactorRhsData;
+
+//! Signature of a user-defined function which modifies the governing
+//! equations of a reactor. The function should return zero if successful.
+//! Any other value is treated as an error in evaluating the governing
+//! equations, after which the integrator tries again with a smaller time
+//! step. If the integrator cannot recover (e.g. if the function fails on its
+//! first call), the error raised includes the value returned by the function.
+typedef int (*ReactorRhsFunction)(ReactorRhsData* data);
+
+#ifdef __cplusplus
+}
+#endif
+
+#endif
@@ -57,6 +57,11 @@ public:
         m_master = master;
     }
 
+    //! The flow device which determines the nominal mass flow rate
+    FlowDevice* master() const {
+        return m_master;
+    }
+
     virtual void updateMassFlowRate(doublereal time) {
         if (!ready()) {
             throw CanteraError("PressureController::updateMassFlowRate",
@@ -3,6 +3,8 @@ from ._cantera import __version__, __sundials_version__
 from .composite import *
 from .liquidvapor import *
 from .onedim import *
+from .reduction import *
+from .tables import *
 from .utils import *
 
 import os
@@ -56,9 +56,38 @@ cdef extern from "cantera/cython/funcWrapper.h":
     ctypedef double (*callback_wrapper)(double, void*, void**)
     cdef int translate_exception()
 
-    cdef cppclass CxxFunc1 "Func1Py":
-        CxxFunc1(callback_wrapper, void*)
+cdef extern from "cantera/numerics/Func1.h":
+    cdef cppclass CxxFunc1 "Cantera::Func1":
         double eval(double) except +translate_exception
+        CxxFunc1& duplicate()
+
+    cdef cppclass CxxConst1 "Cantera::Const1" (CxxFunc1):
+        CxxConst1(double)
+
+    cdef cppclass CxxPoly1 "Cantera::Poly1" (CxxFunc1):
+        CxxPoly1(size_t, double*)
+
+    cdef cppclass CxxFourier1 "Cantera::Fourier1" (CxxFunc1):
+        CxxFourier1(size_t, double, double, double*, double*)
+
+    cdef cppclass CxxTabulated1 "Cantera::Tabulated1" (CxxFunc1):
+        CxxTabulated1(size_t, double*, double*) except +
+
+    cdef cppclass CxxSum1 "Cantera::Sum1" (CxxFunc1):
+        CxxSum1(CxxFunc1&, CxxFunc1&)
+
+    cdef cppclass CxxDiff1 "Cantera::Diff1" (CxxFunc1):
+        CxxDiff1(CxxFunc1&, CxxFunc1&)
+
+    cdef cppclass CxxProduct1 "Cantera::Product1" (CxxFunc1):
+        CxxProduct1(CxxFunc1&, CxxFunc1&)
+
+    cdef cppclass CxxComposite1 "Cantera::Composite1" (CxxFunc1):
+        CxxComposite1(CxxFunc1&, CxxFunc1&)
+
+cdef extern from "cantera/cython/funcWrapper.h":
+    cdef cppclass CxxFunc1Py "Func1Py" (CxxFunc1):
+        CxxFunc1Py(callback_wrapper, void*)
 
 cdef extern from "<memory>":
     cppclass shared_ptr "std::shared_ptr" [T]:
@@ -118,7 +147,7 @@ cdef extern from "cantera/thermo/ThermoPhase.h" namespace "Cantera":
         double maxTemp() except +
         double refPressure() except +
         cbool getElementPotentials(double*) except +
-        void equilibrate(string, string, double, int, int, int, int) except +
+        void equilibrate(string, string, double, int, int, int, int) nogil except +
 
         # initialization
         void addUndefinedElements() except +
@@ -126,6 +155,9 @@ cdef extern from "cantera/thermo/ThermoPhase.h" namespace "Cantera":
         void modifySpecies(size_t, shared_ptr[CxxSpecies]) except +
         void initThermo() except +
         void invalidateCache() except +
+        void setStateCacheSize(size_t) except +
+        size_t stateCacheSize()
+        void getStateCacheStats(size_t&, size_t&)
 
         # basic thermodynamic properties
         double temperature() except +
@@ -225,6 +257,14 @@ cdef extern from "cantera/thermo/IdealGasPhase.h":
     cdef cppclass CxxIdealGasPhase "Cantera::IdealGasPhase"
 
 
+cdef extern from "cantera/thermo/PureFluidPhase.h":
+    cdef cppclass CxxPureFluidPhase "Cantera::PureFluidPhase":
+        double tabulate(double, double, double, double, size_t, size_t,
+                        double) except +
+        cbool tabulated()
+        void clearTables()
+
+
 cdef extern from "cantera/thermo/SurfPhase.h":
     cdef cppclass CxxSurfPhase "Cantera::SurfPhase":
         CxxSurfPhase()
@@ -363,6 +403,9 @@ cdef extern from "cantera/kinetics/Kinetics.h" namespace "Cantera":
         void addReaction(shared_ptr[CxxReaction]) except +
         void modifyReaction(int, shared_ptr[CxxReaction]) except +
         void invalidateCache() except +
+        void setStateCacheSize(size_t) except +
+        size_t stateCacheSize()
+        void getStateCacheStats(size_t&, size_t&)
 
         shared_ptr[CxxReaction] reaction(size_t) except +
         cbool isReversible(int) except +
@@ -379,7 +422,7 @@ cdef extern from "cantera/kinetics/Kinetics.h" namespace "Cantera":
 
 cdef extern from "cantera/kinetics/InterfaceKinetics.h":
     cdef cppclass CxxInterfaceKinetics "Cantera::InterfaceKinetics":
-        void advanceCoverages(double) except +
+        void advanceCoverages(double) nogil except +
 
 
 cdef extern from "cantera/transport/TransportFactory.h":
@@ -395,6 +438,18 @@ cdef extern from "cantera/transport/TransportBase.h" namespace "Cantera":
         double electricalConductivity() except +
 
 
+cdef extern from "cantera/transport/GasTransport.h" namespace "Cantera":
+    cdef cppclass CxxGasTransport "Cantera::GasTransport":
+        double setupTime()
+
+
+cdef extern from "cantera/transport/MultiTransport.h" namespace "Cantera":
+    cdef cppclass CxxMultiTransport "Cantera::MultiTransport":
+        void setLMatrixSolver(size_t, double) except +
+        int nLMatrixFactorizations()
+        int nLMatrixIterations()
+
+
 cdef extern from "cantera/transport/DustyGasTransport.h" namespace "Cantera":
     cdef cppclass CxxDustyGasTransport "Cantera::DustyGasTransport":
         void setPorosity(double) except +
@@ -430,7 +485,7 @@ cdef extern from "cantera/equil/MultiPhase.h" namespace "Cantera":
         void init() except +
         void updatePhases() except +
 
-        void equilibrate(string, string, double, int, int, int, int) except +
+        void equilibrate(string, string, double, int, int, int, int) nogil except +
 
         size_t nSpecies()
         size_t nElements()
@@ -480,12 +535,19 @@ cdef extern from "cantera/zeroD/ReactorBase.h" namespace "Cantera":
         void setInitialVolume(double)
 
 
+cdef extern from "cantera/zeroD/ReactorRhs.h":
+    cdef struct CxxReactorRhsData "Cantera::ReactorRhsData":
+        pass
+    ctypedef int (*CxxReactorRhsFunction "Cantera::ReactorRhsFunction")(CxxReactorRhsData*)
+
+
 cdef extern from "cantera/zeroD/Reactor.h":
     cdef cppclass CxxReactor "Cantera::Reactor" (CxxReactorBase):
         CxxReactor()
         void setKineticsMgr(CxxKinetics&)
         void setEnergy(int)
         cbool energyEnabled()
+        void setRhsFunction(CxxReactorRhsFunction, void*)
         size_t componentIndex(string&)
         size_t neq()
         void getState(double*)
@@ -547,12 +609,46 @@ cdef extern from "cantera/zeroD/flowControllers.h":
         void setMaster(CxxFlowDevice*)
 
 
+cdef extern from "cantera/numerics/IsatTable.h":
+    cdef cppclass CxxIsatStats "Cantera::IsatStats":
+        size_t queries
+        size_t retrieves
+        size_t grows
+        size_t adds
+        size_t evictions
+
+    cdef cppclass CxxIsatTable "Cantera::IsatTable":
+        size_t nRecords()
+        size_t maxRecords()
+        size_t memory()
+
+
 cdef extern from "cantera/zeroD/ReactorNet.h":
+    cdef cppclass CxxIntegratorStats "Cantera::IntegratorStats":
+        long steps
+        long rhsEvals
+        long jacEvals
+        long linSolveSetups
+        long nonlinIters
+        long nonlinConvFails
+        long errTestFails
+        int lastOrder
+        double lastStepSize
+
+    cdef cppclass CxxSteadyStateStats "Cantera::SteadyStateStats":
+        int newtonIterations
+        int jacobianEvals
+        int timeSteps
+        int steadyAttempts
+        double stepNorm
+        double residual
+
     cdef cppclass CxxReactorNet "Cantera::ReactorNet":
         CxxReactorNet()
         void addReactor(CxxReactor&)
-        void advance(double) except +
-        double step(double) except +
+        void addReactionPathAccumulator(CxxReactor&, CxxReactionPathAccumulator&) except +
+        void advance(double) nogil except +
+        double step(double) nogil except +
         void reinitialize() except +
         double time()
         void setInitialTime(double)
@@ -561,10 +657,25 @@ cdef extern from "cantera/zeroD/ReactorNet.h":
         double atol()
         void setMaxTimeStep(double)
         void setMaxErrTestFails(int)
+        void setMaxOrder(int) except +
+        int maxOrder()
+        void setMaxSteps(int) except +
+        int maxSteps()
+        void setInitialStepSize(double) except +
+        double initialStepSize()
+        void setBandwidth(int, int)
+        int bandwidthUpper()
+        int bandwidthLower()
+        CxxIntegratorStats& integratorStats()
+        void setLinearSolverType(string&) except +
+        string linearSolverType()
         cbool verbose()
         void setVerbose(cbool)
         size_t neq()
         void getState(double*)
+        void solveSteady(int) except +
+        CxxSteadyStateStats& steadyStats()
+        void setSteadyTimeStepping(int, double) except +
 
         void setSensitivityTolerances(double, double)
         double rtolSensitivity()
@@ -573,6 +684,41 @@ cdef extern from "cantera/zeroD/ReactorNet.h":
         double sensitivity(string&, size_t, int) except +
         size_t nparams()
         string sensitivityParameterName(size_t) except +
+        size_t globalComponentIndex(string&, size_t) except +
+        void adjointSensitivities(double, vector[double]&,
+                                  vector[double]&) except +
+        double adjointEventSensitivities(double, size_t, double,
+                                         vector[double]&) except +
+        void setTabulation(double, double) except +
+        void advanceTabulated(double) except +
+        CxxIsatStats tabulationStats()
+        CxxIsatTable* tabulation()
+        string checkpoint() except +
+        void restore(string&) except +
+
+
+cdef extern from "cantera/zeroD/PlugFlowReactor.h":
+    cdef cppclass CxxPlugFlowReactor "Cantera::PlugFlowReactor":
+        CxxPlugFlowReactor(CxxThermoPhase&, CxxKinetics&) except +
+        void setSurface(CxxInterfaceKinetics&) except +
+        void setInletState()
+        void setMassFlowRate(double) except +
+        void setArea(CxxFunc1*)
+        void setSurfaceArea(CxxFunc1*)
+        void setHeatTransfer(CxxFunc1*, CxxFunc1*)
+        void setEnergy(cbool)
+        cbool energyEnabled()
+        void setTolerances(double, double)
+        void setMaxStepSize(double)
+        void initialize(double) except +
+        void advance(double) except +
+        double step() except +
+        void solve(size_t, double*, double*, double*) except +
+        double distance()
+        double massFlowRate()
+        double residenceTime()
+        double speed() except +
+        size_t neq()
 
 
 cdef extern from "cantera/thermo/ThermoFactory.h" namespace "Cantera":
@@ -691,7 +837,7 @@ cdef extern from "cantera/oneD/Sim1D.h":
         void setMaxTimeStepCount(int)
         int maxTimeStepCount()
         void getInitialSoln() except +
-        void solve(int, cbool) except +translate_exception
+        void solve(int, cbool) nogil except +translate_exception
         void refine(int) except +
         void setRefineCriteria(size_t, double, double, double, double) except +
         void save(string, string, string, int) except +
@@ -705,18 +851,29 @@ cdef extern from "cantera/oneD/Sim1D.h":
         vector[int]& jacobianCountStats()
         vector[int]& evalCountStats()
         vector[int]& timeStepStats()
+        vector[int]& newtonIterationStats()
+        vector[int]& linearSolveCountStats()
+        vector[double]& linearSolveTimeStats()
+        vector[double]& steadySolveTimeStats()
+        vector[double]& timeSteppingTimeStats()
+        vector[double]& regridTimeStats()
+        vector[stdmap[string,double]]& residualTimeStats()
 
         int domainIndex(string) except +
         double value(size_t, size_t, size_t) except +
         double workValue(size_t, size_t, size_t) except +
         void eval(double, int) except +
         void setJacAge(int, int)
+        void setBlockTridiagonal(cbool)
+        cbool blockTridiagonal()
         void setTimeStepFactor(double)
         void setMinTimeStep(double)
         void setMaxTimeStep(double)
         void setGridMin(int, double) except +
         void setFixedTemperature(double)
         void setInterrupt(CxxFunc1*) except +
+        void setTimeStepCallback(CxxFunc1*)
+        void setSteadyCallback(CxxFunc1*)
 
 cdef extern from "<sstream>":
     cdef cppclass CxxStringStream "std::stringstream":
@@ -746,12 +903,32 @@ cdef extern from "cantera/kinetics/ReactionPath.h":
         void add(CxxReactionPathDiagram&) except +
         void exportToDot(CxxStringStream&)
         void writeData(CxxStringStream&)
+        void getFlows(vector[size_t]&, vector[size_t]&, vector[double]&, vector[double]&)
+        void getReactionFlows(vector[size_t]&, vector[size_t]&, vector[size_t]&, vector[int]&, vector[double]&)
         void displayOnly(size_t)
 
     cdef cppclass CxxReactionPathBuilder "Cantera::ReactionPathBuilder":
         void init(CxxStringStream&, CxxKinetics&) except +
         void build(CxxKinetics&, string&, CxxStringStream&, CxxReactionPathDiagram&, cbool)
 
+    cdef cppclass CxxReactionPathAccumulator "Cantera::ReactionPathAccumulator":
+        CxxReactionPathAccumulator(CxxKinetics&) except +
+        void addSample(double, double) except +
+        void reset()
+        size_t nSamples()
+        double start()
+        double end()
+        void getFwdRatesOfProgress(double*)
+        void getRevRatesOfProgress(double*)
+        int build(string&, CxxStringStream&, CxxReactionPathDiagram&, cbool) except +
+        void getElementFluxes(string&, double*) except +
+
+cdef extern from "cantera/numerics/LookupTable.h":
+    cdef cppclass CxxLookupTable "Cantera::LookupTable":
+        CxxLookupTable(vector[vector[double]]&, size_t, double*) except +
+        size_t nDim()
+        size_t nVars()
+        void interpolate(size_t, double*, size_t, size_t*, double*) nogil except +
 
 cdef extern from "cantera/cython/wrappers.h":
     # config definitions
@@ -823,10 +1000,32 @@ cdef extern from "cantera/cython/wrappers.h":
     cdef void tran_getMultiDiffCoeffs(CxxTransport*, size_t, double*) except +
     cdef void tran_getBinaryDiffCoeffs(CxxTransport*, size_t, double*) except +
 
+    # Transport properties for arrays of states
+    cdef void tran_batch_viscosity(CxxTransport*, size_t, double*, double*, double*, double*) nogil except +
+    cdef void tran_batch_thermalConductivity(CxxTransport*, size_t, double*, double*, double*, double*) nogil except +
+    cdef void tran_batch_electricalConductivity(CxxTransport*, size_t, double*, double*, double*, double*) nogil except +
+    cdef void tran_batch_getMixDiffCoeffs(CxxTransport*, size_t, double*, double*, double*, double*) nogil except +
+    cdef void tran_batch_getMixDiffCoeffsMass(CxxTransport*, size_t, double*, double*, double*, double*) nogil except +
+    cdef void tran_batch_getMixDiffCoeffsMole(CxxTransport*, size_t, double*, double*, double*, double*) nogil except +
+    cdef void tran_batch_getThermalDiffCoeffs(CxxTransport*, size_t, double*, double*, double*, double*) nogil except +
+    cdef void tran_batch_getMultiDiffCoeffs(CxxTransport*, size_t, double*, double*, double*, double*) nogil except +
+    cdef void tran_batch_getBinaryDiffCoeffs(CxxTransport*, size_t, double*, double*, double*, double*) nogil except +
+
+    # Chemical equilibrium for arrays of states
+    cdef void thermo_batchEquilibrate(CxxThermoPhase*, string, string, size_t, double*, double*, double*, double*, double*, double*, int*, double, int, int, cbool) nogil except +
+
+    # PureFluid states for arrays of property values
+    cdef void purefluid_batchSetState(CxxPureFluidPhase*, string, size_t, double*, double*, double*, double*, double*, double*, double*, double*) nogil except +
+    cdef void purefluid_saturationCurve(CxxPureFluidPhase*, size_t, double*, double*, double*, double*, double*) nogil except +
+
+    # Steady-state surface coverages for arrays of states
+    cdef void surf_batchSteadyCoverages(CxxInterfaceKinetics*, size_t, size_t, double*, double*, double*, double*, double*) nogil except +
+
 # typedefs
 ctypedef void (*thermoMethod1d)(CxxThermoPhase*, double*) except +
 ctypedef void (*transportMethod1d)(CxxTransport*, double*) except +
 ctypedef void (*transportMethod2d)(CxxTransport*, size_t, double*) except +
+ctypedef void (*transportBatchMethod)(CxxTransport*, size_t, double*, double*, double*, double*) nogil except +
 ctypedef void (*kineticsMethod1d)(CxxKinetics*, double*) except +
 
 # classes
@@ -900,6 +1099,7 @@ cdef class Func1:
     cdef CxxFunc1* func
     cdef object callable
     cdef object exception
+    cdef tuple children
 
 cdef class ReactorBase:
     cdef CxxReactorBase* rbase
@@ -911,6 +1111,7 @@ cdef class ReactorBase:
 cdef class Reactor(ReactorBase):
     cdef CxxReactor* reactor
     cdef object _kinetics
+    cdef object _rhs_function
 
 cdef class Reservoir(ReactorBase):
     pass
@@ -962,6 +1163,14 @@ cdef class PressureController(FlowDevice):
 cdef class ReactorNet:
     cdef CxxReactorNet net
     cdef list _reactors
+    cdef list _accumulators
+
+cdef class PlugFlowReactor:
+    cdef CxxPlugFlowReactor* pfr
+    cdef readonly _SolutionBase gas
+    cdef readonly _SolutionBase surface
+    cdef dict _funcs
+    cdef CxxFunc1* _func(self, name, f)
 
 cdef class Domain1D:
     cdef CxxDomain1D* domain
@@ -1005,6 +1214,8 @@ cdef class Sim1D:
     cdef object _initial_guess_args
     cdef object _initial_guess_kwargs
     cdef Func1 interrupt
+    cdef Func1 _time_step_callback
+    cdef Func1 _steady_callback
 
 cdef class ReactionPathDiagram:
     cdef CxxReactionPathDiagram diagram
@@ -1013,6 +1224,18 @@ cdef class ReactionPathDiagram:
     cdef str element
     cdef pybool built
     cdef CxxStringStream* _log
+    cdef ReactionPathAccumulator _accumulator
+
+cdef class ReactionPathAccumulator:
+    cdef CxxReactionPathAccumulator* accumulator
+    cdef readonly Kinetics kinetics
+
+cdef class LookupTable:
+    cdef CxxLookupTable* table
+    cdef readonly tuple axis_names
+    cdef readonly tuple axes
+    cdef readonly tuple names
+    cdef readonly np.ndarray data
 
 # free functions
 cdef string stringify(x) except *
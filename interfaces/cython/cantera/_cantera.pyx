@@ -25,3 +25,4 @@ include "mixture.pyx"
 include "reactor.pyx"
 include "onedim.pyx"
 include "reactionpath.pyx"
+include "lookuptable.pyx"
@@ -0,0 +1,56 @@
+"""
+Compare the banded and block-tridiagonal linear solvers used in the Newton
+iteration for a freely-propagating, premixed methane/air flame.
+
+Each case is run in a separate process so that the peak memory usage of each
+solver can be measured. A different mechanism can be specified on the command
+line, e.g.::
+
+    python flame_linear_solver.py mechanism.cti fuel_name
+
+Requires: the 'resource' module (Unix only)
+"""
+
+import sys
+import multiprocessing
+import resource
+from time import time
+import cantera as ct
+
+mech = sys.argv[1] if len(sys.argv) > 1 else 'gri30.xml'
+fuel = sys.argv[2] if len(sys.argv) > 2 else 'CH4'
+
+
+def run(solver):
+    gas = ct.Solution(mech)
+    gas.set_equivalence_ratio(1.0, fuel, 'O2:1.0, N2:3.76')
+    gas.TP = 300.0, ct.one_atm
+
+    f = ct.FreeFlame(gas, width=0.03)
+    f.set_refine_criteria(ratio=3, slope=0.1, curve=0.2)
+    f.linear_solver = solver
+
+    t0 = time()
+    f.solve(loglevel=0, auto=True)
+    elapsed = time() - t0
+
+    stats = f.solver_stats
+    linear_solve = sum(s['linear_solve_time'] for s in stats)
+    # ru_maxrss is in kilobytes on Linux
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0
+    return f.u[0], len(f.grid), elapsed, linear_solve, peak
+
+
+if __name__ == '__main__':
+    print('Mechanism: {} ({} species)'.format(mech, ct.Solution(mech).n_species))
+    print('{:>18s} {:>10s} {:>6s} {:>10s} {:>14s} {:>12s}'.format(
+          'solver', 'Su [m/s]', 'points', 'total [s]', 'lin. solve [s]',
+          'peak [MiB]'))
+    for solver in ('band', 'block-tridiagonal'):
+        # use a new process for each case to get an independent peak memory
+        pool = multiprocessing.Pool(1)
+        Su, npoints, elapsed, linear_solve, peak = pool.apply(run, (solver,))
+        pool.close()
+        pool.join()
+        print('{:>18s} {:10.5f} {:6d} {:10.2f} {:14.2f} {:12.1f}'.format(
+              solver, Su, npoints, elapsed, linear_solve, peak))
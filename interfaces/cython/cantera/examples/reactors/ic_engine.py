@@ -97,8 +97,11 @@ A_piston = .25 * np.pi * d_piston ** 2
 stroke = V_H / A_piston
 r.volume = V_oT
 piston.area = A_piston
-def piston_speed(t):
-    return - stroke / 2 * 2 * np.pi * f * np.sin(crank_angle(t))
+# The piston speed, - stroke / 2 * 2 * pi * f * sin(crank_angle(t)), is
+# defined as a Fourier series so that it is evaluated in C++ rather than by
+# calling a Python function at every time step
+piston_speed = ct.Func1.fourier(2 * np.pi * f, 0.0, [0.0],
+                                [- stroke / 2 * 2 * np.pi * f])
 piston.set_velocity(piston_speed)
 
 # create a reactor network containing the cylinder
@@ -37,14 +37,10 @@ r2 = ct.IdealGasReactor(gas2)
 r2.volume = 0.1
 
 # The wall is held fixed until t = 0.1 s, then released to allow the pressure to
-# equilibrate.
-def v(t):
-    if t < 0.1:
-        return 0.0
-    else:
-        return (r1.thermo.P - r2.thermo.P) * 1e-4
-
-w = ct.Wall(r1, r2, velocity=v)
+# equilibrate. Once released, its velocity is proportional to the pressure
+# difference, which is set using the expansion rate coefficient rather than a
+# Python function, so that it is evaluated in C++.
+w = ct.Wall(r1, r2, K=0.0)
 
 net = ct.ReactorNet([r1, r2])
 
@@ -59,6 +55,8 @@ xh2 = []
 
 for n in range(200):
     time = (n+1)*0.001
+    if n == 100:
+        w.expansion_rate_coeff = 1e-4
     net.advance(time)
     if n % 4 == 3:
         print(fmt % (time, r1.T, r2.T, r1.volume, r2.volume,
@@ -0,0 +1,67 @@
+"""
+Throughput of ignition delay calculations using multiple Python threads.
+
+The reactor networks are independent, and do not use any functions defined in
+Python, so `ReactorNet.advance` releases the global interpreter lock (GIL)
+and the networks are integrated concurrently on multiple cores. Each thread
+uses its own `Solution` object. The number of cases can be given on the
+command line, e.g.::
+
+    python threaded_reactors.py 64
+"""
+
+import sys
+import threading
+import multiprocessing
+from time import time
+import numpy as np
+import cantera as ct
+
+n_cases = int(sys.argv[1]) if len(sys.argv) > 1 else 32
+T0 = np.linspace(1000, 1400, n_cases)
+
+
+def ignition_delay(gas, T):
+    gas.TPX = T, 10 * ct.one_atm, 'CH4:1.0, O2:2.0, N2:7.52'
+    r = ct.IdealGasConstPressureReactor(gas)
+    net = ct.ReactorNet([r])
+    t_ign = 0.0
+    while r.T < T + 400 and net.time < 1.0:
+        t_ign = net.step()
+    return t_ign
+
+
+def run(cases, results):
+    gas = ct.Solution('gri30.xml')
+    for i in cases:
+        results[i] = ignition_delay(gas, T0[i])
+
+
+def run_threads(n_threads):
+    results = np.zeros(n_cases)
+    threads = [threading.Thread(target=run,
+                                args=(range(i, n_cases, n_threads), results))
+               for i in range(n_threads)]
+    t0 = time()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return results, time() - t0
+
+
+if __name__ == '__main__':
+    print('{} ignition delay calculations, {} cores'.format(
+          n_cases, multiprocessing.cpu_count()))
+    print('{:>8s} {:>10s} {:>14s} {:>8s}'.format(
+          'threads', 'time [s]', 'cases / s', 'speedup'))
+    n_threads = 1
+    while n_threads <= multiprocessing.cpu_count():
+        results, elapsed = run_threads(n_threads)
+        if n_threads == 1:
+            reference, serial_time = results, elapsed
+        # the results do not depend on the number of threads
+        assert np.allclose(results, reference)
+        print('{:8d} {:10.2f} {:14.2f} {:8.2f}'.format(
+              n_threads, elapsed, n_cases / elapsed, serial_time / elapsed))
+        n_threads *= 2
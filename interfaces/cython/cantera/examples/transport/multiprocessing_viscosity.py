@@ -71,6 +71,15 @@ def serial(mech, predicate, nTemps):
                      itertools.repeat(X))))
     return y
 
+def batch(mech, name, nTemps):
+    P = ct.one_atm
+    X = 'CH4:1.0, O2:1.0, N2:3.76'
+    gas = ct.Solution(mech)
+    gas.transport_model = 'Multi'
+    gas.X = X
+    # All of the states are evaluated in a single call into C++
+    return gas.batch_transport(name, np.linspace(300, 900, nTemps), P, gas.X)
+
 if __name__ == '__main__':
     nPoints = 5000
     nProcs = 4
@@ -88,6 +97,11 @@ if __name__ == '__main__':
     t2 = time()
     print('Serial: {0:.3f} seconds'.format(t2-t1))
 
+    t1 = time()
+    batch('gri30.xml', 'thermal_conductivity', nPoints)
+    t2 = time()
+    print('Batch: {0:.3f} seconds'.format(t2-t1))
+
     # On the other hand, if the work done per call to the predicate function is
     # small, there may be no advantage to using multiprocessing.
     print('\nViscosity')
@@ -100,3 +114,10 @@ if __name__ == '__main__':
     serial('gri30.xml', get_viscosity, nPoints)
     t2 = time()
     print('Serial: {0:.3f} seconds'.format(t2-t1))
+
+    # Evaluating all of the states in a single call avoids the overhead of
+    # setting the state and calling the property function from Python
+    t1 = time()
+    batch('gri30.xml', 'viscosity', nPoints)
+    t2 = time()
+    print('Batch: {0:.3f} seconds'.format(t2-t1))
@@ -1,11 +1,12 @@
 import sys
 
-cdef double func_callback(double t, void* obj, void** err):
+cdef double func_callback(double t, void* obj, void** err) with gil:
     """
     This function is called from C/C++ to evaluate a `Func1` object *obj*,
     returning the value of the function at *t*. If an exception occurs while
     evaluating the function, the Python exception info is saved in the
-    two-element array *err*.
+    two-element array *err*. The GIL is acquired if the calling thread does
+    not hold it.
     """
     try:
         return (<Func1>obj).callable(t)
@@ -19,6 +20,42 @@ cdef double func_callback(double t, void* obj, void** err):
         return 0.0
 
 
+cdef bint _calls_python(Func1 f):
+    """
+    Returns True if evaluating *f* calls a Python function, in which case
+    solvers using *f* do not release the GIL.
+    """
+    if f is None:
+        return False
+    elif f.callable is not None:
+        return True
+    for child in f.children:
+        if _calls_python(child):
+            return True
+    return False
+
+
+cdef Func1 _combine(a, b, op):
+    """
+    Combine two functions into a new `Func1`. The new function owns copies of
+    the underlying C++ functions, and keeps references to the original
+    objects so that any Python callables remain available.
+    """
+    cdef Func1 f1 = a if isinstance(a, Func1) else Func1(a)
+    cdef Func1 f2 = b if isinstance(b, Func1) else Func1(b)
+    cdef Func1 f = Func1(init=False)
+    if op == '+':
+        f.func = new CxxSum1(f1.func.duplicate(), f2.func.duplicate())
+    elif op == '-':
+        f.func = new CxxDiff1(f1.func.duplicate(), f2.func.duplicate())
+    elif op == '*':
+        f.func = new CxxProduct1(f1.func.duplicate(), f2.func.duplicate())
+    else:
+        f.func = new CxxComposite1(f1.func.duplicate(), f2.func.duplicate())
+    f.children = (f1, f2)
+    return f
+
+
 cdef class Func1:
     """
     This class is used as a wrapper for a function of one variable, i.e.
@@ -53,11 +90,30 @@ cdef class Func1:
     Note that all methods which accept `Func1` objects will also accept the
     callable object and create the wrapper on their own, so it is generally
     unnecessary to explicitly create a `Func1` object.
+
+    Evaluating a function defined in Python requires calling back into the
+    Python interpreter, which is slow when the function is evaluated many
+    times, e.g. by a `ReactorNet` at every time step. Solvers which use such
+    functions also hold the Python global interpreter lock (GIL) while
+    running, so they cannot run concurrently with other Python threads.
+    Constants and the functions created with `polynomial`, `tabulated` and
+    `fourier`, as well as sums, differences, products (``+``, ``-``, ``*``)
+    and compositions (`compose`) of these, are evaluated entirely in C++::
+
+        >>> f5 = Func1.polynomial([1, 0, 3]) * Func1.tabulated([0, 1], [2, 4])
+        >>> f5(0.5)
+        5.25
     """
-    def __cinit__(self, c):
+    def __cinit__(self, c=None, *, init=True):
         self.exception = None
+        self.func = NULL
+        self.children = ()
+        if not init:
+            return
+
         if hasattr(c, '__call__'):
             self.callable = c
+            self.func = new CxxFunc1Py(func_callback, <void*>self)
         else:
             try:
                 # calling float() converts numpy arrays of size 1 to scalars
@@ -69,9 +125,7 @@ cdef class Func1:
                 else:
                     raise TypeError('Func1 must be constructed from a number or'
                                     ' a callable object')
-            self.callable = lambda t: k
-
-        self.func = new CxxFunc1(func_callback, <void*>self)
+            self.func = new CxxConst1(k)
 
     def __dealloc__(self):
         del self.func
@@ -79,6 +133,82 @@ cdef class Func1:
     def __call__(self, t):
         return self.func.eval(t)
 
+    @staticmethod
+    def polynomial(coeffs):
+        """
+        Create a polynomial function, evaluated in C++, where *coeffs* are the
+        coefficients in order of increasing degree, i.e.
+        :math:`f(t) = c_0 + c_1 t + c_2 t^2 + \ldots`.
+        """
+        cdef np.ndarray[np.double_t, ndim=1] c = np.array(coeffs,
+                                                          dtype=np.double,
+                                                          ndmin=1)
+        if not len(c):
+            raise ValueError('At least one coefficient is required')
+        cdef Func1 f = Func1(init=False)
+        f.func = new CxxPoly1(len(c) - 1, &c[0])
+        return f
+
+    @staticmethod
+    def tabulated(t, y):
+        """
+        Create a function, evaluated in C++, which linearly interpolates the
+        values *y* given at the points *t*. The values in *t* must be in
+        non-decreasing order. Outside the range of *t*, the function is equal
+        to the value at the nearest end point.
+        """
+        cdef np.ndarray[np.double_t, ndim=1] tt = np.array(t, dtype=np.double,
+                                                           ndmin=1)
+        cdef np.ndarray[np.double_t, ndim=1] yy = np.array(y, dtype=np.double,
+                                                           ndmin=1)
+        if len(tt) != len(yy):
+            raise ValueError('Arrays t and y must have the same length')
+        if not len(tt):
+            raise ValueError('At least one point is required')
+        cdef Func1 f = Func1(init=False)
+        f.func = new CxxTabulated1(len(tt), &tt[0], &yy[0])
+        return f
+
+    @staticmethod
+    def fourier(omega, a0, a, b):
+        """
+        Create a Fourier series, evaluated in C++:
+
+        .. math::
+
+            f(t) = a_0 / 2 + \sum_{n=1}^N a_n \cos (n \omega t)
+                   + b_n \sin (n \omega t)
+
+        where *a* and *b* are sequences of the same length *N*.
+        """
+        cdef np.ndarray[np.double_t, ndim=1] aa = np.array(a, dtype=np.double,
+                                                           ndmin=1)
+        cdef np.ndarray[np.double_t, ndim=1] bb = np.array(b, dtype=np.double,
+                                                           ndmin=1)
+        if len(aa) != len(bb):
+            raise ValueError('Arrays a and b must have the same length')
+        if not len(aa):
+            raise ValueError('At least one pair of coefficients is required')
+        cdef Func1 f = Func1(init=False)
+        f.func = new CxxFourier1(len(aa), omega, a0, &aa[0], &bb[0])
+        return f
+
+    def compose(self, inner):
+        """
+        Return the composite function :math:`f(g(t))` of this function
+        :math:`f` and the function *inner*, :math:`g`.
+        """
+        return _combine(self, inner, 'compose')
+
+    def __add__(a, b):
+        return _combine(a, b, '+')
+
+    def __sub__(a, b):
+        return _combine(a, b, '-')
+
+    def __mul__(a, b):
+        return _combine(a, b, '*')
+
     def __reduce__(self):
         raise NotImplementedError('Func1 object is not picklable')
 
@@ -124,6 +124,30 @@ cdef class Kinetics(_SolutionBase):
             self._check_reaction_index(i_reaction)
             self.kinetics.setMultiplier(i_reaction, value)
 
+    property rate_cache_size:
+        """
+        The number of recent states for which the temperature-dependent parts
+        of the rate constants are kept, in addition to the current state. The
+        states are identified by temperature and, for mechanisms containing
+        P-log or Chebyshev reactions, pressure. Zero (the default) disables
+        the cache. Setting the size resets `rate_cache_stats`.
+        """
+        def __get__(self):
+            return self.kinetics.stateCacheSize()
+        def __set__(self, n):
+            self.kinetics.setStateCacheSize(n)
+
+    property rate_cache_stats:
+        """
+        The number of times the rate constants were found in (hits) or added
+        to (misses) the cache of recent states, as a tuple ``(hits, misses)``.
+        See `rate_cache_size`.
+        """
+        def __get__(self):
+            cdef size_t hits, misses
+            self.kinetics.getStateCacheStats(hits, misses)
+            return hits, misses
+
     def reaction_type(self, int i_reaction):
         """Type of reaction *i_reaction*."""
         self._check_reaction_index(i_reaction)
@@ -350,9 +374,82 @@ cdef class InterfaceKinetics(Kinetics):
     def advance_coverages(self, double dt):
         """
         This method carries out a time-accurate advancement of the surface
-        coverages for a specified amount of time.
-        """
-        (<CxxInterfaceKinetics*>self.kinetics).advanceCoverages(dt)
+        coverages for a specified amount of time. The GIL is released while
+        integrating.
+        """
+        cdef CxxInterfaceKinetics* kin = <CxxInterfaceKinetics*>self.kinetics
+        with nogil:
+            kin.advanceCoverages(dt)
+
+    def batch_steady_coverages(self, T, P, X, phase=None):
+        """
+        Solve for the steady-state surface coverages for an array of N states
+        of the adjacent phase *phase*. The surface is held at the same
+        temperature and pressure as the adjacent phase. The calculation is
+        carried out entirely in C++, without holding the Python global
+        interpreter lock, and each solution is started from the coverages
+        found for the previous state, so neighboring states (e.g. consecutive
+        cells of a plug flow reactor) should be given in order. The states of
+        the phases are not changed.
+
+        :param T:
+            Temperatures [K]. Array of length N, or a scalar.
+        :param P:
+            Pressures [Pa]. Array of length N, or a scalar.
+        :param X:
+            Mole fractions of the species in *phase*. Array with shape
+            (N, number of species in *phase*), or a single composition used
+            for all states.
+        :param phase:
+            The adjacent phase, specified as the phase object, its name, or
+            its index. By default, the first phase other than the surface is
+            used.
+
+        Returns a tuple ``(coverages, wdot)`` containing the coverages (shape
+        (N, `n_species`)) and the net production rates [kmol/m^2/s] of all
+        the species in the kinetics object (shape (N, `n_total_species`)).
+
+        >>> cov, wdot = surf.batch_steady_coverages(T, ct.one_atm, X)
+        >>> wdot_gas = wdot[:, surf.kinetics_species_index(0, 1):]
+        """
+        cdef size_t iphase
+        if phase is None:
+            iphase = 0 if self.reaction_phase_index != 0 else 1
+            if iphase >= self.n_phases:
+                raise ValueError('The surface has no adjacent phase')
+        else:
+            iphase = self.phase_index(phase)
+            if iphase == self.reaction_phase_index:
+                raise ValueError('The adjacent phase must not be the surface')
+
+        cdef size_t kk = self.kinetics.thermo(iphase).nSpecies()
+        X = np.array(X, dtype=np.double, ndmin=2)
+        if X.ndim != 2 or X.shape[1] != kk:
+            raise ValueError('Mole fractions must have shape (N, {}), got '
+                             '{}'.format(kk, X.shape))
+        T = np.array(T, dtype=np.double, ndmin=1)
+        P = np.array(P, dtype=np.double, ndmin=1)
+        cdef size_t n = max(X.shape[0], T.size, P.size)
+        for a in (X, T, P):
+            if a.shape[0] not in (1, n) or a is not X and a.ndim != 1:
+                raise ValueError('Inconsistent numbers of states')
+
+        cdef np.ndarray[np.double_t, ndim=1] TT = np.ascontiguousarray(
+            T * np.ones(n))
+        cdef np.ndarray[np.double_t, ndim=1] PP = np.ascontiguousarray(
+            P * np.ones(n))
+        cdef np.ndarray[np.double_t, ndim=2] XX = np.ascontiguousarray(
+            X * np.ones((n, 1)))
+        cdef np.ndarray[np.double_t, ndim=2] cov = np.empty(
+            (n, self.kinetics.thermo(self.reaction_phase_index).nSpecies()))
+        cdef np.ndarray[np.double_t, ndim=2] wdot = np.empty(
+            (n, self.n_total_species))
+        if n:
+            with nogil:
+                surf_batchSteadyCoverages(
+                    <CxxInterfaceKinetics*>self.kinetics, iphase, n, &TT[0],
+                    &PP[0], &XX[0,0], &cov[0,0], &wdot[0,0])
+        return cov, wdot
 
     def phase_index(self, phase):
         """
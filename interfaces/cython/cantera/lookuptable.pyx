@@ -0,0 +1,159 @@
+import json
+
+# First line of files written by LookupTable.save
+_LOOKUP_TABLE_MAGIC = b'#cantera-lookup-table 1\n'
+
+cdef class LookupTable:
+    """
+    A table of precomputed quantities on an N-dimensional structured grid,
+    which can be evaluated at arbitrary points using multilinear
+    interpolation. The interpolation is carried out in C++, without holding
+    the Python global interpreter lock.
+
+    :param axes:
+        A sequence of N one-dimensional arrays containing the strictly
+        increasing (but not necessarily uniformly spaced) coordinates of the
+        grid points along each axis.
+    :param data:
+        The values of the tabulated variables, as an array with shape
+        ``(len(axes[0]), ..., len(axes[N-1]), len(names))``.
+    :param names:
+        The names of the tabulated variables.
+    :param axis_names:
+        The names of the coordinates along each axis (optional).
+
+    Tables can be saved to a file using `save` and read back using `load`. The
+    data in the file is memory-mapped rather than read, so that large tables
+    can be shared between processes without being copied.
+
+    Tables of equilibrium properties can be generated using
+    `build_equilibrium_table`.
+    """
+    def __cinit__(self, *args, **kwargs):
+        self.table = NULL
+
+    def __init__(self, axes, data, names, axis_names=None):
+        self.axes = tuple(np.array(ax, dtype=np.double, ndmin=1) for ax in axes)
+        self.names = tuple(names)
+        if axis_names is None:
+            axis_names = ['x{}'.format(i) for i in range(len(self.axes))]
+        if len(axis_names) != len(self.axes):
+            raise ValueError('Got {} axis names for {} axes'.format(
+                len(axis_names), len(self.axes)))
+        self.axis_names = tuple(axis_names)
+
+        shape = tuple(len(ax) for ax in self.axes) + (len(self.names),)
+        # Avoids copying memory-mapped data, if it is already in the right
+        # format
+        data = np.require(data, dtype=np.double, requirements='CA')
+        if data.shape != shape:
+            raise ValueError('Expected data with shape {}, got {}'.format(
+                shape, data.shape))
+        self.data = data
+
+        cdef vector[vector[double]] cxx_axes
+        for ax in self.axes:
+            cxx_axes.push_back(ax)
+        self.table = new CxxLookupTable(cxx_axes, len(self.names),
+                                        <double*>np.PyArray_DATA(self.data))
+
+    def __dealloc__(self):
+        del self.table
+
+    property n_dim:
+        """Number of dimensions of the table."""
+        def __get__(self):
+            return self.table.nDim()
+
+    def variable_index(self, name):
+        """The index of the tabulated variable *name*."""
+        try:
+            return self.names.index(name)
+        except ValueError:
+            raise ValueError('No variable named {!r} in the table'.format(name))
+
+    def interpolate(self, points, names=None):
+        """
+        Interpolate the tabulated variables at an array of points.
+
+        :param points:
+            Coordinates of the query points, as an array with shape (M,
+            `n_dim`), or a single point as an array of length `n_dim`.
+        :param names:
+            The name of a single variable, or a list of variable names. By
+            default, all of the variables are interpolated.
+
+        Returns an array with shape (M, K), where K is the number of variables
+        requested. If *names* is a single name, the second dimension is
+        omitted, and if *points* is a single point, the first dimension is
+        omitted.
+
+        >>> table.interpolate([[0.8, 300, 101325], [1.2, 500, 101325]],
+        ...                   ['T', 'density'])
+        """
+        cdef size_t ndim = self.table.nDim()
+        single_name = isinstance(names, (str, unicode))
+        if names is None:
+            names = self.names
+        elif single_name:
+            names = [names]
+
+        cdef np.ndarray[size_t, ndim=1] indices = np.array(
+            [self.variable_index(name) for name in names], dtype=np.uintp)
+        cdef np.ndarray[np.double_t, ndim=2] x = np.array(
+            points, dtype=np.double, ndmin=2, order='C')
+        if x.shape[1] != ndim:
+            raise ValueError('Points must have {} coordinates, got {}'.format(
+                ndim, x.shape[1]))
+
+        cdef size_t n = x.shape[0]
+        cdef size_t nout = len(indices)
+        cdef np.ndarray[np.double_t, ndim=2] y = np.empty((n, nout))
+        if n and nout:
+            with nogil:
+                self.table.interpolate(n, &x[0,0], nout, &indices[0], &y[0,0])
+
+        result = y
+        if single_name:
+            result = result[:,0]
+        if np.ndim(points) == 1:
+            result = result[0]
+        return result
+
+    def save(self, filename):
+        """
+        Write the table to the file *filename*. The file contains a short
+        header followed by the table data in binary form, which can be
+        memory-mapped by `load`.
+        """
+        header = json.dumps({'axis_names': list(self.axis_names),
+                             'axes': [ax.tolist() for ax in self.axes],
+                             'names': list(self.names)})
+        header = header.encode('utf-8')
+        # Pad the header so that the data is aligned to 64 bytes
+        size = len(_LOOKUP_TABLE_MAGIC) + len(header) + 1
+        header += b' ' * (-size % 64) + b'\n'
+        with open(filename, 'wb') as f:
+            f.write(_LOOKUP_TABLE_MAGIC)
+            f.write(header)
+            np.ascontiguousarray(self.data, dtype='<f8').tofile(f)
+
+    @staticmethod
+    def load(filename):
+        """
+        Read a table written by `save` from the file *filename*. The table
+        data is memory-mapped, rather than read into memory.
+        """
+        with open(filename, 'rb') as f:
+            if f.readline() != _LOOKUP_TABLE_MAGIC:
+                raise ValueError('{!r} is not a lookup table file'.format(
+                    filename))
+            header = json.loads(f.readline().decode('utf-8'))
+            offset = f.tell()
+
+        shape = (tuple(len(ax) for ax in header['axes']) +
+                 (len(header['names']),))
+        data = np.memmap(filename, dtype='<f8', mode='r', offset=offset,
+                         shape=shape)
+        return LookupTable(header['axes'], data, header['names'],
+                           header['axis_names'])
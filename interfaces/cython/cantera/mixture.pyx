@@ -315,6 +315,14 @@ cdef class Mixture:
             Determines the amount of output displayed during the solution
             process. 0 indicates no output, while larger numbers produce
             successively more verbose information.
+
+        The GIL is released while solving the equilibrium problem.
         """
-        self.mix.equilibrate(stringify(XY.upper()), stringify(solver), rtol,
-                             max_steps, max_iter, estimate_equil, log_level)
+        cdef string cxx_XY = stringify(XY.upper())
+        cdef string cxx_solver = stringify(solver)
+        cdef double cxx_rtol = rtol
+        cdef int steps = max_steps, iters = max_iter
+        cdef int estimate = estimate_equil, level = log_level
+        with nogil:
+            self.mix.equilibrate(cxx_XY, cxx_solver, cxx_rtol, steps, iters,
+                                 estimate, level)
@@ -542,11 +542,43 @@ cdef class Sim1D:
         called. The signature of *f* is `float f(float)`. The default
         interrupt function is used to trap KeyboardInterrupt exceptions so
         that `ctrl-c` can be used to break out of the C++ solver loop.
+
+        If *f* is `None`, no interrupt function is used. Since the default
+        interrupt function is defined in Python, this allows `solve` to
+        release the GIL, so that independent flames can be solved
+        concurrently from different Python threads, but `ctrl-c` will no
+        longer interrupt the solver.
         """
-        if not isinstance(f, Func1):
+        if f is not None and not isinstance(f, Func1):
             f = Func1(f)
         self.interrupt = f
-        self.sim.setInterrupt(self.interrupt.func)
+        self.sim.setInterrupt(self.interrupt.func if f is not None else NULL)
+
+    def set_time_step_callback(self, f):
+        """
+        Set a callback function to be called after each successful timestep.
+        The signature of *f* is `float f(float)`. The argument passed to *f* is
+        the size of the timestep. The output is ignored. If *f* is `None`, any
+        existing callback is removed.
+        """
+        if f is not None and not isinstance(f, Func1):
+            f = Func1(f)
+        self._time_step_callback = f
+        self.sim.setTimeStepCallback(
+            self._time_step_callback.func if f is not None else NULL)
+
+    def set_steady_callback(self, f):
+        """
+        Set a callback function to be called after each successful steady-state
+        solve, before regridding. The signature of *f* is `float f(float)`. The
+        argument passed to *f* is "0" and the output is ignored. If *f* is
+        `None`, any existing callback is removed.
+        """
+        if f is not None and not isinstance(f, Func1):
+            f = Func1(f)
+        self._steady_callback = f
+        self.sim.setSteadyCallback(
+            self._steady_callback.func if f is not None else NULL)
 
     def domain_index(self, dom):
         """
@@ -735,6 +767,20 @@ cdef class Sim1D:
         self._get_initial_solution()
         self._initialized = True
 
+    def _solve(self, int loglevel, refine_grid):
+        """
+        Call the C++ solver, releasing the GIL if none of the interrupt and
+        callback functions are defined in Python.
+        """
+        cdef cbool refine = refine_grid
+        if (_calls_python(self.interrupt) or
+            _calls_python(self._time_step_callback) or
+            _calls_python(self._steady_callback)):
+            self.sim.solve(loglevel, refine)
+        else:
+            with nogil:
+                self.sim.solve(loglevel, refine)
+
     def _get_initial_solution(self):
         """
         Load the initial solution from each domain into the global solution
@@ -767,12 +813,15 @@ cdef class Sim1D:
             If non-default tolerances have been specified or multicomponent
             transport is enabled, an additional solution using these options
             will be calculated.
+
+        The GIL is released while solving unless an interrupt or callback
+        function defined in Python is used (see `set_interrupt`).
         """
 
         if not auto:
             if not self._initialized:
                 self.set_initial_guess()
-            self.sim.solve(loglevel, <cbool>refine_grid)
+            self._solve(loglevel, refine_grid)
             return
 
         have_user_tolerances = any(dom.have_user_tolerances for dom in self.domains)
@@ -816,7 +865,7 @@ cdef class Sim1D:
                 # Try solving with energy enabled, which usually works
                 log('Solving on {} point grid with energy equation enabled', N)
                 self.energy_enabled = True
-                self.sim.solve(loglevel, <cbool>False)
+                self._solve(loglevel, False)
                 solved = True
             except Exception:
                 solved = False
@@ -828,10 +877,10 @@ cdef class Sim1D:
                 log('Initial solve failed; Retrying with energy equation disabled')
                 try:
                     self.energy_enabled = False
-                    self.sim.solve(loglevel, <cbool>False)
+                    self._solve(loglevel, False)
                     log('Solving on {} point grid with energy equation re-enabled', N)
                     self.energy_enabled = True
-                    self.sim.solve(loglevel, <cbool>False)
+                    self._solve(loglevel, False)
                     solved = True
                 except Exception:
                     pass
@@ -840,7 +889,7 @@ cdef class Sim1D:
                 # Found a non-extinct solution on the fixed grid
                 log('Solving with grid refinement enabled')
                 try:
-                    self.sim.solve(loglevel, <cbool>True)
+                    self._solve(loglevel, True)
                     solved = True
                 except Exception:
                     solved = False
@@ -872,7 +921,7 @@ cdef class Sim1D:
 
         # Final call with expensive options enabled
         if have_user_tolerances or solve_multi:
-            self.sim.solve(loglevel, <cbool>True)
+            self._solve(loglevel, True)
 
 
     def refine(self, loglevel=1):
@@ -934,6 +983,28 @@ cdef class Sim1D:
         """
         self.sim.setJacAge(ss_age, ts_age)
 
+    property linear_solver:
+        """
+        Get/Set the method used to solve the linear systems in the Newton
+        iteration, either ``'band'`` (banded LU factorization of the Jacobian;
+        the default) or ``'block-tridiagonal'`` (block Gaussian elimination
+        over the grid points). The block-tridiagonal solver requires less work
+        and memory for mechanisms with many species. If it encounters a
+        singular diagonal block, the banded solver is used instead.
+        """
+        def __get__(self):
+            if self.sim.blockTridiagonal():
+                return 'block-tridiagonal'
+            else:
+                return 'band'
+        def __set__(self, solver):
+            if solver == 'band':
+                self.sim.setBlockTridiagonal(False)
+            elif solver == 'block-tridiagonal':
+                self.sim.setBlockTridiagonal(True)
+            else:
+                raise ValueError('Unknown linear solver: {!r}'.format(solver))
+
     def set_time_step_factor(self, tfactor):
         """
         Set the factor by which the time step will be increased after a
@@ -1058,5 +1129,53 @@ cdef class Sim1D:
         def __get__(self):
             return self.sim.timeStepStats()
 
+    property solver_stats:
+        """
+        Return a list containing a dict of solver statistics for each call to
+        solve(), e.g. for each successive grid refinement. Each dict contains:
+
+        - ``grid_points``: total grid size
+        - ``time_steps``: number of time steps taken
+        - ``newton_iterations``: number of Newton iterations
+        - ``eval_count``, ``eval_time``: number of and CPU time spent on
+          non-Jacobian function evaluations
+        - ``jacobian_count``, ``jacobian_time``: number of and CPU time spent
+          on Jacobian evaluations
+        - ``linear_solve_count``, ``linear_solve_time``: number of and CPU time
+          spent on factorizing the Jacobian and solving the linear system
+        - ``steady_time``, ``time_stepping_time``: CPU time spent on Newton
+          iterations on the steady-state problem and on time stepping
+        - ``regrid_time``: CPU time spent refining the grid
+        - ``residual_time``: dict of CPU time spent in each part of the
+          residual evaluation (for flow domains, ``thermo``, ``kinetics``,
+          ``transport`` and ``diffusive_fluxes``), including the evaluations
+          made while computing the Jacobian
+
+        All times are in seconds.
+        """
+        def __get__(self):
+            cdef vector[stdmap[string,double]] residual_times = \
+                self.sim.residualTimeStats()
+            cdef size_t i
+            columns = {
+                'grid_points': self.sim.gridSizeStats(),
+                'time_steps': self.sim.timeStepStats(),
+                'newton_iterations': self.sim.newtonIterationStats(),
+                'eval_count': self.sim.evalCountStats(),
+                'eval_time': self.sim.evalTimeStats(),
+                'jacobian_count': self.sim.jacobianCountStats(),
+                'jacobian_time': self.sim.jacobianTimeStats(),
+                'linear_solve_count': self.sim.linearSolveCountStats(),
+                'linear_solve_time': self.sim.linearSolveTimeStats(),
+                'steady_time': self.sim.steadySolveTimeStats(),
+                'time_stepping_time': self.sim.timeSteppingTimeStats(),
+                'regrid_time': self.sim.regridTimeStats()}
+            stats = []
+            for i in range(residual_times.size()):
+                level = {key: value[i] for key, value in columns.items()}
+                level['residual_time'] = comp_map_to_dict(residual_times[i])
+                stats.append(level)
+            return stats
+
     def __dealloc__(self):
         del self.sim
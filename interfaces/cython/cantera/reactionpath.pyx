@@ -168,14 +168,64 @@ cdef class ReactionPathDiagram:
         self.diagram.writeData(out)
         return pystr(out.str())
 
+    def get_fluxes(self):
+        """
+        Get the fluxes between pairs of species as sparse arrays in coordinate
+        (COO) format. Returns a tuple ``(k1, k2, forward, reverse)`` of arrays
+        with one entry for each pair of species connected in either direction,
+        where *k1* < *k2* are the (kinetics) species indices, *forward* is the
+        one-way flux of the element from species *k1* to species *k2*, and
+        *reverse* is the one-way flux from *k2* to *k1*. This is the same
+        information returned in text form by `get_data`. For example, the net
+        flux matrix can be constructed using SciPy::
+
+            >>> k1, k2, fwd, rev = diagram.get_fluxes()
+            >>> n = gas.n_total_species
+            >>> F = scipy.sparse.coo_matrix((fwd - rev, (k1, k2)), (n, n))
+        """
+        if not self.built:
+            self.build()
+        cdef vector[size_t] k1, k2
+        cdef vector[double] fwd, rev
+        self.diagram.getFlows(k1, k2, fwd, rev)
+        return (np.array(k1, dtype=int), np.array(k2, dtype=int),
+                np.array(fwd, dtype=np.double),
+                np.array(rev, dtype=np.double))
+
+    def get_reaction_fluxes(self):
+        """
+        Get the contributions of individual reactions to the one-way fluxes
+        between species as sparse arrays in coordinate (COO) format. Returns a
+        tuple ``(k1, k2, reaction, direction, flux)`` of arrays with one entry
+        for each reaction contributing to the flux from species *k1* to
+        species *k2*, where *flux* is the flux of the element due to the
+        reaction with index *reaction* proceeding in the forward (*direction*
+        = 1) or reverse (*direction* = -1) direction. Summing *flux* over the
+        entries for each pair of species gives the one-way fluxes returned by
+        `get_fluxes`.
+        """
+        if not self.built:
+            self.build()
+        cdef vector[size_t] k1, k2, rxn
+        cdef vector[int] direction
+        cdef vector[double] flux
+        self.diagram.getReactionFlows(k1, k2, rxn, direction, flux)
+        return (np.array(k1, dtype=int), np.array(k2, dtype=int),
+                np.array(rxn, dtype=int), np.array(direction, dtype=int),
+                np.array(flux, dtype=np.double))
+
     def build(self, verbose=False):
         """
         Build the reaction path diagram. Called automatically by methods which
         return representations of the diagram, e.g. write_dot().
         """
-        self.builder.build(deref(self.kinetics.kinetics),
-                           stringify(self.element), deref(self._log),
-                           self.diagram, True)
+        if self._accumulator is not None:
+            self._accumulator.accumulator.build(stringify(self.element),
+                deref(self._log), self.diagram, True)
+        else:
+            self.builder.build(deref(self.kinetics.kinetics),
+                               stringify(self.element), deref(self._log),
+                               self.diagram, True)
         self.built = True
         if verbose:
             print self.log
@@ -186,3 +236,123 @@ cdef class ReactionPathDiagram:
         """
         def __get__(self):
             return pystr(self._log.str())
+
+
+cdef class ReactionPathAccumulator:
+    """
+    Integrates the rates of progress of the reactions in a `Kinetics` object
+    over time or space, so that reaction path diagrams and element flux
+    matrices can be produced for the integrated fluxes, e.g. over the whole
+    course of an ignition process. The integration is done in C++, using the
+    trapezoidal rule.
+
+    Samples can be added manually using `add_sample`, for each grid point of
+    a flame using `add_flame`, or automatically after each time step of a
+    reactor network using `ReactorNet.add_reaction_path_accumulator`:
+
+    >>> r = ct.IdealGasReactor(gas)
+    >>> net = ct.ReactorNet([r])
+    >>> acc = ct.ReactionPathAccumulator(gas)
+    >>> net.add_reaction_path_accumulator(r, acc)
+    >>> net.advance(0.1)
+    >>> acc.diagram('C').write_dot('carbon.dot')
+    """
+    def __cinit__(self, Kinetics kin, *args, **kwargs):
+        self.accumulator = new CxxReactionPathAccumulator(deref(kin.kinetics))
+
+    def __dealloc__(self):
+        del self.accumulator
+
+    def __init__(self, Kinetics kin):
+        self.kinetics = kin
+
+    def add_sample(self, double x, double scale=1.0):
+        """
+        Add a sample of the rates of progress at the current state of the
+        `Kinetics` object.
+
+        :param x:
+            The independent variable, e.g. time or position. Samples must be
+            added in order of increasing *x*.
+        :param scale:
+            A factor multiplying the rates of progress, e.g. the volume of a
+            reactor.
+        """
+        self.accumulator.addSample(x, scale)
+
+    def add_flame(self, flame, double scale=1.0):
+        """
+        Add samples at each grid point of the flame *flame*, which must use
+        the same `Solution` object as this accumulator. The integrated fluxes
+        are then per unit area of the flame, multiplied by *scale*.
+        """
+        if flame.gas is not self.kinetics:
+            raise ValueError('The flame must use the same Solution object as'
+                             ' the accumulator')
+        for j, z in enumerate(flame.grid):
+            flame.set_gas_state(j)
+            self.accumulator.addSample(z, scale)
+
+    def reset(self):
+        """ Discard all samples. """
+        self.accumulator.reset()
+
+    property n_samples:
+        """ The number of samples added since the last call to `reset`. """
+        def __get__(self):
+            return self.accumulator.nSamples()
+
+    property start:
+        """ The value of the independent variable for the first sample. """
+        def __get__(self):
+            return self.accumulator.start()
+
+    property end:
+        """ The value of the independent variable for the last sample. """
+        def __get__(self):
+            return self.accumulator.end()
+
+    property forward_rates_of_progress:
+        """ Integrated forward rates of progress for each reaction. """
+        def __get__(self):
+            cdef np.ndarray[np.double_t, ndim=1] data = \
+                np.empty(self.kinetics.n_reactions)
+            if data.size:
+                self.accumulator.getFwdRatesOfProgress(&data[0])
+            return data
+
+    property reverse_rates_of_progress:
+        """ Integrated reverse rates of progress for each reaction. """
+        def __get__(self):
+            cdef np.ndarray[np.double_t, ndim=1] data = \
+                np.empty(self.kinetics.n_reactions)
+            if data.size:
+                self.accumulator.getRevRatesOfProgress(&data[0])
+            return data
+
+    property net_rates_of_progress:
+        """ Integrated net rates of progress for each reaction. """
+        def __get__(self):
+            return (self.forward_rates_of_progress -
+                    self.reverse_rates_of_progress)
+
+    def diagram(self, element):
+        """
+        Return a `ReactionPathDiagram` for the integrated fluxes of the
+        element *element*.
+        """
+        d = ReactionPathDiagram(self.kinetics, element)
+        d._accumulator = self
+        return d
+
+    def flux_matrix(self, element):
+        """
+        Return an array with shape (`n_total_species`, `n_total_species`)
+        where the element ``[k1, k2]`` is the integrated one-way flux of the
+        element *element* from species *k1* to species *k2*. The net fluxes
+        are given by ``F - F.T``.
+        """
+        cdef int nsp = self.kinetics.n_total_species
+        cdef np.ndarray[np.double_t, ndim=2] data = np.empty((nsp, nsp))
+        self.accumulator.getElementFluxes(stringify(element), &data[0,0])
+        return data
@@ -1,8 +1,68 @@
 from collections import defaultdict as _defaultdict
 import numbers as _numbers
+import ctypes as _ctypes
 
 _reactor_counts = _defaultdict(int)
 
+
+class ReactorRhsData(_ctypes.Structure):
+    """
+    The data passed to a function set using `Reactor.set_rhs_function`, as a
+    `ctypes` structure matching the C struct ``Cantera::ReactorRhsData``
+    defined in ``cantera/zeroD/ReactorRhs.h``. The arrays are only valid
+    during the call to the function.
+    """
+    _fields_ = [
+        ('time', _ctypes.c_double),
+        ('y', _ctypes.POINTER(_ctypes.c_double)),
+        ('ydot', _ctypes.POINTER(_ctypes.c_double)),
+        ('neq', _ctypes.c_size_t),
+        ('nsp', _ctypes.c_size_t),
+        ('energy_index', _ctypes.c_size_t),
+        ('species_index', _ctypes.c_size_t),
+        ('mass', _ctypes.c_double),
+        ('volume', _ctypes.c_double),
+        ('T', _ctypes.c_double),
+        ('P', _ctypes.c_double),
+        ('density', _ctypes.c_double),
+        ('cp_mass', _ctypes.c_double),
+        ('cv_mass', _ctypes.c_double),
+        ('Y', _ctypes.POINTER(_ctypes.c_double)),
+        ('molecular_weights', _ctypes.POINTER(_ctypes.c_double)),
+        ('net_production_rates', _ctypes.POINTER(_ctypes.c_double)),
+        ('partial_molar_enthalpies', _ctypes.POINTER(_ctypes.c_double)),
+        ('partial_molar_int_energies', _ctypes.POINTER(_ctypes.c_double)),
+        ('user_data', _ctypes.c_void_p)
+    ]
+
+#: The `ctypes` function type for functions which can be passed to
+#: `Reactor.set_rhs_function`
+ReactorRhsFunction = _ctypes.CFUNCTYPE(_ctypes.c_int,
+                                       _ctypes.POINTER(ReactorRhsData))
+
+
+def _pointer_address(obj):
+    """
+    Get the address held by a `ctypes` function or pointer, a ``cffi``
+    pointer, or an integer. The address of other `ctypes` objects (e.g. a
+    `ctypes.Structure`) is the address of the object itself.
+    """
+    if obj is None:
+        return 0
+    elif isinstance(obj, _numbers.Integral):
+        return int(obj)
+    elif isinstance(obj, (_ctypes._CFuncPtr, _ctypes._Pointer,
+                          _ctypes.c_void_p)):
+        return _ctypes.cast(obj, _ctypes.c_void_p).value or 0
+    elif isinstance(obj, _ctypes._SimpleCData) or hasattr(obj, '_fields_') \
+         or isinstance(obj, _ctypes.Array):
+        return _ctypes.addressof(obj)
+    elif type(obj).__module__ == '_cffi_backend':
+        import cffi
+        return int(cffi.FFI().cast('uintptr_t', obj))
+    raise TypeError('Unable to get the address of an object of type '
+                    '{!r}'.format(type(obj).__name__))
+
 cdef class ReactorBase:
     """
     Common base class for reactors and reservoirs.
@@ -221,6 +281,59 @@ cdef class Reactor(ReactorBase):
         """
         self.reactor.addSensitivityReaction(m)
 
+    def set_rhs_function(self, func, user_data=None):
+        """
+        Set a compiled function which modifies the governing equations of
+        this reactor, e.g. to add source terms or to replace the energy
+        equation. The function is called with a pointer to a `ReactorRhsData`
+        structure each time the time derivatives of the reactor's state are
+        evaluated, after they have been computed using the reactor's own
+        equations, and can modify any of them through its ``ydot`` array.
+        The thermodynamic properties and net production rates at the current
+        state are provided without copying, so a function compiled from C or
+        Cython is evaluated at the same speed as the reactor's built-in
+        equations. The function should return 0 if successful. Any other
+        value is treated as a failure to evaluate the equations, after which
+        the integrator tries again with a smaller time step. If it cannot
+        recover, `ReactorNet.advance` or `ReactorNet.step` raises an error
+        which includes the returned value.
+
+        :param func:
+            The function to use, as a `ctypes` function (e.g. an instance of
+            `ReactorRhsFunction` or a function loaded from a shared library),
+            a ``cffi`` function pointer, or an integer holding the address of
+            a function with the signature
+            ``int func(Cantera::ReactorRhsData*)``, e.g. a Cython ``cdef``
+            function. Use *None* to remove a previously set function.
+        :param user_data:
+            A pointer passed to *func* as the ``user_data`` member of
+            `ReactorRhsData`, given as a `ctypes` object, a ``cffi`` pointer,
+            or an integer address.
+
+        References to *func* and *user_data* are held by the reactor, so they
+        remain valid while the function is in use.
+
+        >>> heat_loss = ReactorRhsFunction(my_heat_loss)
+        >>> r.set_rhs_function(heat_loss)
+
+        Note that a `ReactorRhsFunction` created from a Python function is
+        called via the Python interpreter, and is therefore slower than a
+        compiled function.
+
+        `ReactorNet.advance` and `ReactorNet.step` do not hold the GIL while
+        this function is called. Functions created with `ctypes` or ``cffi``
+        acquire the GIL themselves if needed, while a Cython function must
+        either be declared ``nogil`` or be declared ``with gil``.
+        """
+        cdef size_t faddr = _pointer_address(func)
+        cdef size_t daddr = _pointer_address(user_data)
+        if isinstance(self, FlowReactor):
+            raise TypeError('FlowReactor does not support user-defined '
+                            'functions')
+        self.reactor.setRhsFunction(<CxxReactorRhsFunction>faddr,
+                                    <void*>daddr)
+        self._rhs_function = (func, user_data) if faddr else None
+
     def component_index(self, name):
         """
         Returns the index of the component named *name* in the system. This
@@ -775,6 +888,25 @@ cdef class PressureController(FlowDevice):
         (<CxxPressureController*>self.dev).setMaster(d.dev)
 
 
+cdef bint _network_calls_python(ReactorNet net):
+    """
+    Returns True if integrating *net* calls any `Func1` objects defined in
+    Python, e.g. wall velocities or mass flow rates.
+    """
+    cdef ReactorBase r
+    cdef Wall w
+    cdef FlowDevice d
+    for r in net._reactors:
+        for w in r._walls:
+            if (_calls_python(w._velocity_func) or
+                _calls_python(w._heat_flux_func)):
+                return True
+        for d in r._inlets + r._outlets:
+            if _calls_python(d._rate_func):
+                return True
+    return False
+
+
 cdef class ReactorNet:
     """
     Networks of reactors. ReactorNet objects are used to simultaneously
@@ -791,6 +923,7 @@ cdef class ReactorNet:
     """
     def __init__(self, reactors=()):
         self._reactors = []  # prevents premature garbage collection
+        self._accumulators = []
         for R in reactors:
             self.add_reactor(R)
 
@@ -799,23 +932,55 @@ cdef class ReactorNet:
         self._reactors.append(r)
         self.net.addReactor(deref(r.reactor))
 
+    def add_reaction_path_accumulator(self, Reactor r,
+                                      ReactionPathAccumulator acc):
+        """
+        Integrate the rates of progress in reactor *r* over time using the
+        `ReactionPathAccumulator` *acc*, which must have been created for the
+        `Kinetics` object of *r*. The rates of progress, multiplied by the
+        reactor volume, are sampled at the current time and after each
+        internal time step taken by `advance` or `step`, so that *acc* gives
+        the integrated element fluxes in kmol.
+        """
+        if acc.kinetics is not r._kinetics:
+            raise ValueError('The accumulator must use the Kinetics object'
+                             ' of the reactor')
+        self.net.addReactionPathAccumulator(deref(r.reactor),
+                                            deref(acc.accumulator))
+        self._accumulators.append(acc)
+
     def advance(self, double t):
         """
         Advance the state of the reactor network in time from the current
         time to time *t* [s], taking as many integrator timesteps as necessary.
+
+        Unless the network uses functions defined in Python (see `Func1`), the
+        GIL is released while integrating, so that independent networks can
+        be advanced concurrently from different Python threads.
         """
-        self.net.advance(t)
+        if _network_calls_python(self):
+            self.net.advance(t)
+        else:
+            with nogil:
+                self.net.advance(t)
 
     def step(self, double t=-999):
         """
         Take a single internal time step. The time after taking the step is
-        returned.
+        returned. As for `advance`, the GIL is released unless the network
+        uses functions defined in Python.
 
         .. deprecated:: 2.2
             The argument *t* is deprecated and will be removed after
             Cantera 2.3.
         """
-        return self.net.step(t)
+        cdef double tnew
+        if _network_calls_python(self):
+            tnew = self.net.step(t)
+        else:
+            with nogil:
+                tnew = self.net.step(t)
+        return tnew
 
     def reinitialize(self):
         """
@@ -837,6 +1002,33 @@ cdef class ReactorNet:
         """
         self.net.setInitialTime(t)
 
+    def checkpoint(self):
+        """
+        Save the current state of the network, including the current time,
+        the sensitivities and the integrator's next step size, and return it
+        as a compact binary string (`bytes`). The integration can be
+        continued from this state by passing the string to `restore`, for
+        example after writing it to a file::
+
+            with open('checkpoint.bin', 'wb') as f:
+                f.write(net.checkpoint())
+
+        The reactors, walls, and flow devices are not included, so the state
+        can only be restored to a network with the same structure.
+        """
+        return self.net.checkpoint()
+
+    def restore(self, bytes data):
+        """
+        Restore the state of the network from a string returned by
+        `checkpoint`. The state of the network's reactors is updated, and the
+        integration continues from the time at which the checkpoint was
+        created. The same checkpoint can be restored many times, e.g. to
+        integrate several continuations from a common state with different
+        conditions.
+        """
+        self.net.restore(data)
+
     def set_max_time_step(self, double t):
         """
         Set the maximum time step *t* [s] that the integrator is allowed
@@ -852,6 +1044,72 @@ cdef class ReactorNet:
         def __set__(self, n):
             self.net.setMaxErrTestFails(n)
 
+    property max_order:
+        """
+        Get/Set the maximum order of the BDF method used by the integrator,
+        between 1 and 5 (the default).
+        """
+        def __get__(self):
+            return self.net.maxOrder()
+        def __set__(self, int order):
+            self.net.setMaxOrder(order)
+
+    property max_steps:
+        """
+        Get/Set the maximum number of internal time steps the integrator may
+        take in a single call to `advance`. Default: 20000.
+        """
+        def __get__(self):
+            return self.net.maxSteps()
+        def __set__(self, int nmax):
+            self.net.setMaxSteps(nmax)
+
+    property initial_time_step:
+        """
+        Get/Set the size [s] of the first internal time step taken after the
+        integrator is initialized or reinitialized. The default of 0.0 lets
+        the integrator estimate a suitable value.
+        """
+        def __get__(self):
+            return self.net.initialStepSize()
+        def __set__(self, double h0):
+            self.net.setInitialStepSize(h0)
+
+    property bandwidth:
+        """
+        Get/Set the numbers of diagonals above and below the main diagonal,
+        as a tuple ``(upper, lower)``, in the approximate Jacobian used by the
+        ``'band'`` linear solver. A value of -1 (the default) includes all of
+        the diagonals.
+        """
+        def __get__(self):
+            return self.net.bandwidthUpper(), self.net.bandwidthLower()
+        def __set__(self, widths):
+            upper, lower = widths
+            self.net.setBandwidth(upper, lower)
+
+    property linear_solver:
+        """
+        Get/Set the method used to solve the linear systems in the Newton
+        iterations of the integrator:
+
+        - ``'dense'`` (the default): direct solution using the full Jacobian
+          matrix.
+        - ``'gmres'``: iterative solution preconditioned with the Jacobian
+          blocks for each reactor and for the connections between reactors.
+          This requires much less work and memory for networks with many
+          reactors, and works best if the reactors are added to the network
+          in the direction of the flow.
+        - ``'band'``: direct solution using a banded approximation to the
+          Jacobian matrix, with the widths set by `bandwidth`.
+        - ``'diag'``: a diagonal approximation to the Jacobian matrix, which
+          is inexpensive but only suitable for problems which are not stiff.
+        """
+        def __get__(self):
+            return pystr(self.net.linearSolverType())
+        def __set__(self, solver):
+            self.net.setLinearSolverType(stringify(solver))
+
     property rtol:
         """
         The relative error tolerance used while integrating the reactor
@@ -966,6 +1224,76 @@ cdef class ReactorNet:
         def __get__(self):
             return self.net.nparams()
 
+    def _adjoint_component(self, component, int r):
+        if isinstance(component, (str, unicode, bytes)):
+            return self.net.globalComponentIndex(stringify(component), r)
+        else:
+            return component
+
+    def adjoint_sensitivities(self, double t, component, int r=0):
+        r"""
+        Advance the state of the reactor network to time *t*, and return the
+        sensitivities of the solution variable *component* in reactor *r* at
+        time *t* with respect to the rates of all reactions, computed using
+        adjoint sensitivity analysis. *component* can be a string or an
+        integer, as for `sensitivity`, or an array of length `n_vars` with
+        the coefficients of a linear combination of the solution variables.
+
+        The sensitivity coefficients are :math:`\partial G / \partial p_i`,
+        where :math:`G` is the selected output and :math:`p_i` is a factor
+        multiplying the rate of reaction :math:`i`, evaluated at
+        :math:`p_i = 1`. Unlike the coefficients returned by `sensitivity`,
+        they are not normalized by the value of the output. The parameters
+        are all of the homogeneous phase reactions of each reactor, in the
+        order in which the reactors were added to the network. Registered
+        sensitivity parameters are not used.
+
+        The cost of the calculation is independent of the number of
+        reactions, which makes this method preferable to adding all of the
+        reactions as sensitivity parameters for large mechanisms.
+
+        The adjoint equations are derived from the built-in governing
+        equations of each reactor, so an exception is raised if any reactor
+        in the network has a function set using `Reactor.set_rhs_function`.
+        """
+        cdef vector[double] dgdy, sens
+        if isinstance(component, (str, unicode, bytes, int)):
+            # check if system is initialized
+            if not self.n_vars:
+                self.reinitialize()
+            dgdy.resize(self.n_vars, 0.0)
+            dgdy[self._adjoint_component(component, r)] = 1.0
+        else:
+            for g in component:
+                dgdy.push_back(g)
+        self.net.adjointSensitivities(t, dgdy, sens)
+        return np.array(sens, dtype=np.double)
+
+    def adjoint_event_sensitivities(self, double t_max, component,
+                                    double value, int r=0):
+        """
+        Advance the state of the reactor network until the solution variable
+        *component* in reactor *r* reaches *value*, and return the time at
+        which this happens along with its sensitivities with respect to the
+        rates of all reactions, computed using adjoint sensitivity analysis.
+        For example, the sensitivities of the ignition delay time can be
+        found using the time at which the temperature exceeds a threshold.
+        The sensitivity coefficients are defined as for
+        `adjoint_sensitivities`.
+
+        The time of the event is found by linear interpolation between the
+        integrator's time steps. On return, the network is at the end of the
+        time step in which the event occurred. An exception is raised if the
+        event does not occur before *t_max*, or if any reactor in the network
+        has a function set using `Reactor.set_rhs_function`.
+
+        Returns a tuple *(t_event, sensitivities)*.
+        """
+        cdef vector[double] sens
+        cdef size_t k = self._adjoint_component(component, r)
+        t_event = self.net.adjointEventSensitivities(t_max, k, value, sens)
+        return t_event, np.array(sens, dtype=np.double)
+
     property n_vars:
         """
         The number of state variables in the system. This is the sum of the
@@ -1057,8 +1385,370 @@ cdef class ReactorNet:
         if return_residuals:
             return residuals[:step + 1]
 
+    def solve_steady(self, int loglevel=0, int max_time_steps=500,
+                     double initial_time_step=1e-6):
+        """
+        Solve directly for the steady state of the reactor network, using a
+        damped Newton method. If the Newton iteration does not converge,
+        pseudo-transient time steps are taken to bring the solution closer to
+        the steady state before trying again. The Jacobian is evaluated and
+        the linear systems are solved using the method set by
+        `linear_solver`. Convergence is determined using `rtol` and `atol`.
+
+        Variables whose rates of change do not depend on the state of the
+        network, such as the volume of a reactor without moving walls, are
+        held fixed. Each reactor must have at least one inlet or outlet. On
+        return, the reactors are set to the steady state, and the time of the
+        network is unchanged.
+
+        :param loglevel:
+            Amount of diagnostic output to print
+        :param max_time_steps:
+            Maximum number of pseudo-transient time steps
+        :param initial_time_step:
+            Size of the first pseudo-transient time step [s]
+
+        Returns a dict of convergence diagnostics: the number of Newton
+        iterations, Jacobian evaluations, successful pseudo-transient time
+        steps, and attempts to solve the steady-state problem; the weighted
+        norm of the last Newton step; and the largest absolute value of the
+        time derivatives at the solution.
+        """
+        self.net.setSteadyTimeStepping(max_time_steps, initial_time_step)
+        self.net.solveSteady(loglevel)
+        cdef CxxSteadyStateStats stats = self.net.steadyStats()
+        return {'newton_iterations': stats.newtonIterations,
+                'jacobian_evaluations': stats.jacobianEvals,
+                'time_steps': stats.timeSteps,
+                'steady_attempts': stats.steadyAttempts,
+                'step_norm': stats.stepNorm,
+                'residual': stats.residual}
+
+    def set_tabulation(self, double tolerance, double max_memory=100.0):
+        r"""
+        Enable in situ adaptive tabulation (ISAT) of the results of
+        `advance_tabulated`, with the error tolerance *tolerance*. A
+        tolerance of zero disables tabulation. The table is limited to
+        *max_memory* megabytes; when it is full, the least recently used
+        records are replaced. Any existing table is discarded.
+
+        The table approximates the mapping from the initial temperature,
+        pressure and mass fractions of the reactor and the time step to the
+        temperature, pressure and mass fractions at the end of the time step.
+        The mapping is evaluated by direct integration when no record in the
+        table can approximate it to within the tolerance, and new records are
+        added as needed. The inputs are scaled as :math:`(\ln T, \ln P,
+        \ln \Delta t, Y_k)` and the outputs as :math:`(\ln T, \ln P,
+        Y_k)`, so the tolerance is approximately a relative error in the
+        temperature and pressure and an absolute error in the mass fractions.
+
+        The reactor must be added to the network before calling this method.
+        """
+        self.net.setTabulation(tolerance, max_memory)
+
+    def advance_tabulated(self, double dt):
+        """
+        Advance the state of the reactor by the time interval *dt* [s],
+        starting from the current state of its contents, using the
+        tabulation enabled by `set_tabulation` (or direct integration, if
+        tabulation is not enabled). This is intended for operator-split
+        calculations, where a single reactor is used to integrate the
+        chemistry for many different initial states::
+
+            gas.TPY = T, P, Y
+            reactor.syncState()
+            net.advance_tabulated(dt)
+
+        The network must contain a single reactor without walls or flow
+        devices. The time of the network is increased by *dt*.
+        """
+        self.net.advanceTabulated(dt)
+
+    property integrator_stats:
+        """
+        A dict of counters describing the work done by the integrator during
+        the most recent call to `advance` or `step`: the number of internal
+        time steps (steps), evaluations of the governing equations, including
+        those used to compute the Jacobian by finite differences (rhs_evals),
+        evaluations of the Jacobian or, for the ``'gmres'`` linear solver, of
+        the preconditioner (jac_evals), linear solver setups
+        (lin_solve_setups), Newton iterations (nonlinear_iters), Newton
+        convergence failures (nonlinear_conv_fails), and local error test
+        failures (err_test_fails); and the order (last_order) and size
+        (last_step_size) of the last internal time step.
+        """
+        def __get__(self):
+            cdef CxxIntegratorStats stats = self.net.integratorStats()
+            return {'steps': stats.steps,
+                    'rhs_evals': stats.rhsEvals,
+                    'jac_evals': stats.jacEvals,
+                    'lin_solve_setups': stats.linSolveSetups,
+                    'nonlinear_iters': stats.nonlinIters,
+                    'nonlinear_conv_fails': stats.nonlinConvFails,
+                    'err_test_fails': stats.errTestFails,
+                    'last_order': stats.lastOrder,
+                    'last_step_size': stats.lastStepSize}
+
+    property tabulation_stats:
+        """
+        A dict describing the use of the table enabled by `set_tabulation`:
+        the number of queries, the number of queries answered using the table
+        (retrieves), the number of directly integrated states which were
+        within the tolerance of an existing record and were used to grow its
+        region of accuracy (grows), the number of records added to and
+        removed from the table (adds and evictions), and the current number
+        of records and the memory they use [bytes].
+        """
+        def __get__(self):
+            cdef CxxIsatStats stats = self.net.tabulationStats()
+            cdef CxxIsatTable* table = self.net.tabulation()
+            return {'queries': stats.queries,
+                    'retrieves': stats.retrieves,
+                    'grows': stats.grows,
+                    'adds': stats.adds,
+                    'evictions': stats.evictions,
+                    'records': table.nRecords() if table else 0,
+                    'memory': table.memory() if table else 0}
+
     def __reduce__(self):
         raise NotImplementedError('ReactorNet object is not picklable')
 
     def __copy__(self):
         raise NotImplementedError('ReactorNet object is not copyable')
+
+
+cdef class PlugFlowReactor:
+    """
+    A steady, isobaric plug flow reactor, where the governing equations for
+    the temperature, the mass flow rate, the residence time, and the mass
+    fractions of the gas species are integrated in the axial direction.
+    Homogeneous reactions in the gas phase described by *gas* and reactions on
+    the reactor wall described by the `Interface` object *surface* are
+    included. The surface coverages are assumed to be in steady state at each
+    point, and the surface is at the temperature of the gas. The state of
+    *gas* when the reactor is created is used as the inlet state.
+
+    :param gas:
+        The `Solution` object for the gas phase.
+    :param mdot:
+        The mass flow rate at the inlet [kg/s].
+    :param area:
+        The cross-sectional area [m^2], as a constant or as a function of the
+        axial position (see `set_area`).
+    :param surface:
+        An `Interface` object for the reacting surface, which must have *gas*
+        as one of its phases.
+    :param surface_area:
+        The area of the reacting surface per unit length [m], as a constant
+        or as a function of the axial position. By default, this is the
+        perimeter of a circular cross section.
+    :param U:
+        The heat transfer coefficient per unit length [W/m/K], i.e. the heat
+        transfer coefficient multiplied by the perimeter, as a constant or as
+        a function of the axial position.
+    :param T_wall:
+        The wall temperature [K], as a constant or as a function of the axial
+        position.
+    :param energy:
+        Set to ``'off'`` to hold the temperature at its inlet value.
+
+    Functions of the axial position may be given as any object accepted by
+    `Func1`. For long profiles, tabulated or polynomial functions created
+    with `Func1.tabulated` or `Func1.polynomial` avoid calling back into
+    Python at each evaluation.
+
+    >>> gas.TPX = 1500, ct.one_atm, 'H2:2, O2:1, AR:7'
+    >>> pfr = ct.PlugFlowReactor(gas, mdot=0.01, area=1e-4)
+    >>> profiles = pfr.solve(np.linspace(0, 0.5, 201))
+    >>> plt.plot(profiles['z'], profiles['T'])
+    """
+    def __cinit__(self, *args, **kwargs):
+        self.pfr = NULL
+
+    def __init__(self, _SolutionBase gas, mdot, area=None, surface=None,
+                 surface_area=None, U=None, T_wall=None, energy='on'):
+        if not isinstance(gas, Kinetics):
+            raise TypeError('The gas must be a Solution object with kinetics')
+        self.gas = gas
+        self._funcs = {}
+        self.pfr = new CxxPlugFlowReactor(deref(gas.thermo),
+                                          deref(gas.kinetics))
+        self.pfr.setMassFlowRate(mdot)
+        if surface is not None:
+            self.set_surface(surface)
+        if area is not None:
+            self.set_area(area)
+        if surface_area is not None:
+            self.set_surface_area(surface_area)
+        if U is not None or T_wall is not None:
+            self.set_heat_transfer(U, T_wall)
+        self.energy_enabled = (energy == 'on')
+
+    def __dealloc__(self):
+        del self.pfr
+
+    cdef CxxFunc1* _func(self, name, f):
+        cdef Func1 g
+        if f is None:
+            self._funcs.pop(name, None)
+            return NULL
+        g = f if isinstance(f, Func1) else Func1(f)
+        self._funcs[name] = g
+        return g.func
+
+    def set_surface(self, InterfaceKinetics surface):
+        """
+        Add the reacting surface described by the `Interface` object
+        *surface*, which must have the gas as one of its phases.
+        """
+        self.pfr.setSurface(deref(<CxxInterfaceKinetics*>surface.kinetics))
+        self.surface = surface
+
+    def set_inlet(self):
+        """
+        Use the current state of the gas as the inlet state.
+        """
+        self.pfr.setInletState()
+
+    property mdot:
+        """
+        Get the mass flow rate [kg/s] at the current position, or set the
+        mass flow rate at the inlet.
+        """
+        def __get__(self):
+            return self.pfr.massFlowRate()
+        def __set__(self, double mdot):
+            self.pfr.setMassFlowRate(mdot)
+
+    def set_area(self, A):
+        """
+        Set the cross-sectional area [m^2] as a function of the axial
+        position, or as a constant. `None` restores the default of 1 m^2.
+        """
+        self.pfr.setArea(self._func('area', A))
+
+    def set_surface_area(self, a):
+        """
+        Set the area of the reacting surface per unit length [m] as a function
+        of the axial position, or as a constant. `None` restores the default,
+        which is the perimeter of a circular cross section.
+        """
+        self.pfr.setSurfaceArea(self._func('surface_area', a))
+
+    def set_heat_transfer(self, U, T_wall):
+        """
+        Set the heat transfer coefficient per unit length *U* [W/m/K] and the
+        wall temperature *T_wall* [K], as functions of the axial position or
+        as constants. If either is `None`, the reactor is adiabatic.
+        """
+        self.pfr.setHeatTransfer(self._func('U', U),
+                                 self._func('T_wall', T_wall))
+
+    property energy_enabled:
+        """
+        *True* if the energy equation is being solved. Otherwise, the
+        temperature is held at its inlet value.
+        """
+        def __get__(self):
+            return self.pfr.energyEnabled()
+        def __set__(self, pybool value):
+            self.pfr.setEnergy(value)
+
+    def set_tolerances(self, double rtol=-1, double atol=-1):
+        """
+        Set the relative and absolute tolerances for the integrator. Negative
+        values leave the corresponding tolerance unchanged. If the integration
+        has already started, it continues from the current position.
+        """
+        self.pfr.setTolerances(rtol, atol)
+
+    property max_step_size:
+        """
+        Set the maximum step size [m] of the integrator. If the integration
+        has already started, it continues from the current position.
+        """
+        def __set__(self, double maxstep):
+            self.pfr.setMaxStepSize(maxstep)
+
+    def initialize(self, double z0=0.0):
+        """
+        Restart the integration from the inlet state at the axial position
+        *z0* [m].
+        """
+        self.pfr.initialize(z0)
+
+    def advance(self, double z):
+        """
+        Advance the solution to the axial position *z* [m]. After this call,
+        the gas is in the state at *z*.
+        """
+        self.pfr.advance(z)
+
+    def step(self):
+        """
+        Take a single integrator step, and return the new axial position [m].
+        """
+        return self.pfr.step()
+
+    property distance:
+        """ The current axial position [m]. """
+        def __get__(self):
+            return self.pfr.distance()
+
+    property residence_time:
+        """ The residence time [s] at the current position. """
+        def __get__(self):
+            return self.pfr.residenceTime()
+
+    property velocity:
+        """ The velocity [m/s] at the current position. """
+        def __get__(self):
+            return self.pfr.speed()
+
+    def solve(self, z):
+        """
+        Integrate from the inlet state to each of the (increasing) axial
+        positions in the array *z* [m], starting at *z[0]*. The integration
+        is carried out in a single call to the C++ core, after which the gas
+        is in the state at the last position. Returns a dictionary containing
+        the arrays of the axial profiles, with the keys ``'z'``, ``'T'``,
+        ``'P'``, ``'mdot'``, ``'residence_time'``, ``'velocity'``,
+        ``'density'``, ``'Y'`` and ``'X'`` (shape *(N, n_species)*), and
+        ``'coverages'`` (shape *(N, number of surface species)*) if the
+        reactor has a surface.
+        """
+        cdef np.ndarray[np.double_t, ndim=1] zz = np.array(z, dtype=np.double,
+                                                           ndmin=1)
+        cdef size_t n = zz.size
+        cdef size_t nsurf = 0 if self.surface is None else self.surface.n_species
+        cdef np.ndarray[np.double_t, ndim=2] states = np.empty(
+            (n, self.pfr.neq()))
+        cdef np.ndarray[np.double_t, ndim=2] cov = np.empty((n, nsurf))
+        if n:
+            self.pfr.solve(n, &zz[0], &states[0,0],
+                           &cov[0,0] if nsurf else NULL)
+
+        P = self.gas.P
+        Y = states[:, 3:]
+        X = np.empty_like(Y)
+        density = np.empty(n)
+        for i in range(n):
+            self.gas.TPY = states[i, 0], P, Y[i]
+            X[i] = self.gas.X
+            density[i] = self.gas.density
+        area = self._funcs.get('area')
+        A = np.array([area(zi) for zi in zz]) if area else np.ones(n)
+
+        profiles = {'z': zz, 'T': states[:, 0], 'P': P * np.ones(n),
+                    'mdot': states[:, 1], 'residence_time': states[:, 2],
+                    'velocity': states[:, 1] / (density * A),
+                    'density': density, 'Y': Y, 'X': X}
+        if nsurf:
+            profiles['coverages'] = cov
+        return profiles
+
+    def __reduce__(self):
+        raise NotImplementedError('PlugFlowReactor object is not picklable')
+
+    def __copy__(self):
+        raise NotImplementedError('PlugFlowReactor object is not copyable')
@@ -0,0 +1,369 @@
+import numpy as np
+
+from ._cantera import Solution, IdealGasConstPressureReactor, ReactorNet
+from .utils import _get_worker_object, _pool_map
+
+
+def _get_reduction_gas(mechanism, phase_id, species=None):
+    """
+    The `Solution` used by this process for the mechanism reduced to the
+    species in the tuple *species*, or the full mechanism if *species* is
+    `None`.
+    """
+    def create():
+        if not species:
+            return Solution(mechanism, phase_id)
+        full = _get_reduction_gas(mechanism, phase_id)
+        return Solution(thermo='IdealGas', kinetics='GasKinetics',
+                        species=[full.species(k) for k in species],
+                        reactions=_reduced_reactions(full, species))
+    return _get_worker_object(('reduction', mechanism, phase_id, species),
+                              create)
+
+
+def _reduced_reactions(gas, species):
+    """
+    The reactions of *gas* which involve only the species in *species*.
+    Third-body efficiencies of other species are ignored.
+    """
+    species = set(species)
+    reactions = []
+    for R in gas.reactions():
+        if (species.issuperset(R.reactants) and
+                species.issuperset(R.products) and
+                species.issuperset(R.orders)):
+            reactions.append(R)
+    return reactions
+
+
+def _ignition_run(args):
+    """
+    Integrate an adiabatic, constant pressure reactor and return the ignition
+    delay, defined as the time of the maximum rate of temperature rise, and the
+    states at each time step if *sample* is True.
+    """
+    mechanism, phase_id, species, T0, P0, X0, t_end, sample = args
+    gas = _get_reduction_gas(mechanism, phase_id, species)
+    gas.TPX = T0, P0, X0
+    r = IdealGasConstPressureReactor(gas)
+    net = ReactorNet([r])
+    t = [0.0]
+    T = [gas.T]
+    Y = [gas.Y] if sample else []
+    while net.time < t_end:
+        t.append(net.step())
+        T.append(r.T)
+        if sample:
+            Y.append(r.thermo.Y)
+    t = np.array(t)
+    T = np.array(T)
+    dTdt = np.diff(T) / np.maximum(np.diff(t), 1e-300)
+    tau = t[dTdt.argmax() + 1] if len(dTdt) else np.nan
+    if sample:
+        return tau, T, np.array(Y)
+    else:
+        return tau
+
+
+def _widest_paths(r, sources, combine):
+    """
+    Find the value of the best path from any of the *sources* to each node of
+    the graph with edge weights *r*, where the value of a path is computed
+    from the weights of its edges using *combine* (`np.multiply` for the
+    product, `np.minimum` for the weakest edge). The value at the sources is
+    1. This is Dijkstra's algorithm, which applies since neither operation
+    can increase the value of a path as it is extended.
+    """
+    R = np.zeros(r.shape[0])
+    R[sources] = 1.0
+    done = np.zeros(r.shape[0], dtype=bool)
+    while True:
+        candidates = np.where(done, -1.0, R)
+        k = candidates.argmax()
+        if candidates[k] <= 0:
+            return R
+        done[k] = True
+        np.maximum(R, combine(R[k], r[k]), out=R)
+
+
+class MechanismReducer(object):
+    """
+    Reduction of a chemical mechanism using the Directed Relation Graph (DRG)
+    method of Lu and Law (Proc. Combust. Inst. 30, 2005) or the Directed
+    Relation Graph with Error Propagation (DRGEP) method of Pepiot-Desjardins
+    and Pitsch (Combust. Flame 154, 2008).
+
+    States at which the reduced mechanism should be accurate are added using
+    `add_states`, `add_flame`, or `add_ignition`. At each state, the direct
+    interaction coefficient :math:`r_{AB}` measures the error introduced in
+    the production rate of species A by removing species B. For DRG,
+
+    .. math::
+
+        r_{AB} = \\frac{\\sum_i |\\nu_{A,i} q_i \\delta_{B,i}|}
+                      {\\sum_i |\\nu_{A,i} q_i|}
+
+    and for DRGEP,
+
+    .. math::
+
+        r_{AB} = \\frac{|\\sum_i \\nu_{A,i} q_i \\delta_{B,i}|}
+                      {\\max(P_A, C_A)}
+
+    where :math:`q_i` is the net rate of progress of reaction *i*,
+    :math:`\\nu_{A,i}` is the net stoichiometric coefficient of species A,
+    :math:`\\delta_{B,i}` is 1 if species B participates in reaction *i* and
+    0 otherwise, and :math:`P_A` and :math:`C_A` are the total production and
+    consumption rates of species A. The importance of each species is the
+    largest value over all of the states and target species of the overall
+    interaction coefficient, which is the weakest edge along the strongest
+    path from the target (DRG) or the largest product of the edge weights
+    along any path from the target (DRGEP). For a given threshold, the
+    reduced mechanism contains the species whose importance is at least the
+    threshold and the reactions involving only these species.
+
+    :param mechanism:
+        The input file used to create the `Solution` object. This must be an
+        ideal gas mechanism.
+    :param targets:
+        Names of the target species, e.g. the fuel, the oxidizer, and
+        important radicals.
+    :param phase_id:
+        The ID of the phase in *mechanism* to use.
+    :param method:
+        Either ``'DRG'`` or ``'DRGEP'``.
+    :param retained:
+        Names of additional species which are retained in all reduced
+        mechanisms, e.g. inert species which appear in the initial mixtures.
+
+    >>> reducer = ct.MechanismReducer('gri30.xml', ['CH4', 'O2'],
+    ...                               retained=['N2'])
+    >>> reducer.add_ignition([(1200, 5*ct.one_atm, 'CH4:0.5, O2:1, N2:3.76'),
+    ...                       (1500, 5*ct.one_atm, 'CH4:1, O2:1, N2:3.76')],
+    ...                      t_end=0.1, processes=2)
+    >>> threshold, gas = reducer.reduce_to_error(0.05, processes=2)
+    """
+    def __init__(self, mechanism, targets, phase_id='', method='DRGEP',
+                 retained=()):
+        if method not in ('DRG', 'DRGEP'):
+            raise ValueError('Unknown reduction method {!r}'.format(method))
+        self.mechanism = mechanism
+        self.phase_id = phase_id
+        self.method = method
+        self.gas = Solution(mechanism, phase_id)
+        self.targets = [self.gas.species_index(k) for k in targets]
+        self.retained = [self.gas.species_index(k) for k in retained]
+
+        # Sparse representation of the net stoichiometric coefficients of the
+        # species participating in each reaction
+        nu_species = []
+        nu_reaction = []
+        nu = []
+        for i, R in enumerate(self.gas.reactions()):
+            for k in set(R.reactants) | set(R.products):
+                nu_species.append(self.gas.species_index(k))
+                nu_reaction.append(i)
+                nu.append(R.products.get(k, 0.0) - R.reactants.get(k, 0.0))
+        self._nu_species = np.array(nu_species, dtype=int)
+        self._nu_reaction = np.array(nu_reaction, dtype=int)
+        self._nu = np.array(nu)
+
+        # All pairs of distinct entries for the same reaction. Pair n
+        # describes the contribution of entry pair_entry[n] to the production
+        # rate of species A, where B = pair_species[n] participates in the
+        # same reaction.
+        entries = {}
+        for n, i in enumerate(nu_reaction):
+            entries.setdefault(i, []).append(n)
+        pair_entry = []
+        pair_species = []
+        for group in entries.values():
+            for a in group:
+                for b in group:
+                    if a != b:
+                        pair_entry.append(a)
+                        pair_species.append(nu_species[b])
+        self._pair_entry = np.array(pair_entry, dtype=int)
+        self._pair_index = (self._nu_species[self._pair_entry] *
+                            self.gas.n_species +
+                            np.array(pair_species, dtype=int))
+
+        self._importance = np.zeros(self.gas.n_species)
+        self._importance[self.targets] = 1.0
+        self.n_samples = 0
+        self.ignition_conditions = []
+        self.ignition_delays = np.zeros(0)
+
+    def interaction_coefficients(self, T, P, Y):
+        """
+        The matrix of direct interaction coefficients :math:`r_{AB}` at the
+        state with temperature *T* [K], pressure *P* [Pa] and mass fractions
+        *Y*. Element *[A,B]* is the coefficient for species A and B.
+        """
+        self.gas.TPY = T, P, Y
+        return self._interaction_coefficients(self.gas.net_rates_of_progress)
+
+    def _interaction_coefficients(self, q):
+        nsp = self.gas.n_species
+        rates = self._nu * q[self._nu_reaction]
+        if self.method == 'DRG':
+            rates = np.abs(rates)
+            denom = np.bincount(self._nu_species, rates, nsp)
+        else:
+            prod = np.bincount(self._nu_species, np.maximum(rates, 0), nsp)
+            cons = np.bincount(self._nu_species, np.maximum(-rates, 0), nsp)
+            denom = np.maximum(prod, cons)
+
+        r = np.bincount(self._pair_index, rates[self._pair_entry], nsp*nsp)
+        r = np.abs(r.reshape(nsp, nsp))
+        active = denom > 0
+        r[active] /= denom[active, np.newaxis]
+        r[~active] = 0.0
+        np.fill_diagonal(r, 0.0)
+        return r
+
+    def _add_sample(self, q):
+        r = self._interaction_coefficients(q)
+        combine = np.minimum if self.method == 'DRG' else np.multiply
+        R = _widest_paths(r, self.targets, combine)
+        np.maximum(self._importance, R, out=self._importance)
+        self.n_samples += 1
+
+    def add_states(self, T, P, Y):
+        """
+        Add samples at the states with temperatures *T* [K], pressures *P*
+        [Pa] and mass fractions *Y*. *T* and *P* may be scalars or arrays of
+        length *N*, and *Y* may be an array with shape *(N, n_species)*.
+        """
+        Y = np.array(Y, dtype=np.double, ndmin=2)
+        n = len(Y)
+        T = np.broadcast_to(T, (n,))
+        P = np.broadcast_to(P, (n,))
+        for i in range(n):
+            self.gas.TPY = T[i], P[i], Y[i]
+            self._add_sample(self.gas.net_rates_of_progress)
+
+    def add_flame(self, flame):
+        """
+        Add samples at each grid point of the flame *flame*, which must use a
+        phase with the same species as this reducer.
+        """
+        if flame.gas.species_names != self.gas.species_names:
+            raise ValueError('The flame must use the same species as the'
+                             ' reducer')
+        for j in range(len(flame.grid)):
+            flame.set_gas_state(j)
+            self._add_sample(flame.gas.net_rates_of_progress)
+
+    def add_ignition(self, conditions, t_end, processes=1):
+        """
+        Add samples at each time step of the integration of adiabatic,
+        constant pressure reactors. The ignition delays for these conditions,
+        defined as the time of the maximum rate of temperature rise, are
+        stored and used by `validate` and `reduce_to_error`.
+
+        :param conditions:
+            A list of tuples ``(T, P, X)`` giving the initial temperature [K],
+            pressure [Pa] and mole fractions of each reactor.
+        :param t_end:
+            The time [s] until which each reactor is integrated.
+        :param processes:
+            The number of processes used to integrate the reactors, using the
+            `multiprocessing` module.
+        """
+        conditions = list(conditions)
+        args = [(self.mechanism, self.phase_id, None, T, P, X, t_end, True)
+                for T, P, X in conditions]
+        results = _pool_map(_ignition_run, args, processes)
+        for (T0, P0, X0), (tau, T, Y) in zip(conditions, results):
+            self.add_states(T, P0, Y)
+        self.ignition_conditions.extend(
+            (T, P, X, t_end) for T, P, X in conditions)
+        self.ignition_delays = np.append(self.ignition_delays,
+                                         [res[0] for res in results])
+
+    @property
+    def importance(self):
+        """
+        The overall interaction coefficient of each species, i.e. the largest
+        value over all samples and target species. This is 1 for the targets.
+        """
+        return self._importance.copy()
+
+    def species_names(self, threshold):
+        """
+        Names of the species retained in the mechanism reduced using the
+        specified *threshold*.
+        """
+        keep = self._importance >= threshold
+        keep[self.targets] = True
+        keep[self.retained] = True
+        return [self.gas.species_name(k) for k in np.nonzero(keep)[0]]
+
+    def reduce(self, threshold):
+        """
+        Return the lists of `Species` and `Reaction` objects for the mechanism
+        reduced using the specified *threshold*.
+        """
+        names = self.species_names(threshold)
+        return ([self.gas.species(k) for k in names],
+                _reduced_reactions(self.gas, names))
+
+    def reduced_solution(self, threshold):
+        """
+        Return a new `Solution` object for the mechanism reduced using the
+        specified *threshold*.
+        """
+        species, reactions = self.reduce(threshold)
+        return Solution(thermo='IdealGas', kinetics='GasKinetics',
+                        species=species, reactions=reactions)
+
+    def validate(self, threshold, processes=1):
+        """
+        Compute the ignition delays for each of the conditions added with
+        `add_ignition` using the mechanism reduced with the specified
+        *threshold*, and return the relative error of each compared to the
+        full mechanism.
+        """
+        if not self.ignition_conditions:
+            raise ValueError('No ignition conditions have been added')
+        species = tuple(self.species_names(threshold))
+        args = [(self.mechanism, self.phase_id, species, T, P, X, t_end,
+                 False) for T, P, X, t_end in self.ignition_conditions]
+        tau = np.array(_pool_map(_ignition_run, args, processes))
+        return np.abs(tau - self.ignition_delays) / self.ignition_delays
+
+    def reduce_to_error(self, max_error, processes=1):
+        """
+        Find the smallest reduced mechanism for which the relative error in
+        each of the ignition delays computed by `validate` does not exceed
+        *max_error*. Candidate thresholds are the distinct importance values
+        of the species, which are searched by bisection, assuming that the
+        error increases with the threshold. Returns the threshold and the
+        reduced `Solution`. If even the smallest threshold gives an error
+        larger than *max_error*, the threshold 0.0 is returned along with the
+        unreduced set of species.
+        """
+        optional = np.ones(self.gas.n_species, dtype=bool)
+        optional[self.targets] = False
+        optional[self.retained] = False
+        thresholds = np.unique(self._importance[optional])
+        thresholds = thresholds[thresholds > 0]
+        if not len(thresholds):
+            return 0.0, self.reduced_solution(0.0)
+
+        # If even the smallest reduction is not accurate enough, the full set
+        # of species is used
+        if self.validate(thresholds[0], processes).max() > max_error:
+            return 0.0, self.reduced_solution(0.0)
+
+        # Index of the largest threshold known to be acceptable
+        lo = 0
+        hi = len(thresholds)
+        while hi - lo > 1:
+            mid = (lo + hi) // 2
+            if self.validate(thresholds[mid], processes).max() <= max_error:
+                lo = mid
+            else:
+                hi = mid
+        return thresholds[lo], self.reduced_solution(thresholds[lo])
@@ -0,0 +1,168 @@
+import numpy as np
+
+from ._cantera import Solution, LookupTable, one_atm
+from .utils import _get_worker_object, _pool_map
+
+
+def _get_table_gas(mechanism, phase_id, transport_model):
+    def create():
+        gas = Solution(mechanism, phase_id)
+        if transport_model is not None:
+            gas.transport_model = transport_model
+        return gas
+    return _get_worker_object(('table', mechanism, phase_id, transport_model),
+                              create)
+
+
+def _init_table_worker(mechanism, phase_id, transport_model):
+    _get_table_gas(mechanism, phase_id, transport_model)
+
+
+def _equilibrium_table_chunk(args):
+    """
+    Compute the equilibrium properties for a block of consecutive grid points.
+    The states are passed to `ThermoPhase.batch_equilibrate` in order, so that
+    each one is warm-started from the solution for its neighbor.
+    """
+    (mechanism, phase_id, transport_model, Y, thermal, P, use_enthalpy,
+     species) = args
+    gas = _get_table_gas(mechanism, phase_id, transport_model)
+    n = len(Y)
+
+    # Initial mole fractions and temperatures of the unburned mixtures
+    X = Y / gas.molecular_weights
+    X /= X.sum(axis=1)[:, np.newaxis]
+    if use_enthalpy:
+        T = np.empty(n)
+        for i in range(n):
+            gas.HPY = thermal[i], P[i], Y[i]
+            T[i] = gas.T
+    else:
+        T = thermal
+
+    Teq, Peq, Xeq, _ = gas.batch_equilibrate('HP', T, P, X)
+
+    indices = [gas.species_index(k) for k in species]
+    columns = [Teq, np.empty(n), np.empty(n)]
+    Yeq = np.empty((n, len(indices)))
+    for i in range(n):
+        gas.TPX = Teq[i], Peq[i], Xeq[i]
+        columns[1][i] = gas.density
+        columns[2][i] = gas.cp_mass
+        Yeq[i] = gas.Y[indices]
+    columns.extend(Yeq.T)
+    if transport_model is not None:
+        for name in ('viscosity', 'thermal_conductivity'):
+            columns.append(gas.batch_transport(name, Teq, Peq, Xeq))
+
+    return np.column_stack(columns)
+
+
+def build_equilibrium_table(mechanism, fuel, oxidizer, axes, species=(),
+                            P=one_atm, transport_model=None, phase_id='',
+                            processes=1):
+    """
+    Build a `LookupTable` of the adiabatic, isobaric equilibrium states of
+    mixtures of a fuel and an oxidizer on a structured grid.
+
+    :param mechanism:
+        The input file used to create the `Solution` object.
+    :param fuel:
+        The composition of the fuel, as mole fractions.
+    :param oxidizer:
+        The composition of the oxidizer, as mole fractions.
+    :param axes:
+        A list of ``(name, values)`` pairs defining the grid axes, in the
+        order in which they are stored in the table. The mixture composition
+        is specified using one axis named either ``'phi'`` (the equivalence
+        ratio) or ``'Z'`` (the mixture fraction, i.e. the mass fraction of
+        material originating from the fuel stream). The enthalpy of the
+        mixture is specified using one axis named either ``'T'`` (the
+        temperature of the unburned mixture [K]) or ``'h'`` (the specific
+        enthalpy [J/kg]). An axis named ``'P'`` (pressure [Pa]) may also be
+        given.
+    :param species:
+        Names of the species whose equilibrium mass fractions are tabulated.
+    :param P:
+        The pressure [Pa], if it is not given as one of the axes.
+    :param transport_model:
+        If given, the viscosity and thermal conductivity are tabulated, using
+        this transport model.
+    :param phase_id:
+        The ID of the phase in *mechanism* to use.
+    :param processes:
+        The number of processes used to compute the table. If greater than 1,
+        the grid is divided among a pool of worker processes using the
+        `multiprocessing` module.
+
+    The tabulated variables are ``'T'``, ``'density'``, ``'cp_mass'``,
+    ``'Y_<name>'`` for each of the *species*, and ``'viscosity'`` and
+    ``'thermal_conductivity'`` if a *transport_model* is given.
+
+    >>> table = ct.build_equilibrium_table('gri30.xml', 'CH4', 'O2:1, N2:3.76',
+    ...     [('phi', np.linspace(0.5, 2.0, 31)),
+    ...      ('T', np.linspace(300, 800, 11))], species=['CO2', 'CO'])
+    >>> table.save('methane-air.table')
+    """
+    axis_names = [name for name, values in axes]
+    values = [np.array(v, dtype=np.double, ndmin=1) for name, v in axes]
+    for name in axis_names:
+        if name not in ('phi', 'Z', 'T', 'h', 'P'):
+            raise ValueError('Unknown axis {!r}'.format(name))
+        if axis_names.count(name) != 1:
+            raise ValueError('Duplicate axis {!r}'.format(name))
+    mix_axes = [name for name in axis_names if name in ('phi', 'Z')]
+    thermal_axes = [name for name in axis_names if name in ('T', 'h')]
+    if len(mix_axes) != 1 or len(thermal_axes) != 1:
+        raise ValueError("Exactly one of the axes 'phi' and 'Z' and one of "
+                         "the axes 'T' and 'h' must be given")
+
+    gas = Solution(mechanism, phase_id)
+    for k in species:
+        gas.species_index(k)  # raise an exception for unknown species
+
+    # Compositions of the unburned mixtures at each point along the
+    # composition axis
+    imix = axis_names.index(mix_axes[0])
+    if mix_axes[0] == 'phi':
+        Ymix = []
+        for phi in values[imix]:
+            gas.set_equivalence_ratio(phi, fuel, oxidizer)
+            Ymix.append(gas.Y)
+        Ymix = np.array(Ymix)
+    else:
+        gas.X = fuel
+        Yfuel = gas.Y
+        gas.X = oxidizer
+        Yox = gas.Y
+        Z = values[imix][:, np.newaxis]
+        Ymix = Z * Yfuel + (1 - Z) * Yox
+
+    # Flattened coordinates of all of the grid points, in the order in which
+    # they are stored in the table
+    shape = tuple(len(v) for v in values)
+    index = np.indices(shape).reshape(len(shape), -1)
+    Y = Ymix[index[imix]]
+    thermal = values[axis_names.index(thermal_axes[0])][
+        index[axis_names.index(thermal_axes[0])]]
+    if 'P' in axis_names:
+        Pgrid = values[axis_names.index('P')][index[axis_names.index('P')]]
+    else:
+        Pgrid = P * np.ones(index.shape[1])
+
+    names = ['T', 'density', 'cp_mass'] + ['Y_' + k for k in species]
+    if transport_model is not None:
+        names.extend(['viscosity', 'thermal_conductivity'])
+
+    # Divide the grid into contiguous blocks, so that each worker can
+    # warm-start the equilibrium solver from neighboring states
+    nblocks = 4 * processes if processes > 1 else 1
+    blocks = np.array_split(np.arange(index.shape[1]), nblocks)
+    args = [(mechanism, phase_id, transport_model, Y[b], thermal[b], Pgrid[b],
+             thermal_axes[0] == 'h', list(species)) for b in blocks if len(b)]
+    results = _pool_map(_equilibrium_table_chunk, args, processes,
+                        initializer=_init_table_worker,
+                        initargs=(mechanism, phase_id, transport_model))
+
+    data = np.concatenate(results).reshape(shape + (len(names),))
+    return LookupTable(values, data, names, axis_names)
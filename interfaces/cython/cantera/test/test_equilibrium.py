@@ -2,6 +2,7 @@ from __future__ import division
 
 import unittest
 import os
+import threading
 import warnings
 
 import numpy as np
@@ -106,6 +107,197 @@ class VCS_EquilTest(EquilTestCases, utilities.CanteraTest):
         unittest.TestCase.__init__(self, *args, **kwargs)
 
 
+class BatchEquilTest(utilities.CanteraTest):
+    def setUp(self):
+        self.gas = ct.Solution('gri30.xml')
+        phi = np.linspace(0.6, 1.6, 11)
+        self.X = np.zeros((len(phi), self.gas.n_species))
+        self.X[:, self.gas.species_index('CH4')] = phi
+        self.X[:, self.gas.species_index('O2')] = 2.0
+        self.X[:, self.gas.species_index('N2')] = 7.52
+
+    def test_batch_HP(self):
+        self.gas.TPX = 500, 2 * ct.one_atm, 'H2:1.0, O2:1.0'
+        T0, P0, X0 = self.gas.TPX
+        Teq, Peq, Xeq, iters = self.gas.batch_equilibrate(
+            'HP', 300, ct.one_atm, self.X)
+
+        # state of the phase is unchanged
+        self.assertNear(self.gas.T, T0)
+        self.assertNear(self.gas.P, P0)
+        self.assertArrayNear(self.gas.X, X0)
+
+        self.assertEqual(Xeq.shape, self.X.shape)
+        self.assertTrue(all(iters >= 0))
+        for i in range(len(self.X)):
+            self.gas.TPX = 300, ct.one_atm, self.X[i]
+            self.gas.equilibrate('HP')
+            self.assertNear(Teq[i], self.gas.T, 1e-6)
+            self.assertNear(Peq[i], self.gas.P)
+            self.assertArrayNear(Xeq[i], self.gas.X, 1e-5, 1e-9)
+
+    def test_batch_warm_start(self):
+        T = np.linspace(300, 500, len(self.X))
+        Tw, Pw, Xw, warm = self.gas.batch_equilibrate('HP', T, ct.one_atm,
+                                                      self.X)
+        Tc, Pc, Xc, cold = self.gas.batch_equilibrate('HP', T, ct.one_atm,
+                                                      self.X, warm_start=False)
+        self.assertArrayNear(Tw, Tc, 1e-6)
+        self.assertArrayNear(Xw, Xc, 1e-5, 1e-9)
+        self.assertEqual(warm[0], cold[0])
+
+    def test_batch_gibbs(self):
+        Teq, Peq, Xeq, iters = self.gas.batch_equilibrate(
+            'TP', [1500, 2000], ct.one_atm, self.X[5], solver='gibbs')
+        self.assertTrue(all(iters == -1))
+        for i, T in enumerate([1500, 2000]):
+            self.gas.TPX = T, ct.one_atm, self.X[5]
+            self.gas.equilibrate('TP')
+            self.assertArrayNear(Xeq[i], self.gas.X, 1e-5, 1e-9)
+
+    def test_threads(self):
+        # Independent phases can be equilibrated concurrently
+        Teq, Peq, Xeq, iters = self.gas.batch_equilibrate(
+            'HP', 300, ct.one_atm, self.X)
+        gases = [ct.Solution('gri30.xml') for i in range(len(self.X))]
+        mixtures = []
+        for gas, X in zip(gases, self.X):
+            gas.TPX = 300, ct.one_atm, X
+            mixtures.append(ct.Mixture([(gas, 1.0)]))
+
+        threads = [threading.Thread(target=gas.equilibrate, args=('HP',))
+                   for gas in gases[::2]]
+        threads.extend(threading.Thread(target=mix.equilibrate,
+                                        args=('HP',), kwargs={'solver': 'vcs'})
+                       for mix in mixtures[1::2])
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        for i, gas in enumerate(gases):
+            self.assertNear(Teq[i], gas.T, 1e-6)
+            self.assertArrayNear(Xeq[i], gas.X, 1e-5, 1e-9)
+
+    def test_batch_errors(self):
+        with self.assertRaises(ValueError):
+            self.gas.batch_equilibrate('TP', [300, 400], ct.one_atm, self.X)
+        with self.assertRaises(ValueError):
+            self.gas.batch_equilibrate('TP', 300, ct.one_atm, self.X[:, :5])
+
+
+class TestLookupTable(utilities.CanteraTest):
+    def setUp(self):
+        self.x = np.array([0.0, 1.0, 3.0])
+        self.y = np.array([-1.0, 0.0, 0.5, 2.0])
+        xx, yy = np.meshgrid(self.x, self.y, indexing='ij')
+        # Bilinear functions are reproduced exactly by the interpolation
+        data = np.dstack([2*xx + 3*yy + 1, xx*yy])
+        self.table = ct.LookupTable([self.x, self.y], data, ['f', 'g'],
+                                    ['x', 'y'])
+
+    def test_interpolate(self):
+        points = [[0.5, 0.25], [2.0, -0.5], [3.0, 2.0]]
+        f = self.table.interpolate(points, 'f')
+        fg = self.table.interpolate(points)
+        self.assertEqual(fg.shape, (3, 2))
+        for i, (x, y) in enumerate(points):
+            self.assertNear(f[i], 2*x + 3*y + 1)
+            self.assertNear(fg[i,0], 2*x + 3*y + 1)
+            self.assertNear(fg[i,1], x*y)
+
+        gf = self.table.interpolate((1.5, 1.0), ['g', 'f'])
+        self.assertArrayNear(gf, [1.5, 7.0])
+
+    def test_clip(self):
+        self.assertNear(self.table.interpolate((5.0, -3.0), 'f'),
+                        self.table.interpolate((3.0, -1.0), 'f'))
+
+    def test_save_load(self):
+        filename = 'lookup-table-test.bin'
+        if os.path.exists(filename):
+            os.remove(filename)
+        self.table.save(filename)
+        table = ct.LookupTable.load(filename)
+        self.assertEqual(table.names, ('f', 'g'))
+        self.assertEqual(table.axis_names, ('x', 'y'))
+        self.assertArrayNear(table.axes[1], self.y)
+        self.assertArrayNear(table.data.ravel(), self.table.data.ravel())
+        points = np.random.random((10, 2)) * 3
+        self.assertArrayNear(table.interpolate(points).ravel(),
+                             self.table.interpolate(points).ravel())
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            ct.LookupTable([self.x, self.y], np.zeros((3, 3, 2)), ['f', 'g'])
+        with self.assertRaises(ValueError):
+            self.table.interpolate([1.0, 2.0, 3.0])
+        with self.assertRaises(ValueError):
+            self.table.interpolate([1.0, 2.0], 'h')
+        with self.assertRaises(Exception):
+            ct.LookupTable([[0, 1, 1]], np.zeros((3, 1)), ['f'])
+
+
+class TestEquilibriumTable(utilities.CanteraTest):
+    @classmethod
+    def setUpClass(cls):
+        cls.gas = ct.Solution('h2o2.xml')
+        cls.fuel = 'H2:1.0'
+        cls.oxidizer = 'O2:1.0, AR:3.76'
+
+    def test_phi_T(self):
+        phi = [0.5, 1.0, 1.5]
+        T = [300, 600]
+        table = ct.build_equilibrium_table('h2o2.xml', self.fuel,
+            self.oxidizer, [('phi', phi), ('T', T)], species=['H2O', 'OH'],
+            transport_model='Mix')
+        self.assertEqual(table.names,
+                         ('T', 'density', 'cp_mass', 'Y_H2O', 'Y_OH',
+                          'viscosity', 'thermal_conductivity'))
+        self.assertEqual(table.data.shape, (3, 2, 7))
+
+        for i, p in enumerate(phi):
+            for j, T0 in enumerate(T):
+                self.gas.set_equivalence_ratio(p, self.fuel, self.oxidizer)
+                self.gas.TP = T0, ct.one_atm
+                self.gas.equilibrate('HP')
+                y = table.interpolate((p, T0))
+                self.assertNear(y[0], self.gas.T, 1e-6)
+                self.assertNear(y[1], self.gas.density, 1e-6)
+                self.assertNear(y[2], self.gas.cp_mass, 1e-6)
+                self.assertNear(y[3], self.gas['H2O'].Y[0], 1e-5)
+                self.assertNear(y[5], self.gas.viscosity, 1e-6)
+
+    def test_Z_h_P(self):
+        Z = [0.0, 0.02, 0.05]
+        h = [-1e5, 0.0, 2e5]
+        P = [ct.one_atm, 5 * ct.one_atm]
+        table = ct.build_equilibrium_table('h2o2.xml', self.fuel,
+            self.oxidizer, [('P', P), ('Z', Z), ('h', h)], processes=2)
+        self.assertEqual(table.axis_names, ('P', 'Z', 'h'))
+
+        self.gas.X = self.fuel
+        Yfuel = self.gas.Y
+        self.gas.X = self.oxidizer
+        Yox = self.gas.Y
+        for Pk in P:
+            for Zk in Z:
+                for hk in h:
+                    self.gas.HPY = hk, Pk, Zk * Yfuel + (1 - Zk) * Yox
+                    self.gas.equilibrate('HP')
+                    self.assertNear(table.interpolate((Pk, Zk, hk), 'T'),
+                                    self.gas.T, 1e-6)
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            ct.build_equilibrium_table('h2o2.xml', self.fuel, self.oxidizer,
+                                       [('phi', [1.0]), ('Z', [0.1])])
+        with self.assertRaises(ValueError):
+            ct.build_equilibrium_table('h2o2.xml', self.fuel, self.oxidizer,
+                                       [('phi', [1.0]), ('T', [300]),
+                                        ('X', [0.0])])
+
+
 class TestKOH_Equil(utilities.CanteraTest):
     "Test roughly based on examples/multiphase/plasma_equilibrium.py"
     @classmethod
@@ -51,6 +51,67 @@ class TestFunc1(utilities.CanteraTest):
         with self.assertRaises(TypeError):
             ct.Func1(np.array([3,4]))
 
+    def test_polynomial(self):
+        f = ct.Func1.polynomial([1.5, -2, 0.5])
+        for t in [0.1, 0.7, 4.5]:
+            self.assertNear(f(t), 1.5 - 2*t + 0.5*t**2)
+
+        self.assertNear(ct.Func1.polynomial([3.2])(7), 3.2)
+        with self.assertRaises(ValueError):
+            ct.Func1.polynomial([])
+
+    def test_tabulated(self):
+        t = [0, 1, 1, 3]
+        y = [2, 4, 6, 2]
+        f = ct.Func1.tabulated(t, y)
+        self.assertNear(f(-1), 2)
+        self.assertNear(f(0.5), 3)
+        self.assertNear(f(2), 4)
+        self.assertNear(f(3.5), 2)
+        self.assertArrayNear([f(tt) for tt in np.linspace(-1, 4, 12)],
+                             np.interp(np.linspace(-1, 4, 12), t, y))
+
+        with self.assertRaises(ValueError):
+            ct.Func1.tabulated([0, 1], [1, 2, 3])
+        with self.assertRaises(Exception):
+            ct.Func1.tabulated([0, 2, 1], [1, 2, 3])
+
+    def test_fourier(self):
+        f = ct.Func1.fourier(2.0, 1.0, [0.5, -0.3], [1.2, 0.4])
+        for t in [0.1, 0.7, 4.5]:
+            self.assertNear(f(t), 0.5 + 0.5 * np.cos(2*t) + 1.2 * np.sin(2*t)
+                                  - 0.3 * np.cos(4*t) + 0.4 * np.sin(4*t))
+
+    def test_arithmetic(self):
+        p = ct.Func1.polynomial([1, 2])
+        q = ct.Func1.tabulated([0, 10], [0, 5])
+        for t in [0.1, 0.7, 4.5]:
+            self.assertNear((p + q)(t), 1 + 2*t + 0.5*t)
+            self.assertNear((p - q)(t), 1 + 2*t - 0.5*t)
+            self.assertNear((p * q)(t), (1 + 2*t) * 0.5*t)
+            self.assertNear((p * 3)(t), 3 + 6*t)
+            self.assertNear((2 + q)(t), 2 + 0.5*t)
+            self.assertNear(p.compose(q)(t), 1 + t)
+
+        # combinations of different functions of the same type are distinct
+        r = ct.Func1.polynomial([0, 0, 1])
+        self.assertNear((p + r)(3), 16)
+        self.assertNear((p + r).compose(p)(2), 36)
+
+    def test_arithmetic_python(self):
+        # functions involving Python callables keep them alive
+        f = ct.Func1(np.sin) * ct.Func1.polynomial([0, 1])
+        g = f + (lambda t: t**2)
+        for t in [0.1, 0.7, 4.5]:
+            self.assertNear(f(t), t * np.sin(t))
+            self.assertNear(g(t), t * np.sin(t) + t**2)
+
+        def fails(t):
+            raise ValueError('bad')
+        h = ct.Func1(fails) + 1
+        with self.assertRaises(ValueError):
+            h(0.1)
+
     def test_failure(self):
         def fails(t):
             raise ValueError('bad')
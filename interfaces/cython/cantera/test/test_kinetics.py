@@ -344,6 +344,34 @@ class KineticsRepeatability(utilities.CanteraTest):
     def test_pdep_pressure(self):
         self.check_rates_pressure('pdep-test.xml')
 
+    def check_rate_cache(self, mech, states):
+        gas = self.setup_gas(mech)
+        expected = []
+        for T, P in states:
+            gas.TPX = T, P, self.X0
+            expected.append((gas.forward_rate_constants,
+                             gas.net_production_rates))
+
+        gas.rate_cache_size = 3
+        self.assertEqual(gas.rate_cache_size, 3)
+        for i in range(3):
+            for (T, P), (kf, wdot) in zip(states, expected):
+                gas.TPX = T, P, self.X0
+                self.assertArrayNear(gas.forward_rate_constants, kf, 1e-15)
+                self.assertArrayNear(gas.net_production_rates, wdot, 1e-15)
+        hits, misses = gas.rate_cache_stats
+        self.assertEqual(misses, len(states))
+        self.assertEqual(hits, 2 * len(states))
+
+    def test_gri30_rate_cache(self):
+        self.check_rate_cache('gri30.xml', [(self.T0, self.P0),
+            (self.T1, self.P1), (1500, self.P0)])
+
+    def test_pdep_rate_cache(self):
+        # rates of P-log and Chebyshev reactions depend on pressure
+        self.check_rate_cache('pdep-test.xml', [(self.T0, self.P0),
+            (self.T0, self.P1), (self.T1, self.P1)])
+
     def test_modify_thermo(self):
         # Make sure that thermo modifications propagate through to Kinetics
 
@@ -430,6 +458,310 @@ class TestReactionPath(utilities.CanteraTest):
             for spec in species:
                 self.assertTrue(gas.n_atoms(spec, element) > 0)
 
+    def test_sparse_fluxes(self):
+        gas = ct.Solution('gri30.xml')
+        gas.TPX = 1500, ct.one_atm, 'CH4:0.4, O2:1, N2:3.76, H:0.01, OH:0.01'
+        gas.equilibrate('TP')
+        gas.TP = 1200, None
+        for element in ['C', 'H']:
+            diagram = ct.ReactionPathDiagram(gas, element)
+            k1, k2, fwd, rev = diagram.get_fluxes()
+            self.assertTrue(len(k1))
+            self.assertTrue((k1 < k2).all())
+            self.assertEqual(len(set(zip(k1, k2))), len(k1))
+
+            # compare with the text output
+            lines = diagram.get_data().split('\n')[2:]
+            data = {}
+            for line in filter(None, lines):
+                A, B, f, r = line.split()
+                data[tuple(sorted([A, B]))] = (float(f), -float(r)) if \
+                    gas.species_index(A) < gas.species_index(B) else \
+                    (-float(r), float(f))
+            for i in range(len(k1)):
+                key = tuple(sorted([gas.species_name(k1[i]),
+                                    gas.species_name(k2[i])]))
+                self.assertNear(data[key][0], fwd[i], 1e-5, 1e-25)
+                self.assertNear(data[key][1], rev[i], 1e-5, 1e-25)
+
+            # per-reaction contributions
+            j1, j2, rxn, direction, flux = diagram.get_reaction_fluxes()
+            self.assertTrue((rxn >= 0).all())
+            self.assertTrue((rxn < gas.n_reactions).all())
+            self.assertEqual(set(direction), {-1, 1})
+            self.assertTrue((flux >= 0).all())
+            total = np.zeros((gas.n_species, gas.n_species))
+            np.add.at(total, (j1, j2), flux)
+            self.assertArrayNear(total[k1, k2], fwd)
+            self.assertArrayNear(total[k2, k1], rev)
+            total[k1, k2] = 0
+            total[k2, k1] = 0
+            self.assertEqual(total.max(), 0)
+
+            # Contributing reactions must involve both species
+            nu_r = gas.reactant_stoich_coeffs()
+            nu_p = gas.product_stoich_coeffs()
+            for a, b, i, d in zip(j1, j2, rxn, direction):
+                if d == 1:
+                    self.assertTrue(nu_r[a, i] and nu_p[b, i])
+                else:
+                    self.assertTrue(nu_p[a, i] and nu_r[b, i])
+
+    def test_reaction_flux_direction(self):
+        # Only the reverse direction of 2 O + M <=> O2 + M (reaction 0 in
+        # h2o2.xml) proceeds, since there is no O
+        gas = ct.Solution('h2o2.xml')
+        gas.TPX = 2500, ct.one_atm, 'O2:1, AR:5'
+        self.assertEqual(gas.forward_rates_of_progress[0], 0)
+        self.assertGreater(gas.reverse_rates_of_progress[0], 0)
+        diagram = ct.ReactionPathDiagram(gas, 'O')
+        k1, k2, rxn, direction, flux = diagram.get_reaction_fluxes()
+        mask = (rxn == 0)
+        self.assertTrue(mask.any())
+        self.assertTrue((direction[mask] == -1).all())
+        kO = gas.species_index('O')
+        kO2 = gas.species_index('O2')
+        self.assertIn((kO2, kO), set(zip(k1[mask], k2[mask])))
+
+    def test_accumulator_constant_state(self):
+        gas = ct.Solution('h2o2.xml')
+        gas.TPX = 1200, ct.one_atm, 'H2:1, O2:1, H:0.01, OH:0.01, AR:5'
+        acc1 = ct.ReactionPathAccumulator(gas)
+        acc1.add_sample(0.0)
+        acc1.add_sample(1.0)
+        acc2 = ct.ReactionPathAccumulator(gas)
+        for t in np.linspace(2.0, 2.5, 5):
+            acc2.add_sample(t, 2.0)
+
+        self.assertEqual(acc1.n_samples, 2)
+        self.assertEqual(acc2.n_samples, 5)
+        self.assertNear(acc2.start, 2.0)
+        self.assertNear(acc2.end, 2.5)
+        self.assertArrayNear(acc1.forward_rates_of_progress,
+                             gas.forward_rates_of_progress)
+        self.assertArrayNear(acc2.net_rates_of_progress,
+                             gas.net_rates_of_progress)
+
+        for element in ['H', 'O']:
+            F1 = acc1.flux_matrix(element)
+            F2 = acc2.flux_matrix(element)
+            self.assertEqual(F1.shape, (gas.n_species, gas.n_species))
+            self.assertArrayNear(F1, F2)
+            self.assertTrue((F1 >= 0).all())
+            self.assertGreater(F1.max(), 0)
+            kO = gas.species_index('O')
+            if element == 'H':
+                self.assertEqual(F1[kO].max(), 0)
+
+        # Diagram for the integrated fluxes should be the same as the one for
+        # the instantaneous state, since the integration time is 1 s
+        d1 = acc1.diagram('H')
+        d2 = ct.ReactionPathDiagram(gas, 'H')
+        self.assertEqual(d1.get_dot(), d2.get_dot())
+
+        acc1.reset()
+        self.assertEqual(acc1.n_samples, 0)
+        self.assertArrayNear(acc1.forward_rates_of_progress,
+                             np.zeros(gas.n_reactions))
+
+    def test_accumulator_trapezoid(self):
+        gas = ct.Solution('h2o2.xml')
+        acc = ct.ReactionPathAccumulator(gas)
+        gas.TPX = 1200, ct.one_atm, 'H2:1, O2:1, H:0.01, OH:0.01, AR:5'
+        r1 = gas.forward_rates_of_progress
+        acc.add_sample(1.0)
+        gas.TPX = 1400, 2 * ct.one_atm, 'H2:1, O2:1, H:0.01, OH:0.02, AR:5'
+        r2 = gas.forward_rates_of_progress
+        acc.add_sample(3.0, 0.5)
+        self.assertArrayNear(acc.forward_rates_of_progress, r1 + 0.5 * r2)
+
+        with self.assertRaises(Exception):
+            acc.add_sample(2.0)
+        with self.assertRaises(Exception):
+            acc.flux_matrix('C')
+
+    def test_accumulator_flame(self):
+        gas = ct.Solution('h2o2.xml')
+        gas.TPX = 300, ct.one_atm, 'H2:1.1, O2:1, AR:5'
+        flame = ct.FreeFlame(gas, width=0.03)
+        flame.set_initial_guess()
+        acc = ct.ReactionPathAccumulator(gas)
+        acc.add_flame(flame)
+        self.assertEqual(acc.n_samples, len(flame.grid))
+        self.assertNear(acc.end, flame.grid[-1])
+
+        ropf = np.zeros(gas.n_reactions)
+        z = flame.grid
+        for j in range(len(z) - 1):
+            flame.set_gas_state(j)
+            r1 = gas.forward_rates_of_progress
+            flame.set_gas_state(j+1)
+            r2 = gas.forward_rates_of_progress
+            ropf += 0.5 * (z[j+1] - z[j]) * (r1 + r2)
+        self.assertArrayNear(acc.forward_rates_of_progress, ropf)
+
+        with self.assertRaises(ValueError):
+            ct.ReactionPathAccumulator(ct.Solution('h2o2.xml')).add_flame(flame)
+
+    def test_accumulator_reactor(self):
+        gas = ct.Solution('h2o2.xml')
+        gas.TPX = 1000, ct.one_atm, 'H2:2, O2:1, AR:5'
+        r = ct.IdealGasReactor(gas)
+        r.volume = 0.5
+        net = ct.ReactorNet([r])
+        acc1 = ct.ReactionPathAccumulator(gas)
+        net.add_reaction_path_accumulator(r, acc1)
+
+        # Samples taken manually at the same times should give the same result
+        acc2 = ct.ReactionPathAccumulator(gas)
+        acc2.add_sample(0.0, r.volume)
+        while net.time < 1e-3:
+            net.step()
+            acc2.add_sample(net.time, r.volume)
+
+        self.assertEqual(acc1.n_samples, acc2.n_samples)
+        self.assertArrayNear(acc1.forward_rates_of_progress,
+                             acc2.forward_rates_of_progress)
+        self.assertArrayNear(acc1.flux_matrix('O'), acc2.flux_matrix('O'))
+
+        net.advance(2e-3)
+        self.assertGreater(acc1.n_samples, acc2.n_samples + 1)
+        self.assertNear(acc1.end, 2e-3)
+
+        # The integrated net production of H2O [kmol]
+        kH2O = gas.species_index('H2O')
+        nu = gas.product_stoich_coeffs() - gas.reactant_stoich_coeffs()
+        nH2O = np.dot(nu[kH2O], acc1.net_rates_of_progress)
+        self.assertNear(nH2O, r.volume * r.thermo.density_mole *
+                        r.thermo.X[kH2O], 1e-2)
+
+        with self.assertRaises(ValueError):
+            net.add_reaction_path_accumulator(
+                r, ct.ReactionPathAccumulator(ct.Solution('h2o2.xml')))
+
+
+class TestMechanismReducer(utilities.CanteraTest):
+    @classmethod
+    def setUpClass(cls):
+        cls.gas = ct.Solution('gri30.xml')
+        cls.gas.TPX = 1500, ct.one_atm, 'CH4:0.5, O2:1, N2:3.76'
+        cls.gas.equilibrate('HP')
+        cls.gas.TP = 1600, None
+        cls.gas.X = 0.8 * cls.gas.X + 0.2 * np.array(
+            [0.5 if k == 'CH4' else 1 if k == 'O2' else 3.76 if k == 'N2'
+             else 0 for k in cls.gas.species_names]) / 5.26
+
+    def check_coefficients(self, method):
+        gas = self.gas
+        reducer = ct.MechanismReducer('gri30.xml', ['CH4', 'O2'],
+                                      method=method)
+        r = reducer.interaction_coefficients(gas.T, gas.P, gas.Y)
+
+        nu = gas.product_stoich_coeffs() - gas.reactant_stoich_coeffs()
+        delta = (gas.product_stoich_coeffs() +
+                 gas.reactant_stoich_coeffs()) > 0
+        rates = nu * gas.net_rates_of_progress
+        if method == 'DRG':
+            num = np.dot(np.abs(rates), delta.T)
+            denom = np.abs(rates).sum(axis=1)
+        else:
+            num = np.abs(np.dot(rates, delta.T))
+            denom = np.maximum(np.maximum(rates, 0).sum(axis=1),
+                               np.maximum(-rates, 0).sum(axis=1))
+        for a in range(gas.n_species):
+            for b in range(gas.n_species):
+                if a == b or denom[a] == 0:
+                    self.assertEqual(r[a, b], 0)
+                else:
+                    self.assertNear(r[a, b], num[a, b] / denom[a], 1e-8,
+                                    1e-14)
+        return reducer
+
+    def test_drg_coefficients(self):
+        self.check_coefficients('DRG')
+
+    def test_drgep_coefficients(self):
+        self.check_coefficients('DRGEP')
+
+    def test_unknown_method(self):
+        with self.assertRaises(ValueError):
+            ct.MechanismReducer('gri30.xml', ['CH4'], method='CSP')
+
+    def test_importance(self):
+        gas = self.gas
+        for method in ('DRG', 'DRGEP'):
+            reducer = ct.MechanismReducer('gri30.xml', ['CH4', 'O2'],
+                                          method=method)
+            reducer.add_states(gas.T, gas.P, gas.Y)
+            r = reducer.interaction_coefficients(gas.T, gas.P, gas.Y)
+            R = reducer.importance
+            self.assertEqual(reducer.n_samples, 1)
+            self.assertEqual(R[gas.species_index('CH4')], 1.0)
+            self.assertEqual(R[gas.species_index('O2')], 1.0)
+
+            # direct neighbors of the targets
+            for k in range(gas.n_species):
+                for t in (gas.species_index('CH4'), gas.species_index('O2')):
+                    self.assertTrue(R[k] >= r[t, k] * (1 - 1e-12))
+
+            # no species is more important than all of its predecessors
+            for k in range(gas.n_species):
+                if R[k] == 1.0:
+                    continue
+                if method == 'DRG':
+                    best = (np.minimum(R, r[:, k])).max()
+                else:
+                    best = (R * r[:, k]).max()
+                self.assertNear(R[k], best, 1e-12)
+
+    def test_reduce(self):
+        gas = self.gas
+        reducer = ct.MechanismReducer('gri30.xml', ['CH4', 'O2'],
+                                      retained=['N2', 'AR'])
+        reducer.add_states([gas.T, 1200], gas.P, [gas.Y, gas.Y])
+        self.assertEqual(reducer.n_samples, 2)
+
+        names = reducer.species_names(1e-3)
+        self.assertIn('CH4', names)
+        self.assertIn('AR', names)
+        self.assertTrue(set(names) < set(reducer.species_names(1e-4)))
+        self.assertTrue(len(names) < gas.n_species)
+
+        species, reactions = reducer.reduce(1e-3)
+        self.assertEqual([sp.name for sp in species], names)
+        for R in reactions:
+            self.assertTrue(set(names).issuperset(R.reactants))
+            self.assertTrue(set(names).issuperset(R.products))
+
+        gas2 = reducer.reduced_solution(1e-3)
+        self.assertEqual(gas2.species_names, names)
+        self.assertEqual(gas2.n_reactions, len(reactions))
+
+        # The production rates of the targets should be close to those of
+        # the full mechanism with a small threshold
+        gas2 = reducer.reduced_solution(1e-6)
+        gas2.TPY = gas.T, gas.P, gas[gas2.species_names].Y
+        for k in ('CH4', 'O2'):
+            self.assertNear(gas2.net_production_rates[gas2.species_index(k)],
+                            gas.net_production_rates[gas.species_index(k)],
+                            1e-3)
+
+    def test_reduce_to_error(self):
+        reducer = ct.MechanismReducer('gri30.xml', ['CH4', 'O2'],
+                                      retained=['N2'])
+        conditions = [(1300, ct.one_atm, 'CH4:0.5, O2:1, N2:3.76'),
+                      (1500, 5 * ct.one_atm, 'CH4:1, O2:1, N2:3.76')]
+        reducer.add_ignition(conditions, t_end=0.05)
+        self.assertEqual(len(reducer.ignition_delays), 2)
+        threshold, gas2 = reducer.reduce_to_error(0.05)
+        self.assertTrue(gas2.n_species < self.gas.n_species)
+        self.assertTrue(max(reducer.validate(threshold)) <= 0.05)
+
+        # No reduced mechanism is accurate enough, so all species are kept
+        threshold, gas3 = reducer.reduce_to_error(-1.0)
+        self.assertEqual(threshold, 0.0)
+        self.assertEqual(gas3.n_species, self.gas.n_species)
+
 
 class TestChemicallyActivated(utilities.CanteraTest):
     def test_rate_evaluation(self):
@@ -485,6 +817,59 @@ class ExplicitForwardOrderTest(utilities.CanteraTest):
         self.assertNear(ratio[2], 2**0.0) # order of R1B is 0
 
 
+class TestSteadyCoverages(utilities.CanteraTest):
+    def setUp(self):
+        self.gas = ct.Solution('ptcombust.xml', 'gas')
+        self.surf = ct.Interface('ptcombust.xml', 'Pt_surf', [self.gas])
+        self.gas.TPX = 900, ct.one_atm, 'CH4:0.095, O2:0.21, AR:0.79'
+        self.surf.TP = 900, ct.one_atm
+
+    def test_batch_steady_coverages(self):
+        gas, surf = self.gas, self.surf
+        T = np.linspace(900, 1300, 9)
+        X = np.outer(np.linspace(1, 0.2, 9), gas.X) + \
+            np.outer(np.linspace(0, 0.8, 9), gas['CO2'].X * 0 +
+                     np.eye(gas.n_species)[gas.species_index('CO2')])
+        gas_state = gas.TPX
+        surf_state = surf.TP, surf.coverages
+
+        cov, wdot = surf.batch_steady_coverages(T, ct.one_atm, X)
+        self.assertEqual(cov.shape, (9, surf.n_species))
+        self.assertEqual(wdot.shape, (9, surf.n_total_species))
+
+        # States are unchanged
+        self.assertArrayNear(gas.X, gas_state[2])
+        self.assertNear(gas.T, gas_state[0])
+        self.assertArrayNear(surf.coverages, surf_state[1])
+
+        ksurf = surf.kinetics_species_index(0, surf.phase_index(surf))
+        for i in range(9):
+            self.assertNear(cov[i].sum(), 1.0)
+            gas.TPX = T[i], ct.one_atm, X[i]
+            surf.TP = T[i], ct.one_atm
+            surf.coverages = cov[i]
+            self.assertArrayNear(surf.net_production_rates, wdot[i])
+            # steady state for the surface species
+            rates = wdot[i][ksurf:ksurf+surf.n_species]
+            scale = np.abs(surf.creation_rates).max()
+            self.assertTrue(np.abs(rates).max() < 1e-5 * scale)
+
+    def test_batch_steady_coverages_phase(self):
+        gas, surf = self.gas, self.surf
+        cov1, wdot1 = surf.batch_steady_coverages(1000, ct.one_atm, gas.X)
+        cov2, wdot2 = surf.batch_steady_coverages([1000], ct.one_atm,
+                                                  [gas.X], phase=gas)
+        self.assertArrayNear(cov1, cov2)
+        self.assertArrayNear(wdot1, wdot2)
+        with self.assertRaises(ValueError):
+            surf.batch_steady_coverages(1000, ct.one_atm, gas.X, phase=surf)
+        with self.assertRaises(ValueError):
+            surf.batch_steady_coverages(1000, ct.one_atm, gas.X[:-1])
+        with self.assertRaises(ValueError):
+            surf.batch_steady_coverages([1000, 1100, 1200], ct.one_atm,
+                                        [gas.X, gas.X])
+
+
 class TestSofcKinetics(utilities.CanteraTest):
     """ Test based on sofc.py """
     def test_sofc(self):
@@ -2,6 +2,7 @@ import cantera as ct
 from . import utilities
 import numpy as np
 import os
+import threading
 
 
 class TestOnedim(utilities.CanteraTest):
@@ -295,6 +296,104 @@ class TestFreeFlame(utilities.CanteraTest):
         # TODO: check that the solution is actually correct (i.e. that the
         # residual satisfies the error tolerances) on the new grid.
 
+    def test_solver_stats(self):
+        reactants= 'H2:1.1, O2:1, AR:5'
+        p = ct.one_atm
+        Tin = 300
+
+        self.create_sim(p, Tin, reactants)
+        timesteps = []
+        steady = []
+
+        def time_step_func(dt):
+            timesteps.append(dt)
+            return 0
+
+        def steady_func(x):
+            steady.append(x)
+            return 0
+
+        self.sim.set_time_step_callback(time_step_func)
+        self.sim.set_steady_callback(steady_func)
+        self.sim.clear_stats()
+        self.solve_fixed_T()
+        self.solve_mix(slope=0.5, curve=0.3)
+
+        stats = self.sim.solver_stats
+        self.assertEqual(len(stats), len(self.sim.grid_size_stats))
+        self.assertEqual([s['grid_points'] for s in stats],
+                         list(self.sim.grid_size_stats))
+        self.assertLessEqual(sum(s['time_steps'] for s in stats), len(timesteps))
+        self.assertTrue(all(dt > 0 for dt in timesteps))
+        self.assertGreaterEqual(len(steady), len(stats))
+        for s in stats:
+            self.assertGreater(s['newton_iterations'], 0)
+            self.assertGreaterEqual(s['linear_solve_count'],
+                                    s['newton_iterations'])
+            self.assertEqual(set(s['residual_time']),
+                             {'thermo', 'kinetics', 'transport',
+                              'diffusive_fluxes'})
+            for key in ('eval_time', 'jacobian_time', 'linear_solve_time',
+                        'steady_time', 'time_stepping_time', 'regrid_time'):
+                self.assertGreaterEqual(s[key], 0.0)
+
+        self.sim.clear_stats()
+        self.assertEqual(self.sim.solver_stats, [])
+
+    def test_no_interrupt_threads(self):
+        # Without an interrupt function, flames can be solved concurrently
+        def solve(sim):
+            sim.energy_enabled = False
+            sim.solve(loglevel=0, refine_grid=False)
+            sim.energy_enabled = True
+            sim.solve(loglevel=0, refine_grid=False)
+
+        mixtures = ['H2:1.1, O2:1, AR:5', 'H2:0.8, O2:1, AR:5']
+        sims = []
+        for interrupt in [True, False]:
+            for reactants in mixtures:
+                self.create_sim(ct.one_atm, 300, reactants)
+                if not interrupt:
+                    self.sim.set_interrupt(None)
+                sims.append(self.sim)
+
+        for sim in sims[:2]:
+            solve(sim)
+        threads = [threading.Thread(target=solve, args=(sim,))
+                   for sim in sims[2:]]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        for sim1, sim2 in zip(sims[:2], sims[2:]):
+            self.assertArrayNear(sim1.T, sim2.T, 1e-10)
+            self.assertNear(sim1.u[0], sim2.u[0], 1e-10)
+        self.assertGreater(sims[0].u[0], sims[1].u[0])
+
+    def test_block_tridiagonal_solver(self):
+        reactants= 'H2:1.1, O2:1, AR:5'
+        p = ct.one_atm
+        Tin = 300
+
+        self.create_sim(p, Tin, reactants)
+        self.assertEqual(self.sim.linear_solver, 'band')
+        self.solve_fixed_T()
+        self.solve_mix(ratio=5, slope=0.5, curve=0.3)
+        Su_band = self.sim.u[0]
+
+        self.create_sim(p, Tin, reactants)
+        self.sim.linear_solver = 'block-tridiagonal'
+        self.assertEqual(self.sim.linear_solver, 'block-tridiagonal')
+        self.solve_fixed_T()
+        self.solve_mix(ratio=5, slope=0.5, curve=0.3)
+        Su_block = self.sim.u[0]
+
+        self.assertNear(Su_band, Su_block, 1e-3)
+
+        with self.assertRaises(ValueError):
+            self.sim.linear_solver = 'foobar'
+
     def test_save_restore(self):
         reactants= 'H2:1.1, O2:1, AR:5'
         p = 2 * ct.one_atm
@@ -648,7 +747,8 @@ class TestCounterflowPremixedFlame(utilities.CanteraTest):
     #     >>> t = cantera.test.test_onedim.TestCounterflowPremixedFlame("test_mixture_averaged")
     #     >>> t.test_mixture_averaged(True)
 
-    def test_mixture_averaged(self, saveReference=False):
+    def test_mixture_averaged(self, saveReference=False,
+                              linear_solver='band'):
         T_in = 373.0  # inlet temperature
         comp = 'H2:1.6, O2:1, AR:7'  # premixed gas composition
 
@@ -657,6 +757,7 @@ class TestCounterflowPremixedFlame(utilities.CanteraTest):
         width = 0.2 # m
 
         sim = ct.CounterflowPremixedFlame(gas=gas, width=width)
+        sim.linear_solver = linear_solver
 
         # set the properties at the inlets
         sim.reactants.mdot = 0.12  # kg/m^2/s
@@ -690,6 +791,9 @@ class TestCounterflowPremixedFlame(utilities.CanteraTest):
                                             rtol=1e-2, atol=1e-8, xtol=1e-2)
             self.assertFalse(bad, bad)
 
+    def test_block_tridiagonal_solver(self):
+        self.test_mixture_averaged(linear_solver='block-tridiagonal')
+
     def run_case(self, phi, T, width, P):
         gas = ct.Solution('h2o2.xml')
         gas.TPX = T, P * ct.one_atm, {'H2':phi, 'O2':0.5, 'AR':2}
@@ -113,6 +113,80 @@ class TestPureFluid(utilities.CanteraTest):
         with self.assertRaises(AttributeError):
             self.water.TPX = 500, 101325, 0.3
 
+    def test_batch_set_state(self):
+        self.water.TP = 350, 2e5
+        T0, D0 = self.water.T, self.water.density
+        TT = np.array([300, 400, 500, 800])
+        PP = np.array([1e5, 2e5, 1e6, 5e6])
+        for pair in ('TP', 'HP', 'SP', 'UV', 'TV', 'PV', 'ST'):
+            x = []
+            y = []
+            for T, P in zip(TT, PP):
+                self.water.TP = T, P
+                a, b = getattr(self.water, pair)
+                x.append(a)
+                y.append(b)
+            self.water.TP = 350, 2e5
+            T, P, D, h, s, X = self.water.batch_set_state(pair, x, y)
+            # The pressure of the liquid states is sensitive to the
+            # convergence tolerance for some property pairs
+            self.assertArrayNear(T, TT, 1e-6)
+            self.assertArrayNear(P, PP, 1e-4)
+            for i in range(len(TT)):
+                self.water.TP = TT[i], PP[i]
+                self.assertNear(D[i], self.water.density, 1e-6)
+                self.assertNear(h[i], self.water.h, 1e-6)
+                self.assertNear(s[i], self.water.s, 1e-6)
+                self.assertNear(X[i], self.water.X)
+
+        # state is not changed
+        self.water.TP = 350, 2e5
+        self.water.batch_set_state('TP', TT, PP)
+        self.assertNear(self.water.T, T0)
+        self.assertNear(self.water.density, D0)
+
+    def test_batch_set_state_two_phase(self):
+        P = [1e4, 1e5, 1e6]
+        T, P2, D, h, s, X = self.water.batch_set_state('PX', P, 0.4)
+        self.assertArrayNear(P2, P)
+        self.assertArrayNear(X, [0.4] * 3)
+        for i in range(3):
+            self.water.PX = P[i], 0.4
+            self.assertNear(T[i], self.water.T)
+            self.assertNear(h[i], self.water.h)
+
+        T, P2, D, h, s, X = self.water.batch_set_state('TX', 400, [0, 0.5, 1])
+        self.assertArrayNear(T, [400] * 3)
+        self.assertArrayNear(X, [0, 0.5, 1])
+
+        with self.assertRaises(Exception):
+            self.water.batch_set_state('TX', 700, 0.5)
+        with self.assertRaises(ValueError):
+            self.water.batch_set_state('TP', [300, 400], [1e5, 2e5, 3e5])
+
+    def test_batch_set_state_molar(self):
+        self.water.basis = 'molar'
+        self.water.TP = 400, 1e6
+        T, P, D, h, s, X = self.water.batch_set_state('HP', self.water.h, 1e6)
+        self.assertNear(T[0], 400, 1e-6)
+        self.assertNear(D[0], self.water.density, 1e-6)
+        self.assertNear(s[0], self.water.s, 1e-6)
+
+    def test_saturation_curve(self):
+        TT = np.linspace(300, 640, 30)
+        P, D, h, s = self.water.saturation_curve(TT)
+        self.assertEqual(D.shape, (30, 2))
+        for i, T in enumerate(TT):
+            for j in range(2):
+                self.water.TX = T, j
+                self.assertNear(P[i], self.water.P, 1e-7)
+                self.assertNear(D[i,j], self.water.density, 1e-7)
+                self.assertNear(h[i,j], self.water.h, 1e-7)
+                self.assertNear(s[i,j], self.water.s, 1e-7)
+
+        with self.assertRaises(Exception):
+            self.water.saturation_curve([600, 650])
+
 
 # To minimize errors when transcribing tabulated data, the input units here are:
 # T: K, P: MPa, rho: kg/m3, v: m3/kg, (u,h): kJ/kg, s: kJ/kg-K
@@ -471,3 +545,82 @@ class PureFluidConvergence(utilities.CanteraTest):
         if errors:
             errors += 'Total error count:%s\n' % nErrors
             raise AssertionError(errors)
+
+
+class TestTabulatedPureFluid(utilities.CanteraTest):
+    @classmethod
+    def setUpClass(cls):
+        cls.exact = ct.Water()
+        cls.water = ct.Water()
+        cls.coverage = cls.water.tabulate((300, 1000), (1e3, 5e7),
+                                          n_T=60, n_P=60, rtol=1e-6)
+
+    def test_tabulated(self):
+        self.assertTrue(self.water.tabulated)
+        self.assertFalse(self.exact.tabulated)
+        self.assertGreater(self.coverage, 0.8)
+        self.assertLessEqual(self.coverage, 1.0)
+
+    def test_clear_tables(self):
+        w = ct.Water()
+        w.tabulate((300, 600), (1e4, 1e6), n_T=10, n_P=10)
+        self.assertTrue(w.tabulated)
+        w.clear_tables()
+        self.assertFalse(w.tabulated)
+        w.TP = 400, 1e5
+        self.assertNear(w.T, 400)
+
+    def test_invalid(self):
+        w = ct.Water()
+        with self.assertRaises(Exception):
+            w.tabulate((600, 300), (1e4, 1e6))
+        with self.assertRaises(Exception):
+            w.tabulate((300, 600), (1e4, 1e6), n_T=2)
+        self.assertFalse(w.tabulated)
+
+    def check_states(self, pair):
+        for T, P in itertools.product(np.linspace(310, 990, 9),
+                                      np.logspace(3.2, 7.6, 9)):
+            self.exact.TP = T, P
+            values = getattr(self.exact, pair)
+            setattr(self.water, pair, values)
+            self.assertNear(self.water.T, T, 1e-5)
+            self.assertNear(self.water.density, self.exact.density, 1e-5)
+            self.assertNear(self.water.cp_mass, self.exact.cp_mass, 1e-4)
+
+    def test_TP(self):
+        self.check_states('TP')
+
+    def test_interpolation_error(self):
+        # The division between the liquid and vapor tables has a kink at the
+        # saturation pressure at the lower temperature limit (about 3.5 kPa),
+        # which must not cause errors larger than the tolerance in cells which
+        # are marked as valid
+        for T, P in itertools.product(np.linspace(800, 900, 11),
+                                      np.linspace(3400, 3600, 9)):
+            self.exact.TP = T, P
+            self.water.TP = T, P
+            self.assertNear(self.water.density, self.exact.density, 2e-6)
+
+    def test_HP(self):
+        self.check_states('HP')
+
+    def test_SP(self):
+        self.check_states('SP')
+
+    def test_saturation(self):
+        for P in [5e3, 1e5, 2e6, 1e7]:
+            for X in [0.0, 0.3, 1.0]:
+                self.exact.PX = P, X
+                self.water.PX = P, X
+                self.assertNear(self.water.T, self.exact.T, 1e-6)
+                self.assertNear(self.water.density, self.exact.density, 1e-5)
+
+                self.water.HP = self.exact.h, P
+                self.assertNear(self.water.T, self.exact.T, 1e-5)
+                self.assertNear(self.water.X, X, 1e-4, 1e-5)
+
+        for T in [320, 450, 600]:
+            self.exact.TX = T, 0.5
+            self.water.TX = T, 0.5
+            self.assertNear(self.water.P, self.exact.P, 1e-5)
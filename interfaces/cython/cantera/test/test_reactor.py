@@ -1,5 +1,7 @@
+import ctypes
 import math
 import re
+import threading
 
 import numpy as np
 from .utilities import unittest
@@ -280,6 +282,27 @@ class TestReactor(utilities.CanteraTest):
         self.assertNear(self.r1.volume, V1 + 1.0 * A, 1e-7)
         self.assertNear(self.r2.volume, V2 - 1.0 * A, 1e-7)
 
+    def test_wall_velocity_tabulated(self):
+        self.make_reactors()
+        A = 0.2
+
+        V1 = 2.0
+        V2 = 5.0
+        self.r1.volume = V1
+        self.r2.volume = V2
+
+        self.add_wall(A=A)
+
+        # same velocity profile as test_wall_velocity, evaluated in C++
+        self.w.set_velocity(ct.Func1.tabulated([0, 1, 2], [0, 1, 0]))
+        self.net.advance(1.0)
+        self.assertNear(self.w.vdot(1.0), 1.0 * A, 1e-7)
+        self.net.advance(2.0)
+        self.assertNear(self.w.vdot(2.0), 0.0, 1e-7)
+
+        self.assertNear(self.r1.volume, V1 + 1.0 * A, 1e-7)
+        self.assertNear(self.r2.volume, V2 - 1.0 * A, 1e-7)
+
     def test_disable_energy(self):
         self.make_reactors(T1=500)
         self.r1.energy_enabled = False
@@ -679,6 +702,656 @@ class TestWellStirredReactorIgnition(utilities.CanteraTest):
         self.assertNear(self.combustor.thermo['HO2'].Y[0], 7.71296e-06, 1e-5)
 
 
+class TestReactorNetLinearSolver(utilities.CanteraTest):
+    def make_network(self, solver):
+        # A chain of reactors fed by a mixture of hydrogen and air, with heat
+        # exchange between the first and last reactors and a small recycle
+        # stream, which couples reactors in the "upstream" direction
+        gas = ct.Solution('h2o2.xml')
+        gas.TPX = 1000, ct.one_atm, 'H2:2, O2:1, AR:4'
+        inlet = ct.Reservoir(gas)
+        gas.TPX = 300, ct.one_atm, 'H2:2, O2:1, AR:4'
+        outlet = ct.Reservoir(gas)
+
+        self.reactors = []
+        self.gases = []
+        for i in range(4):
+            g = ct.Solution('h2o2.xml')
+            g.TPX = 1000 + 200 * i, ct.one_atm, 'H2O:1, AR:4'
+            self.gases.append(g)
+            self.reactors.append(ct.IdealGasReactor(g, volume=1e-3))
+
+        mfc = ct.MassFlowController(inlet, self.reactors[0], mdot=0.01)
+        upstream = mfc
+        for r1, r2 in zip(self.reactors[:-1], self.reactors[1:]):
+            upstream = ct.PressureController(r1, r2, master=upstream, K=1e-5)
+        ct.PressureController(self.reactors[-1], outlet, master=upstream,
+                              K=1e-5)
+        ct.Valve(self.reactors[2], self.reactors[1], K=1e-7)
+        ct.Wall(self.reactors[0], self.reactors[3], U=100, A=0.1)
+
+        net = ct.ReactorNet(self.reactors)
+        net.linear_solver = solver
+        return net
+
+    def test_default(self):
+        net = ct.ReactorNet()
+        self.assertEqual(net.linear_solver, 'dense')
+        with self.assertRaises(RuntimeError):
+            net.linear_solver = 'spam'
+        self.assertEqual(net.linear_solver, 'dense')
+
+    def test_gmres(self):
+        net = self.make_network('dense')
+        net.advance(0.05)
+        T = [r.T for r in self.reactors]
+        Y = [r.thermo.Y for r in self.reactors]
+
+        net = self.make_network('gmres')
+        self.assertEqual(net.linear_solver, 'gmres')
+        net.advance(0.05)
+        for r, T_dense, Y_dense in zip(self.reactors, T, Y):
+            self.assertNear(r.T, T_dense, 1e-5)
+            self.assertArrayNear(r.thermo.Y, Y_dense, 1e-4, 1e-8)
+
+    def test_steady_gmres(self):
+        net = self.make_network('dense')
+        net.solve_steady()
+        T = [r.T for r in self.reactors]
+        Y = [r.thermo.Y for r in self.reactors]
+
+        net = self.make_network('gmres')
+        net.solve_steady()
+        for r, T_dense, Y_dense in zip(self.reactors, T, Y):
+            self.assertNear(r.T, T_dense, 1e-6)
+            self.assertArrayNear(r.thermo.Y, Y_dense, 1e-5, 1e-10)
+
+
+    def test_band(self):
+        net = self.make_network('dense')
+        net.advance(0.05)
+        T = [r.T for r in self.reactors]
+
+        net = self.make_network('band')
+        self.assertEqual(net.bandwidth, (-1, -1))
+        net.bandwidth = (1000, 1000)
+        self.assertEqual(net.bandwidth, (1000, 1000))
+        net.advance(0.05)
+        for r, T_dense in zip(self.reactors, T):
+            self.assertNear(r.T, T_dense, 1e-5)
+
+    def test_diag(self):
+        net = ct.ReactorNet()
+        net.linear_solver = 'diag'
+        self.assertEqual(net.linear_solver, 'diag')
+
+
+class TestReactorNetIntegrator(utilities.CanteraTest):
+    def setUp(self):
+        self.gas = ct.Solution('h2o2.xml')
+        self.gas.TPX = 1000, ct.one_atm, 'H2:2, O2:1, AR:4'
+        self.r = ct.IdealGasReactor(self.gas)
+        self.net = ct.ReactorNet([self.r])
+
+    def test_options(self):
+        net = self.net
+        self.assertEqual(net.max_order, 5)
+        self.assertEqual(net.max_steps, 20000)
+        self.assertEqual(net.initial_time_step, 0.0)
+        net.max_order = 2
+        net.max_steps = 50000
+        net.initial_time_step = 1e-8
+        self.assertEqual(net.max_order, 2)
+        self.assertEqual(net.max_steps, 50000)
+        self.assertEqual(net.initial_time_step, 1e-8)
+
+        with self.assertRaises(RuntimeError):
+            net.max_order = 6
+        with self.assertRaises(RuntimeError):
+            net.max_steps = 0
+        with self.assertRaises(RuntimeError):
+            net.initial_time_step = -1
+
+        net.advance(1e-3)
+        self.assertLessEqual(net.integrator_stats['last_order'], 2)
+        self.assertGreater(self.r.T, 2000)
+
+    def test_stats(self):
+        net = self.net
+        net.advance(1e-4)
+        stats1 = net.integrator_stats
+        self.assertGreater(stats1['steps'], 0)
+        self.assertGreaterEqual(stats1['rhs_evals'], stats1['steps'])
+        self.assertGreater(stats1['last_step_size'], 0)
+        self.assertGreaterEqual(stats1['last_order'], 1)
+        for key in ['jac_evals', 'lin_solve_setups', 'nonlinear_iters',
+                    'nonlinear_conv_fails', 'err_test_fails']:
+            self.assertGreaterEqual(stats1[key], 0)
+
+        # Counters are reset for each call to advance
+        net.advance(1e-3)
+        stats2 = net.integrator_stats
+        self.assertGreater(stats2['steps'], 0)
+        net.advance(net.time)
+        self.assertEqual(net.integrator_stats['steps'], 0)
+
+        net.step()
+        self.assertEqual(net.integrator_stats['steps'], 1)
+
+    def test_max_steps(self):
+        self.net.max_steps = 5
+        with self.assertRaises(RuntimeError):
+            self.net.advance(1e-3)
+
+    def test_initial_step(self):
+        self.net.initial_time_step = 1e-7
+        self.assertNear(self.net.step(), 1e-7)
+
+
+class TestReactorNetSteadyState(utilities.CanteraTest):
+    def make_cstr(self):
+        gas = ct.Solution('h2o2.xml')
+        gas.TPX = 300, ct.one_atm, 'H2:1.0, O2:1.0, AR:4'
+        inlet = ct.Reservoir(gas)
+        gas.equilibrate('HP')
+        self.r = ct.IdealGasReactor(gas, volume=1e-3)
+        exhaust = ct.Reservoir(gas)
+        mfc = ct.MassFlowController(inlet, self.r, mdot=self.r.mass/0.1)
+        ct.PressureController(self.r, exhaust, master=mfc, K=1e-5)
+        return ct.ReactorNet([self.r])
+
+    def test_cstr(self):
+        net = self.make_cstr()
+        stats = net.solve_steady()
+        self.assertEqual(net.time, 0.0)
+        self.assertLess(stats['newton_iterations'], 30)
+        self.assertEqual(stats['time_steps'], 0)
+        self.assertLess(stats['step_norm'], 1.0)
+        self.assertLess(stats['residual'], 1e-4)
+        T = self.r.T
+        Y = self.r.thermo.Y
+
+        # Integrating from the steady state should not change it
+        net.advance(1.0)
+        self.assertNear(self.r.T, T, 1e-8)
+        self.assertArrayNear(self.r.thermo.Y, Y, 1e-6, 1e-12)
+
+    def test_matches_transient(self):
+        net = self.make_cstr()
+        net.advance(2.0)
+        T = self.r.T
+        Y = self.r.thermo.Y
+
+        net = self.make_cstr()
+        net.solve_steady()
+        self.assertNear(self.r.T, T, 1e-6)
+        self.assertArrayNear(self.r.thermo.Y, Y, 1e-5, 1e-10)
+
+    def test_closed_reactor(self):
+        gas = ct.Solution('h2o2.xml')
+        r = ct.IdealGasReactor(gas)
+        net = ct.ReactorNet([r])
+        with self.assertRaises(RuntimeError):
+            net.solve_steady()
+
+
+class TestReactorNetTabulation(utilities.CanteraTest):
+    def setUp(self):
+        self.gas = ct.Solution('h2o2.xml')
+        self.gas.TPX = 1000, ct.one_atm, 'H2:2, O2:1, AR:4'
+        self.r = ct.IdealGasConstPressureReactor(self.gas)
+        self.net = ct.ReactorNet([self.r])
+
+    def states(self, n):
+        # States along an ignition trajectory
+        gas = ct.Solution('h2o2.xml')
+        gas.TPX = 1000, ct.one_atm, 'H2:2, O2:1, AR:4'
+        net = ct.ReactorNet([ct.IdealGasConstPressureReactor(gas)])
+        states = []
+        for t in np.linspace(0, 3e-4, n):
+            net.advance(t)
+            states.append(gas.TPY)
+        return states
+
+    def direct(self, state, dt):
+        gas = ct.Solution('h2o2.xml')
+        gas.TPY = state
+        net = ct.ReactorNet([ct.IdealGasConstPressureReactor(gas)])
+        net.advance(dt)
+        return gas.T, gas.Y
+
+    def advance(self, state, dt):
+        self.gas.TPY = state
+        self.r.syncState()
+        self.net.advance_tabulated(dt)
+        return self.gas.T, self.gas.Y
+
+    def test_direct(self):
+        state = self.states(5)[3]
+        T, Y = self.advance(state, 1e-5)
+        self.assertNear(self.net.time, 1e-5)
+        self.assertEqual(self.net.tabulation_stats['queries'], 0)
+        T0, Y0 = self.direct(state, 1e-5)
+        self.assertNear(T, T0, 1e-7)
+        self.assertArrayNear(Y, Y0, 1e-6, 1e-12)
+
+        # The network can still be integrated normally afterwards
+        self.net.advance(2e-5)
+        self.assertNear(self.net.time, 2e-5)
+
+    def test_retrieve(self):
+        tol = 1e-4
+        self.net.set_tabulation(tol)
+        state = self.states(5)[3]
+        T1, Y1 = self.advance(state, 1e-5)
+        stats = self.net.tabulation_stats
+        self.assertEqual(stats['queries'], 1)
+        self.assertEqual(stats['adds'], 1)
+        self.assertEqual(stats['records'], 1)
+        self.assertGreater(stats['memory'], 0)
+
+        # Repeating the same query uses the table
+        T2, Y2 = self.advance(state, 1e-5)
+        stats = self.net.tabulation_stats
+        self.assertEqual(stats['queries'], 2)
+        self.assertEqual(stats['retrieves'], 1)
+        self.assertNear(T1, T2, 1e-12)
+        self.assertArrayNear(Y1, Y2, 1e-12, 1e-16)
+
+        # Nearby states are approximated to within the tolerance
+        T, P, Y = state
+        T3, Y3 = self.advance((T + 0.01, P, Y), 1e-5)
+        self.assertEqual(self.net.tabulation_stats['retrieves'], 2)
+        T0, Y0 = self.direct((T + 0.01, P, Y), 1e-5)
+        self.assertNear(T3, T0, tol)
+        self.assertLess(abs(Y3 - Y0).max(), tol)
+
+    def test_accuracy(self):
+        tol = 1e-3
+        self.net.set_tabulation(tol)
+        states = self.states(30)
+        for i in [3, 4, 5, 20, 21, 4, 5, 20, 3, 22, 21, 3, 4]:
+            T, Y = self.advance(states[i], 2e-6)
+            T0, Y0 = self.direct(states[i], 2e-6)
+            err = np.linalg.norm(np.hstack([np.log(T/T0), Y - Y0]))
+            self.assertLess(err, 2 * tol)
+
+        stats = self.net.tabulation_stats
+        self.assertEqual(stats['queries'], 13)
+        self.assertEqual(stats['queries'],
+                         stats['retrieves'] + stats['grows'] + stats['adds'])
+        self.assertGreaterEqual(stats['retrieves'], 6)
+        self.assertEqual(stats['records'], stats['adds'])
+
+    def test_memory_limit(self):
+        states = self.states(10)
+        self.net.set_tabulation(1e-4, max_memory=1e-6)
+        for i in (2, 5, 8):
+            self.advance(states[i], 1e-5)
+        stats = self.net.tabulation_stats
+        self.assertEqual(stats['records'], 1)
+        self.assertEqual(stats['adds'], 3)
+        self.assertEqual(stats['evictions'], 2)
+
+        # Disabling tabulation
+        self.net.set_tabulation(0)
+        self.advance(states[8], 1e-5)
+        self.assertEqual(self.net.tabulation_stats['queries'], 0)
+
+    def test_invalid(self):
+        with self.assertRaises(RuntimeError):
+            self.net.advance_tabulated(-1.0)
+        with self.assertRaises(RuntimeError):
+            self.net.set_tabulation(-1.0)
+
+        self.net.add_reactor(ct.IdealGasReactor(self.gas))
+        with self.assertRaises(RuntimeError):
+            self.net.set_tabulation(1e-4)
+        with self.assertRaises(RuntimeError):
+            self.net.advance_tabulated(1e-5)
+
+        r = ct.IdealGasReactor(self.gas)
+        ct.Wall(r, ct.Reservoir(self.gas))
+        net = ct.ReactorNet([r])
+        net.set_tabulation(1e-4)
+        with self.assertRaises(RuntimeError):
+            net.advance_tabulated(1e-5)
+
+
+class TestReactorNetCheckpoint(utilities.CanteraTest):
+    def make_network(self):
+        gas1 = ct.Solution('h2o2.xml')
+        gas1.TPX = 1000, ct.one_atm, 'H2:2, O2:1, AR:4'
+        gas2 = ct.Solution('h2o2.xml')
+        gas2.TPX = 500, 2 * ct.one_atm, 'O2:1, AR:4'
+        r1 = ct.Reactor(gas1)
+        r2 = ct.IdealGasReactor(gas2)
+        ct.Wall(r1, r2, A=0.1, K=1e-4, U=200)
+        return ct.ReactorNet([r1, r2]), r1, r2
+
+    def test_restart(self):
+        net1, r1, r2 = self.make_network()
+        net1.advance(1e-4)
+        data = net1.checkpoint()
+        self.assertIsInstance(data, bytes)
+        state1 = (r1.thermo.TPY, r2.thermo.TPY, r1.volume)
+
+        # Restore to a network with the same structure and a different state
+        net2, r3, r4 = self.make_network()
+        r3.thermo.TP = 800, None
+        r3.syncState()
+        net2.advance(1e-5)
+        net2.restore(data)
+        self.assertNear(net2.time, 1e-4)
+        self.assertNear(r3.T, state1[0][0])
+        self.assertNear(r4.thermo.P, state1[1][1])
+        self.assertNear(r3.volume, state1[2])
+        self.assertArrayNear(r4.thermo.Y, state1[1][2])
+
+        for t in [2e-4, 5e-4, 1e-3]:
+            net1.advance(t)
+            net2.advance(t)
+            self.assertNear(r1.T, r3.T, 1e-4)
+            self.assertNear(r2.T, r4.T, 1e-4)
+            self.assertArrayNear(r1.thermo.Y, r3.thermo.Y, 1e-4, 1e-8)
+        self.assertGreater(r1.T, 2000)
+
+    def test_branch(self):
+        net, r1, r2 = self.make_network()
+        net.advance(1e-4)
+        data = net.checkpoint()
+
+        # Continuations with different wall heat transfer coefficients,
+        # starting from the same state
+        T = []
+        for U in [0, 200, 2000]:
+            net.restore(data)
+            r1.walls[0].heat_transfer_coeff = U
+            net.advance(5e-4)
+            T.append(r2.T)
+        self.assertLess(T[0], T[1])
+        self.assertLess(T[1], T[2])
+
+        net.restore(data)
+        r1.walls[0].heat_transfer_coeff = 200
+        net.advance(5e-4)
+        self.assertNear(r2.T, T[1], 1e-6)
+
+    def test_invalid(self):
+        net, r1, r2 = self.make_network()
+        net.advance(1e-4)
+        data = net.checkpoint()
+
+        with self.assertRaisesRegex(RuntimeError, 'truncated'):
+            net.restore(data[:-8])
+        with self.assertRaisesRegex(RuntimeError, 'Unexpected data'):
+            net.restore(data + data[-8:])
+        with self.assertRaisesRegex(RuntimeError, 'not a reactor network'):
+            net.restore(b'x' * len(data))
+
+        gas = ct.Solution('gri30.xml')
+        net2 = ct.ReactorNet([ct.IdealGasReactor(gas)])
+        with self.assertRaisesRegex(RuntimeError, 'does not match'):
+            net2.restore(data)
+
+
+class TestReactorRhsFunction(utilities.CanteraTest):
+    def setUp(self):
+        self.gas = ct.Solution('h2o2.xml')
+        self.gas.TPX = 1000, ct.one_atm, 'H2:2, O2:1, AR:4'
+
+    def test_data(self):
+        r = ct.IdealGasReactor(self.gas)
+        net = ct.ReactorNet([r])
+        data = {}
+
+        def record(ptr):
+            d = ptr.contents
+            if not data:
+                data['neq'] = d.neq
+                data['nsp'] = d.nsp
+                data['indices'] = d.energy_index, d.species_index
+                data['T'] = d.T, d.y[d.energy_index]
+                data['P'] = d.P
+                data['rho'] = d.density, d.mass / d.volume
+                data['cp'] = d.cp_mass
+                data['Y'] = [d.Y[k] for k in range(d.nsp)]
+                data['Y1'] = [d.y[d.species_index + k] for k in range(d.nsp)]
+                data['mw'] = [d.molecular_weights[k] for k in range(d.nsp)]
+                data['wdot'] = [d.net_production_rates[k]
+                                for k in range(d.nsp)]
+                data['hk'] = [d.partial_molar_enthalpies[k]
+                              for k in range(d.nsp)]
+                data['uk'] = [d.partial_molar_int_energies[k]
+                              for k in range(d.nsp)]
+            return 0
+
+        func = ct.ReactorRhsFunction(record)
+        r.set_rhs_function(func)
+        gas = ct.Solution('h2o2.xml')
+        gas.TPX = self.gas.TPX
+        net.step()
+
+        self.assertEqual(data['neq'], r.n_vars)
+        self.assertEqual(data['nsp'], gas.n_species)
+        self.assertEqual(data['indices'], (2, 3))
+        self.assertNear(data['T'][0], data['T'][1])
+        self.assertNear(data['T'][0], gas.T, 1e-6)
+        self.assertNear(data['P'], gas.P, 1e-6)
+        self.assertNear(data['rho'][0], data['rho'][1])
+        self.assertNear(data['cp'], gas.cp_mass, 1e-6)
+        self.assertArrayNear(data['Y'], data['Y1'])
+        self.assertArrayNear(data['Y'], gas.Y, 1e-6, 1e-12)
+        self.assertArrayNear(data['mw'], gas.molecular_weights)
+        self.assertArrayNear(data['wdot'], gas.net_production_rates,
+                             1e-5, 1e-12)
+        self.assertArrayNear(data['hk'], gas.partial_molar_enthalpies, 1e-6)
+        self.assertArrayNear(data['uk'], gas.partial_molar_int_energies,
+                             1e-6)
+
+    def test_heat_loss(self):
+        # A heat loss term equivalent to a wall with a heat transfer
+        # coefficient, with the coefficient passed as the user data
+        gas2 = ct.Solution('h2o2.xml')
+        gas2.TPX = self.gas.TPX
+        r1 = ct.IdealGasReactor(self.gas)
+        r2 = ct.IdealGasReactor(gas2)
+        env = ct.Reservoir(ct.Solution('air.xml'))
+        env.thermo.TP = 500, ct.one_atm
+        ct.Wall(r1, env, A=1.0, U=0.3)
+
+        def heat_loss(ptr):
+            d = ptr.contents
+            U = ctypes.c_double.from_address(d.user_data).value
+            d.ydot[d.energy_index] -= U * (d.T - 500) / (d.mass * d.cv_mass)
+            return 0
+
+        U = ctypes.c_double(0.3)
+        r2.set_rhs_function(ct.ReactorRhsFunction(heat_loss), U)
+        net1 = ct.ReactorNet([r1])
+        net2 = ct.ReactorNet([r2])
+
+        for t in np.linspace(1e-4, 2e-3, 10):
+            net1.advance(t)
+            net2.advance(t)
+            self.assertNear(r1.T, r2.T, 1e-4)
+            self.assertArrayNear(r1.thermo.Y, r2.thermo.Y, 1e-4, 1e-8)
+
+    def test_replace_energy_equation(self):
+        # Replacing the energy equation with dT/dt = 0 is equivalent to
+        # disabling it
+        gas2 = ct.Solution('h2o2.xml')
+        gas2.TPX = self.gas.TPX
+        r1 = ct.IdealGasConstPressureReactor(self.gas, energy='off')
+        r2 = ct.IdealGasConstPressureReactor(gas2)
+
+        def isothermal(ptr):
+            d = ptr.contents
+            d.ydot[d.energy_index] = 0.0
+            return 0
+
+        func = ct.ReactorRhsFunction(isothermal)
+        r2.set_rhs_function(func)
+        del func  # the reactor keeps a reference to the function
+        net1 = ct.ReactorNet([r1])
+        net2 = ct.ReactorNet([r2])
+        net1.advance(1e-3)
+        net2.advance(1e-3)
+        self.assertNear(r2.T, 1000)
+        self.assertArrayNear(r1.thermo.Y, r2.thermo.Y, 1e-4, 1e-8)
+
+    def test_remove(self):
+        gas2 = ct.Solution('h2o2.xml')
+        gas2.TPX = self.gas.TPX
+        r1 = ct.IdealGasReactor(self.gas)
+        r2 = ct.IdealGasReactor(gas2)
+        r2.set_rhs_function(ct.ReactorRhsFunction(lambda ptr: 1))
+        r2.set_rhs_function(None)
+        net1 = ct.ReactorNet([r1])
+        net2 = ct.ReactorNet([r2])
+        net1.advance(1e-3)
+        net2.advance(1e-3)
+        self.assertNear(r1.T, r2.T)
+        self.assertGreater(r2.T, 2000)
+
+    def test_error(self):
+        r = ct.IdealGasReactor(self.gas)
+        r.set_rhs_function(ct.ReactorRhsFunction(lambda ptr: 3))
+        net = ct.ReactorNet([r])
+        with self.assertRaisesRegex(RuntimeError, 'returned error code 3'):
+            net.advance(1e-3)
+
+    def test_recoverable_error(self):
+        # A failure away from the initial state is handled by the integrator
+        # retrying with a smaller step
+        gas2 = ct.Solution('h2o2.xml')
+        gas2.TPX = self.gas.TPX
+        r1 = ct.IdealGasReactor(self.gas)
+        r2 = ct.IdealGasReactor(gas2)
+        calls = []
+
+        def fail_once(ptr):
+            calls.append(ptr.contents.time)
+            return 1 if len(calls) == 20 else 0
+
+        r2.set_rhs_function(ct.ReactorRhsFunction(fail_once))
+        net1 = ct.ReactorNet([r1])
+        net2 = ct.ReactorNet([r2])
+        net1.advance(1e-3)
+        net2.advance(1e-3)
+        self.assertGreater(len(calls), 20)
+        self.assertNear(r1.T, r2.T, 1e-5)
+        self.assertArrayNear(r1.thermo.Y, r2.thermo.Y, 1e-4, 1e-8)
+
+    def test_adjoint_unsupported(self):
+        r = ct.IdealGasReactor(self.gas)
+        r.set_rhs_function(ct.ReactorRhsFunction(lambda ptr: 0))
+        net = ct.ReactorNet([r])
+        with self.assertRaisesRegex(RuntimeError, 'not supported'):
+            net.adjoint_sensitivities(1e-4, 'temperature')
+        with self.assertRaisesRegex(RuntimeError, 'not supported'):
+            net.adjoint_event_sensitivities(1e-3, 'temperature', 1500)
+
+    def test_invalid(self):
+        r = ct.IdealGasReactor(self.gas)
+        with self.assertRaises(TypeError):
+            r.set_rhs_function('foo')
+        with self.assertRaises(TypeError):
+            ct.FlowReactor(self.gas).set_rhs_function(
+                ct.ReactorRhsFunction(lambda ptr: 0))
+
+
+class TestReactorNetThreads(utilities.CanteraTest):
+    def make_network(self, T0, Q=None):
+        gas = ct.Solution('h2o2.xml')
+        gas.TPX = T0, ct.one_atm, 'H2:2, O2:1, AR:4'
+        r = ct.IdealGasReactor(gas)
+        env = ct.Reservoir(ct.Solution('air.xml'))
+        ct.Wall(r, env, A=1.0, Q=Q)
+        return ct.ReactorNet([r]), r
+
+    def run_threads(self, func, args):
+        results = [None] * len(args)
+        errors = []
+        def target(i):
+            try:
+                results[i] = func(args[i])
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=target, args=(i,))
+                   for i in range(len(args))]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        if errors:
+            raise errors[0]
+        return results
+
+    def test_concurrent(self):
+        def ignite(T0):
+            net, r = self.make_network(T0)
+            net.advance(1e-3)
+            return r.T, r.thermo.Y
+
+        T0 = [950, 1000, 1050, 1100]
+        serial = [ignite(T) for T in T0]
+        threaded = self.run_threads(ignite, T0)
+        for (T1, Y1), (T2, Y2) in zip(serial, threaded):
+            self.assertNear(T1, T2, 1e-12)
+            self.assertArrayNear(Y1, Y2, 1e-12, 1e-20)
+        self.assertGreater(serial[0][0], 2000)
+
+    def test_releases_gil(self):
+        net, r = self.make_network(1000)
+        worker = threading.Thread(target=net.advance, args=(1e-3,))
+        count = 0
+        worker.start()
+        while worker.is_alive():
+            count += 1
+        worker.join()
+        self.assertGreater(r.T, 2000)
+        # If the GIL were held by the worker, this thread would only be able
+        # to run before and after the integration
+        self.assertGreater(count, 100)
+
+    def test_python_function(self):
+        # Functions defined in Python can be used from multiple threads
+        calls = []
+        def heat_loss(t):
+            calls.append(t)
+            return 1e5
+
+        def ignite(T0):
+            net, r = self.make_network(T0, heat_loss)
+            for i in range(10):
+                net.step()
+            return r.T
+
+        T0 = [1000, 1000, 1050]
+        serial = [ignite(T) for T in T0]
+        n = len(calls)
+        threaded = self.run_threads(ignite, T0)
+        self.assertEqual(len(calls), 2 * n)
+        self.assertArrayNear(serial, threaded, 1e-12)
+
+    def test_errors(self):
+        def fail(T0):
+            net, r = self.make_network(T0)
+            net.max_steps = 2
+            net.advance(1e-3)
+
+        def fail_python(T0):
+            net, r = self.make_network(T0, lambda t: 1 / 0)
+            net.advance(1e-3)
+
+        with self.assertRaises(RuntimeError):
+            self.run_threads(fail, [1000, 1100])
+        with self.assertRaisesRegex(RuntimeError, 'ZeroDivisionError'):
+            self.run_threads(fail_python, [1000, 1100])
+
+
 class TestConstPressureReactor(utilities.CanteraTest):
     """
     The constant pressure reactor should give essentially the same results as
@@ -837,6 +1510,126 @@ class TestFlowReactor(utilities.CanteraTest):
             self.assertNear(r.speed, v, 1e-3)
 
 
+class TestPlugFlowReactor(utilities.CanteraTest):
+    def test_nonreacting_heat_transfer(self):
+        # Argon has a constant heat capacity, so the temperature relaxes
+        # exponentially toward the wall temperature
+        gas = ct.Solution('h2o2.xml')
+        gas.TPX = 300, ct.one_atm, 'AR:1.0'
+        mdot = 0.02
+        pfr = ct.PlugFlowReactor(gas, mdot, area=lambda z: 1e-3 * (1 + z),
+                                 U=40, T_wall=800)
+        z = np.linspace(0, 2, 101)
+        p = pfr.solve(z)
+        Texact = 800 - 500 * np.exp(-40 * z / (mdot * gas.cp_mass))
+        self.assertArrayNear(p['T'], Texact, 1e-5)
+        self.assertArrayNear(p['mdot'], mdot * np.ones_like(z))
+        self.assertArrayNear(p['velocity'],
+                             mdot / (p['density'] * 1e-3 * (1 + z)))
+        self.assertArrayNear(p['P'], ct.one_atm * np.ones_like(z))
+        self.assertNear(gas.T, p['T'][-1])
+        self.assertNear(pfr.distance, 2.0)
+        self.assertNotIn('coverages', p)
+
+        # residence time is the integral of 1/velocity
+        tau = np.trapz(1 / p['velocity'], z)
+        self.assertNear(p['residence_time'][-1], tau, 1e-3)
+
+    def test_energy_disabled(self):
+        gas = ct.Solution('h2o2.xml')
+        gas.TPX = 1100, ct.one_atm, 'H2:2, O2:1, AR:7'
+        pfr = ct.PlugFlowReactor(gas, 0.01, area=1e-4, energy='off')
+        self.assertFalse(pfr.energy_enabled)
+        p = pfr.solve(np.linspace(0, 0.2, 5))
+        self.assertArrayNear(p['T'], 1100 * np.ones(5))
+        self.assertTrue(p['X'][-1, gas.species_index('H2O')] > 0.01)
+
+    def test_ignition(self):
+        # The temperature as a function of residence time should match an
+        # adiabatic constant pressure reactor
+        gas = ct.Solution('h2o2.xml')
+        gas.TPX = 1100, ct.one_atm, 'H2:2, O2:1, AR:7'
+        r = ct.IdealGasConstPressureReactor(gas)
+        net = ct.ReactorNet([r])
+        t = [0.0]
+        T = [r.T]
+        while net.time < 2e-3:
+            t.append(net.step())
+            T.append(r.T)
+
+        gas.TPX = 1100, ct.one_atm, 'H2:2, O2:1, AR:7'
+        pfr = ct.PlugFlowReactor(gas, 0.01, area=1e-4)
+        p = pfr.solve(np.linspace(0, 0.5, 201))
+        self.assertTrue(p['T'][-1] > 2500)
+        self.assertArrayNear(p['T'], np.interp(p['residence_time'], t, T),
+                             1e-4)
+
+        # restart from the inlet
+        p2 = pfr.solve([0, 0.25, 0.5])
+        self.assertArrayNear(p2['T'], p['T'][::100], 1e-6)
+        with self.assertRaises(Exception):
+            pfr.solve([0, 0.5, 0.25])
+
+    def test_step(self):
+        gas = ct.Solution('h2o2.xml')
+        gas.TPX = 300, ct.one_atm, 'O2:1.0, AR:4'
+        pfr = ct.PlugFlowReactor(gas, 0.01, area=1e-4)
+        v0 = pfr.velocity
+        z = 0.0
+        while z < 1.0:
+            z = pfr.step()
+            self.assertNear(pfr.distance, z)
+            self.assertNear(pfr.velocity, v0)
+            self.assertNear(pfr.residence_time, z / v0)
+
+    def test_change_settings(self):
+        # Changing the integrator settings does not restart from the inlet
+        gas = ct.Solution('h2o2.xml')
+        gas.TPX = 1100, ct.one_atm, 'H2:2, O2:1, AR:7'
+        pfr = ct.PlugFlowReactor(gas, 0.01, area=1e-4)
+        p = pfr.solve([0.0, 0.25, 0.5])
+
+        pfr.initialize()
+        pfr.advance(0.25)
+        self.assertNear(gas.T, p['T'][1], 1e-6)
+        tau = pfr.residence_time
+        pfr.set_tolerances(1e-10, 1e-16)
+        pfr.max_step_size = 0.01
+        pfr.step()
+        self.assertTrue(0.25 < pfr.distance <= 0.26)
+        self.assertTrue(pfr.residence_time > tau)
+        pfr.advance(0.5)
+        self.assertNear(pfr.distance, 0.5)
+        self.assertNear(gas.T, p['T'][2], 1e-6)
+
+    def test_surface(self):
+        gas = ct.Solution('ptcombust.xml', 'gas')
+        surf = ct.Interface('ptcombust.xml', 'Pt_surf', [gas])
+        gas.TPX = 1200, ct.one_atm, 'CH4:0.095, O2:0.21, AR:0.79'
+        pfr = ct.PlugFlowReactor(gas, 1e-4, area=1e-4, surface=surf,
+                                 surface_area=0.05, energy='off')
+        z = np.linspace(0, 0.1, 21)
+        p = pfr.solve(z)
+        self.assertEqual(p['coverages'].shape, (21, surf.n_species))
+        self.assertArrayNear(p['coverages'].sum(axis=1), np.ones(21))
+
+        # With steady coverages, there is no net production of gas-phase
+        # mass or elements at the surface
+        self.assertArrayNear(p['mdot'], 1e-4 * np.ones(21), 1e-6)
+        iC = gas.element_index('C')
+        nC = np.array([gas.n_atoms(k, iC) for k in range(gas.n_species)])
+        ZC = np.dot(p['Y'] / gas.molecular_weights, nC)
+        self.assertArrayNear(ZC, ZC[0] * np.ones(21), 1e-6)
+        self.assertTrue(p['X'][-1, gas.species_index('CH4')] <
+                        0.9 * p['X'][0, gas.species_index('CH4')])
+
+        # more catalyst area means more conversion
+        pfr.set_surface_area(0.1)
+        p2 = pfr.solve(z)
+        self.assertTrue(p2['X'][-1, gas.species_index('CH4')] <
+                        p['X'][-1, gas.species_index('CH4')])
+
+
 class TestWallKinetics(utilities.CanteraTest):
     def make_reactors(self):
         self.net = ct.ReactorNet()
@@ -958,6 +1751,29 @@ class TestReactorSensitivities(utilities.CanteraTest):
         S = net.sensitivities()
         self.assertEqual(S.shape, (net.n_vars, net.n_sensitivity_params))
 
+    def test_checkpoint(self):
+        def make_network():
+            gas = ct.Solution('h2o2.xml')
+            gas.TPX = 1000, ct.one_atm, 'H2:2, O2:1, AR:4'
+            r = ct.IdealGasReactor(gas)
+            net = ct.ReactorNet([r])
+            r.add_sensitivity_reaction(2)
+            r.add_sensitivity_reaction(5)
+            return net
+
+        net1 = make_network()
+        net1.advance(5e-5)
+        S1 = net1.sensitivities()
+        data = net1.checkpoint()
+        net1.advance(2e-4)
+
+        net2 = make_network()
+        net2.restore(data)
+        self.assertArrayNear(S1, net2.sensitivities(), 1e-8, 1e-12)
+        net2.advance(2e-4)
+        self.assertArrayNear(net1.sensitivities(), net2.sensitivities(),
+                             1e-3, 1e-6)
+
     def test_sensitivities2(self):
         net = ct.ReactorNet()
 
@@ -1187,6 +2003,95 @@ class TestReactorSensitivities(utilities.CanteraTest):
             for i,j in enumerate((4,2,1,3,0)):
                 self.assertArrayNear(S[a][:,i], S[b][:,j], 1e-2, 1e-3)
 
+    def _test_adjoint(self, reactorClass, component):
+        gas = ct.Solution('h2o2.xml')
+
+        def setup(k=None, dp=0.0):
+            gas.set_multiplier(1.0)
+            if k is not None:
+                gas.set_multiplier(1.0 + dp, k)
+            gas.TPX = 1000, ct.one_atm, 'H2:2, O2:1, AR:4'
+            r = reactorClass(gas)
+            net = ct.ReactorNet([r])
+            net.rtol = 1e-10
+            net.atol = 1e-18
+            return r, net
+
+        r, net = setup()
+        S = net.adjoint_sensitivities(2e-4, component)
+        self.assertEqual(len(S), gas.n_reactions)
+
+        i = r.component_index(component)
+        dp = 1e-4
+        for k in (0, 1, 2, 9, 15):
+            r1, net1 = setup(k, dp)
+            net1.advance(2e-4)
+            r2, net2 = setup(k, -dp)
+            net2.advance(2e-4)
+            dydp = (net1.get_state()[i] - net2.get_state()[i]) / (2 * dp)
+            self.assertNear(S[k], dydp, 5e-3, 1e-3 * np.abs(S).max())
+        gas.set_multiplier(1.0)
+
+    def test_adjoint_ideal_gas(self):
+        self._test_adjoint(ct.IdealGasReactor, 'temperature')
+
+    def test_adjoint_const_pressure(self):
+        self._test_adjoint(ct.IdealGasConstPressureReactor, 'OH')
+
+    def test_adjoint_reactor(self):
+        self._test_adjoint(ct.Reactor, 'H2O')
+
+    def test_adjoint_linear_combination(self):
+        gas = ct.Solution('h2o2.xml')
+        gas.TPX = 1000, ct.one_atm, 'H2:2, O2:1, AR:4'
+        r = ct.IdealGasReactor(gas)
+        net = ct.ReactorNet([r])
+        S1 = net.adjoint_sensitivities(1e-4, 'OH')
+
+        gas.TPX = 1000, ct.one_atm, 'H2:2, O2:1, AR:4'
+        r = ct.IdealGasReactor(gas)
+        net = ct.ReactorNet([r])
+        net.reinitialize()
+        dgdy = np.zeros(net.n_vars)
+        dgdy[r.component_index('OH')] = 2.0
+        S2 = net.adjoint_sensitivities(1e-4, dgdy)
+        self.assertArrayNear(2 * S1, S2)
+
+        with self.assertRaises(RuntimeError):
+            net.adjoint_sensitivities(2e-4, np.ones(3))
+
+    def test_adjoint_ignition_delay(self):
+        gas = ct.Solution('h2o2.xml')
+
+        def ignition(k=None, dp=0.0):
+            gas.set_multiplier(1.0)
+            if k is not None:
+                gas.set_multiplier(1.0 + dp, k)
+            gas.TPX = 1000, ct.one_atm, 'H2:2, O2:1, AR:4'
+            r = ct.IdealGasReactor(gas)
+            net = ct.ReactorNet([r])
+            net.rtol = 1e-10
+            net.atol = 1e-18
+            net.set_max_time_step(2e-6)
+            return net.adjoint_event_sensitivities(1e-2, 'temperature', 1400)
+
+        tig, S = ignition()
+        self.assertTrue(0 < tig < 1e-2)
+        self.assertEqual(len(S), gas.n_reactions)
+
+        dp = 1e-3
+        for k in (0, 1, 9):
+            t1 = ignition(k, dp)[0]
+            t2 = ignition(k, -dp)[0]
+            self.assertNear(S[k], (t1 - t2) / (2 * dp), 1e-2,
+                            1e-3 * np.abs(S).max())
+        gas.set_multiplier(1.0)
+
+        with self.assertRaises(RuntimeError):
+            gas.TPX = 300, ct.one_atm, 'H2:2, O2:1, AR:4'
+            net = ct.ReactorNet([ct.IdealGasReactor(gas)])
+            net.adjoint_event_sensitivities(1e-3, 'temperature', 1400)
+
 
 class CombustorTestImplementation(object):
     """
@@ -556,6 +556,42 @@ class TestThermoPhase(utilities.CanteraTest):
         self.assertNear(self.phase.min_temp, 300.0)
         self.assertNear(self.phase.max_temp, 3500.0)
 
+    def test_state_cache(self):
+        self.assertEqual(self.phase.thermo_cache_size, 0)
+        self.phase.X = 'H2:0.3, O2:0.5, H2O:0.2'
+        temperatures = [500, 1200, 2500]
+        expected = []
+        for T in temperatures:
+            self.phase.TP = T, ct.one_atm
+            expected.append((self.phase.cp_mole, self.phase.entropy_mole,
+                             self.phase.standard_gibbs_RT))
+
+        self.phase.thermo_cache_size = 4
+        self.assertEqual(self.phase.thermo_cache_size, 4)
+        for i in range(3):
+            for T, (cp, s, g) in zip(temperatures, expected):
+                self.phase.TP = T, ct.one_atm
+                self.assertEqual(self.phase.cp_mole, cp)
+                self.assertEqual(self.phase.entropy_mole, s)
+                self.assertArrayNear(self.phase.standard_gibbs_RT, g, 1e-15)
+        hits, misses = self.phase.thermo_cache_stats
+        self.assertEqual(misses, 3)
+        self.assertEqual(hits, 6)
+
+        # Modifying the species thermo must discard the saved states
+        k = self.phase.species_index('H2O')
+        self.phase.TP = temperatures[0], ct.one_atm
+        h0 = self.phase.standard_enthalpies_RT[k]
+        sp = self.phase.species(k)
+        sp.thermo = self.phase.species('OH').thermo
+        self.phase.modify_species(k, sp)
+        self.phase.TP = temperatures[1], ct.one_atm
+        self.phase.TP = temperatures[0], ct.one_atm
+        self.assertNotAlmostEqual(self.phase.standard_enthalpies_RT[k], h0)
+
+        self.phase.thermo_cache_size = 0
+        self.assertEqual(self.phase.thermo_cache_stats, (0, 0))
+
     def test_unpicklable(self):
         import pickle
         with self.assertRaises(NotImplementedError):
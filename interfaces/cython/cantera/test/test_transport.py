@@ -43,6 +43,108 @@ class TestTransport(utilities.CanteraTest):
         self.assertTrue(all(self.phase.multi_diff_coeffs.flat >= 0.0))
         self.assertTrue(all(self.phase.thermal_diff_coeffs.flat != 0.0))
 
+    def test_shared_fits(self):
+        self.phase.transport_model = 'Multi'
+        k1 = self.phase.thermal_conductivity
+        D1 = self.phase.multi_diff_coeffs
+        self.assertGreaterEqual(self.phase.transport_setup_time, 0.0)
+
+        # A new Solution with the same species reuses the fits
+        gas2 = ct.Solution('h2o2.xml', transport_model='Multi')
+        gas2.TPX = self.phase.TPX
+        self.assertNear(k1, gas2.thermal_conductivity)
+        self.assertArrayNear(D1.flat, gas2.multi_diff_coeffs.flat)
+
+        # Different species data requires a new set of fits
+        species = ct.Species.listFromFile('h2o2.xml')
+        species[0].transport.diameter *= 1.1
+        gas3 = ct.Solution(thermo='IdealGas', species=species,
+                           transport_model='Multi')
+        gas3.TPX = self.phase.TPX
+        k3 = gas3.thermal_conductivity
+        self.assertGreater(abs(k3 - k1), 1e-4 * k1)
+
+        # The fits are freed along with the last object using them, and are
+        # computed again when they are needed
+        del gas3
+        gas4 = ct.Solution(thermo='IdealGas', species=species,
+                           transport_model='Multi')
+        gas4.TPX = self.phase.TPX
+        self.assertNear(k3, gas4.thermal_conductivity)
+
+        with self.assertRaises(ValueError):
+            ct.Solution('h2o2.xml', transport_model=None).transport_setup_time
+
+    def test_batch_transport(self):
+        T = np.array([300, 800, 1200, 800, 300])
+        P = ct.one_atm * np.array([1, 2, 3, 4, 5])
+        X = np.random.random((5, self.phase.n_species))
+        X0 = self.phase.X
+        T0, P0 = self.phase.TP
+
+        mu = self.phase.batch_transport('viscosity', T, P, X)
+        Dkm = self.phase.batch_transport('mix_diff_coeffs', T, P, X)
+        Dbin = self.phase.batch_transport('binary_diff_coeffs', T, P, X)
+        self.assertEqual(mu.shape, (5,))
+        self.assertEqual(Dkm.shape, (5, self.phase.n_species))
+        self.assertEqual(Dbin.shape, (5, self.phase.n_species,
+                                      self.phase.n_species))
+
+        # state of the phase is unchanged
+        self.assertNear(self.phase.T, T0)
+        self.assertNear(self.phase.P, P0)
+        self.assertArrayNear(self.phase.X, X0)
+
+        for i in range(5):
+            self.phase.TPX = T[i], P[i], X[i]
+            self.assertNear(mu[i], self.phase.viscosity)
+            self.assertArrayNear(Dkm[i], self.phase.mix_diff_coeffs)
+            self.assertArrayNear(Dbin[i].flat, self.phase.binary_diff_coeffs.flat)
+
+        # scalar temperature and pressure, single composition
+        k = self.phase.batch_transport('thermal_conductivity', 900,
+                                       ct.one_atm, X[2])
+        self.phase.TPX = 900, ct.one_atm, X[2]
+        self.assertEqual(k.shape, (1,))
+        self.assertNear(k[0], self.phase.thermal_conductivity)
+
+        with self.assertRaises(ValueError):
+            self.phase.batch_transport('density', T, P, X)
+        with self.assertRaises(ValueError):
+            self.phase.batch_transport('viscosity', T[:3], P, X)
+        with self.assertRaises(ValueError):
+            self.phase.batch_transport('viscosity', T, P, X[:, :3])
+
+    def test_multicomponent_iterative_solver(self):
+        with self.assertRaises(ValueError):
+            self.phase.set_multicomponent_solver('iterative')
+
+        gas2 = ct.Solution('h2o2.xml')
+        self.phase.transport_model = 'Multi'
+        gas2.transport_model = 'Multi'
+        gas2.set_multicomponent_solver('iterative', max_iterations=10,
+                                       rtol=1e-11)
+        with self.assertRaises(ValueError):
+            gas2.set_multicomponent_solver('gmres')
+
+        X0 = self.phase.X
+        for i in range(10):
+            X = X0 * (1 + 0.001 * i * np.arange(self.phase.n_species))
+            T = 800 + 0.5 * i
+            self.phase.TPX = T, 2*ct.one_atm, X
+            gas2.TPX = T, 2*ct.one_atm, X
+            self.assertNear(self.phase.thermal_conductivity,
+                            gas2.thermal_conductivity)
+            self.assertArrayNear(self.phase.thermal_diff_coeffs,
+                                 gas2.thermal_diff_coeffs)
+            self.assertArrayNear(self.phase.multi_diff_coeffs,
+                                 gas2.multi_diff_coeffs)
+
+        # Nearby states should mostly reuse the existing factorization
+        nfactor, niter = gas2.multicomponent_solver_stats
+        self.assertLess(nfactor, 10)
+        self.assertGreater(niter, 0)
+
 class TestTransportGeometryFlags(utilities.CanteraTest):
     phase_data = """
 units(length="cm", time="s", quantity="mol", act_energy="cal/mol")
@@ -328,9 +328,100 @@ cdef class ThermoPhase(_SolutionBase):
             and an estimate is formulated.
         :param loglevel:
             Set to a value > 0 to write diagnostic output.
+
+        The GIL is released while solving the equilibrium problem, so
+        independent phases can be equilibrated concurrently from different
+        Python threads.
             """
-        self.thermo.equilibrate(stringify(XY.upper()), stringify(solver), rtol,
-                                maxsteps, maxiter, estimate_equil, loglevel)
+        cdef string cxx_XY = stringify(XY.upper())
+        cdef string cxx_solver = stringify(solver)
+        with nogil:
+            self.thermo.equilibrate(cxx_XY, cxx_solver, rtol, maxsteps,
+                                    maxiter, estimate_equil, loglevel)
+
+    def batch_equilibrate(self, XY, T, P, X, solver='auto', double rtol=1e-9,
+                          int maxsteps=1000, int maxiter=100, warm_start=True):
+        """
+        Find the equilibrium states for an array of N initial states, holding
+        property pair *XY* constant for each one. The calculation is carried
+        out entirely in C++, without holding the Python global interpreter
+        lock, and a single solver object is reused for all of the states. The
+        state of the phase is not changed.
+
+        :param XY:
+            A two-letter string specifying the property pair, as in
+            `equilibrate`.
+        :param T:
+            Initial temperatures [K]. Array of length N, or a scalar.
+        :param P:
+            Initial pressures [Pa]. Array of length N, or a scalar.
+        :param X:
+            Initial mole fractions. Array with shape (N, `n_species`), or a
+            single composition used for all states.
+        :param solver:
+            The equilibrium solver to use, as in `equilibrate`.
+        :param rtol:
+            the relative error tolerance.
+        :param maxsteps:
+            maximum number of steps in composition to take to find a converged
+            solution.
+        :param maxiter:
+            For the Gibbs minimization solver, the number of 'outer' iterations
+            on T or P when some property pair other than TP is specified.
+        :param warm_start:
+            If `True`, the element potential solver is started from the
+            converged solution for the previous state, rather than from an
+            estimate computed from scratch. This is most effective when
+            neighboring states in a sweep are given consecutively.
+
+        Returns a tuple ``(T, P, X, iterations)`` containing the equilibrium
+        temperatures, pressures, and mole fractions (shape (N, `n_species`)),
+        and the number of iterations taken by the element potential solver for
+        each state (-1 for states that were solved with one of the other
+        solvers).
+
+        >>> phi = np.linspace(0.5, 2.0, 100)
+        >>> X = np.zeros((100, gas.n_species))
+        >>> X[:, gas.species_index('CH4')] = phi
+        >>> X[:, gas.species_index('O2')] = 2.0
+        >>> X[:, gas.species_index('N2')] = 7.52
+        >>> Tad, P, Xeq, iters = gas.batch_equilibrate('HP', 300, ct.one_atm, X)
+        """
+        cdef size_t kk = self.thermo.nSpecies()
+        X = np.array(X, dtype=np.double, ndmin=2)
+        if X.ndim != 2 or X.shape[1] != kk:
+            raise ValueError('Mole fractions must have shape (N, {}), got '
+                             '{}'.format(kk, X.shape))
+        T = np.array(T, dtype=np.double, ndmin=1)
+        P = np.array(P, dtype=np.double, ndmin=1)
+        cdef size_t n = max(X.shape[0], T.size, P.size)
+        for a in (X, T, P):
+            if a.shape[0] not in (1, n) or a is not X and a.ndim != 1:
+                raise ValueError('Inconsistent numbers of states')
+
+        cdef np.ndarray[np.double_t, ndim=1] TT = np.ascontiguousarray(
+            T * np.ones(n))
+        cdef np.ndarray[np.double_t, ndim=1] PP = np.ascontiguousarray(
+            P * np.ones(n))
+        cdef np.ndarray[np.double_t, ndim=2] XX = np.ascontiguousarray(
+            X * np.ones((n, 1)))
+        cdef np.ndarray[np.double_t, ndim=1] Tout = np.empty(n)
+        cdef np.ndarray[np.double_t, ndim=1] Pout = np.empty(n)
+        cdef np.ndarray[np.double_t, ndim=2] Xout = np.empty((n, kk))
+        cdef np.ndarray[int, ndim=1] iterations = np.empty(n, dtype=np.intc)
+        cdef string cxx_XY = stringify(XY.upper())
+        cdef string cxx_solver = stringify(solver)
+        cdef cbool warm = warm_start
+        if n:
+            with nogil:
+                thermo_batchEquilibrate(self.thermo, cxx_XY, cxx_solver, n,
+                    &TT[0], &PP[0], &XX[0,0], &Tout[0], &Pout[0], &Xout[0,0],
+                    &iterations[0], rtol, maxsteps, maxiter, warm)
+
+        if self._selected_species.size:
+            return Tout, Pout, Xout[:, self._selected_species], iterations
+        else:
+            return Tout, Pout, Xout, iterations
 
     ####### Composition, species, and elements ########
 
@@ -437,6 +528,31 @@ cdef class ThermoPhase(_SolutionBase):
         if self.kinetics:
             self.kinetics.invalidateCache()
 
+    property thermo_cache_size:
+        """
+        The number of recent temperatures for which the species reference
+        state properties are kept, in addition to the current state. Keeping
+        several states avoids recomputing these properties when the phase
+        alternates between a few states, e.g. when it is shared by several
+        reactors. Zero (the default) disables the cache. Setting the size
+        resets `thermo_cache_stats`.
+        """
+        def __get__(self):
+            return self.thermo.stateCacheSize()
+        def __set__(self, n):
+            self.thermo.setStateCacheSize(n)
+
+    property thermo_cache_stats:
+        """
+        The number of times the reference state properties were found in
+        (hits) or added to (misses) the cache of recent states, as a tuple
+        ``(hits, misses)``. See `thermo_cache_size`.
+        """
+        def __get__(self):
+            cdef size_t hits, misses
+            self.thermo.getStateCacheStats(hits, misses)
+            return hits, misses
+
     def n_atoms(self, species, element):
         """
         Number of atoms of element *element* in species *species*. The element
@@ -1275,6 +1391,46 @@ cdef class PureFluid(ThermoPhase):
     A pure substance that can  be a gas, a liquid, a mixed gas-liquid fluid,
     or a fluid beyond its critical point.
     """
+    def tabulate(self, T_range, P_range, n_T=100, n_P=100, rtol=1e-6):
+        """
+        Switch to tabulated mode, where the state is set and the saturation
+        properties are evaluated by interpolating in tables computed from the
+        equation of state, which is much faster than the iterative solution
+        used otherwise. Returns the fraction of the table cells where the
+        interpolation error satisfies the tolerance *rtol*. States in the
+        remaining cells, and outside the tables, are computed as usual. The
+        error is only checked at a few points in each cell (on a 3 x 3 grid
+        inside the cell and at three points on each edge), so the tolerance
+        is not guaranteed to be met everywhere in the tables.
+
+        :param T_range:
+            Tuple ``(T_min, T_max)`` giving the temperature range [K] of the
+            tables
+        :param P_range:
+            Tuple ``(P_min, P_max)`` giving the pressure range [Pa] of the
+            tables
+        :param n_T:
+            Number of grid points along the temperature axis
+        :param n_P:
+            Number of grid points along the pressure axis
+        :param rtol:
+            Relative error tolerance for the interpolated properties
+
+        >>> w = ct.Water()
+        >>> w.tabulate((300, 1000), (1e3, 3e7))
+        """
+        return (<CxxPureFluidPhase*>self.thermo).tabulate(
+            T_range[0], T_range[1], P_range[0], P_range[1], n_T, n_P, rtol)
+
+    def clear_tables(self):
+        """ Discard the tables created by `tabulate`. """
+        (<CxxPureFluidPhase*>self.thermo).clearTables()
+
+    property tabulated:
+        """ True if the tables created by `tabulate` are in use. """
+        def __get__(self):
+            return (<CxxPureFluidPhase*>self.thermo).tabulated()
+
     property X:
         """
         Get/Set vapor fraction (quality). Can be set only when in the two-phase
@@ -1334,7 +1490,7 @@ cdef class PureFluid(ThermoPhase):
         a PureFluid.
         """
         def __get__(self):
-            return self.p, self.v
+            return self.P, self.v
         def __set__(self, values):
             P = values[0] if values[0] is not None else self.P
             V = values[1] if values[1] is not None else self.v
@@ -1436,6 +1592,102 @@ cdef class PureFluid(ThermoPhase):
         def __get__(self):
             return self.s, self.v, self.X
 
+    def batch_set_state(self, XY, x, y):
+        """
+        Compute the states specified by arrays of values of a property pair.
+        The calculation is carried out entirely in C++, without holding the
+        Python global interpreter lock, and each state is found starting from
+        the previous one. The state of the phase is not changed.
+
+        :param XY:
+            A two-letter string specifying the property pair, which may be any
+            of ``'TP'``, ``'HP'``, ``'SP'``, ``'UV'``, ``'SV'``, ``'ST'``,
+            ``'TV'``, ``'PV'``, ``'UP'``, ``'VH'``, ``'TH'``, ``'SH'``,
+            ``'TX'``, or ``'PX'``.
+        :param x:
+            Values of the first property. Array of length N, or a scalar.
+        :param y:
+            Values of the second property. Array of length N, or a scalar.
+
+        Returns a tuple ``(T, P, density, h, s, X)`` of arrays of length N
+        containing the temperature, pressure, density, specific enthalpy,
+        specific entropy, and vapor fraction of each state, in units depending
+        on `basis`.
+
+        >>> P = np.logspace(3, 7, 50)
+        >>> T, P, D, h, s, X = w.batch_set_state('PX', P, 1.0)
+        """
+        XY = XY.upper()
+        if len(XY) != 2:
+            raise ValueError('Invalid property pair {!r}'.format(XY))
+        x = np.array(x, dtype=np.double, ndmin=1)
+        y = np.array(y, dtype=np.double, ndmin=1)
+        cdef size_t n = max(x.size, y.size)
+        if x.ndim != 1 or y.ndim != 1 or x.size not in (1, n) or y.size not in (1, n):
+            raise ValueError('Inconsistent numbers of states')
+
+        cdef double f = self._mass_factor()
+        if XY[0] in 'UVHS':
+            x = x / f
+        if XY[1] in 'UVHS':
+            y = y / f
+        cdef np.ndarray[np.double_t, ndim=1] xx = np.ascontiguousarray(
+            x * np.ones(n))
+        cdef np.ndarray[np.double_t, ndim=1] yy = np.ascontiguousarray(
+            y * np.ones(n))
+        cdef np.ndarray[np.double_t, ndim=1] T = np.empty(n)
+        cdef np.ndarray[np.double_t, ndim=1] P = np.empty(n)
+        cdef np.ndarray[np.double_t, ndim=1] D = np.empty(n)
+        cdef np.ndarray[np.double_t, ndim=1] h = np.empty(n)
+        cdef np.ndarray[np.double_t, ndim=1] s = np.empty(n)
+        cdef np.ndarray[np.double_t, ndim=1] X = np.empty(n)
+        cdef string cxx_XY = stringify(XY)
+        cdef CxxPureFluidPhase* fluid = <CxxPureFluidPhase*>self.thermo
+        if n:
+            with nogil:
+                purefluid_batchSetState(fluid, cxx_XY, n, &xx[0], &yy[0],
+                    &T[0], &P[0], &D[0], &h[0], &s[0], &X[0])
+        return T, P, D / f, h * f, s * f, X
+
+    def saturation_curve(self, T):
+        """
+        Compute the saturation pressure and the properties of the saturated
+        liquid and vapor at an array of temperatures. The calculation is
+        carried out entirely in C++, without holding the Python global
+        interpreter lock. The saturation state at each temperature is found
+        starting from the one for the previous temperature, which is much
+        faster than setting each state independently if the temperatures are
+        given in order. The state of the phase is not changed.
+
+        :param T:
+            Temperatures [K] below the critical temperature. Array of length
+            N.
+
+        Returns a tuple ``(P, density, h, s)``, where *P* is an array of the
+        saturation pressures and *density*, *h*, and *s* are arrays with shape
+        (N, 2) containing the density, specific enthalpy, and specific entropy
+        of the saturated liquid (first column) and vapor (second column), in
+        units depending on `basis`.
+
+        >>> T = np.linspace(300, 640, 200)
+        >>> P, D, h, s = w.saturation_curve(T)
+        >>> plt.plot(s[:,0], T, s[:,1], T)
+        """
+        cdef np.ndarray[np.double_t, ndim=1] TT = np.ascontiguousarray(
+            T, dtype=np.double).reshape(-1)
+        cdef size_t n = TT.size
+        cdef np.ndarray[np.double_t, ndim=1] P = np.empty(n)
+        cdef np.ndarray[np.double_t, ndim=2] D = np.empty((n, 2))
+        cdef np.ndarray[np.double_t, ndim=2] h = np.empty((n, 2))
+        cdef np.ndarray[np.double_t, ndim=2] s = np.empty((n, 2))
+        cdef CxxPureFluidPhase* fluid = <CxxPureFluidPhase*>self.thermo
+        if n:
+            with nogil:
+                purefluid_saturationCurve(fluid, n, &TT[0], &P[0], &D[0,0],
+                                          &h[0,0], &s[0,0])
+        cdef double f = self._mass_factor()
+        return P, D / f, h * f, s * f
+
 
 class Element(object):
     """
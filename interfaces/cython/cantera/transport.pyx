@@ -139,6 +139,23 @@ cdef class Transport(_SolutionBase):
             self.transport = newTransportMgr(stringify(model), self.thermo)
             del old # only if the new transport manager was successfully created
 
+    property transport_setup_time:
+        """
+        CPU time [s] spent computing the collision integral and property
+        fits when the current transport model was set up. The fits are
+        computed only once per process for each mechanism and are then
+        shared by all gas transport models that use the same species, so
+        this is much smaller for subsequent `Solution` objects or
+        `transport_model` changes. Only available for the ``Mix``,
+        ``Multi``, ``CK_Mix``, ``CK_Multi`` and ``HighP`` models.
+        """
+        def __get__(self):
+            if self.transport_model not in ('Mix', 'Multi', 'CK_Mix',
+                                            'CK_Multi', 'HighP'):
+                raise ValueError('Setup time is only available for gas '
+                                 'transport models')
+            return (<CxxGasTransport*>self.transport).setupTime()
+
     property viscosity:
         """Viscosity [Pa-s]."""
         def __get__(self):
@@ -197,6 +214,142 @@ cdef class Transport(_SolutionBase):
         def __get__(self):
             return get_transport_2d(self, tran_getBinaryDiffCoeffs)
 
+    def batch_transport(self, name, T, P, X):
+        """
+        Evaluate a transport property for an array of N states. The
+        calculation is carried out entirely in C++, without holding the
+        Python global interpreter lock. States with the same temperature
+        share the evaluation of the temperature-dependent parts of the
+        transport model. The state of the phase is not changed.
+
+        :param name:
+            Name of the property, e.g. ``'viscosity'`` or
+            ``'mix_diff_coeffs'``. Supported properties are `viscosity`,
+            `thermal_conductivity`, `electrical_conductivity`,
+            `mix_diff_coeffs`, `mix_diff_coeffs_mass`, `mix_diff_coeffs_mole`,
+            `thermal_diff_coeffs`, `multi_diff_coeffs` and
+            `binary_diff_coeffs`.
+        :param T:
+            Temperatures [K]. Array of length N, or a scalar.
+        :param P:
+            Pressures [Pa]. Array of length N, or a scalar.
+        :param X:
+            Mole fractions. Array with shape (N, `n_species`), or a single
+            composition used for all states.
+
+        Returns an array with shape (N,) for scalar properties, (N,
+        `n_species`) for species properties, and (N, `n_species`,
+        `n_species`) for the multicomponent and binary diffusion coefficients.
+
+        >>> T = np.linspace(300, 2000, 50)
+        >>> mu = gas.batch_transport('viscosity', T, ct.one_atm, gas.X)
+        """
+        cdef transportBatchMethod method
+        cdef size_t kk = self.thermo.nSpecies()
+        cdef int ndim = 0
+        if name == 'viscosity':
+            method = tran_batch_viscosity
+        elif name == 'thermal_conductivity':
+            method = tran_batch_thermalConductivity
+        elif name == 'electrical_conductivity':
+            method = tran_batch_electricalConductivity
+        elif name == 'mix_diff_coeffs':
+            method, ndim = tran_batch_getMixDiffCoeffs, 1
+        elif name == 'mix_diff_coeffs_mass':
+            method, ndim = tran_batch_getMixDiffCoeffsMass, 1
+        elif name == 'mix_diff_coeffs_mole':
+            method, ndim = tran_batch_getMixDiffCoeffsMole, 1
+        elif name == 'thermal_diff_coeffs':
+            method, ndim = tran_batch_getThermalDiffCoeffs, 1
+        elif name == 'multi_diff_coeffs':
+            method, ndim = tran_batch_getMultiDiffCoeffs, 2
+        elif name == 'binary_diff_coeffs':
+            method, ndim = tran_batch_getBinaryDiffCoeffs, 2
+        else:
+            raise ValueError('Unknown transport property: {!r}'.format(name))
+
+        X = np.array(X, dtype=np.double, ndmin=2)
+        if X.ndim != 2 or X.shape[1] != kk:
+            raise ValueError('Mole fractions must have shape (N, {}), got '
+                             '{}'.format(kk, X.shape))
+        T = np.array(T, dtype=np.double, ndmin=1)
+        P = np.array(P, dtype=np.double, ndmin=1)
+        cdef size_t n = max(X.shape[0], T.size, P.size)
+        for a in (X, T, P):
+            if a.shape[0] not in (1, n) or a is not X and a.ndim != 1:
+                raise ValueError('Inconsistent numbers of states')
+
+        cdef np.ndarray[np.double_t, ndim=1] TT = np.ascontiguousarray(
+            T * np.ones(n))
+        cdef np.ndarray[np.double_t, ndim=1] PP = np.ascontiguousarray(
+            P * np.ones(n))
+        cdef np.ndarray[np.double_t, ndim=2] XX = np.ascontiguousarray(
+            X * np.ones((n, 1)))
+        cdef np.ndarray[np.double_t, ndim=1] data = np.empty(n * kk**ndim)
+        if n:
+            with nogil:
+                method(self.transport, n, &TT[0], &PP[0], &XX[0,0], &data[0])
+
+        if ndim == 0:
+            return data
+        elif ndim == 1:
+            if self._selected_species.size:
+                return data.reshape((n, kk))[:, self._selected_species]
+            else:
+                return data.reshape((n, kk))
+        else:
+            return data.reshape((n, kk, kk))
+
+    def set_multicomponent_solver(self, method, max_iterations=5, rtol=1e-8):
+        """
+        Set the method used to solve the linear system (the "L matrix")
+        which determines the thermal conductivity and the thermal diffusion
+        coefficients in the multicomponent (``Multi`` or ``CK_Multi``)
+        transport models.
+
+        :param method:
+            ``'direct'`` (the default) factorizes the L matrix every time the
+            temperature or composition changes. ``'iterative'`` reuses the
+            factorization from an earlier state as a preconditioner and
+            refines the previous solution until it converges, only
+            refactorizing if more than *max_iterations* iterations would be
+            needed. This is much faster when evaluating properties for a
+            sequence of similar states, e.g. along a flame.
+        :param max_iterations:
+            Maximum number of iterations of the iterative solver
+        :param rtol:
+            Relative tolerance for the iterative solver
+
+        The solver settings are reset to ``'direct'`` when the transport model
+        is changed.
+        """
+        if self.transport_model not in ('Multi', 'CK_Multi'):
+            raise ValueError("The L-matrix solver can only be set for the "
+                "'Multi' and 'CK_Multi' transport models")
+        if method == 'direct':
+            max_iterations = 0
+        elif method == 'iterative':
+            if max_iterations < 1:
+                raise ValueError('max_iterations must be at least 1')
+        else:
+            raise ValueError("Solver method must be 'direct' or 'iterative'")
+        (<CxxMultiTransport*>self.transport).setLMatrixSolver(max_iterations,
+                                                              rtol)
+
+    property multicomponent_solver_stats:
+        """
+        Get a tuple containing the number of factorizations of the L matrix
+        and the number of iterations of the iterative L-matrix solver since
+        the last call to `set_multicomponent_solver`, for the multicomponent
+        transport models.
+        """
+        def __get__(self):
+            if self.transport_model not in ('Multi', 'CK_Multi'):
+                raise ValueError("Solver statistics are only available for "
+                    "the 'Multi' and 'CK_Multi' transport models")
+            cdef CxxMultiTransport* tran = <CxxMultiTransport*>self.transport
+            return tran.nLMatrixFactorizations(), tran.nLMatrixIterations()
+
 
 cdef class DustyGasTransport(Transport):
     """
@@ -1,8 +1,43 @@
 import os
 import inspect as _inspect
+import multiprocessing as _multiprocessing
 
 from . import Solution, add_directory
 
+# Objects (e.g. Solution objects) used by worker processes, keyed by the
+# arguments used to create them. Each process builds its own copy, since
+# Cantera objects cannot be passed between processes.
+_worker_objects = {}
+
+
+def _get_worker_object(key, factory):
+    """
+    Return the object cached in this process for *key*, creating it by calling
+    *factory* if it does not exist yet.
+    """
+    if key not in _worker_objects:
+        _worker_objects[key] = factory()
+    return _worker_objects[key]
+
+
+def _pool_map(func, args, processes=1, initializer=None, initargs=()):
+    """
+    Apply *func* to each item in *args* and return the list of results. If
+    *processes* is greater than 1, the items are distributed over a
+    `multiprocessing` pool of that many worker processes.
+    """
+    if processes > 1:
+        pool = _multiprocessing.Pool(processes=processes,
+                                     initializer=initializer,
+                                     initargs=initargs)
+        try:
+            return pool.map(func, args)
+        finally:
+            pool.close()
+            pool.join()
+    else:
+        return [func(a) for a in args]
+
 
 def import_phases(filename, phase_names):
     """
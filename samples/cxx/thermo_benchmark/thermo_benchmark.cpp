@@ -0,0 +1,111 @@
+/*
+ * Micro-benchmark for the evaluation of species reference state properties
+ *
+ * Compares the time required to evaluate the NASA polynomials for all species
+ * in a phase using the packed coefficient tables used by GeneralSpeciesThermo
+ * (see class ThermoPolyTable) with the time required when making a virtual
+ * function call to the SpeciesThermoInterpType object for each species.
+ *
+ * Phases with 50, 500 and 5000 species are constructed by repeating the
+ * species in the GRI 3.0 mechanism, with perturbed coefficients.
+ */
+
+#include "cantera/IdealGasMix.h"
+#include "cantera/thermo/GeneralSpeciesThermo.h"
+#include "cantera/thermo/NasaPoly2.h"
+
+#include <chrono>
+#include <cstdio>
+
+using namespace Cantera;
+typedef std::chrono::steady_clock Clock;
+
+// Time per evaluation of the properties of all species [s]
+template <class F>
+double timeit(F f, size_t nrep)
+{
+    auto t0 = Clock::now();
+    for (size_t n = 0; n < nrep; n++) {
+        f(1200.0 + 0.01*n);
+    }
+    std::chrono::duration<double> dt = Clock::now() - t0;
+    return dt.count() / nrep;
+}
+
+void benchmark(IdealGasMix& gas, size_t nsp)
+{
+    // Create the species parameterizations
+    std::vector<shared_ptr<SpeciesThermoInterpType>> stits;
+    for (size_t k = 0; k < nsp; k++) {
+        size_t n;
+        int type;
+        double tlow, thigh, pref;
+        double c[15];
+        gas.species(k % gas.nSpecies())->thermo->reportParameters(
+            n, type, tlow, thigh, pref, c);
+        for (size_t j = 1; j < 15; j++) {
+            c[j] *= 1.0 + 1e-6 * (k / gas.nSpecies());
+        }
+        stits.emplace_back(new NasaPoly2(tlow, thigh, pref, c));
+    }
+
+    GeneralSpeciesThermo spthermo;
+    for (size_t k = 0; k < nsp; k++) {
+        spthermo.install_STIT(k, stits[k]);
+    }
+
+    vector_fp cp_R(nsp), h_RT(nsp), s_R(nsp);
+    vector_fp cp_R0(nsp), h_RT0(nsp), s_R0(nsp);
+    vector_fp tpoly(stits[0]->temperaturePolySize());
+    size_t nrep = 2000000 / nsp;
+
+    // Evaluation using the SpeciesThermoInterpType objects
+    auto perSpecies = [&](double T) {
+        stits[0]->updateTemperaturePoly(T, &tpoly[0]);
+        for (size_t k = 0; k < nsp; k++) {
+            stits[k]->updateProperties(&tpoly[0], &cp_R0[k], &h_RT0[k],
+                                       &s_R0[k]);
+        }
+    };
+
+    // Evaluation using the packed tables
+    auto packed = [&](double T) {
+        spthermo.update(T, &cp_R[0], &h_RT[0], &s_R[0]);
+    };
+
+    double t0 = timeit(perSpecies, nrep);
+    double t1 = timeit(packed, nrep);
+
+    // Check that the results are the same
+    double maxdiff = 0.0;
+    for (double T : {500.0, 1500.0}) {
+        perSpecies(T);
+        packed(T);
+        for (size_t k = 0; k < nsp; k++) {
+            maxdiff = std::max(maxdiff, std::abs(cp_R[k] - cp_R0[k]) / cp_R0[k]);
+            maxdiff = std::max(maxdiff, std::abs(h_RT[k] - h_RT0[k]) /
+                                        std::abs(h_RT0[k]));
+            maxdiff = std::max(maxdiff, std::abs(s_R[k] - s_R0[k]) / s_R0[k]);
+        }
+    }
+
+    printf("%8d %14.2f %14.2f %10.2f %12.2e\n", (int) nsp, 1e9 * t0 / nsp,
+           1e9 * t1 / nsp, t0 / t1, maxdiff);
+}
+
+int main()
+{
+    try {
+        IdealGasMix gas("gri30.xml", "gri30");
+        printf("Time per species per evaluation [ns]\n\n");
+        printf("%8s %14s %14s %10s %12s\n", "species", "per-species",
+               "packed", "speedup", "max rel diff");
+        for (size_t nsp : {50, 500, 5000}) {
+            benchmark(gas, nsp);
+        }
+    } catch (CanteraError& err) {
+        std::cout << err.what() << std::endl;
+        return 1;
+    }
+    return 0;
+}
@@ -43,16 +43,17 @@ int _equilflag(const char* xy)
     return -1;
 }
 
-ChemEquil::ChemEquil() : m_skip(npos), m_elementTotalSum(1.0),
-    m_p0(OneAtm), m_eloc(npos),
+ChemEquil::ChemEquil() : m_phase(0), m_skip(npos), m_elementTotalSum(1.0),
+    m_p0(OneAtm), m_eloc(npos), m_haveStartSoln(false),
     m_elemFracCutoff(1.0E-100),
     m_doResPerturb(false)
 {}
 
 ChemEquil::ChemEquil(thermo_t& s) :
+    m_phase(0),
     m_skip(npos),
     m_elementTotalSum(1.0),
-    m_p0(OneAtm), m_eloc(npos),
+    m_p0(OneAtm), m_eloc(npos), m_haveStartSoln(false),
     m_elemFracCutoff(1.0E-100),
     m_doResPerturb(false)
 {
@@ -66,6 +67,9 @@ ChemEquil::~ChemEquil()
 void ChemEquil::initialize(thermo_t& s)
 {
     // store a pointer to s and some of its properties locally.
+    if (m_phase != &s) {
+        m_haveStartSoln = false;
+    }
     m_phase = &s;
     m_p0 = s.refPressure();
     m_kk = s.nSpecies();
@@ -426,10 +430,14 @@ int ChemEquil::equilibrate(thermo_t& s, const char* XYstr,
     // mole fractions.
     update(s);
 
+    // If continuing from a previous solution, it replaces the initial
+    // estimates of the temperature, composition, and element potentials.
+    bool contin = options.contin && m_haveStartSoln;
+
     doublereal tmaxPhase = s.maxTemp();
     doublereal tminPhase = s.minTemp();
     // loop to estimate T
-    if (!tempFixed) {
+    if (!tempFixed && !contin) {
         doublereal tmin = std::max(s.temperature(), tminPhase);
         if (tmin > tmaxPhase) {
             tmin = tmaxPhase - 20;
@@ -500,11 +508,18 @@ int ChemEquil::equilibrate(thermo_t& s, const char* XYstr,
         }
     }
 
-    setInitialMoles(s, elMolesGoal,loglevel);
+    if (contin) {
+        copy(m_startSoln.begin(), m_startSoln.begin() + m_mm, x.begin());
+        setToEquilState(s, x, tempFixed ? s.temperature() : m_startSoln[m_mm]);
+    } else {
+        setInitialMoles(s, elMolesGoal,loglevel);
+    }
 
     // If requested, get the initial estimate for the chemical potentials from
     // the ThermoPhase object itself. Or else, create our own estimate.
-    if (useThermoPhaseElementPotentials) {
+    if (contin) {
+        // use the previous solution
+    } else if (useThermoPhaseElementPotentials) {
         bool haveEm = s.getElementPotentials(x.data());
         if (haveEm) {
             if (s.temperature() < 100.) {
@@ -602,6 +617,9 @@ int ChemEquil::equilibrate(thermo_t& s, const char* XYstr,
             for (size_t m = 0; m < m_mm; m++) {
                 m_lambda[m] = x[m]* s.RT();
             }
+            copy(x.begin(), x.begin() + m_mm, m_startSoln.begin());
+            m_startSoln[m_mm] = s.temperature();
+            m_haveStartSoln = true;
 
             if (m_eloc != npos) {
                 adjustEloc(s, elMolesGoal);
@@ -33,6 +33,33 @@ void GasKinetics::update_rates_T()
     m_logStandConc = log(thermo().standardConcentration());
     doublereal logT = log(T);
 
+    // Rates for P-log and Chebyshev reactions also depend on pressure
+    bool pdep = m_plog_rates.nReactions() || m_cheb_rates.nReactions();
+    // The equilibrium constants depend on the species thermo data, which
+    // may have been modified since the rates for a state were saved
+    int thermoNum = thermo().cacheNumber();
+    bool cacheMiss = false;
+    vector_fp* saved = 0;
+    if (m_stateCache.capacity() && (T != m_temp || (pdep && P != m_pres))) {
+        // Check whether the rates are stored for a recent state
+        saved = m_stateCache.find(T, pdep ? P : 0.0, thermoNum);
+        size_t n = m_rfn.size() + m_rfn_low.size() + m_rfn_high.size()
+                   + falloff_work.size() + m_rkcn.size();
+        if (saved && saved->size() == n) {
+            auto iter = saved->begin();
+            for (vector_fp* v : {&m_rfn, &m_rfn_low, &m_rfn_high,
+                                 &falloff_work, &m_rkcn}) {
+                std::copy(iter, iter + v->size(), v->begin());
+                iter += v->size();
+            }
+            m_ROP_ok = false;
+            m_pres = P;
+            m_temp = T;
+            return;
+        }
+        cacheMiss = true;
+    }
+
     if (T != m_temp) {
         if (!m_rfn.empty()) {
             m_rates.update(T, logT, m_rfn.data());
@@ -62,6 +89,17 @@ void GasKinetics::update_rates_T()
     }
     m_pres = P;
     m_temp = T;
+
+    if (cacheMiss) {
+        // Replace an entry saved before reactions were added, if any
+        vector_fp& data = saved ? *saved : m_stateCache.insert(
+            T, pdep ? P : 0.0, thermoNum);
+        data.clear();
+        for (vector_fp* v : {&m_rfn, &m_rfn_low, &m_rfn_high, &falloff_work,
+                             &m_rkcn}) {
+            data.insert(data.end(), v->begin(), v->end());
+        }
+    }
 }
 
 void GasKinetics::update_rates_C()
@@ -241,6 +279,8 @@ bool GasKinetics::addReaction(shared_ptr<Reaction> r)
     if (!added) {
         return false;
     }
+    // Saved rates do not include the new reaction
+    m_stateCache.clear();
 
     switch (r->reaction_type) {
     case ELEMENTARY_RXN:
@@ -396,6 +436,18 @@ void GasKinetics::invalidateCache()
 {
     BulkKinetics::invalidateCache();
     m_pres += 0.13579;
+    m_stateCache.clear();
+}
+
+void GasKinetics::setStateCacheSize(size_t n)
+{
+    m_stateCache.setCapacity(n);
+}
+
+void GasKinetics::getStateCacheStats(size_t& hits, size_t& misses) const
+{
+    hits = m_stateCache.hits();
+    misses = m_stateCache.misses();
 }
 
 }
@@ -7,6 +7,8 @@
 #include "cantera/kinetics/ReactionPath.h"
 #include "cantera/kinetics/reaction_defs.h"
 
+#include <sstream>
+
 using namespace std;
 
 namespace Cantera
@@ -41,9 +43,12 @@ Path::Path(SpeciesNode* begin, SpeciesNode* end)
 }
 
 void Path::addReaction(size_t rxnNumber, doublereal value,
-                       const string& label)
+                       const string& label, bool reverse)
 {
     m_rxn[rxnNumber] += value;
+    if (reverse) {
+        m_reverse.insert(rxnNumber);
+    }
     m_total += value;
     if (label != "") {
         m_label[label] += value;
@@ -197,6 +202,58 @@ void ReactionPathDiagram::writeData(ostream& s)
     }
 }
 
+void ReactionPathDiagram::getFlows(vector<size_t>& k1, vector<size_t>& k2,
+                                   vector_fp& fwd, vector_fp& rev)
+{
+    // Index of the entry for each pair of species
+    map<pair<size_t, size_t>, size_t> entries;
+    for (size_t n = 0; n < nPaths(); n++) {
+        Path* p = path(n);
+        size_t a = p->begin()->number;
+        size_t b = p->end()->number;
+        auto key = std::make_pair(std::min(a, b), std::max(a, b));
+        auto iter = entries.find(key);
+        size_t i;
+        if (iter == entries.end()) {
+            i = k1.size();
+            entries[key] = i;
+            k1.push_back(key.first);
+            k2.push_back(key.second);
+            fwd.push_back(0.0);
+            rev.push_back(0.0);
+        } else {
+            i = iter->second;
+        }
+        if (a < b) {
+            fwd[i] += p->flow();
+        } else {
+            rev[i] += p->flow();
+        }
+    }
+}
+
+void ReactionPathDiagram::getReactionFlows(vector<size_t>& k1,
+    vector<size_t>& k2, vector<size_t>& rxn, vector_int& dir, vector_fp& flow)
+{
+    for (size_t n = 0; n < nPaths(); n++) {
+        Path* p = path(n);
+        for (const auto& item : p->reactionMap()) {
+            k1.push_back(p->begin()->number);
+            k2.push_back(p->end()->number);
+            // Contributions of reverse reactions are stored with negated
+            // reaction numbers by ReactionPathBuilder
+            if (p->isReverse(item.first)) {
+                rxn.push_back(-static_cast<int>(item.first));
+                dir.push_back(-1);
+            } else {
+                rxn.push_back(item.first);
+                dir.push_back(1);
+            }
+            flow.push_back(item.second);
+        }
+    }
+}
+
 void ReactionPathDiagram::exportToDot(ostream& s)
 {
     doublereal flxratio, flmax = 0.0, lwidth;
@@ -392,7 +449,8 @@ void ReactionPathDiagram::addNode(size_t k, const string& nm, doublereal x)
 }
 
 void ReactionPathDiagram::linkNodes(size_t k1, size_t k2, size_t rxn,
-                                    doublereal value, string legend)
+                                    doublereal value, string legend,
+                                    bool reverse)
 {
     SpeciesNode* begin = m_nodes[k1];
     SpeciesNode* end = m_nodes[k2];
@@ -402,7 +460,7 @@ void ReactionPathDiagram::linkNodes(size_t k1, size_t k2, size_t rxn,
         m_paths[k1][k2] = ff;
         m_pathlist.push_back(ff);
     }
-    ff->addReaction(rxn, value, legend);
+    ff->addReaction(rxn, value, legend, reverse);
     m_rxns[rxn] = 1;
     m_flxmax = std::max(ff->flow(), m_flxmax);
 }
@@ -731,6 +789,16 @@ string reactionLabel(size_t i, size_t kr, size_t nr,
 
 int ReactionPathBuilder::build(Kinetics& s, const string& element,
                                ostream& output, ReactionPathDiagram& r, bool quiet)
+{
+    s.getFwdRatesOfProgress(m_ropf.data());
+    s.getRevRatesOfProgress(m_ropr.data());
+    return build(s, element, output, r, m_ropf.data(), m_ropr.data(), quiet);
+}
+
+int ReactionPathBuilder::build(Kinetics& s, const string& element,
+                               ostream& output, ReactionPathDiagram& r,
+                               const double* ropf_in, const double* ropr_in,
+                               bool quiet)
 {
     doublereal f, ropf, ropr, fwd, rev;
     string fwdlabel, revlabel;
@@ -743,9 +811,6 @@ int ReactionPathBuilder::build(Kinetics& s, const string& element,
         return -1;
     }
 
-    s.getFwdRatesOfProgress(m_ropf.data());
-    s.getRevRatesOfProgress(m_ropr.data());
-
     // species explicitly included or excluded
     vector<string>& in_nodes = r.included();
     vector<string>& out_nodes = r.excluded();
@@ -760,8 +825,8 @@ int ReactionPathBuilder::build(Kinetics& s, const string& element,
     }
 
     for (size_t i = 0; i < m_nr; i++) {
-        ropf = m_ropf[i];
-        ropr = m_ropr[i];
+        ropf = ropf_in[i];
+        ropr = ropr_in[i];
 
         // loop over reactions involving element m
         if (m_elatoms(m, i) > 0) {
@@ -847,7 +912,7 @@ int ReactionPathBuilder::build(Kinetics& s, const string& element,
                             r.linkNodes(kkr, kkp, int(i), fwd, fwdlabel);
                         }
                         if (rev_incl) {
-                            r.linkNodes(kkp, kkr, -int(i), rev, revlabel);
+                            r.linkNodes(kkp, kkr, -int(i), rev, revlabel, true);
                         }
                     }
                 }
@@ -857,4 +922,95 @@ int ReactionPathBuilder::build(Kinetics& s, const string& element,
     return 1;
 }
 
+ReactionPathAccumulator::ReactionPathAccumulator(Kinetics& kin)
+    : m_kin(kin)
+    , m_ropf(kin.nReactions(), 0.0)
+    , m_ropr(kin.nReactions(), 0.0)
+    , m_lastf(kin.nReactions(), 0.0)
+    , m_lastr(kin.nReactions(), 0.0)
+    , m_nsamples(0)
+    , m_x0(0.0)
+    , m_xlast(0.0)
+    , m_lastScale(0.0)
+{
+    std::stringstream log;
+    m_builder.init(log, kin);
+}
+
+void ReactionPathAccumulator::addSample(double x, double scale)
+{
+    if (m_nsamples && x < m_xlast) {
+        throw CanteraError("ReactionPathAccumulator::addSample",
+            "Samples must be added in order: x = {} is less than the value "
+            "for the previous sample, {}", x, m_xlast);
+    }
+    size_t nr = m_kin.nReactions();
+    if (m_ropf.size() != nr) {
+        throw CanteraError("ReactionPathAccumulator::addSample",
+            "Number of reactions changed from {} to {}", m_ropf.size(), nr);
+    }
+    vector_fp ropf(nr), ropr(nr);
+    m_kin.getFwdRatesOfProgress(ropf.data());
+    m_kin.getRevRatesOfProgress(ropr.data());
+    if (m_nsamples == 0) {
+        m_x0 = x;
+    } else {
+        // trapezoidal rule
+        double dx = 0.5 * (x - m_xlast);
+        for (size_t i = 0; i < nr; i++) {
+            m_ropf[i] += dx * (m_lastScale * m_lastf[i] + scale * ropf[i]);
+            m_ropr[i] += dx * (m_lastScale * m_lastr[i] + scale * ropr[i]);
+        }
+    }
+    m_lastf.swap(ropf);
+    m_lastr.swap(ropr);
+    m_lastScale = scale;
+    m_xlast = x;
+    m_nsamples++;
+}
+
+void ReactionPathAccumulator::reset()
+{
+    m_nsamples = 0;
+    m_x0 = m_xlast = 0.0;
+    std::fill(m_ropf.begin(), m_ropf.end(), 0.0);
+    std::fill(m_ropr.begin(), m_ropr.end(), 0.0);
+}
+
+void ReactionPathAccumulator::getFwdRatesOfProgress(double* ropf) const
+{
+    std::copy(m_ropf.begin(), m_ropf.end(), ropf);
+}
+
+void ReactionPathAccumulator::getRevRatesOfProgress(double* ropr) const
+{
+    std::copy(m_ropr.begin(), m_ropr.end(), ropr);
+}
+
+int ReactionPathAccumulator::build(const string& element, ostream& output,
+                                   ReactionPathDiagram& r, bool quiet)
+{
+    return m_builder.build(m_kin, element, output, r, m_ropf.data(),
+                           m_ropr.data(), quiet);
+}
+
+void ReactionPathAccumulator::getElementFluxes(const string& element,
+                                               double* fluxes)
+{
+    size_t nsp = m_kin.nTotalSpecies();
+    std::fill(fluxes, fluxes + nsp*nsp, 0.0);
+    ReactionPathDiagram d;
+    std::stringstream log;
+    if (build(element, log, d, true) < 0) {
+        throw CanteraError("ReactionPathAccumulator::getElementFluxes",
+                           "Element '{}' not found", element);
+    }
+    for (size_t n = 0; n < d.nPaths(); n++) {
+        Path* p = d.path(n);
+        size_t k1 = p->begin()->number;
+        size_t k2 = p->end()->number;
+        fluxes[k1*nsp + k2] = p->flow();
+    }
+}
+
 }
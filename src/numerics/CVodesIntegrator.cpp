@@ -43,6 +43,10 @@ public:
     virtual ~FuncData() {}
     vector_fp m_pars;
     FuncEval* m_func;
+
+    //! Message from the last exception thrown while evaluating #m_func, which
+    //! is added to the error raised if the integrator cannot recover from it
+    std::string m_error;
 };
 
 extern "C" {
@@ -57,11 +61,12 @@ extern "C" {
     static int cvodes_rhs(realtype t, N_Vector y, N_Vector ydot,
                           void* f_data)
     {
+        FuncData* d = (FuncData*)f_data;
         try {
-            FuncData* d = (FuncData*)f_data;
             FuncEval* f = d->m_func;
             f->eval(t, NV_DATA_S(y), NV_DATA_S(ydot), d->m_pars.data());
         } catch (CanteraError& err) {
+            d->m_error = err.what();
             std::cerr << err.what() << std::endl;
             return 1; // possibly recoverable error
         } catch (...) {
@@ -71,6 +76,90 @@ extern "C" {
         return 0; // successful evaluation
     }
 
+    //! Function called by CVodes to set up the preconditioner when using an
+    //! iterative linear solver with the PRECOND option. The Jacobian data may
+    //! be reused if *jok* is true; *jcurPtr* is set to indicate whether it was
+    //! re-evaluated.
+    static int cvodes_prec_setup(realtype t, N_Vector y, N_Vector fy,
+                                 booleantype jok, booleantype* jcurPtr,
+                                 realtype gamma, void* f_data, N_Vector tmp1,
+                                 N_Vector tmp2, N_Vector tmp3)
+    {
+        try {
+            FuncData* d = (FuncData*)f_data;
+            bool jcur = d->m_func->setupPreconditioner(t, NV_DATA_S(y),
+                                                       gamma, jok);
+            *jcurPtr = jcur ? TRUE : FALSE;
+        } catch (CanteraError& err) {
+            std::cerr << err.what() << std::endl;
+            return 1; // possibly recoverable error
+        } catch (...) {
+            std::cerr << "cvodes_prec_setup: unhandled exception" << std::endl;
+            return -1; // unrecoverable error
+        }
+        return 0;
+    }
+
+    //! Function called by CVodes to solve the preconditioner system `P z = r`
+    static int cvodes_prec_solve(realtype t, N_Vector y, N_Vector fy,
+                                 N_Vector r, N_Vector z, realtype gamma,
+                                 realtype delta, int lr, void* f_data,
+                                 N_Vector tmp)
+    {
+        try {
+            FuncData* d = (FuncData*)f_data;
+            d->m_func->solvePreconditioner(NV_DATA_S(r), NV_DATA_S(z));
+        } catch (CanteraError& err) {
+            std::cerr << err.what() << std::endl;
+            return 1; // possibly recoverable error
+        } catch (...) {
+            std::cerr << "cvodes_prec_solve: unhandled exception" << std::endl;
+            return -1; // unrecoverable error
+        }
+        return 0;
+    }
+
+    //! Function called by CVodes to evaluate the right-hand-side of the
+    //! adjoint equations, yBdot = -J^T yB.
+    static int cvodes_rhsB(realtype t, N_Vector y, N_Vector yB,
+                           N_Vector yBdot, void* f_data)
+    {
+        try {
+            FuncData* d = (FuncData*)f_data;
+            d->m_func->evalAdjoint(t, NV_DATA_S(y), NV_DATA_S(yB),
+                                   NV_DATA_S(yBdot));
+        } catch (CanteraError& err) {
+            std::cerr << err.what() << std::endl;
+            return 1; // possibly recoverable error
+        } catch (...) {
+            std::cerr << "cvodes_rhsB: unhandled exception" << std::endl;
+            return -1; // unrecoverable error
+        }
+        return 0;
+    }
+
+    //! Function called by CVodes to evaluate the integrand of the adjoint
+    //! sensitivities. The quadratures are integrated backward in time from
+    //! zero, so the sign is reversed to obtain the integral from the initial
+    //! time to the final time.
+    static int cvodes_quadB(realtype t, N_Vector y, N_Vector yB,
+                            N_Vector qBdot, void* f_data)
+    {
+        try {
+            FuncData* d = (FuncData*)f_data;
+            d->m_func->evalAdjointGradient(t, NV_DATA_S(y), NV_DATA_S(yB),
+                                           NV_DATA_S(qBdot));
+            N_VScale(-1.0, qBdot, qBdot);
+        } catch (CanteraError& err) {
+            std::cerr << err.what() << std::endl;
+            return 1; // possibly recoverable error
+        } catch (...) {
+            std::cerr << "cvodes_quadB: unhandled exception" << std::endl;
+            return -1; // unrecoverable error
+        }
+        return 0;
+    }
+
     //! Function called by CVodes when an error is encountered instead of
     //! writing to stdout. Here, save the error message provided by CVodes so
     //! that it can be included in the subsequently raised CanteraError.
@@ -101,11 +190,17 @@ CVodesIntegrator::CVodesIntegrator() :
     m_nabs(0),
     m_hmax(0.0),
     m_hmin(0.0),
+    m_h0(0.0),
     m_maxsteps(20000),
     m_maxErrTestFails(0),
     m_np(0),
     m_mupper(0), m_mlower(0),
-    m_sens_ok(false)
+    m_sens_ok(false),
+    m_adjoint(false),
+    m_adjointInit(false),
+    m_indexB(-1),
+    m_yB(0),
+    m_qB(0)
 {
 }
 
@@ -123,6 +218,12 @@ CVodesIntegrator::~CVodesIntegrator()
     if (m_abstol) {
         N_VDestroy_Serial(m_abstol);
     }
+    if (m_yB) {
+        N_VDestroy_Serial(m_yB);
+    }
+    if (m_qB) {
+        N_VDestroy_Serial(m_qB);
+    }
 }
 
 double& CVodesIntegrator::solution(size_t k)
@@ -264,8 +365,19 @@ void CVodesIntegrator::initialize(double t0, FuncEval& func)
     func.getState(NV_DATA_S(m_y));
 
     if (m_cvode_mem) {
+        // also frees the memory used for adjoint sensitivity analysis
         CVodeFree(&m_cvode_mem);
     }
+    m_adjointInit = false;
+    m_indexB = -1;
+    if (m_yB) {
+        N_VDestroy_Serial(m_yB);
+        m_yB = 0;
+    }
+    if (m_qB) {
+        N_VDestroy_Serial(m_qB);
+        m_qB = 0;
+    }
 
     //! Specify the method and the iteration type. Cantera Defaults:
     //!        CV_BDF  - Use BDF methods
@@ -322,6 +434,9 @@ void CVodesIntegrator::initialize(double t0, FuncEval& func)
         flag = CVodeSetSensParams(m_cvode_mem, m_fdata->m_pars.data(),
                                   NULL, NULL);
     }
+    if (m_adjoint) {
+        adjointInit();
+    }
     applyOptions();
 }
 
@@ -336,9 +451,30 @@ void CVodesIntegrator::reinitialize(double t0, FuncEval& func)
         throw CanteraError("CVodesIntegrator::reinitialize",
                            "CVodeReInit failed. result = {}", result);
     }
+    m_sens_ok = false;
+    if (m_adjoint) {
+        adjointInit();
+    }
     applyOptions();
 }
 
+void CVodesIntegrator::adjointInit()
+{
+    int flag;
+    if (m_adjointInit) {
+        flag = CVodeAdjReInit(m_cvode_mem);
+    } else {
+        // Store a checkpoint every 100 steps, and use Hermite interpolation
+        // of the forward solution between checkpoints
+        flag = CVodeAdjInit(m_cvode_mem, 100, CV_HERMITE);
+    }
+    if (flag != CV_SUCCESS) {
+        throw CanteraError("CVodesIntegrator::adjointInit",
+                           "CVodeAdjInit failed. Error code: {}", flag);
+    }
+    m_adjointInit = true;
+}
+
 void CVodesIntegrator::applyOptions()
 {
     if (m_type == DENSE + NOJAC) {
@@ -352,6 +488,10 @@ void CVodesIntegrator::applyOptions()
         CVDiag(m_cvode_mem);
     } else if (m_type == GMRES) {
         CVSpgmr(m_cvode_mem, PREC_NONE, 0);
+    } else if (m_type == GMRES + PRECOND) {
+        CVSpgmr(m_cvode_mem, PREC_LEFT, 0);
+        CVSpilsSetPreconditioner(m_cvode_mem, cvodes_prec_setup,
+                                 cvodes_prec_solve);
     } else if (m_type == BAND + NOJAC) {
         sd_size_t N = static_cast<sd_size_t>(m_neq);
         long int nu = m_mupper;
@@ -381,28 +521,51 @@ void CVodesIntegrator::applyOptions()
     if (m_maxErrTestFails > 0) {
         CVodeSetMaxErrTestFails(m_cvode_mem, m_maxErrTestFails);
     }
+    CVodeSetInitStep(m_cvode_mem, m_h0);
 }
 
 void CVodesIntegrator::integrate(double tout)
 {
-    int flag = CVode(m_cvode_mem, tout, m_y, &m_time, CV_NORMAL);
+    int flag;
+    m_fdata->m_error.clear();
+    if (m_adjoint && m_adjointInit) {
+        int ncheck;
+        flag = CVodeF(m_cvode_mem, tout, m_y, &m_time, CV_NORMAL, &ncheck);
+    } else {
+        flag = CVode(m_cvode_mem, tout, m_y, &m_time, CV_NORMAL);
+    }
     if (flag != CV_SUCCESS) {
+        string f_errs = m_fdata->m_error;
+        if (!f_errs.empty()) {
+            f_errs = "Exception raised during RHS evaluation:\n" + f_errs;
+        }
         throw CanteraError("CVodesIntegrator::integrate",
-            "CVodes error encountered. Error code: {}\n{}\n"
+            "CVodes error encountered. Error code: {}\n{}\n{}"
             "Components with largest weighted error estimates:\n{}",
-            flag, m_error_message, getErrorInfo(10));
+            flag, m_error_message, f_errs, getErrorInfo(10));
     }
     m_sens_ok = false;
 }
 
 double CVodesIntegrator::step(double tout)
 {
-    int flag = CVode(m_cvode_mem, tout, m_y, &m_time, CV_ONE_STEP);
+    int flag;
+    m_fdata->m_error.clear();
+    if (m_adjoint && m_adjointInit) {
+        int ncheck;
+        flag = CVodeF(m_cvode_mem, tout, m_y, &m_time, CV_ONE_STEP, &ncheck);
+    } else {
+        flag = CVode(m_cvode_mem, tout, m_y, &m_time, CV_ONE_STEP);
+    }
     if (flag != CV_SUCCESS) {
+        string f_errs = m_fdata->m_error;
+        if (!f_errs.empty()) {
+            f_errs = "Exception raised during RHS evaluation:\n" + f_errs;
+        }
         throw CanteraError("CVodesIntegrator::step",
-            "CVodes error encountered. Error code: {}\n{}\n"
+            "CVodes error encountered. Error code: {}\n{}\n{}"
             "Components with largest weighted error estimates:\n{}",
-            flag, m_error_message, getErrorInfo(10));
+            flag, m_error_message, f_errs, getErrorInfo(10));
 
     }
     m_sens_ok = false;
@@ -418,7 +581,7 @@ int CVodesIntegrator::nEvals() const
 
 double CVodesIntegrator::sensitivity(size_t k, size_t p)
 {
-    if (m_time == m_t0) {
+    if (m_time == m_t0 && !m_sens_ok) {
         // calls to CVodeGetSens are only allowed after a successful time step.
         return 0.0;
     }
@@ -442,6 +605,156 @@ double CVodesIntegrator::sensitivity(size_t k, size_t p)
     return NV_Ith_S(m_yS[p],k);
 }
 
+void CVodesIntegrator::setInitialSensitivities(const double* yS)
+{
+    if (m_np == 0) {
+        return;
+    }
+    for (size_t p = 0; p < m_np; p++) {
+        copy(yS + p*m_neq, yS + (p+1)*m_neq, NV_DATA_S(m_yS[p]));
+    }
+    int flag = CVodeSensReInit(m_cvode_mem, CV_STAGGERED, m_yS);
+    if (flag != CV_SUCCESS) {
+        throw CanteraError("CVodesIntegrator::setInitialSensitivities",
+                           "CVodeSensReInit failed. Error code: {}", flag);
+    }
+    // The initial values in m_yS are returned by sensitivity() until the
+    // next time step
+    m_sens_ok = true;
+}
+
+double CVodesIntegrator::currentStepSize() const
+{
+    double h = 0.0;
+    if (m_cvode_mem) {
+        CVodeGetCurrentStep(m_cvode_mem, &h);
+    }
+    return h;
+}
+
+IntegratorStats CVodesIntegrator::stats() const
+{
+    IntegratorStats s;
+    if (!m_cvode_mem) {
+        return s;
+    }
+    int qcur;
+    double hinused, hcur, tcur;
+    CVodeGetIntegratorStats(m_cvode_mem, &s.steps, &s.rhsEvals,
+                            &s.linSolveSetups, &s.errTestFails, &s.lastOrder,
+                            &qcur, &hinused, &s.lastStepSize, &hcur, &tcur);
+    CVodeGetNonlinSolvStats(m_cvode_mem, &s.nonlinIters, &s.nonlinConvFails);
+
+    // Evaluations used by the linear solver, e.g. for finite difference
+    // approximations of the Jacobian
+    long int nfeLS = 0;
+    if (m_type == DENSE + NOJAC || m_type == BAND + NOJAC) {
+        CVDlsGetNumJacEvals(m_cvode_mem, &s.jacEvals);
+        CVDlsGetNumRhsEvals(m_cvode_mem, &nfeLS);
+    } else if (m_type == DIAG) {
+        CVDiagGetNumRhsEvals(m_cvode_mem, &nfeLS);
+    } else if (m_type == GMRES || m_type == GMRES + PRECOND) {
+        CVSpilsGetNumPrecEvals(m_cvode_mem, &s.jacEvals);
+        CVSpilsGetNumRhsEvals(m_cvode_mem, &nfeLS);
+    }
+    s.rhsEvals += nfeLS;
+    return s;
+}
+
+void CVodesIntegrator::integrateAdjoint(double tB0, double* lambda,
+                                        double* grad)
+{
+    if (!m_adjoint || !m_adjointInit) {
+        throw CanteraError("CVodesIntegrator::integrateAdjoint",
+            "Adjoint sensitivity analysis was not enabled before the forward "
+            "integration.");
+    }
+    size_t nq = m_fdata->m_func->nAdjointParams();
+    if (!m_yB) {
+        m_yB = N_VNew_Serial(static_cast<sd_size_t>(m_neq));
+    }
+    for (size_t i = 0; i < m_neq; i++) {
+        NV_Ith_S(m_yB, i) = lambda[i];
+    }
+    if (nq && !m_qB) {
+        m_qB = N_VNew_Serial(static_cast<sd_size_t>(nq));
+    }
+    if (nq) {
+        N_VConst(0.0, m_qB);
+    }
+
+    // The adjoint equations are linear, so the absolute tolerance is scaled
+    // by the magnitude of the final values of the adjoint variables
+    double abstolB = std::max(N_VMaxNorm(m_yB), SmallNumber) * m_reltol;
+
+    int flag;
+    if (m_indexB < 0) {
+        flag = CVodeCreateB(m_cvode_mem, CV_BDF, CV_NEWTON, &m_indexB);
+        if (flag != CV_SUCCESS) {
+            throw CanteraError("CVodesIntegrator::integrateAdjoint",
+                               "CVodeCreateB failed. Error code: {}", flag);
+        }
+        flag = CVodeInitB(m_cvode_mem, m_indexB, cvodes_rhsB, tB0, m_yB);
+        if (flag != CV_SUCCESS) {
+            throw CanteraError("CVodesIntegrator::integrateAdjoint",
+                               "CVodeInitB failed. Error code: {}", flag);
+        }
+        CVodeSetErrHandlerFn(CVodeGetAdjCVodeBmem(m_cvode_mem, m_indexB),
+                             &cvodes_err, this);
+        CVodeSetUserDataB(m_cvode_mem, m_indexB, m_fdata.get());
+        CVodeSetMaxNumStepsB(m_cvode_mem, m_indexB, m_maxsteps);
+
+        // The Jacobian of the adjoint equations is -J^T, which is evaluated
+        // by finite differences of cvodes_rhsB
+        sd_size_t N = static_cast<sd_size_t>(m_neq);
+        #if SUNDIALS_USE_LAPACK
+            CVLapackDenseB(m_cvode_mem, m_indexB, N);
+        #else
+            CVDenseB(m_cvode_mem, m_indexB, N);
+        #endif
+
+        if (nq) {
+            flag = CVodeQuadInitB(m_cvode_mem, m_indexB, cvodes_quadB, m_qB);
+            if (flag != CV_SUCCESS) {
+                throw CanteraError("CVodesIntegrator::integrateAdjoint",
+                                   "CVodeQuadInitB failed. Error code: {}",
+                                   flag);
+            }
+            // The quadratures do not affect the step size selection
+            CVodeSetQuadErrConB(m_cvode_mem, m_indexB, FALSE);
+        }
+    } else {
+        flag = CVodeReInitB(m_cvode_mem, m_indexB, tB0, m_yB);
+        if (flag != CV_SUCCESS) {
+            throw CanteraError("CVodesIntegrator::integrateAdjoint",
+                               "CVodeReInitB failed. Error code: {}", flag);
+        }
+        if (nq) {
+            CVodeQuadReInitB(m_cvode_mem, m_indexB, m_qB);
+        }
+    }
+    CVodeSStolerancesB(m_cvode_mem, m_indexB, m_reltol, abstolB);
+
+    flag = CVodeB(m_cvode_mem, m_t0, CV_NORMAL);
+    if (flag < 0) {
+        throw CanteraError("CVodesIntegrator::integrateAdjoint",
+            "CVodes error encountered. Error code: {}\n{}",
+            flag, m_error_message);
+    }
+
+    double tret;
+    CVodeGetB(m_cvode_mem, m_indexB, &tret, m_yB);
+    for (size_t i = 0; i < m_neq; i++) {
+        lambda[i] = NV_Ith_S(m_yB, i);
+    }
+    if (nq) {
+        CVodeGetQuadB(m_cvode_mem, m_indexB, &tret, m_qB);
+        for (size_t i = 0; i < nq; i++) {
+            grad[i] = NV_Ith_S(m_qB, i);
+        }
+    }
+}
+
 string CVodesIntegrator::getErrorInfo(int N)
 {
     N_Vector errs = N_VNew_Serial(static_cast<sd_size_t>(m_neq));
@@ -1,6 +1,7 @@
 //! @file Func1.cpp
 #include "cantera/numerics/Func1.h"
 #include "cantera/base/stringUtils.h"
+#include "cantera/base/ctexceptions.h"
 
 using namespace std;
 
@@ -67,6 +68,11 @@ Func1& Func1::derivative() const
 
 bool Func1::isIdentical(Func1& other) const
 {
+    if (ID() == 0 || other.ID() == 0) {
+        // These functions may have additional parameters which can't be
+        // compared here
+        return this == &other;
+    }
     if (ID() != other.ID() || m_c != other.m_c) {
         return false;
     }
@@ -137,6 +143,36 @@ void Func1::setParent(Func1* p)
     m_parent = p;
 }
 
+Tabulated1::Tabulated1(size_t n, const double* tvals, const double* fvals) :
+    Func1(),
+    m_tvec(tvals, tvals + n),
+    m_fvec(fvals, fvals + n)
+{
+    if (n == 0) {
+        throw CanteraError("Tabulated1::Tabulated1",
+                           "At least one point is required.");
+    }
+    for (size_t i = 1; i < n; i++) {
+        if (m_tvec[i] < m_tvec[i-1]) {
+            throw CanteraError("Tabulated1::Tabulated1",
+                "Values of the independent variable must be non-decreasing.");
+        }
+    }
+}
+
+doublereal Tabulated1::eval(doublereal t) const
+{
+    if (t <= m_tvec.front()) {
+        return m_fvec.front();
+    } else if (t >= m_tvec.back()) {
+        return m_fvec.back();
+    }
+    // index of the first point with m_tvec[i] > t
+    size_t i = std::upper_bound(m_tvec.begin(), m_tvec.end(), t) - m_tvec.begin();
+    double dt = m_tvec[i] - m_tvec[i-1];
+    return m_fvec[i-1] + (t - m_tvec[i-1]) / dt * (m_fvec[i] - m_fvec[i-1]);
+}
+
 /*****************************************************************************/
 
 string Sin1::write(const string& arg) const
@@ -0,0 +1,318 @@
+//! @file IsatTable.cpp
+#include "cantera/numerics/IsatTable.h"
+#include "cantera/base/ctexceptions.h"
+
+using namespace std;
+
+namespace Cantera
+{
+
+IsatTable::IsatTable(size_t nx, size_t nf, double tol, double maxMemory) :
+    m_nx(nx),
+    m_nf(nf),
+    m_tol(tol),
+    m_maxRecords(0),
+    m_root(0),
+    m_nRecent(10),
+    m_work(max(nx, nf)),
+    m_work2(max(nx, nf))
+{
+    if (nx == 0 || nf == 0) {
+        throw CanteraError("IsatTable::IsatTable",
+                           "Mapping must have at least one input and output");
+    }
+    if (tol <= 0.0) {
+        throw CanteraError("IsatTable::IsatTable",
+                           "Tolerance must be positive");
+    }
+    setMaxMemory(maxMemory);
+}
+
+void IsatTable::setTolerance(double tol)
+{
+    if (tol <= 0.0) {
+        throw CanteraError("IsatTable::setTolerance",
+                           "Tolerance must be positive");
+    }
+    m_tol = tol;
+    clear();
+}
+
+void IsatTable::setMaxMemory(double maxMemory)
+{
+    m_maxRecords = max<size_t>(static_cast<size_t>(maxMemory * 1e6 / recordSize()),
+                               1);
+    while (nRecords() > m_maxRecords) {
+        evict();
+    }
+}
+
+size_t IsatTable::recordSize() const
+{
+    // The record and the tree node created when it was added
+    return sizeof(double) * (2*m_nx + m_nf + m_nx*m_nf + m_nx*m_nx)
+           + sizeof(Record) + sizeof(Node);
+}
+
+bool IsatTable::retrieve(const double* x, double* f)
+{
+    m_stats.queries++;
+    if (m_lru.empty()) {
+        return false;
+    }
+    size_t i = search(x);
+    bool found = (eoaDistance(i, x) <= 1.0);
+    if (!found) {
+        // Check the most recently used records, which are likely to be close
+        // to the query point, but may be on the other side of a cutting plane
+        size_t n = 0;
+        for (size_t j : m_lru) {
+            if (n++ == m_nRecent) {
+                break;
+            } else if (j != i && eoaDistance(j, x) <= 1.0) {
+                i = j;
+                found = true;
+                break;
+            }
+        }
+    }
+    if (found) {
+        approximate(i, x, f);
+        touch(i);
+        m_stats.retrieves++;
+    }
+    return found;
+}
+
+bool IsatTable::grow(const double* x, const double* f)
+{
+    if (m_lru.empty()) {
+        return false;
+    }
+    size_t i = search(x);
+    approximate(i, x, m_work.data());
+    double err = 0.0;
+    for (size_t k = 0; k < m_nf; k++) {
+        err += pow(m_work[k] - f[k], 2);
+    }
+    if (err > m_tol * m_tol) {
+        return false;
+    }
+
+    // Replace the EOA with the smallest ellipsoid with the same center that
+    // contains both the original EOA and x. With u = M (x - x0) and
+    // s = (x - x0)^T u, this is M' = M - (1 - 1/s) / s * u u^T.
+    Record& r = m_records[i];
+    double* u = m_work2.data();
+    double s = 0.0;
+    for (size_t j = 0; j < m_nx; j++) {
+        u[j] = 0.0;
+        for (size_t k = 0; k < m_nx; k++) {
+            u[j] += r.M[j*m_nx + k] * (x[k] - r.x[k]);
+        }
+        s += u[j] * (x[j] - r.x[j]);
+    }
+    if (s > 1.0) {
+        double c = (1.0 - 1.0 / s) / s;
+        for (size_t j = 0; j < m_nx; j++) {
+            for (size_t k = 0; k < m_nx; k++) {
+                r.M[j*m_nx + k] -= c * u[j] * u[k];
+            }
+        }
+    }
+    touch(i);
+    m_stats.grows++;
+    return true;
+}
+
+void IsatTable::add(const double* x, const double* f, const double* A)
+{
+    if (nRecords() >= m_maxRecords) {
+        evict();
+    }
+
+    // Find the leaf which will be split to hold the new record
+    int leaf = 0;
+    double vv = 0.0;
+    if (!m_lru.empty()) {
+        leaf = -1 - static_cast<int>(search(x));
+        const vector_fp& x0 = m_records[-1 - leaf].x;
+        for (size_t j = 0; j < m_nx; j++) {
+            vv += pow(x[j] - x0[j], 2);
+        }
+    }
+
+    size_t i;
+    if (!m_lru.empty() && vv == 0.0) {
+        // Replace a record for the same point
+        i = -1 - leaf;
+    } else if (m_freeRecords.empty()) {
+        i = m_records.size();
+        m_records.emplace_back();
+        m_lru.push_front(i);
+        m_records[i].lru = m_lru.begin();
+    } else {
+        i = m_freeRecords.back();
+        m_freeRecords.pop_back();
+        m_lru.push_front(i);
+        m_records[i].lru = m_lru.begin();
+    }
+
+    Record& r = m_records[i];
+    r.x.assign(x, x + m_nx);
+    r.f.assign(f, f + m_nf);
+    r.A.assign(A, A + m_nf * m_nx);
+
+    // The initial EOA is the region where |A (x - x0)| < tol, bounded by a
+    // ball of radius sqrt(tol), outside of which the second order terms that
+    // are neglected by the linear approximation are assumed to be too large
+    r.M.assign(m_nx * m_nx, 0.0);
+    double tol2 = m_tol * m_tol;
+    for (size_t j = 0; j < m_nx; j++) {
+        for (size_t k = 0; k <= j; k++) {
+            double sum = 0.0;
+            for (size_t n = 0; n < m_nf; n++) {
+                sum += A[n*m_nx + j] * A[n*m_nx + k];
+            }
+            r.M[j*m_nx + k] = r.M[k*m_nx + j] = sum / tol2;
+        }
+        r.M[j*m_nx + j] += 1.0 / m_tol;
+    }
+    touch(i);
+    m_stats.adds++;
+
+    if (m_lru.size() == 1) {
+        m_root = -1 - static_cast<int>(i);
+        r.parent = -1;
+        return;
+    } else if (leaf == -1 - static_cast<int>(i)) {
+        return;
+    }
+
+    // Split the leaf using the plane bisecting the two records
+    int n;
+    if (m_freeNodes.empty()) {
+        n = static_cast<int>(m_nodes.size());
+        m_nodes.emplace_back();
+    } else {
+        n = m_freeNodes.back();
+        m_freeNodes.pop_back();
+    }
+    Node& node = m_nodes[n];
+    Record& old = m_records[-1 - leaf];
+    node.v.resize(m_nx);
+    node.a = 0.0;
+    for (size_t j = 0; j < m_nx; j++) {
+        node.v[j] = x[j] - old.x[j];
+        node.a += 0.5 * node.v[j] * (x[j] + old.x[j]);
+    }
+    node.parent = old.parent;
+    replaceChild(old.parent, leaf, n);
+    node.left = leaf;
+    node.right = -1 - static_cast<int>(i);
+    old.parent = n;
+    r.parent = n;
+}
+
+void IsatTable::clear()
+{
+    m_records.clear();
+    m_nodes.clear();
+    m_freeRecords.clear();
+    m_freeNodes.clear();
+    m_lru.clear();
+    m_root = 0;
+}
+
+size_t IsatTable::search(const double* x) const
+{
+    int c = m_root;
+    while (c >= 0) {
+        const Node& node = m_nodes[c];
+        double vx = 0.0;
+        for (size_t j = 0; j < m_nx; j++) {
+            vx += node.v[j] * x[j];
+        }
+        c = (vx > node.a) ? node.right : node.left;
+    }
+    return -1 - c;
+}
+
+double IsatTable::eoaDistance(size_t i, const double* x) const
+{
+    const Record& r = m_records[i];
+    double* dx = m_work2.data();
+    for (size_t j = 0; j < m_nx; j++) {
+        dx[j] = x[j] - r.x[j];
+    }
+    double s = 0.0;
+    for (size_t j = 0; j < m_nx; j++) {
+        const double* Mj = &r.M[j*m_nx];
+        double sum = 0.0;
+        for (size_t k = 0; k < m_nx; k++) {
+            sum += Mj[k] * dx[k];
+        }
+        s += dx[j] * sum;
+    }
+    return s;
+}
+
+void IsatTable::approximate(size_t i, const double* x, double* f) const
+{
+    const Record& r = m_records[i];
+    for (size_t n = 0; n < m_nf; n++) {
+        const double* An = &r.A[n*m_nx];
+        double sum = r.f[n];
+        for (size_t j = 0; j < m_nx; j++) {
+            sum += An[j] * (x[j] - r.x[j]);
+        }
+        f[n] = sum;
+    }
+}
+
+void IsatTable::touch(size_t i)
+{
+    m_lru.splice(m_lru.begin(), m_lru, m_records[i].lru);
+}
+
+void IsatTable::replaceChild(int p, int old, int c)
+{
+    if (p < 0) {
+        m_root = c;
+    } else if (m_nodes[p].left == old) {
+        m_nodes[p].left = c;
+    } else {
+        m_nodes[p].right = c;
+    }
+}
+
+void IsatTable::evict()
+{
+    size_t i = m_lru.back();
+    m_lru.pop_back();
+    m_freeRecords.push_back(i);
+    m_stats.evictions++;
+    Record& r = m_records[i];
+    vector_fp().swap(r.M);
+    vector_fp().swap(r.A);
+    int p = r.parent;
+    if (p < 0) {
+        // This was the only record
+        m_root = 0;
+        return;
+    }
+
+    // Replace the parent node with the sibling of the removed record
+    Node& node = m_nodes[p];
+    int leaf = -1 - static_cast<int>(i);
+    int sibling = (node.left == leaf) ? node.right : node.left;
+    replaceChild(node.parent, p, sibling);
+    if (sibling >= 0) {
+        m_nodes[sibling].parent = node.parent;
+    } else {
+        m_records[-1 - sibling].parent = node.parent;
+    }
+    m_freeNodes.push_back(p);
+}
+
+}
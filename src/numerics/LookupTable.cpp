@@ -0,0 +1,114 @@
+//! @file LookupTable.cpp
+#include "cantera/numerics/LookupTable.h"
+#include "cantera/base/ctexceptions.h"
+
+using namespace std;
+
+namespace Cantera
+{
+
+LookupTable::LookupTable(const std::vector<vector_fp>& axes, size_t nvars,
+                         const double* data) :
+    m_axes(axes),
+    m_nvars(nvars),
+    m_data(data),
+    m_stride(axes.size())
+{
+    size_t ndim = m_axes.size();
+    if (ndim == 0 || nvars == 0) {
+        throw CanteraError("LookupTable::LookupTable",
+                           "Table must have at least one axis and variable");
+    }
+    size_t stride = nvars;
+    for (size_t n = ndim; n > 0; n--) {
+        const vector_fp& ax = m_axes[n-1];
+        if (ax.size() < 2) {
+            throw CanteraError("LookupTable::LookupTable",
+                               "Axis {} must have at least 2 points", n-1);
+        }
+        for (size_t i = 1; i < ax.size(); i++) {
+            if (ax[i] <= ax[i-1]) {
+                throw CanteraError("LookupTable::LookupTable",
+                                   "Axis {} is not strictly increasing", n-1);
+            }
+        }
+        m_stride[n-1] = stride;
+        stride *= ax.size();
+    }
+
+    // The bits of the corner number determine whether the corner is at the
+    // lower (0) or upper (1) end of the cell along each axis
+    m_corner.resize(size_t(1) << ndim, 0);
+    for (size_t c = 0; c < m_corner.size(); c++) {
+        for (size_t n = 0; n < ndim; n++) {
+            if (c & (size_t(1) << n)) {
+                m_corner[c] += m_stride[n];
+            }
+        }
+    }
+}
+
+size_t LookupTable::locate(const double* x, double* w) const
+{
+    size_t offset = 0;
+    for (size_t n = 0; n < m_axes.size(); n++) {
+        const vector_fp& ax = m_axes[n];
+        size_t i;
+        if (x[n] <= ax.front()) {
+            i = 0;
+            w[n] = 0.0;
+        } else if (x[n] >= ax.back()) {
+            i = ax.size() - 2;
+            w[n] = 1.0;
+        } else {
+            i = upper_bound(ax.begin(), ax.end(), x[n]) - ax.begin() - 1;
+            w[n] = (x[n] - ax[i]) / (ax[i+1] - ax[i]);
+        }
+        offset += i * m_stride[n];
+    }
+    return offset;
+}
+
+void LookupTable::interpolate(const double* x, double* y) const
+{
+    vector<size_t> vars(m_nvars);
+    for (size_t k = 0; k < m_nvars; k++) {
+        vars[k] = k;
+    }
+    interpolate(1, x, m_nvars, vars.data(), y);
+}
+
+void LookupTable::interpolate(size_t n, const double* x, size_t nout,
+                              const size_t* vars, double* y) const
+{
+    size_t ndim = m_axes.size();
+    for (size_t k = 0; k < nout; k++) {
+        if (vars[k] >= m_nvars) {
+            throw IndexError("LookupTable::interpolate", "vars", vars[k],
+                             m_nvars-1);
+        }
+    }
+    vector_fp w(ndim);
+    for (size_t j = 0; j < n; j++) {
+        size_t offset = locate(x + j*ndim, w.data());
+        double* yj = y + j*nout;
+        for (size_t k = 0; k < nout; k++) {
+            yj[k] = 0.0;
+        }
+        for (size_t c = 0; c < m_corner.size(); c++) {
+            double wc = 1.0;
+            for (size_t d = 0; d < ndim; d++) {
+                wc *= (c & (size_t(1) << d)) ? w[d] : 1.0 - w[d];
+            }
+            if (wc == 0.0) {
+                continue;
+            }
+            const double* data = m_data + offset + m_corner[c];
+            for (size_t k = 0; k < nout; k++) {
+                yj[k] += wc * data[vars[k]];
+            }
+        }
+    }
+}
+
+}
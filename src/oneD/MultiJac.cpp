@@ -5,6 +5,7 @@
  */
 
 #include "cantera/oneD/MultiJac.h"
+#include "cantera/numerics/ctlapack.h"
 #include <ctime>
 
 using namespace std;
@@ -26,6 +27,195 @@ MultiJac::MultiJac(OneDim& r)
     m_age = 100000;
     m_atol = sqrt(std::numeric_limits<double>::epsilon());
     m_rtol = 1.0e-5;
+    m_block = false;
+    m_blockDir = 0;
+    m_nBandFallbacks = 0;
+}
+
+void MultiJac::setBlockTridiagonal(bool block)
+{
+    m_block = block;
+    m_blockDir = 0;
+    m_factored = false;
+    if (block) {
+        // The banded LU factors are only needed if the block factorization
+        // fails, in which case they are reallocated by BandMatrix::factor
+        vector_fp().swap(ludata);
+    } else {
+        vector_fp().swap(m_diag);
+        vector_fp().swap(m_lower);
+        vector_fp().swap(m_upper);
+        vector_int().swap(m_blockPivots);
+    }
+}
+
+int MultiJac::factor()
+{
+    if (m_block) {
+        // Try the elimination order that succeeded most recently first
+        bool leftToRight = (m_blockDir != -1);
+        if (blockFactor(leftToRight) == 0 || blockFactor(!leftToRight) == 0) {
+            m_factored = true;
+            return 0;
+        }
+        m_blockDir = 0;
+        m_nBandFallbacks++;
+    }
+    return BandMatrix::factor();
+}
+
+void MultiJac::getBlock(size_t i, size_t j, doublereal* out) const
+{
+    size_t ni = m_resid->nVars(i);
+    size_t nj = m_resid->nVars(j);
+    size_t iloc = m_resid->loc(i);
+    size_t jloc = m_resid->loc(j);
+    for (size_t c = 0; c < nj; c++) {
+        for (size_t r = 0; r < ni; r++) {
+            out[r + ni*c] = value(iloc + r, jloc + c);
+        }
+    }
+}
+
+int MultiJac::blockFactor(bool leftToRight)
+{
+    // Grid point corresponding to the p-th step of the elimination
+    auto point = [&](size_t p) { return leftToRight ? p : m_points - 1 - p; };
+
+    m_diagLoc.resize(m_points);
+    m_lowerLoc.resize(m_points);
+    m_upperLoc.resize(m_points);
+    size_t nd = 0, nl = 0, nu = 0;
+    for (size_t p = 0; p < m_points; p++) {
+        size_t n = m_resid->nVars(point(p));
+        m_diagLoc[p] = nd;
+        m_lowerLoc[p] = nl;
+        m_upperLoc[p] = nu;
+        nd += n*n;
+        if (p > 0) {
+            nl += n*m_resid->nVars(point(p-1));
+        }
+        if (p + 1 < m_points) {
+            nu += n*m_resid->nVars(point(p+1));
+        }
+    }
+    m_diag.resize(nd);
+    m_lower.resize(nl);
+    m_upper.resize(nu);
+    m_blockPivots.resize(m_size);
+
+    for (size_t p = 0; p < m_points; p++) {
+        size_t j = point(p);
+        size_t n = m_resid->nVars(j);
+        size_t lda = std::max<size_t>(n, 1);
+        doublereal* D = m_diag.data() + m_diagLoc[p];
+        getBlock(j, j, D);
+
+        if (p > 0) {
+            // Subtract the contribution of the previously eliminated point,
+            // D = D - L * U_prev
+            size_t nprev = m_resid->nVars(point(p-1));
+            doublereal* L = m_lower.data() + m_lowerLoc[p];
+            const doublereal* U = m_upper.data() + m_upperLoc[p-1];
+            getBlock(j, point(p-1), L);
+            for (size_t c = 0; c < n; c++) {
+                for (size_t k = 0; k < nprev; k++) {
+                    doublereal u = U[k + nprev*c];
+                    if (u != 0.0) {
+                        for (size_t r = 0; r < n; r++) {
+                            D[r + n*c] -= L[r + n*k] * u;
+                        }
+                    }
+                }
+            }
+        }
+
+        int info = 0;
+        integer* ipiv = m_blockPivots.data() + m_resid->loc(j);
+        if (n) {
+            ct_dgetrf(n, n, D, lda, ipiv, info);
+        }
+        if (info != 0) {
+            m_blockDir = 0;
+            return static_cast<int>(m_resid->loc(j)) + std::max(info, 1);
+        }
+
+        if (p + 1 < m_points) {
+            // U = D^-1 * C, where C couples this point to the next one
+            size_t nnext = m_resid->nVars(point(p+1));
+            doublereal* U = m_upper.data() + m_upperLoc[p];
+            getBlock(j, point(p+1), U);
+            if (n && nnext) {
+                ct_dgetrs(ctlapack::NoTranspose, n, nnext, D, lda, ipiv, U,
+                          lda, info);
+            }
+        }
+    }
+    m_blockDir = leftToRight ? 1 : -1;
+    return 0;
+}
+
+int MultiJac::solve(doublereal* b, size_t nrhs, size_t ldb)
+{
+    if (!m_block) {
+        return BandMatrix::solve(b, nrhs, ldb);
+    }
+    int info = 0;
+    if (!m_factored) {
+        info = factor();
+    }
+    if (info != 0) {
+        return info;
+    } else if (m_blockDir == 0) {
+        // Using the banded LU factorization
+        return BandMatrix::solve(b, nrhs, ldb);
+    }
+    if (ldb == 0) {
+        ldb = m_size;
+    }
+
+    auto point = [&](size_t p) {
+        return (m_blockDir == 1) ? p : m_points - 1 - p;
+    };
+    for (size_t m = 0; m < nrhs; m++) {
+        doublereal* x = b + m*ldb;
+
+        // forward substitution
+        for (size_t p = 0; p < m_points; p++) {
+            size_t j = point(p);
+            size_t n = m_resid->nVars(j);
+            doublereal* xj = x + m_resid->loc(j);
+            if (p > 0) {
+                size_t nprev = m_resid->nVars(point(p-1));
+                const doublereal* L = m_lower.data() + m_lowerLoc[p];
+                const doublereal* xprev = x + m_resid->loc(point(p-1));
+                for (size_t k = 0; k < nprev; k++) {
+                    for (size_t r = 0; r < n; r++) {
+                        xj[r] -= L[r + n*k] * xprev[k];
+                    }
+                }
+            }
+            if (n) {
+                ct_dgetrs(ctlapack::NoTranspose, n, 1, &m_diag[m_diagLoc[p]],
+                          n, &m_blockPivots[m_resid->loc(j)], xj, n, info);
+            }
+        }
+
+        // back substitution
+        for (size_t p = m_points - 1; p-- > 0;) {
+            size_t n = m_resid->nVars(point(p));
+            size_t nnext = m_resid->nVars(point(p+1));
+            doublereal* xj = x + m_resid->loc(point(p));
+            const doublereal* xnext = x + m_resid->loc(point(p+1));
+            const doublereal* U = m_upper.data() + m_upperLoc[p];
+            for (size_t c = 0; c < nnext; c++) {
+                for (size_t r = 0; r < n; r++) {
+                    xj[r] -= U[r + n*c] * xnext[c];
+                }
+            }
+        }
+    }
+    return info;
 }
 
 void MultiJac::updateTransient(doublereal rdt, integer* mask)
@@ -136,7 +136,10 @@ const size_t NDAMP = 7;
 // ---------------- MultiNewton methods ----------------
 
 MultiNewton::MultiNewton(int sz)
-    : m_maxAge(5)
+    : m_maxAge(5),
+      m_nIters(0),
+      m_nSolves(0),
+      m_solveElapsed(0.0)
 {
     m_n = sz;
     m_elapsed = 0.0;
@@ -174,7 +177,10 @@ void MultiNewton::step(doublereal* x, doublereal* step,
         step[n] = -step[n];
     }
 
+    clock_t t0 = clock();
     iok = jac.solve(step, step);
+    m_solveElapsed += double(clock() - t0)/CLOCKS_PER_SEC;
+    m_nSolves++;
     // if iok is non-zero, then solve failed
     if (iok != 0) {
         iok--;
@@ -325,6 +331,7 @@ int MultiNewton::solve(doublereal* x0, doublereal* x1,
 
         // compute the undamped Newton step
         step(&m_x[0], &m_stp[0], r, jac, loglevel-1);
+        m_nIters++;
 
         // increment the Jacobian age
         jac.incrementAge();
@@ -14,24 +14,26 @@ namespace Cantera
 
 OneDim::OneDim()
     : m_tmin(1.0e-16), m_tmax(1e8), m_tfactor(0.5),
-      m_rdt(0.0), m_jac_ok(false),
+      m_rdt(0.0), m_jac_ok(false), m_block_tridiag(false),
       m_bw(0), m_size(0),
       m_init(false), m_pts(0), m_solve_time(0.0),
       m_ss_jac_age(20), m_ts_jac_age(20),
       m_interrupt(0), m_nsteps(0), m_nsteps_max(500),
-      m_nevals(0), m_evaltime(0.0)
+      m_time_step_callback(0), m_regridtime(0.0),
+      m_nevals(0), m_evaltime(0.0), m_steadytime(0.0), m_transienttime(0.0)
 {
     m_newt.reset(new MultiNewton(1));
 }
 
 OneDim::OneDim(vector<Domain1D*> domains) :
     m_tmin(1.0e-16), m_tmax(1e8), m_tfactor(0.5),
-    m_rdt(0.0), m_jac_ok(false),
+    m_rdt(0.0), m_jac_ok(false), m_block_tridiag(false),
     m_bw(0), m_size(0),
     m_init(false), m_solve_time(0.0),
     m_ss_jac_age(20), m_ts_jac_age(20),
     m_interrupt(0), m_nsteps(0), m_nsteps_max(500),
-    m_nevals(0), m_evaltime(0.0)
+    m_time_step_callback(0), m_regridtime(0.0),
+    m_nevals(0), m_evaltime(0.0), m_steadytime(0.0), m_transienttime(0.0)
 {
     // create a Newton iterator, and add each domain.
     m_newt.reset(new MultiNewton(1));
@@ -111,6 +113,14 @@ void OneDim::setJacAge(int ss_age, int ts_age)
     }
 }
 
+void OneDim::setBlockTridiagonal(bool block)
+{
+    m_block_tridiag = block;
+    if (m_jac) {
+        m_jac->setBlockTridiagonal(block);
+    }
+}
+
 void OneDim::writeStats(int printTime)
 {
     saveStats();
@@ -142,6 +152,21 @@ void OneDim::saveStats()
             m_evaltime = 0.0;
             m_timeSteps.push_back(m_nsteps);
             m_nsteps = 0;
+            m_newtonIters.push_back(m_newt->nIterations());
+            m_linearSolves.push_back(m_newt->nLinearSolves());
+            m_linearSolveElapsed.push_back(m_newt->linearSolveTime());
+            m_newt->resetStats();
+            m_steadyElapsed.push_back(m_steadytime);
+            m_steadytime = 0.0;
+            m_transientElapsed.push_back(m_transienttime);
+            m_transienttime = 0.0;
+            m_regridElapsed.push_back(m_regridtime);
+            m_regridtime = 0.0;
+            std::map<std::string, double> residualTimes;
+            for (auto dom : m_dom) {
+                dom->collectTimingStats(residualTimes);
+            }
+            m_residualElapsed.push_back(residualTimes);
         }
     }
 }
@@ -154,9 +179,24 @@ void OneDim::clearStats()
     m_funcEvals.clear();
     m_funcElapsed.clear();
     m_timeSteps.clear();
+    m_newtonIters.clear();
+    m_linearSolves.clear();
+    m_linearSolveElapsed.clear();
+    m_steadyElapsed.clear();
+    m_transientElapsed.clear();
+    m_regridElapsed.clear();
+    m_residualElapsed.clear();
     m_nevals = 0;
     m_evaltime = 0.0;
     m_nsteps = 0;
+    m_steadytime = 0.0;
+    m_transienttime = 0.0;
+    m_regridtime = 0.0;
+    m_newt->resetStats();
+    std::map<std::string, double> residualTimes;
+    for (auto dom : m_dom) {
+        dom->collectTimingStats(residualTimes);
+    }
 }
 
 void OneDim::resize()
@@ -208,6 +248,7 @@ void OneDim::resize()
 
     // delete the current Jacobian evaluator and create a new one
     m_jac.reset(new MultiJac(*this));
+    m_jac->setBlockTridiagonal(m_block_tridiag);
     m_jac_ok = false;
 
     for (size_t i = 0; i < nDomains(); i++) {
@@ -217,13 +258,21 @@ void OneDim::resize()
 
 int OneDim::solve(doublereal* x, doublereal* xnew, int loglevel)
 {
+    clock_t t0 = clock();
     if (!m_jac_ok) {
         eval(npos, x, xnew, 0.0, 0);
         m_jac->eval(x, xnew, 0.0);
         m_jac->updateTransient(m_rdt, m_mask.data());
         m_jac_ok = true;
     }
-    return m_newt->solve(x, xnew, *this, *m_jac, loglevel);
+    int m = m_newt->solve(x, xnew, *this, *m_jac, loglevel);
+    double elapsed = double(clock() - t0)/CLOCKS_PER_SEC;
+    if (steady()) {
+        m_steadytime += elapsed;
+    } else {
+        m_transienttime += elapsed;
+    }
+    return m;
 }
 
 void OneDim::evalSSJacobian(doublereal* x, doublereal* xnew)
@@ -370,6 +419,9 @@ doublereal OneDim::timeStep(int nsteps, doublereal dt, doublereal* x,
             n += 1;
             debuglog("\n", loglevel);
             copy(r, r + m_size, x);
+            if (m_time_step_callback) {
+                m_time_step_callback->eval(dt);
+            }
             if (m == 100) {
                 dt *= 1.5;
             }
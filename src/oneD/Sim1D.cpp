@@ -7,9 +7,11 @@
 #include "cantera/oneD/StFlow.h"
 #include "cantera/oneD/MultiNewton.h"
 #include "cantera/numerics/funcs.h"
+#include "cantera/numerics/Func1.h"
 #include "cantera/base/xml.h"
 
 #include <fstream>
+#include <ctime>
 
 using namespace std;
 
@@ -17,7 +19,8 @@ namespace Cantera
 {
 
 Sim1D::Sim1D(vector<Domain1D*>& domains) :
-    OneDim(domains)
+    OneDim(domains),
+    m_steady_callback(0)
 {
     // resize the internal solution vector and the work array, and perform
     // domain-specific initialization of the solution vector.
@@ -271,6 +274,9 @@ void Sim1D::solve(int loglevel, bool refine_grid)
                 }
                 ok = true;
                 soln_number++;
+                if (m_steady_callback) {
+                    m_steady_callback->eval(0);
+                }
             } else {
                 debuglog("    failure. \n", loglevel);
                 if (loglevel > 6) {
@@ -342,6 +348,7 @@ void Sim1D::solve(int loglevel, bool refine_grid)
 
 int Sim1D::refine(int loglevel)
 {
+    clock_t t0 = clock();
     int ianalyze, np = 0;
     vector_fp znew, xnew;
     doublereal xmid, zmid;
@@ -360,6 +367,7 @@ int Sim1D::refine(int loglevel)
         // determine where new points are needed
         ianalyze = r.analyze(d.grid().size(), d.grid().data(), &m_x[start(n)]);
         if (ianalyze < 0) {
+            m_regridtime += double(clock() - t0)/CLOCKS_PER_SEC;
             return ianalyze;
         }
 
@@ -422,6 +430,7 @@ int Sim1D::refine(int loglevel)
 
     // Replace the current solution vector with the new one
     m_x = xnew;
+    m_regridtime += double(clock() - t0)/CLOCKS_PER_SEC;
     resize();
     finalize();
     return np;
@@ -7,6 +7,8 @@
 #include "cantera/transport/TransportBase.h"
 #include "cantera/numerics/funcs.h"
 
+#include <ctime>
+
 using namespace std;
 
 namespace Cantera
@@ -25,7 +27,11 @@ StFlow::StFlow(IdealGasPhase* ph, size_t nsp, size_t points) :
     m_transport_option(-1),
     m_do_radiation(false),
     m_kExcessLeft(0),
-    m_kExcessRight(0)
+    m_kExcessRight(0),
+    m_thermoTime(0.0),
+    m_kineticsTime(0.0),
+    m_transportTime(0.0),
+    m_fluxTime(0.0)
 {
     m_type = cFlowType;
     m_points = points;
@@ -266,10 +272,16 @@ void StFlow::eval(size_t jg, doublereal* xg,
 
     // ------------ update properties ------------
 
+    clock_t t0 = clock();
     updateThermo(x, j0, j1);
+    clock_t t1 = clock();
+    m_thermoTime += double(t1 - t0)/CLOCKS_PER_SEC;
     if (jg == npos) {
         // update transport properties only if a Jacobian is not being evaluated
         updateTransport(x, j0, j1);
+        t0 = clock();
+        m_transportTime += double(t0 - t1)/CLOCKS_PER_SEC;
+        t1 = t0;
 
         double* Yleft = x + index(c_offset_Y, jmin);
         m_kExcessLeft = distance(Yleft, max_element(Yleft, Yleft + m_nsp));
@@ -280,6 +292,14 @@ void StFlow::eval(size_t jg, doublereal* xg,
     // update the species diffusive mass fluxes whether or not a
     // Jacobian is being evaluated
     updateDiffFluxes(x, j0, j1);
+    t0 = clock();
+    m_fluxTime += double(t0 - t1)/CLOCKS_PER_SEC;
+
+    // net production rates at the interior points
+    for (j = std::max<size_t>(jmin, 1); j <= std::min(jmax, m_points - 2); j++) {
+        getWdot(x,j);
+    }
+    m_kineticsTime += double(clock() - t0)/CLOCKS_PER_SEC;
 
     //----------------------------------------------------
     // evaluate the residual equations at all required
@@ -407,7 +427,6 @@ void StFlow::eval(size_t jg, doublereal* xg,
             //   \rho dY_k/dt + \rho u dY_k/dz + dJ_k/dz
             //   = M_k\omega_k
             //-------------------------------------------------
-            getWdot(x,j);
             doublereal convec, diffus;
             for (k = 0; k < m_nsp; k++) {
                 convec = rho_u(x,j)*dYdz(x,k,j);
@@ -464,6 +483,15 @@ void StFlow::eval(size_t jg, doublereal* xg,
     }
 }
 
+void StFlow::collectTimingStats(std::map<std::string, double>& stats)
+{
+    stats["thermo"] += m_thermoTime;
+    stats["kinetics"] += m_kineticsTime;
+    stats["transport"] += m_transportTime;
+    stats["diffusive_fluxes"] += m_fluxTime;
+    m_thermoTime = m_kineticsTime = m_transportTime = m_fluxTime = 0.0;
+}
+
 void StFlow::updateTransport(doublereal* x, size_t j0, size_t j1)
 {
     if (m_transport_option == c_Mixav_Transport) {
@@ -24,6 +24,7 @@ GeneralSpeciesThermo::GeneralSpeciesThermo() :
 GeneralSpeciesThermo::GeneralSpeciesThermo(const GeneralSpeciesThermo& b) :
     SpeciesThermo(b),
     m_tpoly(b.m_tpoly),
+    m_tables(b.m_tables),
     m_speciesLoc(b.m_speciesLoc),
     m_tlow_max(b.m_tlow_max),
     m_thigh_min(b.m_thigh_min),
@@ -61,6 +62,7 @@ GeneralSpeciesThermo::operator=(const GeneralSpeciesThermo& b)
     }
 
     m_tpoly = b.m_tpoly;
+    m_tables = b.m_tables;
     m_speciesLoc = b.m_speciesLoc;
     m_tlow_max = b.m_tlow_max;
     m_thigh_min = b.m_thigh_min;
@@ -88,6 +90,12 @@ void GeneralSpeciesThermo::install_STIT(size_t index,
     m_sp[type].emplace_back(index, stit_ptr);
     if (m_sp[type].size() == 1) {
         m_tpoly[type].resize(stit_ptr->temperaturePolySize());
+        if (ThermoPolyTable::supports(type)) {
+            m_tables.emplace(type, ThermoPolyTable(type));
+        }
+    }
+    if (m_tables.count(type)) {
+        m_tables.at(type).add(index, *stit_ptr);
     }
 
     // Calculate max and min T
@@ -126,6 +134,9 @@ void GeneralSpeciesThermo::modifySpecies(size_t index,
     }
 
     m_sp[type][m_speciesLoc[index].second] = {index, spthermo};
+    if (m_tables.count(type)) {
+        m_tables.at(type).replace(m_speciesLoc[index].second, *spthermo);
+    }
 }
 
 void GeneralSpeciesThermo::installPDSShandler(size_t k, PDSS* PDSS_ptr,
@@ -150,6 +161,11 @@ void GeneralSpeciesThermo::update(doublereal t, doublereal* cp_R,
     auto iter = m_sp.begin();
     auto jter = m_tpoly.begin();
     for (; iter != m_sp.end(); iter++, jter++) {
+        auto table = m_tables.find(iter->first);
+        if (table != m_tables.end()) {
+            table->second.update(t, cp_R, h_RT, s_R);
+            continue;
+        }
         const std::vector<index_STIT>& species = iter->second;
         double* tpoly = &jter->second[0];
         species[0].second->updateTemperaturePoly(t, tpoly);
@@ -251,6 +267,10 @@ void GeneralSpeciesThermo::modifyOneHf298(const size_t k, const doublereal Hf298
     SpeciesThermoInterpType* sp_ptr = provideSTIT(k);
     if (sp_ptr) {
         sp_ptr->modifyOneHf298(k, Hf298New);
+        const std::pair<int, size_t>& loc = m_speciesLoc[k];
+        if (m_tables.count(loc.first)) {
+            m_tables.at(loc.first).replace(loc.second, *sp_ptr);
+        }
     }
 }
 
@@ -55,6 +55,7 @@ IdealGasPhase& IdealGasPhase::operator=(const IdealGasPhase& right)
         m_s0_R = right.m_s0_R;
         m_expg0_RT = right.m_expg0_RT;
         m_pp = right.m_pp;
+        m_stateCache.setCapacity(right.m_stateCache.capacity());
     }
     return *this;
 }
@@ -314,14 +315,55 @@ void IdealGasPhase::_updateThermo() const
     // If the temperature has changed since the last time these
     // properties were computed, recompute them.
     if (cached.state1 != tnow) {
-        m_spthermo->update(tnow, &m_cp0_R[0], &m_h0_RT[0], &m_s0_R[0]);
         cached.state1 = tnow;
 
+        // Check whether the properties are stored for a recent state
+        vector_fp* saved = m_stateCache.capacity() ? m_stateCache.find(tnow) : 0;
+        if (saved) {
+            auto iter = saved->begin();
+            std::copy(iter, iter + m_kk, m_cp0_R.begin());
+            std::copy(iter + m_kk, iter + 2*m_kk, m_h0_RT.begin());
+            std::copy(iter + 2*m_kk, iter + 3*m_kk, m_s0_R.begin());
+            std::copy(iter + 3*m_kk, iter + 4*m_kk, m_g0_RT.begin());
+            m_logc0 = saved->back();
+            return;
+        }
+
+        m_spthermo->update(tnow, &m_cp0_R[0], &m_h0_RT[0], &m_s0_R[0]);
+
         // update the species Gibbs functions
         for (size_t k = 0; k < m_kk; k++) {
             m_g0_RT[k] = m_h0_RT[k] - m_s0_R[k];
         }
         m_logc0 = log(m_p0 / RT());
+
+        if (m_stateCache.capacity()) {
+            vector_fp& data = m_stateCache.insert(tnow);
+            data.resize(4*m_kk + 1);
+            auto iter = data.begin();
+            std::copy(m_cp0_R.begin(), m_cp0_R.end(), iter);
+            std::copy(m_h0_RT.begin(), m_h0_RT.end(), iter + m_kk);
+            std::copy(m_s0_R.begin(), m_s0_R.end(), iter + 2*m_kk);
+            std::copy(m_g0_RT.begin(), m_g0_RT.end(), iter + 3*m_kk);
+            data.back() = m_logc0;
+        }
     }
 }
+
+void IdealGasPhase::invalidateCache()
+{
+    ThermoPhase::invalidateCache();
+    m_stateCache.clear();
+}
+
+void IdealGasPhase::setStateCacheSize(size_t n)
+{
+    m_stateCache.setCapacity(n);
+}
+
+void IdealGasPhase::getStateCacheStats(size_t& hits, size_t& misses) const
+{
+    hits = m_stateCache.hits();
+    misses = m_stateCache.misses();
+}
 }
@@ -26,6 +26,7 @@ Phase::Phase() :
     m_dens(0.001),
     m_mmw(0.0),
     m_stateNum(-1),
+    m_cacheNum(0),
     m_mm(0),
     m_elem_type(0)
 {
@@ -41,6 +42,7 @@ Phase::Phase(const Phase& right) :
     m_dens(0.001),
     m_mmw(0.0),
     m_stateNum(-1),
+    m_cacheNum(0),
     m_mm(0),
     m_elem_type(0)
 {
@@ -884,6 +886,7 @@ bool Phase::ready() const
 
 void Phase::invalidateCache() {
     m_cache.clear();
+    m_cacheNum++;
 }
 
 } // namespace Cantera
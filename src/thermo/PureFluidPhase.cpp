@@ -163,6 +163,24 @@ tpx::Substance& PureFluidPhase::TPX_Substance()
     return *m_sub;
 }
 
+double PureFluidPhase::tabulate(double Tlow, double Thigh, double Plow,
+                                double Phigh, size_t nT, size_t nP,
+                                double rtol)
+{
+    setTPXState();
+    return m_sub->tabulate(Tlow, Thigh, Plow, Phigh, nT, nP, rtol);
+}
+
+bool PureFluidPhase::tabulated() const
+{
+    return m_sub->tabulated();
+}
+
+void PureFluidPhase::clearTables()
+{
+    m_sub->clearTables();
+}
+
 void PureFluidPhase::getPartialMolarEnthalpies(doublereal* hbar) const
 {
     hbar[0] = enthalpy_mole();
@@ -0,0 +1,299 @@
+/**
+ *  @file ThermoPolyTable.cpp
+ *  Definitions for a packed table of polynomial coefficients used to evaluate
+ *  the reference state properties of many species at once (see \ref spthermo
+ *  and \link Cantera::ThermoPolyTable ThermoPolyTable\endlink).
+ */
+
+#include "cantera/thermo/ThermoPolyTable.h"
+#include "cantera/thermo/speciesThermoTypes.h"
+#include "cantera/thermo/ShomatePoly.h"
+#include "cantera/thermo/Nasa9PolyMultiTempRegion.h"
+#include "cantera/base/ctexceptions.h"
+
+namespace Cantera
+{
+
+ThermoPolyTable::ThermoPolyTable(int type) :
+    m_type(type),
+    m_ncoeff(0),
+    m_contiguous(true),
+    m_Tvalid(BigNumber, -BigNumber)
+{
+    if (type == NASA1 || type == NASA2 || type == SHOMATE || type == SHOMATE1) {
+        m_ncoeff = 7;
+    } else if (type == NASA9 || type == NASA9MULTITEMP) {
+        m_ncoeff = 9;
+    } else {
+        throw CanteraError("ThermoPolyTable::ThermoPolyTable",
+                           "Unsupported parameterization type: {}", type);
+    }
+    m_active.resize(m_ncoeff);
+    addRegion();
+}
+
+bool ThermoPolyTable::supports(int type)
+{
+    return (type == NASA1 || type == NASA2 || type == SHOMATE ||
+            type == SHOMATE1 || type == NASA9 || type == NASA9MULTITEMP);
+}
+
+void ThermoPolyTable::add(size_t k, const SpeciesThermoInterpType& stit)
+{
+    size_t i = size();
+    if (i && k != m_index[0] + i) {
+        m_contiguous = false;
+    }
+    m_index.push_back(k);
+    for (auto& region : m_coeffs) {
+        for (auto& c : region) {
+            c.push_back(0.0);
+        }
+    }
+    for (auto& bound : m_bounds) {
+        bound.push_back(BigNumber);
+    }
+    for (auto& c : m_active) {
+        c.push_back(0.0);
+    }
+    m_region.push_back(-1);
+    m_cp.push_back(0.0);
+    m_h.push_back(0.0);
+    m_s.push_back(0.0);
+    setCoeffs(i, stit);
+}
+
+void ThermoPolyTable::replace(size_t i, const SpeciesThermoInterpType& stit)
+{
+    if (i >= size()) {
+        throw IndexError("ThermoPolyTable::replace", "species", i, size()-1);
+    }
+    setCoeffs(i, stit);
+}
+
+void ThermoPolyTable::addRegion()
+{
+    if (!m_coeffs.empty()) {
+        m_bounds.emplace_back(size(), BigNumber);
+    }
+    m_coeffs.emplace_back(m_ncoeff, vector_fp(size(), 0.0));
+}
+
+void ThermoPolyTable::setCoeffs(size_t i, const SpeciesThermoInterpType& stit)
+{
+    if (stit.reportType() != m_type) {
+        throw CanteraError("ThermoPolyTable::setCoeffs",
+            "Parameterization type {} does not match the type of the table, {}",
+            stit.reportType(), m_type);
+    }
+
+    size_t n;
+    int type;
+    double tlow, thigh, pref;
+    vector_fp c;
+    // Lower temperature bound and offset of the coefficients in 'c' for each
+    // temperature region
+    std::vector<std::pair<double, size_t>> regions;
+    double scale = 1.0;
+    if (m_type == NASA1) {
+        c.resize(7);
+        stit.reportParameters(n, type, tlow, thigh, pref, &c[0]);
+        regions = {{tlow, 0}};
+    } else if (m_type == NASA2) {
+        // c[0] is the midpoint temperature, followed by the coefficients for
+        // the high and then the low temperature regions
+        c.resize(15);
+        stit.reportParameters(n, type, tlow, thigh, pref, &c[0]);
+        regions = {{tlow, 8}, {c[0], 1}};
+    } else if (m_type == SHOMATE || m_type == SHOMATE1) {
+        // c[0] is the midpoint temperature, followed by the coefficients for
+        // the low and then the high temperature regions
+        if (dynamic_cast<const ShomatePoly2*>(&stit)) {
+            c.resize(15);
+            stit.reportParameters(n, type, tlow, thigh, pref, &c[0]);
+            regions = {{tlow, 1}, {c[0], 8}};
+        } else {
+            c.resize(7);
+            stit.reportParameters(n, type, tlow, thigh, pref, &c[0]);
+            regions = {{tlow, 0}};
+        }
+        scale = 1000 / GasConstant;
+    } else if (m_type == NASA9) {
+        c.resize(12);
+        stit.reportParameters(n, type, tlow, thigh, pref, &c[0]);
+        regions = {{tlow, 3}};
+    } else if (m_type == NASA9MULTITEMP) {
+        // c[0] is the number of regions, followed by the minimum and maximum
+        // temperatures and the coefficients for each region
+        size_t nreg = dynamic_cast<const Nasa9PolyMultiTempRegion&>(stit).nRegions();
+        c.resize(1 + 11*nreg);
+        stit.reportParameters(n, type, tlow, thigh, pref, &c[0]);
+        for (size_t r = 0; r < nreg; r++) {
+            regions.emplace_back(c[1 + 11*r], 3 + 11*r);
+        }
+    }
+
+    while (m_coeffs.size() < regions.size()) {
+        addRegion();
+    }
+    for (size_t r = 0; r < m_coeffs.size(); r++) {
+        for (size_t j = 0; j < m_ncoeff; j++) {
+            if (r < regions.size()) {
+                m_coeffs[r][j][i] = c[regions[r].second + j] * scale;
+            } else {
+                m_coeffs[r][j][i] = 0.0;
+            }
+        }
+        if (r) {
+            m_bounds[r-1][i] = (r < regions.size()) ? regions[r].first : BigNumber;
+        }
+    }
+    m_region[i] = -1;
+    m_Tvalid = {BigNumber, -BigNumber};
+}
+
+void ThermoPolyTable::selectRegions(double T) const
+{
+    if (T > m_Tvalid.first && T < m_Tvalid.second) {
+        // No species changes region within this interval
+        return;
+    }
+    size_t nsp = size();
+    size_t nreg = m_coeffs.size();
+    // Nasa9PolyMultiTempRegion uses the upper region at the boundary
+    // temperature, while the two-region polynomials use the lower one
+    bool upper = (m_type == NASA9MULTITEMP);
+    double Tmin = -BigNumber;
+    double Tmax = BigNumber;
+    for (size_t i = 0; i < nsp; i++) {
+        int r = 0;
+        for (size_t m = 1; m < nreg; m++) {
+            r += upper ? (T >= m_bounds[m-1][i]) : (T > m_bounds[m-1][i]);
+        }
+        if (r != m_region[i]) {
+            for (size_t j = 0; j < m_ncoeff; j++) {
+                m_active[j][i] = m_coeffs[r][j][i];
+            }
+            m_region[i] = r;
+        }
+        if (r > 0) {
+            Tmin = std::max(Tmin, m_bounds[r-1][i]);
+        }
+        if (r + 1 < (int) nreg) {
+            Tmax = std::min(Tmax, m_bounds[r][i]);
+        }
+    }
+    m_Tvalid = {Tmin, Tmax};
+}
+
+void ThermoPolyTable::evaluate(double T, double* cp_R, double* h_RT,
+                               double* s_R) const
+{
+    size_t nsp = size();
+    const double* a0 = m_active[0].data();
+    const double* a1 = m_active[1].data();
+    const double* a2 = m_active[2].data();
+    const double* a3 = m_active[3].data();
+    const double* a4 = m_active[4].data();
+    const double* a5 = m_active[5].data();
+    const double* a6 = m_active[6].data();
+
+    // Each property is computed in a separate loop to limit the number of
+    // arrays accessed in each loop, so that the compiler is able to vectorize
+    // the loops after checking that the arrays do not overlap. The order of
+    // operations is the same as in the SpeciesThermoInterpType classes, so the
+    // results are identical.
+    if (m_type == NASA1 || m_type == NASA2) {
+        // See NasaPoly1::updateProperties
+        double T2 = T * T;
+        double T3 = T2 * T;
+        double T4 = T3 * T;
+        double rT = 1.0 / T;
+        double logT = std::log(T);
+        for (size_t i = 0; i < nsp; i++) {
+            cp_R[i] = a0[i] + a1[i]*T + a2[i]*T2 + a3[i]*T3 + a4[i]*T4;
+        }
+        for (size_t i = 0; i < nsp; i++) {
+            h_RT[i] = a0[i] + 0.5*(a1[i]*T) + 1.0/3.0*(a2[i]*T2)
+                      + 0.25*(a3[i]*T3) + 0.2*(a4[i]*T4) + a5[i]*rT;
+        }
+        for (size_t i = 0; i < nsp; i++) {
+            s_R[i] = a0[i]*logT + a1[i]*T + 0.5*(a2[i]*T2)
+                     + 1.0/3.0*(a3[i]*T3) + 0.25*(a4[i]*T4) + a6[i];
+        }
+    } else if (m_type == SHOMATE || m_type == SHOMATE1) {
+        // See ShomatePoly::updateProperties
+        double t = 1.e-3 * T;
+        double t2 = t * t;
+        double t3 = t2 * t;
+        double tm2 = 1.0 / t2;
+        double logt = std::log(t);
+        double tm1 = 1.0 / t;
+        for (size_t i = 0; i < nsp; i++) {
+            cp_R[i] = a0[i] + a1[i]*t + a2[i]*t2 + a3[i]*t3 + a4[i]*tm2;
+        }
+        for (size_t i = 0; i < nsp; i++) {
+            h_RT[i] = a0[i] + 0.5*(a1[i]*t) + 1.0/3.0*(a2[i]*t2)
+                      + 0.25*(a3[i]*t3) - a4[i]*tm2 + a5[i]*tm1;
+        }
+        for (size_t i = 0; i < nsp; i++) {
+            s_R[i] = a0[i]*logt + a1[i]*t + 0.5*(a2[i]*t2)
+                     + 1.0/3.0*(a3[i]*t3) - 0.5*(a4[i]*tm2) + a6[i];
+        }
+    } else {
+        // See Nasa9Poly1::updateProperties
+        const double* a7 = m_active[7].data();
+        const double* a8 = m_active[8].data();
+        double T2 = T * T;
+        double T3 = T2 * T;
+        double T4 = T3 * T;
+        double rT = 1.0 / T;
+        double rT2 = rT / T;
+        double logT = std::log(T);
+        for (size_t i = 0; i < nsp; i++) {
+            cp_R[i] = a0[i]*rT2 + a1[i]*rT + a2[i] + a3[i]*T + a4[i]*T2
+                      + a5[i]*T3 + a6[i]*T4;
+        }
+        for (size_t i = 0; i < nsp; i++) {
+            h_RT[i] = -(a0[i]*rT2) + logT*(a1[i]*rT) + a2[i] + 0.5*(a3[i]*T)
+                      + 1.0/3.0*(a4[i]*T2) + 0.25*(a5[i]*T3)
+                      + 0.2*(a6[i]*T4) + a7[i]*rT;
+        }
+        for (size_t i = 0; i < nsp; i++) {
+            s_R[i] = -0.5*(a0[i]*rT2) - a1[i]*rT + logT*a2[i] + a3[i]*T
+                     + 0.5*(a4[i]*T2) + 1.0/3.0*(a5[i]*T3)
+                     + 0.25*(a6[i]*T4) + a8[i];
+        }
+    }
+}
+
+void ThermoPolyTable::update(double T, double* cp_R, double* h_RT,
+                             double* s_R) const
+{
+    if (m_index.empty()) {
+        return;
+    }
+    selectRegions(T);
+    if (m_contiguous) {
+        size_t k0 = m_index[0];
+        evaluate(T, cp_R + k0, h_RT + k0, s_R + k0);
+    } else {
+        evaluate(T, m_cp.data(), m_h.data(), m_s.data());
+        for (size_t i = 0; i < m_index.size(); i++) {
+            size_t k = m_index[i];
+            cp_R[k] = m_cp[i];
+            h_RT[k] = m_h[i];
+            s_R[k] = m_s[i];
+        }
+    }
+}
+
+void ThermoPolyTable::update(size_t nT, const double* T, size_t stride,
+                             double* cp_R, double* h_RT, double* s_R) const
+{
+    for (size_t j = 0; j < nT; j++) {
+        update(T[j], cp_R + j*stride, h_RT + j*stride, s_R + j*stride);
+    }
+}
+
+}
@@ -4,6 +4,7 @@
  * D. Goodwin, Caltech Nov. 1996
  */
 #include "cantera/tpx/Sub.h"
+#include "SubstanceTable.h"
 #include "cantera/base/stringUtils.h"
 #include "cantera/base/global.h"
 
@@ -79,6 +80,10 @@ double Substance::Tsat(double p)
     if (p <= 0.0 || p > Pcrit()) {
         throw CanteraError("Substance::Tsat", "illegal pressure value");
     }
+    double tsat;
+    if (m_table && m_table->Tsat(p, tsat)) {
+        return tsat;
+    }
     int LoopCount = 0;
     double tol = 1.e-6*p;
     double Tsave = T;
@@ -110,7 +115,7 @@ double Substance::Tsat(double p)
             throw CanteraError("Substance::Tsat", "No convergence");
         }
     }
-    double tsat = T;
+    tsat = T;
     T = Tsave;
     return tsat;
 }
@@ -140,6 +145,9 @@ void Substance::Set(PropertyPair::type XY, double x0, double y0)
         set_v(y0);
         break;
     case PropertyPair::HP:
+        if (setFromTable(propertyFlag::H, x0, y0)) {
+            return;
+        }
         if (Lever(Pgiven, y0, x0, propertyFlag::H)) {
             return;
         }
@@ -147,6 +155,9 @@ void Substance::Set(PropertyPair::type XY, double x0, double y0)
                x0, y0, TolAbsH, TolAbsP, TolRel, TolRel);
         break;
     case PropertyPair::SP:
+        if (setFromTable(propertyFlag::S, x0, y0)) {
+            return;
+        }
         if (Lever(Pgiven, y0, x0, propertyFlag::S)) {
             return;
         }
@@ -161,6 +172,9 @@ void Substance::Set(PropertyPair::type XY, double x0, double y0)
                x0, y0, TolAbsP, TolAbsV, TolRel, TolRel);
         break;
     case PropertyPair::TP:
+        if (setFromTable(propertyFlag::T, x0, y0)) {
+            return;
+        }
         if (x0 < Tcrit()) {
             set_T(x0);
             if (y0 < Ps()) {
@@ -223,23 +237,46 @@ void Substance::Set(PropertyPair::type XY, double x0, double y0)
         }
         break;
     case PropertyPair::TX:
-        if (y0 > 1.0 || y0 < 0.0) {
-            throw CanteraError("Substance::Set",
-                               "Invalid vapor fraction, {}", y0);
-        } else if (x0 >= Tcrit()) {
-            throw CanteraError("Substance::Set",
-                               "Can't set vapor fraction above the critical point");
-        } else {
-            set_T(x0);
-            update_sat();
-            Rho = 1.0/((1.0 - y0)/Rhf + y0/Rhv);
-        }
+        setSaturated(x0, y0);
         break;
     default:
         throw CanteraError("Substance::Set", "Invalid input.");
     }
 }
 
+void Substance::setSaturated(double t, double x, bool warm)
+{
+    if (x > 1.0 || x < 0.0) {
+        throw CanteraError("Substance::Set",
+                           "Invalid vapor fraction, {}", x);
+    } else if (t >= Tcrit()) {
+        throw CanteraError("Substance::Set",
+                           "Can't set vapor fraction above the critical point");
+    }
+    set_T(t);
+    if (warm) {
+        try {
+            update_sat(true);
+        } catch (CanteraError&) {
+            update_sat();
+        }
+    } else {
+        update_sat();
+    }
+    Rho = 1.0/((1.0 - x)/Rhf + x/Rhv);
+}
+
+double Substance::tabulate(double Tlow, double Thigh, double Plow,
+                           double Phigh, size_t nT, size_t nP, double rtol)
+{
+    m_table.reset();
+    Tslast = Undef;
+    std::shared_ptr<SubstanceTable> table(
+        new SubstanceTable(*this, Tlow, Thigh, Plow, Phigh, nT, nP, rtol));
+    m_table = table;
+    return table->coverage();
+}
+
 //------------------ Protected and Private Functions -------------------
 
 void Substance::set_Rho(double r0)
@@ -280,29 +317,39 @@ double Substance::Ps()
     return Pst;
 }
 
-void Substance::update_sat()
+void Substance::update_sat(bool warm)
 {
     if ((T != Tslast) && (T < Tcrit())) {
+        if (m_table && m_table->satState(T, Pst, Rhf, Rhv)) {
+            Tslast = T;
+            return;
+        }
         double Rho_save = Rho;
-        double pp = Psat();
+        double pp;
+        if (warm && Tslast != Undef && Tslast < Tcrit()) {
+            // trial values = Psat from correlation, corrected by its error
+            // at the last saturation state, and the last saturation densities
+            double Tsave = T;
+            T = Tslast;
+            double ratio = Pst/Psat();
+            T = Tsave;
+            pp = ratio*Psat();
+        } else {
+            // trial values = Psat from correlation, liquid density from
+            // correlation, and ideal gas
+            pp = Psat();
+            Rhf = ldens();
+            Rhv = pp*MolWt()/(8314.0*T);
+        }
         double lps = log(pp);
-        // trial value = Psat from correlation
         int i;
         for (i = 0; i<20; i++) {
-            if (i==0) {
-                Rho = ldens(); // trial value = liquid density
-            } else {
-                Rho = Rhf;
-            }
+            Rho = Rhf;
             set_TPp(T,pp);
             Rhf = Rho; // sat liquid density
 
             double gf = hp() - T*sp();
-            if (i==0) {
-                Rho = pp*MolWt()/(8314.0*T); // trial value = ideal gas
-            } else {
-                Rho = Rhv;
-            }
+            Rho = Rhv;
             set_TPp(T,pp);
 
             Rhv = Rho; // sat vapor density
@@ -348,6 +395,39 @@ void Substance::update_sat()
     }
 }
 
+bool Substance::setFromTable(propertyFlag::type ifx, double x, double P)
+{
+    double t, v;
+    if (m_table && m_table->state(ifx, x, P, t, v)) {
+        T = t;
+        Rho = 1.0/v;
+        return true;
+    }
+    return false;
+}
+
+void Substance::derivs_Tv(double& dPdT, double& dPdv, double& dsdT)
+{
+    double Tsave = T, Rhosave = Rho;
+    double dt = 1.e-4*T;
+    double T1 = std::max(Tmin(), Tsave - dt);
+    double T2 = std::min(Tmax(), Tsave + dt);
+    T = T1;
+    double P1 = Pp();
+    double s1 = sp();
+    T = T2;
+    dPdT = (Pp() - P1)/(T2 - T1);
+    dsdT = (sp() - s1)/(T2 - T1);
+    T = Tsave;
+
+    double v0 = 1.0/Rhosave, dv = 1.e-4*v0;
+    Rho = 1.0/(v0 - dv);
+    P1 = Pp();
+    Rho = 1.0/(v0 + dv);
+    dPdv = (Pp() - P1)/(2*dv);
+    Rho = Rhosave;
+}
+
 double Substance::vprop(propertyFlag::type ijob)
 {
     switch (ijob) {
@@ -0,0 +1,563 @@
+//! @file SubstanceTable.cpp
+#include "SubstanceTable.h"
+#include "cantera/base/stringUtils.h"
+
+#include <limits>
+
+using namespace Cantera;
+
+namespace tpx
+{
+
+namespace {
+
+const double NaN = std::numeric_limits<double>::quiet_NaN();
+
+//! Value at the local coordinate *t* of the cubic polynomial through the
+//! points (0, f[0]), (1, f[1]), (2, f[2]), (3, f[3])
+double cubic(const double* f, double t)
+{
+    return (- f[0] * (t - 1) * (t - 2) * (t - 3) / 6
+            + f[1] * t * (t - 2) * (t - 3) / 2
+            - f[2] * t * (t - 1) * (t - 3) / 2
+            + f[3] * t * (t - 1) * (t - 2) / 6);
+}
+
+//! Compute the weights for cubic interpolation at the fractional index *u*
+//! on a grid with *n* >= 4 points. Returns the index of the first of the four
+//! points used.
+size_t stencil(double u, size_t n, double* w)
+{
+    size_t base = (u < 2) ? 0 : std::min(static_cast<size_t>(u) - 1, n - 4);
+    double t = u - base;
+    w[0] = - (t - 1) * (t - 2) * (t - 3) / 6;
+    w[1] = t * (t - 2) * (t - 3) / 2;
+    w[2] = - t * (t - 1) * (t - 3) / 2;
+    w[3] = t * (t - 1) * (t - 2) / 6;
+    return base;
+}
+
+//! Index of the cell containing the fractional index *u* on a grid with *n*
+//! points
+size_t cellIndex(double u, size_t n)
+{
+    return (u < 1) ? 0 : std::min(static_cast<size_t>(u), n - 2);
+}
+
+//! Find the fractional index *u* between *ulo* and *uhi* where the cubic
+//! through the values *f* at indices *base* to *base* + 3 is equal to
+//! *target*, which must be bracketed by the values at *ulo* and *uhi*.
+double solveCubic(const double* f, size_t base, double target,
+                  double ulo, double uhi)
+{
+    // Regula falsi, with the Illinois modification
+    double flo = cubic(f, ulo - base) - target;
+    double fhi = cubic(f, uhi - base) - target;
+    double tol = 1e-15 * (std::abs(f[0]) + std::abs(f[3]) + std::abs(target));
+    double u = ulo;
+    int side = 0;
+    for (int i = 0; i < 100; i++) {
+        if (fhi == flo) {
+            break;
+        }
+        u = (ulo * fhi - uhi * flo) / (fhi - flo);
+        double fu = cubic(f, u - base) - target;
+        if (std::abs(fu) <= tol || uhi - ulo < 1e-14) {
+            break;
+        } else if ((fu > 0) == (fhi > 0)) {
+            uhi = u;
+            fhi = fu;
+            if (side == -1) {
+                flo /= 2;
+            }
+            side = -1;
+        } else {
+            ulo = u;
+            flo = fu;
+            if (side == 1) {
+                fhi /= 2;
+            }
+            side = 1;
+        }
+    }
+    return u;
+}
+
+} // end unnamed namespace
+
+SubstanceTable::SubstanceTable(Substance& sub, double Tlow, double Thigh,
+                               double Plow, double Phigh, size_t nT,
+                               size_t nP, double rtol) :
+    m_Tlow(Tlow),
+    m_Thigh(Thigh),
+    m_Plow(Plow),
+    m_Phigh(Phigh),
+    m_lnPlow(log(Plow)),
+    m_dlnP(log(Phigh / Plow) / (nP - 1)),
+    m_Pcrit(sub.Pcrit()),
+    m_R(8314.4621 / sub.MolWt()),
+    m_nT(nT),
+    m_nP(nP),
+    m_rtol(rtol),
+    m_nsat(0),
+    m_dTsat(0.0),
+    m_dTdlnP(0.0),
+    m_ncells(0),
+    m_nvalid(0)
+{
+    if (!(Tlow >= sub.Tmin() && Thigh <= sub.Tmax() && Tlow < Thigh)) {
+        throw CanteraError("SubstanceTable::SubstanceTable",
+            "Invalid temperature range [{}, {}]. The valid range for {} "
+            "is [{}, {}].", Tlow, Thigh, sub.name(), sub.Tmin(), sub.Tmax());
+    } else if (!(Plow > 0.0 && Plow < Phigh)) {
+        throw CanteraError("SubstanceTable::SubstanceTable",
+            "Invalid pressure range [{}, {}]", Plow, Phigh);
+    } else if (nT < 4 || nP < 4) {
+        throw CanteraError("SubstanceTable::SubstanceTable",
+            "At least 4 points are needed along each axis");
+    } else if (!(rtol > 0.0)) {
+        throw CanteraError("SubstanceTable::SubstanceTable",
+            "Invalid tolerance: {}", rtol);
+    }
+
+    double Tsave = sub.T;
+    double Rhosave = sub.Rho;
+    double Tslast = sub.Tslast;
+    double Rhf = sub.Rhf;
+    double Rhv = sub.Rhv;
+    double Pst = sub.Pst;
+
+    // Saturation table, stopping short of the critical point where the
+    // saturated liquid and vapor densities are singular
+    double Ttop = std::min(Thigh, (1.0 - 1e-3) * sub.Tcrit());
+    if (Ttop > Tlow) {
+        m_dTsat = (Ttop - Tlow) / (nT - 1);
+        for (size_t k = 0; k < nT; k++) {
+            sub.T = Tlow + k * m_dTsat;
+            sub.Tslast = Undef;
+            try {
+                sub.update_sat();
+            } catch (CanteraError&) {
+                if (k < 4) {
+                    throw CanteraError("SubstanceTable::SubstanceTable",
+                        "Unable to compute the saturation properties of {} "
+                        "at T = {}. Try a higher value of Tlow.",
+                        sub.name(), sub.T);
+                }
+                // Truncate the table. Any cells affected by the
+                // extrapolation of the saturation curve beyond this point
+                // will fail the validation.
+                break;
+            }
+            m_lnPs.push_back(log(sub.Pst));
+            m_lnRhf.push_back(log(sub.Rhf));
+            m_lnRhv.push_back(log(sub.Rhv));
+        }
+        m_nsat = m_lnPs.size();
+    }
+
+    if (m_nsat) {
+        // Slope of the saturation curve at its end, from the
+        // Clausius-Clapeyron equation. The state of sub is the last point
+        // of the saturation table.
+        sub.Rho = sub.Rhv;
+        double hv = sub.hp();
+        sub.Rho = sub.Rhf;
+        double hf = sub.hp();
+        double dPdT = (hv - hf) / (sub.T * (1.0/sub.Rhv - 1.0/sub.Rhf));
+        m_dTdlnP = sub.Pst / dPdT;
+
+        // Check the interpolated saturation properties at three points in
+        // each interval
+        m_satValid.assign(m_nsat - 1, 0);
+        for (size_t k = 0; k < m_nsat - 1; k++) {
+            bool valid = true;
+            for (double f : {0.25, 0.5, 0.75}) {
+                sub.T = Tlow + (k + f) * m_dTsat;
+                sub.Tslast = Undef;
+                try {
+                    sub.update_sat();
+                } catch (CanteraError&) {
+                    valid = false;
+                    break;
+                }
+                double w[4];
+                size_t base = stencil(k + f, m_nsat, w);
+                double lnPs = 0.0, lnRhf = 0.0, lnRhv = 0.0;
+                for (size_t a = 0; a < 4; a++) {
+                    lnPs += w[a] * m_lnPs[base + a];
+                    lnRhf += w[a] * m_lnRhf[base + a];
+                    lnRhv += w[a] * m_lnRhv[base + a];
+                }
+                if (!(std::abs(lnPs - log(sub.Pst)) <= rtol &&
+                      std::abs(lnRhf - log(sub.Rhf)) <= rtol &&
+                      std::abs(lnRhv - log(sub.Rhv)) <= rtol)) {
+                    valid = false;
+                    break;
+                }
+            }
+            m_satValid[k] = valid;
+        }
+    }
+
+    // Single-phase tables
+    for (int r = 0; r < 2; r++) {
+        m_data[r].resize(3 * nT * nP);
+        for (size_t j = 0; j < nP; j++) {
+            fillRow(sub, r, j);
+        }
+    }
+
+    // Check the interpolated properties at the points of a 3 x 3 grid inside
+    // each cell and at three points on each of its edges. The corners are
+    // grid points, where the interpolation is exact.
+    const double fractions[] = {0.25, 0.5, 0.75};
+    for (int r = 0; r < 2; r++) {
+        m_valid[r].assign((nP - 1) * (nT - 1), 0);
+        // Results for the edges at constant pressure and at constant reduced
+        // temperature, which are shared by neighboring cells (-1 if not
+        // checked yet)
+        std::vector<int> edgeP(nP * (nT - 1), -1);
+        std::vector<int> edgeT((nP - 1) * nT, -1);
+        auto checkEdgeP = [&](size_t j, size_t i) {
+            int& valid = edgeP[j * (nT - 1) + i];
+            if (valid == -1) {
+                valid = 1;
+                for (double f : fractions) {
+                    if (!checkPoint(sub, r, j, (i + f) / (nT - 1), j, i)) {
+                        valid = 0;
+                        break;
+                    }
+                }
+            }
+            return valid == 1;
+        };
+        auto checkEdgeT = [&](size_t j, size_t i) {
+            int& valid = edgeT[j * nT + i];
+            if (valid == -1) {
+                valid = 1;
+                for (double f : fractions) {
+                    if (!checkPoint(sub, r, j + f, double(i) / (nT - 1),
+                                    j, i)) {
+                        valid = 0;
+                        break;
+                    }
+                }
+            }
+            return valid == 1;
+        };
+        auto checkInterior = [&](size_t j, size_t i) {
+            for (double fP : fractions) {
+                for (double fT : fractions) {
+                    if (!checkPoint(sub, r, j + fP, (i + fT) / (nT - 1),
+                                    j, i)) {
+                        return false;
+                    }
+                }
+            }
+            return true;
+        };
+        for (size_t j = 0; j < nP - 1; j++) {
+            double Ts1 = Tsplit(m_lnPlow + j * m_dlnP);
+            double Ts2 = Tsplit(m_lnPlow + (j + 1) * m_dlnP);
+            bool empty = (r == 0) ? (Ts1 <= Tlow || Ts2 <= Tlow)
+                                  : (Ts1 >= Thigh || Ts2 >= Thigh);
+            for (size_t i = 0; i < nT - 1; i++) {
+                if (empty) {
+                    continue;
+                }
+                m_ncells++;
+                if (checkInterior(j, i) &&
+                    checkEdgeP(j, i) && checkEdgeP(j + 1, i) &&
+                    checkEdgeT(j, i) && checkEdgeT(j, i + 1)) {
+                    m_valid[r][j * (nT - 1) + i] = 1;
+                    m_nvalid++;
+                }
+            }
+        }
+    }
+
+    sub.T = Tsave;
+    sub.Rho = Rhosave;
+    sub.Tslast = Tslast;
+    sub.Rhf = Rhf;
+    sub.Rhv = Rhv;
+    sub.Pst = Pst;
+}
+
+void SubstanceTable::fillRow(Substance& sub, int r, size_t j)
+{
+    double lnP = m_lnPlow + j * m_dlnP;
+    double P = exp(lnP);
+    double Ts = Tsplit(lnP);
+    double* y = &m_data[r][3 * j * m_nT];
+
+    // Start from the end of the row furthest from the saturation curve, and
+    // use the density at each point as the initial guess for the next one,
+    // so that the points near the saturation curve stay on the right side of
+    // it.
+    bool started = false;
+    double Rho = 0.0;
+    for (size_t n = 0; n < m_nT; n++) {
+        size_t i = (r == 0) ? n : m_nT - 1 - n;
+        double T = mapT(r, double(i) / (m_nT - 1), Ts);
+        try {
+            if (started) {
+                sub.Rho = Rho;
+                sub.set_TPp(T, P);
+            } else {
+                sub.Set(PropertyPair::TP, T, P);
+            }
+            y[3*i] = -log(sub.Rho);
+            y[3*i+1] = sub.hp();
+            y[3*i+2] = sub.sp();
+            Rho = sub.Rho;
+            started = true;
+        } catch (CanteraError&) {
+            y[3*i] = y[3*i+1] = y[3*i+2] = NaN;
+        }
+    }
+}
+
+bool SubstanceTable::checkPoint(Substance& sub, int r, double uP,
+                                double theta, size_t j, size_t i) const
+{
+    double lnP = m_lnPlow + uP * m_dlnP;
+    double T = mapT(r, theta, Tsplit(lnP));
+    double y[3];
+    interpolate(r, uP, theta, y);
+
+    // Solve for the exact state, starting from the density at grid point
+    // (j, i)
+    double lnv = m_data[r][3 * (j * m_nT + i)];
+    if (std::isnan(lnv)) {
+        return false;
+    }
+    sub.Rho = exp(-lnv);
+    try {
+        sub.set_TPp(T, exp(lnP));
+    } catch (CanteraError&) {
+        return false;
+    }
+    double h = sub.hp();
+    double s = sub.sp();
+    return (std::abs(y[0] + log(sub.Rho)) <= m_rtol &&
+            std::abs(y[1] - h) <= m_rtol * (std::abs(h) + m_R * T) &&
+            std::abs(y[2] - s) <= m_rtol * (std::abs(s) + m_R));
+}
+
+double SubstanceTable::Tsplit(double lnP) const
+{
+    double T;
+    if (m_nsat == 0 || lnP <= m_lnPs[0]) {
+        return m_Tlow;
+    } else if (lnP >= m_lnPs[m_nsat-1]) {
+        T = m_Tlow + (m_nsat - 1) * m_dTsat
+            + (lnP - m_lnPs[m_nsat-1]) * m_dTdlnP;
+    } else {
+        size_t k = std::upper_bound(m_lnPs.begin(), m_lnPs.end(), lnP)
+                   - m_lnPs.begin() - 1;
+        double w[4];
+        size_t base = stencil(k + 0.5, m_nsat, w);
+        T = m_Tlow + m_dTsat * solveCubic(&m_lnPs[base], base, lnP, k, k+1);
+    }
+    return std::max(m_Tlow, std::min(T, m_Thigh));
+}
+
+double SubstanceTable::mapT(int r, double theta, double Ts) const
+{
+    if (r == 0) {
+        return m_Tlow + theta * (Ts - m_Tlow);
+    } else {
+        return Ts + theta * (m_Thigh - Ts);
+    }
+}
+
+bool SubstanceTable::interpolate(int r, double uP, double theta,
+                                 double* y) const
+{
+    double uT = theta * (m_nT - 1);
+    double wP[4], wT[4];
+    size_t jb = stencil(uP, m_nP, wP);
+    size_t ib = stencil(uT, m_nT, wT);
+    const double* d = &m_data[r][0];
+    y[0] = y[1] = y[2] = 0.0;
+    for (size_t a = 0; a < 4; a++) {
+        for (size_t b = 0; b < 4; b++) {
+            double w = wP[a] * wT[b];
+            size_t n = 3 * ((jb + a) * m_nT + ib + b);
+            y[0] += w * d[n];
+            y[1] += w * d[n+1];
+            y[2] += w * d[n+2];
+        }
+    }
+    return m_valid[r][cellIndex(uP, m_nP) * (m_nT - 1)
+                      + cellIndex(uT, m_nT)];
+}
+
+bool SubstanceTable::satState(double T, double& Psat, double& Rhf,
+                              double& Rhv) const
+{
+    if (m_nsat == 0) {
+        return false;
+    }
+    double u = (T - m_Tlow) / m_dTsat;
+    if (!(u >= 0 && u <= m_nsat - 1) || !m_satValid[cellIndex(u, m_nsat)]) {
+        return false;
+    }
+    double w[4];
+    size_t base = stencil(u, m_nsat, w);
+    double lnPs = 0.0, lnRhf = 0.0, lnRhv = 0.0;
+    for (size_t a = 0; a < 4; a++) {
+        lnPs += w[a] * m_lnPs[base + a];
+        lnRhf += w[a] * m_lnRhf[base + a];
+        lnRhv += w[a] * m_lnRhv[base + a];
+    }
+    Psat = exp(lnPs);
+    Rhf = exp(lnRhf);
+    Rhv = exp(lnRhv);
+    return true;
+}
+
+bool SubstanceTable::Tsat(double P, double& T) const
+{
+    if (m_nsat == 0) {
+        return false;
+    }
+    double lnP = log(P);
+    if (!(lnP >= m_lnPs[0] && lnP <= m_lnPs[m_nsat-1])) {
+        return false;
+    }
+    size_t k = std::upper_bound(m_lnPs.begin(), m_lnPs.end(), lnP)
+               - m_lnPs.begin() - 1;
+    k = std::min(k, m_nsat - 2);
+    if (!m_satValid[k]) {
+        return false;
+    }
+    double w[4];
+    size_t base = stencil(k + 0.5, m_nsat, w);
+    T = m_Tlow + m_dTsat * solveCubic(&m_lnPs[base], base, lnP, k, k+1);
+    return true;
+}
+
+bool SubstanceTable::state(propertyFlag::type ifx, double x, double P,
+                           double& T, double& v) const
+{
+    if (!(P >= m_Plow && P <= m_Phigh)) {
+        return false;
+    }
+    double lnP = log(P);
+    double uP = std::max(0.0, std::min((lnP - m_lnPlow) / m_dlnP,
+                                       m_nP - 1.0));
+    if (m_nsat && lnP > m_lnPs[m_nsat-1] && P < m_Pcrit) {
+        // Near the critical point, the temperature dividing the two parts of
+        // the table is not the saturation temperature, so the phase of the
+        // state could be misidentified
+        return false;
+    }
+    double Ts = Tsplit(lnP);
+    double y[3];
+
+    if (ifx == propertyFlag::T) {
+        if (!(x >= m_Tlow && x <= m_Thigh)) {
+            return false;
+        }
+        double theta;
+        int r;
+        if (x < Ts) {
+            r = 0;
+            theta = (x - m_Tlow) / (Ts - m_Tlow);
+        } else {
+            r = 1;
+            theta = (Ts < m_Thigh) ? (x - Ts) / (m_Thigh - Ts) : 0.0;
+        }
+        if (!interpolate(r, uP, theta, y)) {
+            return false;
+        }
+        T = x;
+        v = exp(y[0]);
+        return true;
+    }
+
+    size_t k;
+    if (ifx == propertyFlag::H) {
+        k = 1;
+    } else if (ifx == propertyFlag::S) {
+        k = 2;
+    } else {
+        return false;
+    }
+
+    double wP[4];
+    size_t jb = stencil(uP, m_nP, wP);
+    double gsat = NaN; // value for the saturated liquid
+    for (int r = 0; r < 2; r++) {
+        if ((r == 0 && Ts <= m_Tlow) || (r == 1 && Ts >= m_Thigh)) {
+            continue; // this part of the table is empty at this pressure
+        }
+        // Values of the given property along the reduced temperature axis,
+        // interpolated to the specified pressure
+        const double* d = &m_data[r][k];
+        auto g = [&](size_t i) {
+            double gi = 0.0;
+            for (size_t a = 0; a < 4; a++) {
+                gi += wP[a] * d[3 * ((jb + a) * m_nT + i)];
+            }
+            return gi;
+        };
+        double theta;
+        if (r == 0 && x > g(m_nT - 1)) {
+            gsat = g(m_nT - 1);
+            continue; // the state is not a liquid
+        } else if (r == 1 && x < g(0) && x > gsat) {
+            // The state is either in the two-phase region, or within the
+            // interpolation error of the saturated liquid or vapor
+            double scale = (k == 1) ? m_R * Ts : m_R;
+            double tol = 2 * m_rtol * (std::abs(x) + scale);
+            if (x - gsat <= tol) {
+                r = 0;
+                theta = 1.0;
+            } else if (g(0) - x <= tol) {
+                theta = 0.0;
+            } else {
+                return false;
+            }
+        } else if (!(x >= g(0) && x <= g(m_nT - 1))) {
+            return false;
+        } else {
+            // The given property increases monotonically with temperature
+            size_t ilo = 0, ihi = m_nT - 1;
+            while (ihi - ilo > 1) {
+                size_t imid = (ilo + ihi) / 2;
+                if (g(imid) <= x) {
+                    ilo = imid;
+                } else {
+                    ihi = imid;
+                }
+            }
+            size_t base = (ilo == 0) ? 0 : std::min(ilo - 1, m_nT - 4);
+            double g4[4];
+            for (size_t b = 0; b < 4; b++) {
+                g4[b] = g(base + b);
+            }
+            if (!(g4[ilo-base] <= x && x <= g4[ilo+1-base])) {
+                return false;
+            }
+            theta = solveCubic(g4, base, x, ilo, ilo+1) / (m_nT - 1);
+        }
+        if (!interpolate(r, uP, theta, y)) {
+            return false;
+        }
+        T = mapT(r, theta, Ts);
+        v = exp(y[0]);
+        return true;
+    }
+    return false;
+}
+
+double SubstanceTable::coverage() const
+{
+    return (m_ncells) ? double(m_nvalid) / m_ncells : 0.0;
+}
+
+}
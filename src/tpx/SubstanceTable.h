@@ -0,0 +1,140 @@
+//! @file SubstanceTable.h
+#ifndef TPX_SUBSTANCETABLE_H
+#define TPX_SUBSTANCETABLE_H
+
+#include "cantera/tpx/Sub.h"
+#include <vector>
+
+namespace tpx
+{
+
+//! Tables of pure fluid properties used by the tabulated mode of Substance
+/*!
+ * The logarithms of the saturation pressure and of the densities of
+ * saturated liquid and vapor are tabulated at equally spaced temperatures
+ * between the lower temperature of the table and just below the critical
+ * temperature. The single-phase region is divided into a "liquid" and a
+ * "vapor" part by the saturation curve, which is continued linearly in
+ * (ln(P), T) above the end of the saturation table. Each part is covered by
+ * a grid which is uniform in ln(P) and in the reduced temperature
+ * @f$ \theta @f$, which runs from 0 to 1 between the lower temperature of the
+ * table and the saturation temperature (liquid) or between the saturation
+ * temperature and the upper temperature of the table (vapor). At each grid
+ * point, the log of the specific volume, the enthalpy, and the entropy are
+ * stored.
+ *
+ * All quantities are evaluated using piecewise cubic interpolation on four
+ * neighboring points along each axis. When the tables are constructed, the
+ * interpolated values at the points of a 3 x 3 grid inside each cell and at
+ * three points on each of its edges (or at three points in each interval, in
+ * the case of the saturation table) are compared to the values computed from
+ * the equation of state. Cells where the difference exceeds the specified
+ * relative tolerance at any of these points are marked as invalid, and
+ * queries that fall in them are rejected so that the caller can fall back to
+ * the iterative solution. Typically, this excludes a small region around the
+ * critical point. Since the error is only checked at these points, it is not
+ * guaranteed to be within the tolerance everywhere in a valid cell.
+ */
+class SubstanceTable
+{
+public:
+    //! Construct the tables for the substance *sub*. The state of *sub* is
+    //! not changed.
+    /*!
+     * @param sub  The substance. It must not be in tabulated mode.
+     * @param Tlow  Lower temperature limit of the tables [K]
+     * @param Thigh  Upper temperature limit of the tables [K]
+     * @param Plow  Lower pressure limit of the tables [Pa]
+     * @param Phigh  Upper pressure limit of the tables [Pa]
+     * @param nT  Number of grid points along the temperature axes
+     * @param nP  Number of grid points along the pressure axis
+     * @param rtol  Relative tolerance used to validate the tables
+     */
+    SubstanceTable(Substance& sub, double Tlow, double Thigh,
+                   double Plow, double Phigh, size_t nT, size_t nP,
+                   double rtol);
+
+    //! Get the saturation pressure and the densities of the saturated liquid
+    //! and vapor at temperature *T*. Returns false if *T* is outside the
+    //! validated part of the saturation table.
+    bool satState(double T, double& Psat, double& Rhf, double& Rhv) const;
+
+    //! Get the saturation temperature at pressure *P*. Returns false if *P*
+    //! is outside the validated part of the saturation table.
+    bool Tsat(double P, double& T) const;
+
+    //! Find the single-phase state with pressure *P* where the property
+    //! *ifx* (which may be T, H or S) is equal to *x*. Returns false if this
+    //! state is outside the validated part of the tables.
+    /*!
+     * @param ifx  The given property
+     * @param x  The value of the given property
+     * @param P  Pressure [Pa]
+     * @param[out] T  Temperature [K]
+     * @param[out] v  Specific volume [m^3/kg]
+     */
+    bool state(propertyFlag::type ifx, double x, double P,
+               double& T, double& v) const;
+
+    //! The fraction of the cells of the single-phase tables which passed the
+    //! validation
+    double coverage() const;
+
+protected:
+    //! Temperature dividing the liquid and vapor parts of the single-phase
+    //! tables at ln(P) = *lnP*
+    double Tsplit(double lnP) const;
+
+    //! Temperature at reduced temperature *theta* in part *r* (0 = liquid,
+    //! 1 = vapor), where the dividing temperature is *Ts*
+    double mapT(int r, double theta, double Ts) const;
+
+    //! Interpolate ln(v), h and s in part *r* at the (fractional) pressure
+    //! index *uP* and reduced temperature *theta*. Returns false if the point
+    //! is in an invalid cell.
+    bool interpolate(int r, double uP, double theta, double* y) const;
+
+    //! Compute the properties at the grid points of row *j* of part *r*.
+    void fillRow(Substance& sub, int r, size_t j);
+
+    //! Compare the properties interpolated in part *r* at the (fractional)
+    //! pressure index *uP* and reduced temperature *theta* to those computed
+    //! by *sub*, starting from the density at grid point (*j*, *i*). Returns
+    //! true if the difference is within the tolerance.
+    bool checkPoint(Substance& sub, int r, double uP, double theta,
+                    size_t j, size_t i) const;
+
+    double m_Tlow, m_Thigh;
+    double m_Plow, m_Phigh;
+    double m_lnPlow, m_dlnP;
+    double m_Pcrit;
+    double m_R; //!< Gas constant [J/kg/K]
+    size_t m_nT, m_nP;
+    double m_rtol;
+
+    //! @name Saturation table
+    //! @{
+    size_t m_nsat; //!< Number of points (0 if the table is empty)
+    double m_dTsat; //!< Temperature increment
+    //! Logs of the saturation pressure and the densities of saturated liquid
+    //! and vapor
+    std::vector<double> m_lnPs, m_lnRhf, m_lnRhv;
+    double m_dTdlnP; //!< dT/dln(P) along the saturation curve at its end
+    std::vector<char> m_satValid; //!< Validity of each interval
+    //! @}
+
+    //! @name Single-phase tables
+    //! Data for point (j, i) of part r (0 = liquid, 1 = vapor) is stored at
+    //! index 3*(j*nT + i) of m_data[r], where j is the pressure index and i
+    //! is the reduced temperature index.
+    //! @{
+    std::vector<double> m_data[2];
+    std::vector<char> m_valid[2]; //!< Validity of each cell
+    size_t m_ncells; //!< Number of cells with non-zero width
+    size_t m_nvalid; //!< Number of valid cells with non-zero width
+    //! @}
+};
+
+}
+
+#endif
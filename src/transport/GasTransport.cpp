@@ -5,6 +5,9 @@
 #include "cantera/numerics/polyfit.h"
 #include "cantera/transport/TransportData.h"
 
+#include <ctime>
+#include <mutex>
+
 namespace Cantera
 {
 
@@ -12,6 +15,17 @@ namespace Cantera
 //! except in CK mode, where the degree is 6.
 #define COLL_INT_POLY_DEGREE 8
 
+//! number of temperatures used in generating the property fits
+static const size_t Fit_Points = 50;
+
+//! Cache of transport property fits, keyed by all of the inputs to the fits.
+//! Entries do not keep the fits alive; they are freed along with the last
+//! GasTransport object using them.
+static std::map<vector_fp, std::weak_ptr<const GasTransportFits>> s_fitCache;
+
+//! Mutex protecting access to s_fitCache
+static std::mutex s_fitCacheMutex;
+
 GasTransport::GasTransport(ThermoPhase* thermo) :
     Transport(thermo),
     m_viscmix(0.0),
@@ -28,7 +42,8 @@ GasTransport::GasTransport(ThermoPhase* thermo) :
     m_logt(0.0),
     m_t14(0.0),
     m_t32(0.0),
-    m_log_level(0)
+    m_log_level(0),
+    m_setupTime(0.0)
 {
 }
 
@@ -47,7 +62,8 @@ GasTransport::GasTransport(const GasTransport& right) :
     m_logt(0.0),
     m_t14(0.0),
     m_t32(0.0),
-    m_log_level(0)
+    m_log_level(0),
+    m_setupTime(0.0)
 {
 }
 
@@ -75,26 +91,17 @@ GasTransport& GasTransport::operator=(const GasTransport& right)
     m_logt = right.m_logt;
     m_t14 = right.m_t14;
     m_t32 = right.m_t32;
-    m_diffcoeffs = right.m_diffcoeffs;
     m_bdiff = right.m_bdiff;
-    m_condcoeffs = right.m_condcoeffs;
-    m_poly = right.m_poly;
-    m_omega22_poly = right.m_omega22_poly;
-    m_astar_poly = right.m_astar_poly;
-    m_bstar_poly = right.m_bstar_poly;
-    m_cstar_poly = right.m_cstar_poly;
     m_zrot = right.m_zrot;
     m_polar = right.m_polar;
     m_alpha = right.m_alpha;
     m_eps = right.m_eps;
     m_sigma = right.m_sigma;
-    m_reducedMass = right.m_reducedMass;
-    m_diam = right.m_diam;
-    m_epsilon = right.m_epsilon;
     m_dipole = right.m_dipole;
-    m_delta = right.m_delta;
+    m_fits = right.m_fits;
     m_w_ac = right.m_w_ac;
     m_log_level = right.m_log_level;
+    m_setupTime = right.m_setupTime;
 
     return *this;
 }
@@ -179,13 +186,13 @@ void GasTransport::updateSpeciesViscosities()
     update_T();
     if (m_mode == CK_Mode) {
         for (size_t k = 0; k < m_nsp; k++) {
-            m_visc[k] = exp(dot4(m_polytempvec, m_visccoeffs[k]));
+            m_visc[k] = exp(dot4(m_polytempvec, m_fits->visccoeffs[k]));
             m_sqvisc[k] = sqrt(m_visc[k]);
         }
     } else {
         for (size_t k = 0; k < m_nsp; k++) {
             // the polynomial fit is done for sqrt(visc/sqrt(T))
-            m_sqvisc[k] = m_t14 * dot5(m_polytempvec, m_visccoeffs[k]);
+            m_sqvisc[k] = m_t14 * dot5(m_polytempvec, m_fits->visccoeffs[k]);
             m_visc[k] = (m_sqvisc[k] * m_sqvisc[k]);
         }
     }
@@ -200,7 +207,7 @@ void GasTransport::updateDiff_T()
     if (m_mode == CK_Mode) {
         for (size_t i = 0; i < m_nsp; i++) {
             for (size_t j = i; j < m_nsp; j++) {
-                m_bdiff(i,j) = exp(dot4(m_polytempvec, m_diffcoeffs[ic]));
+                m_bdiff(i,j) = exp(dot4(m_polytempvec, m_fits->diffcoeffs[ic]));
                 m_bdiff(j,i) = m_bdiff(i,j);
                 ic++;
             }
@@ -209,7 +216,7 @@ void GasTransport::updateDiff_T()
         for (size_t i = 0; i < m_nsp; i++) {
             for (size_t j = i; j < m_nsp; j++) {
                 m_bdiff(i,j) = m_temp * m_sqrt_t*dot5(m_polytempvec,
-                                                      m_diffcoeffs[ic]);
+                                                      m_fits->diffcoeffs[ic]);
                 m_bdiff(j,i) = m_bdiff(i,j);
                 ic++;
             }
@@ -372,16 +379,12 @@ void GasTransport::init(thermo_t* thermo, int mode, int log_level)
 
 void GasTransport::setupMM()
 {
-    m_epsilon.resize(m_nsp, m_nsp, 0.0);
-    m_delta.resize(m_nsp, m_nsp, 0.0);
-    m_reducedMass.resize(m_nsp, m_nsp, 0.0);
-    m_dipole.resize(m_nsp, m_nsp, 0.0);
-    m_diam.resize(m_nsp, m_nsp, 0.0);
+    clock_t t0 = clock();
+    m_dipole.resize(m_nsp, 0.0);
     m_crot.resize(m_nsp);
     m_zrot.resize(m_nsp);
     m_polar.resize(m_nsp, false);
     m_alpha.resize(m_nsp, 0.0);
-    m_poly.resize(m_nsp);
     m_sigma.resize(m_nsp);
     m_eps.resize(m_nsp);
     m_w_ac.resize(m_nsp);
@@ -389,9 +392,44 @@ void GasTransport::setupMM()
     const vector_fp& mw = m_thermo->molecularWeights();
     getTransportData();
 
-    for (size_t i = 0; i < m_nsp; i++) {
-        m_poly[i].resize(m_nsp);
+    // Collect all of the inputs to the fits. If another object has already
+    // computed the fits for identical inputs, use those.
+    vector_fp key {static_cast<double>(m_mode), m_thermo->minTemp(),
+                   m_thermo->maxTemp()};
+    for (size_t k = 0; k < m_nsp; k++) {
+        double data[] = {mw[k], m_crot[k], m_sigma[k], m_eps[k],
+                         m_dipole[k], m_alpha[k], m_zrot[k], m_w_ac[k]};
+        key.insert(key.end(), std::begin(data), std::end(data));
+    }
+    double dt = (m_thermo->maxTemp() - m_thermo->minTemp())/(Fit_Points-1);
+    vector_fp cp_R(m_nsp);
+    for (size_t n = 0; n < Fit_Points; n++) {
+        m_thermo->setTemperature(m_thermo->minTemp() + dt*n);
+        m_thermo->getCp_R_ref(cp_R.data());
+        key.insert(key.end(), cp_R.begin(), cp_R.end());
+    }
+
+    std::unique_lock<std::mutex> cacheLock(s_fitCacheMutex);
+    auto cached = s_fitCache.find(key);
+    // Skip the cache if the details of the fits are to be printed
+    if (cached != s_fitCache.end() && m_log_level == 0) {
+        m_fits = cached->second.lock();
+        if (m_fits) {
+            m_setupTime = (clock() - t0) / (1.0 * CLOCKS_PER_SEC);
+            return;
+        }
     }
+    cacheLock.unlock();
+
+    auto fits = std::make_shared<GasTransportFits>();
+    fits->epsilon.resize(m_nsp, m_nsp, 0.0);
+    fits->delta.resize(m_nsp, m_nsp, 0.0);
+    fits->reducedMass.resize(m_nsp, m_nsp, 0.0);
+    fits->dipole.resize(m_nsp, m_nsp, 0.0);
+    fits->diam.resize(m_nsp, m_nsp, 0.0);
+    fits->poly.resize(m_nsp, vector_int(m_nsp));
+    // getBinDiffCorrection() reads the collision parameters through m_fits
+    m_fits = fits;
 
     double tstar_min = 1.e8, tstar_max = 0.0;
     double f_eps, f_sigma;
@@ -399,36 +437,37 @@ void GasTransport::setupMM()
     for (size_t i = 0; i < m_nsp; i++) {
         for (size_t j = i; j < m_nsp; j++) {
             // the reduced mass
-            m_reducedMass(i,j) = mw[i] * mw[j] / (Avogadro * (mw[i] + mw[j]));
+            fits->reducedMass(i,j) = mw[i] * mw[j] /
+                                     (Avogadro * (mw[i] + mw[j]));
 
             // hard-sphere diameter for (i,j) collisions
-            m_diam(i,j) = 0.5*(m_sigma[i] + m_sigma[j]);
+            fits->diam(i,j) = 0.5*(m_sigma[i] + m_sigma[j]);
 
             // the effective well depth for (i,j) collisions
-            m_epsilon(i,j) = sqrt(m_eps[i]*m_eps[j]);
+            fits->epsilon(i,j) = sqrt(m_eps[i]*m_eps[j]);
 
             // The polynomial fits of collision integrals vs. T*
             // will be done for the T* from tstar_min to tstar_max
-            tstar_min = std::min(tstar_min, Boltzmann * m_thermo->minTemp()/m_epsilon(i,j));
-            tstar_max = std::max(tstar_max, Boltzmann * m_thermo->maxTemp()/m_epsilon(i,j));
+            tstar_min = std::min(tstar_min, Boltzmann * m_thermo->minTemp()/fits->epsilon(i,j));
+            tstar_max = std::max(tstar_max, Boltzmann * m_thermo->maxTemp()/fits->epsilon(i,j));
 
             // the effective dipole moment for (i,j) collisions
-            m_dipole(i,j) = sqrt(m_dipole(i,i)*m_dipole(j,j));
+            fits->dipole(i,j) = sqrt(m_dipole[i]*m_dipole[j]);
 
             // reduced dipole moment delta* (nondimensional)
-            double d = m_diam(i,j);
-            m_delta(i,j) = 0.5 * m_dipole(i,j)*m_dipole(i,j)
-                           / (4 * Pi * epsilon_0 * m_epsilon(i,j) * d * d * d);
+            double d = fits->diam(i,j);
+            fits->delta(i,j) = 0.5 * fits->dipole(i,j)*fits->dipole(i,j)
+                / (4 * Pi * epsilon_0 * fits->epsilon(i,j) * d * d * d);
             makePolarCorrections(i, j, f_eps, f_sigma);
-            m_diam(i,j) *= f_sigma;
-            m_epsilon(i,j) *= f_eps;
+            fits->diam(i,j) *= f_sigma;
+            fits->epsilon(i,j) *= f_eps;
 
             // properties are symmetric
-            m_reducedMass(j,i) = m_reducedMass(i,j);
-            m_diam(j,i) = m_diam(i,j);
-            m_epsilon(j,i) = m_epsilon(i,j);
-            m_dipole(j,i) = m_dipole(i,j);
-            m_delta(j,i) = m_delta(i,j);
+            fits->reducedMass(j,i) = fits->reducedMass(i,j);
+            fits->diam(j,i) = fits->diam(i,j);
+            fits->epsilon(j,i) = fits->epsilon(i,j);
+            fits->dipole(j,i) = fits->dipole(i,j);
+            fits->delta(j,i) = fits->delta(i,j);
         }
     }
 
@@ -443,12 +482,30 @@ void GasTransport::setupMM()
     debuglog("*** collision_integrals ***\n", m_log_level);
     MMCollisionInt integrals;
     integrals.init(tstar_min, tstar_max, m_log_level);
-    fitCollisionIntegrals(integrals);
+    fitCollisionIntegrals(integrals, *fits);
     debuglog("*** end of collision_integrals ***\n", m_log_level);
     // make polynomial fits
     debuglog("*** property fits ***\n", m_log_level);
-    fitProperties(integrals);
+    fitProperties(integrals, *fits);
     debuglog("*** end of property fits ***\n", m_log_level);
+
+    cacheLock.lock();
+    // Drop the entries for fits which are no longer used by any object
+    for (auto iter = s_fitCache.begin(); iter != s_fitCache.end();) {
+        if (iter->second.expired()) {
+            iter = s_fitCache.erase(iter);
+        } else {
+            ++iter;
+        }
+    }
+    s_fitCache[key] = fits;
+    m_setupTime = (clock() - t0) / (1.0 * CLOCKS_PER_SEC);
+}
+
+void GasTransport::clearFitCache()
+{
+    std::unique_lock<std::mutex> cacheLock(s_fitCacheMutex);
+    s_fitCache.clear();
 }
 
 void GasTransport::getTransportData()
@@ -472,7 +529,7 @@ void GasTransport::getTransportData()
 
         m_sigma[k] = sptran->diameter;
         m_eps[k] = sptran->well_depth;
-        m_dipole(k,k) = sptran->dipole;
+        m_dipole[k] = sptran->dipole;
         m_polar[k] = (sptran->dipole > 0);
         m_alpha[k] = sptran->polarizability;
         m_zrot[k] = sptran->rotational_relaxation;
@@ -498,14 +555,15 @@ void GasTransport::makePolarCorrections(size_t i, size_t j,
     d3np = pow(m_sigma[knp],3);
     d3p = pow(m_sigma[kp],3);
     alpha_star = m_alpha[knp]/d3np;
-    mu_p_star = m_dipole(kp,kp)/sqrt(4 * Pi * epsilon_0 * d3p * m_eps[kp]);
+    mu_p_star = m_dipole[kp]/sqrt(4 * Pi * epsilon_0 * d3p * m_eps[kp]);
     xi = 1.0 + 0.25 * alpha_star * mu_p_star * mu_p_star *
          sqrt(m_eps[kp]/m_eps[knp]);
     f_sigma = pow(xi, -1.0/6.0);
     f_eps = xi*xi;
 }
 
-void GasTransport::fitCollisionIntegrals(MMCollisionInt& integrals)
+void GasTransport::fitCollisionIntegrals(MMCollisionInt& integrals,
+                                         GasTransportFits& fits)
 {
     double dstar;
 
@@ -524,13 +582,13 @@ void GasTransport::fitCollisionIntegrals(MMCollisionInt& integrals)
         for (size_t j = i; j < m_nsp; j++) {
             // Chemkin fits only delta* = 0
             if (m_mode != CK_Mode) {
-                dstar = m_delta(i,j);
+                dstar = fits.delta(i,j);
             } else {
                 dstar = 0.0;
             }
 
-            // if a fit has already been generated for delta* = m_delta(i,j),
-            // then use it. Otherwise, make a new fit, and add m_delta(i,j) to
+            // if a fit has already been generated for delta* = delta(i,j),
+            // then use it. Otherwise, make a new fit, and add delta(i,j) to
             // the list of delta* values for which fits have been done.
 
             // 'find' returns a pointer to end() if not found
@@ -540,26 +598,27 @@ void GasTransport::fitCollisionIntegrals(MMCollisionInt& integrals)
                 vector_fp co22(degree+1);
                 integrals.fit(degree, dstar, ca.data(), cb.data(), cc.data());
                 integrals.fit_omega22(degree, dstar, co22.data());
-                m_omega22_poly.push_back(co22);
-                m_astar_poly.push_back(ca);
-                m_bstar_poly.push_back(cb);
-                m_cstar_poly.push_back(cc);
-                m_poly[i][j] = static_cast<int>(m_astar_poly.size()) - 1;
+                fits.omega22_poly.push_back(co22);
+                fits.astar_poly.push_back(ca);
+                fits.bstar_poly.push_back(cb);
+                fits.cstar_poly.push_back(cc);
+                fits.poly[i][j] = static_cast<int>(fits.astar_poly.size()) - 1;
                 fitlist.push_back(dstar);
             } else {
                 // delta* found in fitlist, so just point to this polynomial
-                m_poly[i][j] = static_cast<int>((dptr - fitlist.begin()));
+                fits.poly[i][j] = static_cast<int>((dptr - fitlist.begin()));
             }
-            m_poly[j][i] = m_poly[i][j];
+            fits.poly[j][i] = fits.poly[i][j];
         }
     }
 }
 
-void GasTransport::fitProperties(MMCollisionInt& integrals)
+void GasTransport::fitProperties(MMCollisionInt& integrals,
+                                 GasTransportFits& fits)
 {
     int ndeg = 0;
     // number of points to use in generating fit data
-    const size_t np = 50;
+    const size_t np = Fit_Points;
     int degree = (m_mode == CK_Mode ? 3 : 4);
     double dt = (m_thermo->maxTemp() - m_thermo->minTemp())/(np-1);
     vector_fp tlog(np), spvisc(np), spcond(np);
@@ -604,11 +663,11 @@ void GasTransport::fitProperties(MMCollisionInt& integrals)
             cp_R = cp_R_all[k];
             double tstar = Boltzmann * t/ m_eps[k];
             sqrt_T = sqrt(t);
-            double om22 = integrals.omega22(tstar, m_delta(k,k));
-            om11 = integrals.omega11(tstar, m_delta(k,k));
+            double om22 = integrals.omega22(tstar, fits.delta(k,k));
+            om11 = integrals.omega11(tstar, fits.delta(k,k));
 
             // self-diffusion coefficient, without polar corrections
-            diffcoeff = 3.0/16.0 * sqrt(2.0 * Pi/m_reducedMass(k,k)) *
+            diffcoeff = 3.0/16.0 * sqrt(2.0 * Pi/fits.reducedMass(k,k)) *
                         pow((Boltzmann * t), 1.5)/
                         (Pi * m_sigma[k] * m_sigma[k] * om11);
 
@@ -689,8 +748,8 @@ void GasTransport::fitProperties(MMCollisionInt& integrals)
             mxerr_cond = std::max(mxerr_cond, fabs(err));
             mxrelerr_cond = std::max(mxrelerr_cond, fabs(relerr));
         }
-        m_visccoeffs.push_back(c);
-        m_condcoeffs.push_back(c2);
+        fits.visccoeffs.push_back(c);
+        fits.condcoeffs.push_back(c2);
 
         if (m_log_level >= 2) {
             writelog(m_thermo->speciesName(k) + ": [" + vec2str(c) + "]\n");
@@ -709,7 +768,7 @@ void GasTransport::fitProperties(MMCollisionInt& integrals)
         if (m_log_level >= 2) {
             for (size_t k = 0; k < m_nsp; k++) {
                 writelog(m_thermo->speciesName(k) + ": [" +
-                         vec2str(m_condcoeffs[k]) + "]\n");
+                         vec2str(fits.condcoeffs[k]) + "]\n");
             }
         }
         writelogf("Maximum conductivity absolute error:  %12.6g\n", mxerr_cond);
@@ -731,11 +790,11 @@ void GasTransport::fitProperties(MMCollisionInt& integrals)
         for (size_t j = k; j < m_nsp; j++) {
             for (size_t n = 0; n < np; n++) {
                 double t = m_thermo->minTemp() + dt*n;
-                eps = m_epsilon(j,k);
+                eps = fits.epsilon(j,k);
                 double tstar = Boltzmann * t/eps;
-                sigma = m_diam(j,k);
-                om11 = integrals.omega11(tstar, m_delta(j,k));
-                diffcoeff = 3.0/16.0 * sqrt(2.0 * Pi/m_reducedMass(k,j)) *
+                sigma = fits.diam(j,k);
+                om11 = integrals.omega11(tstar, fits.delta(j,k));
+                diffcoeff = 3.0/16.0 * sqrt(2.0 * Pi/fits.reducedMass(k,j)) *
                             pow(Boltzmann * t, 1.5) /
                             (Pi * sigma * sigma * om11);
 
@@ -771,7 +830,7 @@ void GasTransport::fitProperties(MMCollisionInt& integrals)
                 mxerr = std::max(mxerr, fabs(err));
                 mxrelerr = std::max(mxrelerr, fabs(relerr));
             }
-            m_diffcoeffs.push_back(c);
+            fits.diffcoeffs.push_back(c);
             if (m_log_level >= 2) {
                 writelog(m_thermo->speciesName(k) + "__" +
                          m_thermo->speciesName(j) + ": [" + vec2str(c) + "]\n");
@@ -803,12 +862,12 @@ void GasTransport::getBinDiffCorrection(double t, MMCollisionInt& integrals,
     double tstar1 = Boltzmann * t / m_eps[k];
     double tstar2 = Boltzmann * t / m_eps[j];
     double tstar12 = Boltzmann * t / sqrt(m_eps[k] * m_eps[j]);
-    double om22_1 = integrals.omega22(tstar1, m_delta(k,k));
-    double om22_2 = integrals.omega22(tstar2, m_delta(j,j));
-    double om11_12 = integrals.omega11(tstar12, m_delta(k,j));
-    double astar_12 = integrals.astar(tstar12, m_delta(k,j));
-    double bstar_12 = integrals.bstar(tstar12, m_delta(k,j));
-    double cstar_12 = integrals.cstar(tstar12, m_delta(k,j));
+    double om22_1 = integrals.omega22(tstar1, m_fits->delta(k,k));
+    double om22_2 = integrals.omega22(tstar2, m_fits->delta(j,j));
+    double om11_12 = integrals.omega11(tstar12, m_fits->delta(k,j));
+    double astar_12 = integrals.astar(tstar12, m_fits->delta(k,j));
+    double bstar_12 = integrals.bstar(tstar12, m_fits->delta(k,j));
+    double cstar_12 = integrals.cstar(tstar12, m_fits->delta(k,j));
 
     double cnst = sigratio * sqrt(2.0*w2/wsum) * 2.0 * w1*w1/(wsum * w2);
     double p1 = cnst * om22_1 / om11_12;
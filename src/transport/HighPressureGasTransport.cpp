@@ -310,7 +310,7 @@ doublereal HighPressureGasTransport::viscosity()
             MW_L = m_mw[i];        }
 
         // Calculate reduced dipole moment for polar correction term:
-        doublereal mu_ri = 52.46*100000*m_dipole(i,i)*m_dipole(i,i)
+        doublereal mu_ri = 52.46*100000*m_dipole[i]*m_dipole[i]
             *Pcrit_i(i)/(Tc*Tc);
         if (mu_ri < 0.022) {
             FP_mix_o += molefracs[i];
@@ -155,11 +155,11 @@ void MixTransport::updateCond_T()
 {
     if (m_mode == CK_Mode) {
         for (size_t k = 0; k < m_nsp; k++) {
-            m_cond[k] = exp(dot4(m_polytempvec, m_condcoeffs[k]));
+            m_cond[k] = exp(dot4(m_polytempvec, m_fits->condcoeffs[k]));
         }
     } else {
         for (size_t k = 0; k < m_nsp; k++) {
-            m_cond[k] = m_sqrt_t * dot5(m_polytempvec, m_condcoeffs[k]);
+            m_cond[k] = m_sqrt_t * dot5(m_polytempvec, m_fits->condcoeffs[k]);
         }
     }
     m_spcond_ok = true;
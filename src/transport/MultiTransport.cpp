@@ -10,6 +10,7 @@
 #include "cantera/transport/MultiTransport.h"
 #include "cantera/thermo/IdealGasPhase.h"
 #include "cantera/base/stringUtils.h"
+#include "cantera/numerics/ctlapack.h"
 
 using namespace std;
 
@@ -36,6 +37,11 @@ doublereal Frot(doublereal tr, doublereal sqtr)
 
 MultiTransport::MultiTransport(thermo_t* thermo)
     : GasTransport(thermo)
+    , m_lmatrix_factor_ok(false)
+    , m_lmatrix_maxiter(0)
+    , m_lmatrix_rtol(1.0e-8)
+    , m_nLfactor(0)
+    , m_nLiter(0)
 {
 }
 
@@ -47,6 +53,7 @@ void MultiTransport::init(ThermoPhase* thermo, int mode, int log_level)
     m_Lmatrix.resize(3*m_nsp, 3*m_nsp);
     m_a.resize(3*m_nsp, 1.0);
     m_b.resize(3*m_nsp, 0.0);
+    m_Lresid.resize(3*m_nsp, 0.0);
     m_aa.resize(m_nsp, m_nsp, 0.0);
     m_molefracs_last.resize(m_nsp, -1.0);
     m_frot_298.resize(m_nsp);
@@ -61,6 +68,7 @@ void MultiTransport::init(ThermoPhase* thermo, int mode, int log_level)
     m_abc_ok = false;
     m_l0000_ok = false;
     m_lmatrix_soln_ok = false;
+    m_lmatrix_factor_ok = false;
     m_thermal_tlast = 0.0;
 
     // some work space
@@ -72,7 +80,7 @@ void MultiTransport::init(ThermoPhase* thermo, int mode, int log_level)
     m_log_eps_k.resize(m_nsp, m_nsp);
     for (size_t i = 0; i < m_nsp; i++) {
         for (size_t j = i; j < m_nsp; j++) {
-            m_log_eps_k(i,j) = log(m_epsilon(i,j)/Boltzmann);
+            m_log_eps_k(i,j) = log(m_fits->epsilon(i,j)/Boltzmann);
             m_log_eps_k(j,i) = m_log_eps_k(i,j);
         }
     }
@@ -154,14 +162,78 @@ void MultiTransport::solveLMatrixEquation()
     eval_L0110();
     eval_L0101(m_molefracs.data());
 
-    // Solve it using GMRES or LU decomposition. The last solution in m_a should
-    // provide a good starting guess, so convergence should be fast.
-    m_a = m_b;
-    solve(m_Lmatrix, m_a.data());
+    if (m_lmatrix_maxiter == 0) {
+        // Solve it using LU decomposition
+        m_a = m_b;
+        solve(m_Lmatrix, m_a.data());
+        m_nLfactor++;
+        // L matrix is overwritten with LU decomposition
+        m_l0000_ok = false;
+    } else if (!refineLMatrixSolution()) {
+        // Either there is no factorization to reuse yet, or the state has
+        // changed too much for the old one to be a good preconditioner, so
+        // factorize the L matrix at the current state. The L matrix itself is
+        // kept to compute residuals at subsequent states.
+        m_Lfactor = m_Lmatrix;
+        m_lmatrix_factor_ok = false;
+        m_a = m_b;
+        solve(m_Lfactor, m_a.data());
+        m_lmatrix_factor_ok = true;
+        m_nLfactor++;
+    }
     m_lmatrix_soln_ok = true;
     m_molefracs_last = m_molefracs;
-    // L matrix is overwritten with LU decomposition
-    m_l0000_ok = false;
+}
+
+bool MultiTransport::refineLMatrixSolution()
+{
+    if (!m_lmatrix_factor_ok) {
+        return false;
+    }
+
+    // The last solution in m_a provides the starting guess. Each iteration
+    // computes the residual with the current L matrix, and a correction with
+    // the LU factorization of the L matrix from an earlier state.
+    size_t n = 3*m_nsp;
+    for (size_t iter = 0; iter < m_lmatrix_maxiter; iter++) {
+        multiply(m_Lmatrix, m_a.data(), m_Lresid.data());
+        for (size_t i = 0; i < n; i++) {
+            m_Lresid[i] = m_b[i] - m_Lresid[i];
+        }
+        int info = 0;
+        ct_dgetrs(ctlapack::NoTranspose, n, 1, m_Lfactor.ptrColumn(0), n,
+                  &m_Lfactor.ipiv()[0], m_Lresid.data(), n, info);
+        m_nLiter++;
+        if (info != 0) {
+            return false;
+        }
+
+        double amax = 0.0;
+        double dmax = 0.0;
+        for (size_t i = 0; i < n; i++) {
+            m_a[i] += m_Lresid[i];
+            amax = std::max(amax, fabs(m_a[i]));
+            dmax = std::max(dmax, fabs(m_Lresid[i]));
+        }
+        if (dmax <= m_lmatrix_rtol * amax) {
+            return true;
+        }
+    }
+    return false;
+}
+
+void MultiTransport::setLMatrixSolver(size_t maxIterations, double rtol)
+{
+    if (rtol <= 0.0) {
+        throw CanteraError("MultiTransport::setLMatrixSolver",
+                           "Tolerance must be positive. Got {}", rtol);
+    }
+    m_lmatrix_maxiter = maxIterations;
+    m_lmatrix_rtol = rtol;
+    m_lmatrix_factor_ok = false;
+    m_lmatrix_soln_ok = false;
+    m_nLfactor = 0;
+    m_nLiter = 0;
 }
 
 void MultiTransport::getSpeciesFluxes(size_t ndim, const doublereal* const grad_T,
@@ -453,17 +525,17 @@ void MultiTransport::updateThermal_T()
     for (size_t i = 0; i < m_nsp; i++) {
         for (size_t j = i; j < m_nsp; j++) {
             z = m_logt - m_log_eps_k(i,j);
-            ipoly = m_poly[i][j];
+            ipoly = m_fits->poly[i][j];
             if (m_mode == CK_Mode) {
-                m_om22(i,j) = poly6(z, m_omega22_poly[ipoly].data());
-                m_astar(i,j) = poly6(z, m_astar_poly[ipoly].data());
-                m_bstar(i,j) = poly6(z, m_bstar_poly[ipoly].data());
-                m_cstar(i,j) = poly6(z, m_cstar_poly[ipoly].data());
+                m_om22(i,j) = poly6(z, m_fits->omega22_poly[ipoly].data());
+                m_astar(i,j) = poly6(z, m_fits->astar_poly[ipoly].data());
+                m_bstar(i,j) = poly6(z, m_fits->bstar_poly[ipoly].data());
+                m_cstar(i,j) = poly6(z, m_fits->cstar_poly[ipoly].data());
             } else {
-                m_om22(i,j) = poly8(z, m_omega22_poly[ipoly].data());
-                m_astar(i,j) = poly8(z, m_astar_poly[ipoly].data());
-                m_bstar(i,j) = poly8(z, m_bstar_poly[ipoly].data());
-                m_cstar(i,j) = poly8(z, m_cstar_poly[ipoly].data());
+                m_om22(i,j) = poly8(z, m_fits->omega22_poly[ipoly].data());
+                m_astar(i,j) = poly8(z, m_fits->astar_poly[ipoly].data());
+                m_bstar(i,j) = poly8(z, m_fits->bstar_poly[ipoly].data());
+                m_cstar(i,j) = poly8(z, m_fits->cstar_poly[ipoly].data());
             }
             m_om22(j,i) = m_om22(i,j);
             m_astar(j,i) = m_astar(i,j);
@@ -90,6 +90,7 @@ void TransportFactory::deleteFactory()
     std::unique_lock<std::mutex> transportLock(transport_mutex);
     delete s_factory;
     s_factory = 0;
+    GasTransport::clearFitCache();
 }
 
 std::string TransportFactory::modelName(int model)
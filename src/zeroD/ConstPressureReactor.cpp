@@ -120,11 +120,21 @@ void ConstPressureReactor::evalEqs(doublereal time, doublereal* y,
     } else {
         ydot[1] = 0.0;
     }
+    evalRhsFunction(time, y, ydot, 1, 2);
 
     // reset sensitivity parameters
     resetSensitivity(params);
 }
 
+void ConstPressureReactor::getProductionRateWeights(const double* lambda,
+                                                    double* w)
+{
+    const vector_fp& mw = m_thermo->molecularWeights();
+    for (size_t k = 0; k < m_nsp; k++) {
+        w[k] = lambda[k+2] * m_vol * mw[k] / m_mass;
+    }
+}
+
 size_t ConstPressureReactor::componentIndex(const string& nm) const
 {
     size_t k = speciesIndex(nm);
@@ -133,10 +133,26 @@ void IdealGasConstPressureReactor::evalEqs(doublereal time, doublereal* y,
     } else {
         ydot[1] = 0.0;
     }
+    evalRhsFunction(time, y, ydot, 1, 2);
 
     resetSensitivity(params);
 }
 
+void IdealGasConstPressureReactor::getProductionRateWeights(
+    const double* lambda, double* w)
+{
+    const vector_fp& mw = m_thermo->molecularWeights();
+    double lambda_T = 0.0;
+    if (m_energy) {
+        m_thermo->getPartialMolarEnthalpies(&m_hk[0]);
+        lambda_T = lambda[1] / (m_mass * m_thermo->cp_mass());
+    }
+    for (size_t k = 0; k < m_nsp; k++) {
+        // species equations and heat release
+        w[k] = (lambda[k+2] * mw[k] / m_mass - lambda_T * m_hk[k]) * m_vol;
+    }
+}
+
 size_t IdealGasConstPressureReactor::componentIndex(const string& nm) const
 {
     size_t k = speciesIndex(nm);
@@ -141,10 +141,25 @@ void IdealGasReactor::evalEqs(doublereal time, doublereal* y,
     } else {
         ydot[2] = 0;
     }
+    evalRhsFunction(time, y, ydot, 2, 3);
 
     resetSensitivity(params);
 }
 
+void IdealGasReactor::getProductionRateWeights(const double* lambda, double* w)
+{
+    const vector_fp& mw = m_thermo->molecularWeights();
+    double lambda_T = 0.0;
+    if (m_energy) {
+        m_thermo->getPartialMolarIntEnergies(&m_uk[0]);
+        lambda_T = lambda[2] / (m_mass * m_thermo->cv_mass());
+    }
+    for (size_t k = 0; k < m_nsp; k++) {
+        // species equations and heat release
+        w[k] = (lambda[k+3] * mw[k] / m_mass - lambda_T * m_uk[k]) * m_vol;
+    }
+}
+
 size_t IdealGasReactor::componentIndex(const string& nm) const
 {
     size_t k = speciesIndex(nm);
@@ -0,0 +1,275 @@
+//! @file PlugFlowReactor.cpp A steady plug flow reactor integrated in space
+
+#include "cantera/zeroD/PlugFlowReactor.h"
+#include "cantera/thermo/ThermoPhase.h"
+#include "cantera/thermo/SurfPhase.h"
+#include "cantera/kinetics/InterfaceKinetics.h"
+#include "cantera/numerics/Func1.h"
+
+using namespace std;
+
+namespace Cantera
+{
+
+PlugFlowReactor::PlugFlowReactor(ThermoPhase& gas, Kinetics& kin) :
+    m_gas(gas),
+    m_kin(kin),
+    m_surfkin(0),
+    m_surf(0),
+    m_nsp(gas.nSpecies()),
+    m_surfStart(0),
+    m_area(0),
+    m_surfArea(0),
+    m_U(0),
+    m_Tw(0),
+    m_energy(true),
+    m_integ(0),
+    m_rtol(1.0e-9),
+    m_atol(1.0e-15),
+    m_maxstep(0.0),
+    m_init(false),
+    m_integrator_init(false),
+    m_mdot0(1.0),
+    m_P(0.0),
+    m_z(0.0),
+    m_mdot(1.0),
+    m_tau(0.0),
+    m_wdot(kin.nTotalSpecies()),
+    m_hk(m_nsp)
+{
+    if (&kin.thermo(0) != &gas || kin.nPhases() != 1) {
+        throw CanteraError("PlugFlowReactor::PlugFlowReactor",
+                           "The kinetics manager must be for the gas phase "
+                           "only.");
+    }
+    setInletState();
+
+    m_integ = newIntegrator("CVODE");
+    // use backward differencing, with a full Jacobian computed
+    // numerically, and use a Newton linear iterator
+    m_integ->setMethod(BDF_Method);
+    m_integ->setProblemType(DENSE + NOJAC);
+    m_integ->setIterator(Newton_Iter);
+}
+
+PlugFlowReactor::~PlugFlowReactor()
+{
+    delete m_integ;
+}
+
+void PlugFlowReactor::setSurface(InterfaceKinetics& surf)
+{
+    size_t ns = surf.surfacePhaseIndex();
+    if (ns == npos) {
+        throw CanteraError("PlugFlowReactor::setSurface",
+                           "The kinetics manager contains no surface phase.");
+    }
+    for (size_t n = 0; n < surf.nPhases(); n++) {
+        if (&surf.thermo(n) == &m_gas) {
+            m_surfkin = &surf;
+            m_surf = dynamic_cast<SurfPhase*>(&surf.thermo(ns));
+            m_surfStart = surf.kineticsSpeciesIndex(0, n);
+            m_sdot.resize(surf.nTotalSpecies());
+            m_integrator_init = false;
+            return;
+        }
+    }
+    throw CanteraError("PlugFlowReactor::setSurface",
+                       "The gas is not one of the phases of the surface.");
+}
+
+void PlugFlowReactor::setInletState()
+{
+    m_gas.saveState(m_inlet);
+    m_init = false;
+}
+
+void PlugFlowReactor::setMassFlowRate(double mdot)
+{
+    if (mdot <= 0.0) {
+        throw CanteraError("PlugFlowReactor::setMassFlowRate",
+                           "The mass flow rate must be positive.");
+    }
+    m_mdot0 = mdot;
+    m_mdot = mdot;
+    m_init = false;
+}
+
+void PlugFlowReactor::setTolerances(double rtol, double atol)
+{
+    if (rtol >= 0.0) {
+        m_rtol = rtol;
+    }
+    if (atol >= 0.0) {
+        m_atol = atol;
+    }
+    m_integrator_init = false;
+}
+
+void PlugFlowReactor::setMaxStepSize(double maxstep)
+{
+    m_maxstep = maxstep;
+    m_integrator_init = false;
+}
+
+double PlugFlowReactor::area(double z) const
+{
+    return m_area ? m_area->eval(z) : 1.0;
+}
+
+double PlugFlowReactor::surfaceArea(double z) const
+{
+    if (!m_surfkin) {
+        return 0.0;
+    }
+    return m_surfArea ? m_surfArea->eval(z) : 2.0 * sqrt(Pi * area(z));
+}
+
+double PlugFlowReactor::speed() const
+{
+    return m_mdot / (m_gas.density() * area(m_z));
+}
+
+void PlugFlowReactor::getState(double* y)
+{
+    y[0] = m_gas.temperature();
+    y[1] = m_mdot;
+    y[2] = m_tau;
+    m_gas.getMassFractions(y + offset_Y);
+}
+
+void PlugFlowReactor::initialize(double z0)
+{
+    m_gas.restoreState(m_inlet);
+    m_P = m_gas.pressure();
+    m_z = z0;
+    m_mdot = m_mdot0;
+    m_tau = 0.0;
+    if (m_surfkin) {
+        m_surf->setState_TP(m_gas.temperature(), m_P);
+        m_surfkin->solvePseudoSteadyStateProblem();
+    }
+    m_integ->setTolerances(m_rtol, m_atol);
+    m_integ->setMaxStepSize(m_maxstep);
+    m_integ->initialize(z0, *this);
+    m_init = true;
+    m_integrator_init = true;
+}
+
+void PlugFlowReactor::reinitialize()
+{
+    // Continue from the current solution, rather than from the inlet state
+    updateState(m_z, m_integ->solution());
+    m_integ->setTolerances(m_rtol, m_atol);
+    m_integ->setMaxStepSize(m_maxstep);
+    m_integ->initialize(m_z, *this);
+    m_integrator_init = true;
+}
+
+void PlugFlowReactor::updateState(double z, const double* y)
+{
+    m_z = z;
+    m_mdot = y[1];
+    m_tau = y[2];
+    m_gas.setMassFractions_NoNorm(y + offset_Y);
+    m_gas.setState_TP(y[0], m_P);
+    if (m_surfkin) {
+        m_surf->setState_TP(y[0], m_P);
+        m_surfkin->solvePseudoSteadyStateProblem();
+    }
+}
+
+void PlugFlowReactor::eval(double z, double* y, double* ydot, double* p)
+{
+    updateState(z, y);
+    double A = area(z);
+    double as = surfaceArea(z);
+    const vector_fp& mw = m_gas.molecularWeights();
+
+    // Molar production rates of each gas species per unit length
+    m_kin.getNetProductionRates(m_wdot.data());
+    for (size_t k = 0; k < m_nsp; k++) {
+        m_wdot[k] *= A;
+    }
+    if (m_surfkin) {
+        m_surfkin->getNetProductionRates(m_sdot.data());
+        for (size_t k = 0; k < m_nsp; k++) {
+            m_wdot[k] += as * m_sdot[m_surfStart + k];
+        }
+    }
+
+    // Mass flow rate
+    double dmdot = 0.0;
+    if (m_surfkin) {
+        for (size_t k = 0; k < m_nsp; k++) {
+            dmdot += as * m_sdot[m_surfStart + k] * mw[k];
+        }
+    }
+    ydot[1] = dmdot;
+
+    // Species
+    for (size_t k = 0; k < m_nsp; k++) {
+        ydot[k + offset_Y] = (m_wdot[k] * mw[k] - y[k + offset_Y] * dmdot)
+                             / m_mdot;
+    }
+
+    // Energy
+    if (m_energy) {
+        m_gas.getPartialMolarEnthalpies(m_hk.data());
+        double q = (m_U && m_Tw) ? m_U->eval(z) * (m_Tw->eval(z) - y[0]) : 0.0;
+        for (size_t k = 0; k < m_nsp; k++) {
+            q -= m_hk[k] * m_wdot[k];
+        }
+        ydot[0] = q / (m_mdot * m_gas.cp_mass());
+    } else {
+        ydot[0] = 0.0;
+    }
+
+    // Residence time
+    ydot[2] = m_gas.density() * A / m_mdot;
+}
+
+void PlugFlowReactor::advance(double z)
+{
+    if (!m_init) {
+        initialize(m_z);
+    } else if (!m_integrator_init) {
+        reinitialize();
+    }
+    m_integ->integrate(z);
+    updateState(z, m_integ->solution());
+}
+
+double PlugFlowReactor::step()
+{
+    if (!m_init) {
+        initialize(m_z);
+    } else if (!m_integrator_init) {
+        reinitialize();
+    }
+    double z = m_integ->step(m_z + 1.0);
+    updateState(z, m_integ->solution());
+    return z;
+}
+
+void PlugFlowReactor::solve(size_t n, const double* z, double* states,
+                            double* coverages)
+{
+    size_t nv = neq();
+    size_t nsurf = m_surf ? m_surf->nSpecies() : 0;
+    initialize(n ? z[0] : 0.0);
+    for (size_t i = 0; i < n; i++) {
+        if (i && z[i] < z[i-1]) {
+            throw CanteraError("PlugFlowReactor::solve",
+                               "The axial positions must be increasing.");
+        } else if (z[i] > m_z) {
+            advance(z[i]);
+        }
+        getState(states + i*nv);
+        if (nsurf) {
+            m_surf->getCoverages(coverages + i*nsurf);
+        }
+    }
+}
+
+}
@@ -22,8 +22,11 @@ Reactor::Reactor() :
     m_chem(false),
     m_energy(true),
     m_nv(0),
-    m_nsens(npos)
-{}
+    m_nsens(npos),
+    m_rhsFunc(0)
+{
+    m_rhsData.userData = 0;
+}
 
 void Reactor::setKineticsMgr(Kinetics& kin)
 {
@@ -271,9 +274,48 @@ void Reactor::evalEqs(doublereal time, doublereal* y,
     }
 
     ydot[0] = dmdt;
+    evalRhsFunction(time, y, ydot, 2, 3);
     resetSensitivity(params);
 }
 
+void Reactor::evalRhsFunction(double t, const double* y, double* ydot,
+                              size_t energyIndex, size_t speciesIndex)
+{
+    if (!m_rhsFunc) {
+        return;
+    }
+    m_rhsHk.resize(m_nsp);
+    m_rhsUk.resize(m_nsp);
+    m_thermo->getPartialMolarEnthalpies(m_rhsHk.data());
+    m_thermo->getPartialMolarIntEnergies(m_rhsUk.data());
+
+    ReactorRhsData& d = m_rhsData;
+    d.time = t;
+    d.y = y;
+    d.ydot = ydot;
+    d.neq = m_nv;
+    d.nsp = m_nsp;
+    d.energyIndex = energyIndex;
+    d.speciesIndex = speciesIndex;
+    d.mass = m_mass;
+    d.volume = m_vol;
+    d.temperature = m_thermo->temperature();
+    d.pressure = m_thermo->pressure();
+    d.density = m_thermo->density();
+    d.cp_mass = m_thermo->cp_mass();
+    d.cv_mass = m_thermo->cv_mass();
+    d.massFractions = m_thermo->massFractions();
+    d.molecularWeights = m_thermo->molecularWeights().data();
+    d.netProductionRates = m_wdot.data();
+    d.partialMolarEnthalpies = m_rhsHk.data();
+    d.partialMolarIntEnergies = m_rhsUk.data();
+    int flag = m_rhsFunc(&d);
+    if (flag != 0) {
+        throw CanteraError("Reactor::evalRhsFunction", "User-defined function"
+            " for reactor '{}' returned error code {}", m_name, flag);
+    }
+}
+
 void Reactor::evalWalls(double t)
 {
     m_vdot = 0.0;
@@ -321,6 +363,25 @@ double Reactor::evalSurfaces(double t, double* ydot)
     return mdot_surf;
 }
 
+std::vector<std::pair<size_t, size_t> > Reactor::surfaceCoverageRanges()
+{
+    // The surface coverages are the last components of the solution vector
+    std::vector<std::pair<size_t, size_t> > ranges;
+    size_t loc = neq();
+    for (size_t m = 0; m < m_wall.size(); m++) {
+        SurfPhase* surf = m_wall[m]->surface(m_lr[m]);
+        if (surf) {
+            ranges.emplace_back(0, surf->nSpecies());
+            loc -= surf->nSpecies();
+        }
+    }
+    for (auto& range : ranges) {
+        range.first = loc;
+        loc += range.second;
+    }
+    return ranges;
+}
+
 void Reactor::addSensitivityReaction(size_t rxn)
 {
     if (rxn >= m_kin->nReactions()) {
@@ -346,6 +407,37 @@ std::vector<std::pair<void*, int> > Reactor::getSensitivityOrder() const
     return order;
 }
 
+void Reactor::evalReactionGradient(const double* lambda, double* grad)
+{
+    size_t nr = nReactions();
+    if (!m_chem || nr == 0) {
+        fill(grad, grad + nr, 0.0);
+        return;
+    }
+    m_thermo->restoreState(m_state);
+
+    // The net production rates depend linearly on the rates of progress, so
+    // d(ydot)/d(p_i) = sum_k d(ydot)/d(wdot_k) * nu_ki * ropnet_i
+    m_rateWeights.resize(m_nsp);
+    m_ropNet.resize(nr);
+    getProductionRateWeights(lambda, m_rateWeights.data());
+    m_kin->getReactionDelta(m_rateWeights.data(), grad);
+    m_kin->getNetRatesOfProgress(m_ropNet.data());
+    for (size_t i = 0; i < nr; i++) {
+        grad[i] *= m_ropNet[i];
+    }
+}
+
+void Reactor::getProductionRateWeights(const double* lambda, double* w)
+{
+    // Only the species equations depend on the gas phase reactions; the
+    // internal energy is unchanged.
+    const vector_fp& mw = m_thermo->molecularWeights();
+    for (size_t k = 0; k < m_nsp; k++) {
+        w[k] = lambda[k+3] * m_vol * mw[k] / m_mass;
+    }
+}
+
 size_t Reactor::speciesIndex(const string& nm) const
 {
     // check for a gas species name
@@ -1,12 +1,45 @@
 //! @file ReactorNet.cpp
 #include "cantera/zeroD/ReactorNet.h"
 #include "cantera/zeroD/FlowDevice.h"
+#include "cantera/zeroD/flowControllers.h"
 #include "cantera/zeroD/Wall.h"
+#include "cantera/kinetics/ReactionPath.h"
+#include "cantera/numerics/ctlapack.h"
+#include "cantera/numerics/DenseMatrix.h"
 
 #include <cstdio>
+#include <cstdint>
+#include <cstring>
+#include <limits>
 
 using namespace std;
 
+namespace {
+
+// Identifies data created by ReactorNet::checkpoint(). The version is
+// incremented when the layout of the data is changed.
+const uint32_t checkpointMagic = 0x4e525443; // "CTRN"
+const uint32_t checkpointVersion = 1;
+
+template <class T>
+void writeBinary(std::string& data, const T* x, size_t n)
+{
+    data.append(reinterpret_cast<const char*>(x), n * sizeof(T));
+}
+
+template <class T>
+void readBinary(const std::string& data, size_t& pos, T* x, size_t n)
+{
+    if (pos + n * sizeof(T) > data.size()) {
+        throw Cantera::CanteraError("ReactorNet::restore",
+                                    "Checkpoint data is truncated");
+    }
+    memcpy(x, data.data() + pos, n * sizeof(T));
+    pos += n * sizeof(T);
+}
+
+}
+
 namespace Cantera
 {
 
@@ -14,8 +47,11 @@ ReactorNet::ReactorNet() :
     m_integ(0), m_time(0.0), m_init(false), m_integrator_init(false),
     m_nv(0), m_rtol(1.0e-9), m_rtolsens(1.0e-4),
     m_atols(1.0e-15), m_atolsens(1.0e-4),
-    m_maxstep(0.0), m_maxErrTestFails(0),
-    m_verbose(false), m_ntotpar(0)
+    m_maxstep(0.0), m_maxErrTestFails(0), m_maxOrder(5), m_maxSteps(20000),
+    m_initialStep(0.0), m_bandUpper(-1), m_bandLower(-1),
+    m_verbose(false), m_ntotpar(0), m_linearSolverType("dense"),
+    m_gamma(0.0), m_steadyJacAge(0), m_steadyMaxSteps(500),
+    m_steadyDt0(1.0e-6), m_adjTime(0.0)
 {
     m_integ = newIntegrator("CVODE");
 
@@ -49,6 +85,43 @@ void ReactorNet::setMaxErrTestFails(int nmax)
     m_init = false;
 }
 
+void ReactorNet::setMaxOrder(int order)
+{
+    if (order < 1 || order > 5) {
+        throw CanteraError("ReactorNet::setMaxOrder",
+            "Maximum order must be between 1 and 5. Got {}.", order);
+    }
+    m_maxOrder = order;
+    m_init = false;
+}
+
+void ReactorNet::setMaxSteps(int nmax)
+{
+    if (nmax < 1) {
+        throw CanteraError("ReactorNet::setMaxSteps",
+            "Maximum number of steps must be positive. Got {}.", nmax);
+    }
+    m_maxSteps = nmax;
+    m_init = false;
+}
+
+void ReactorNet::setInitialStepSize(double h0)
+{
+    if (h0 < 0.0) {
+        throw CanteraError("ReactorNet::setInitialStepSize",
+            "Initial step size must be non-negative. Got {}.", h0);
+    }
+    m_initialStep = h0;
+    m_init = false;
+}
+
+void ReactorNet::setBandwidth(int upper, int lower)
+{
+    m_bandUpper = std::max(upper, -1);
+    m_bandLower = std::max(lower, -1);
+    m_init = false;
+}
+
 void ReactorNet::setTolerances(double rtol, double atol)
 {
     if (rtol >= 0.0) {
@@ -60,6 +133,24 @@ void ReactorNet::setTolerances(double rtol, double atol)
     m_init = false;
 }
 
+void ReactorNet::setLinearSolverType(const std::string& type)
+{
+    if (type == "dense") {
+        m_integ->setProblemType(DENSE + NOJAC);
+    } else if (type == "gmres") {
+        m_integ->setProblemType(GMRES + PRECOND);
+    } else if (type == "band") {
+        m_integ->setProblemType(BAND + NOJAC);
+    } else if (type == "diag") {
+        m_integ->setProblemType(DIAG);
+    } else {
+        throw CanteraError("ReactorNet::setLinearSolverType",
+                           "Unknown linear solver type: '{}'", type);
+    }
+    m_linearSolverType = type;
+    m_init = false;
+}
+
 void ReactorNet::setSensitivityTolerances(double rtol, double atol)
 {
     if (rtol >= 0.0) {
@@ -82,10 +173,12 @@ void ReactorNet::initialize()
     }
     size_t sensParamNumber = 0;
     m_start.assign(1, 0);
+    m_adjStart.assign(1, 0);
     for (n = 0; n < m_reactors.size(); n++) {
         Reactor& r = *m_reactors[n];
         r.initialize(m_time);
         nv = r.neq();
+        m_adjStart.push_back(m_adjStart.back() + r.nReactions());
         m_nparams.push_back(r.nSensParams());
         for (const auto& sens_obj : r.getSensitivityOrder()) {
             for (const auto& order : m_sensOrder[sens_obj]) {
@@ -107,12 +200,22 @@ void ReactorNet::initialize()
     }
 
     m_ydot.resize(m_nv,0.0);
+    if (m_linearSolverType == "gmres") {
+        initBlockJacobian();
+    }
     m_atol.resize(neq());
     fill(m_atol.begin(), m_atol.end(), m_atols);
     m_integ->setTolerances(m_rtol, neq(), m_atol.data());
     m_integ->setSensitivityTolerances(m_rtolsens, m_atolsens);
     m_integ->setMaxStepSize(m_maxstep);
     m_integ->setMaxErrTestFails(m_maxErrTestFails);
+    m_integ->setMaxOrder(m_maxOrder);
+    m_integ->setMaxSteps(m_maxSteps);
+    m_integ->setInitialStepSize(m_initialStep);
+    int maxWidth = static_cast<int>(m_nv) - 1;
+    int upper = (m_bandUpper < 0) ? maxWidth : std::min(m_bandUpper, maxWidth);
+    int lower = (m_bandLower < 0) ? maxWidth : std::min(m_bandLower, maxWidth);
+    m_integ->setBandwidth(upper, lower);
     if (m_verbose) {
         writelog("Number of equations: {:d}\n", neq());
         writelog("Maximum time step:   {:14.6g}\n", m_maxstep);
@@ -140,9 +243,29 @@ void ReactorNet::advance(doublereal time)
     } else if (!m_integrator_init) {
         reinitialize();
     }
-    m_integ->integrate(time);
+    IntegratorStats start = m_integ->stats();
+    if (m_accumulators.empty()) {
+        m_integ->integrate(time);
+    } else {
+        // Take individual steps so that the reaction path accumulators can be
+        // sampled after each one. The last step may overshoot the output time,
+        // in which case the solution at the output time is interpolated.
+        sampleAccumulators(true);
+        while (true) {
+            double t = m_integ->step(time);
+            if (t >= time) {
+                break;
+            }
+            m_time = t;
+            updateState(m_integ->solution());
+            sampleAccumulators();
+        }
+        m_integ->integrate(time);
+    }
     m_time = time;
     updateState(m_integ->solution());
+    sampleAccumulators();
+    updateIntegratorStats(start);
 }
 
 double ReactorNet::step(doublereal time)
@@ -156,17 +279,56 @@ double ReactorNet::step(doublereal time)
     } else if (!m_integrator_init) {
         reinitialize();
     }
+    IntegratorStats start = m_integ->stats();
+    sampleAccumulators(true);
     m_time = m_integ->step(m_time + 1.0);
     updateState(m_integ->solution());
+    sampleAccumulators();
+    updateIntegratorStats(start);
     return m_time;
 }
 
+void ReactorNet::updateIntegratorStats(const IntegratorStats& start)
+{
+    IntegratorStats s = m_integ->stats();
+    s.steps -= start.steps;
+    s.rhsEvals -= start.rhsEvals;
+    s.jacEvals -= start.jacEvals;
+    s.linSolveSetups -= start.linSolveSetups;
+    s.nonlinIters -= start.nonlinIters;
+    s.nonlinConvFails -= start.nonlinConvFails;
+    s.errTestFails -= start.errTestFails;
+    m_integStats = s;
+}
+
 void ReactorNet::addReactor(Reactor& r)
 {
     r.setNetwork(this);
     m_reactors.push_back(&r);
 }
 
+void ReactorNet::addReactionPathAccumulator(Reactor& r,
+                                            ReactionPathAccumulator& acc)
+{
+    if (std::find(m_reactors.begin(), m_reactors.end(), &r)
+        == m_reactors.end()) {
+        throw CanteraError("ReactorNet::addReactionPathAccumulator",
+            "Reactor '{}' is not part of this network", r.name());
+    }
+    m_accumulators.emplace_back(&r, &acc);
+}
+
+void ReactorNet::sampleAccumulators(bool initial)
+{
+    for (auto& item : m_accumulators) {
+        if (initial && item.second->nSamples()) {
+            continue;
+        }
+        item.first->restoreState();
+        item.second->addSample(m_time, item.first->volume());
+    }
+}
+
 void ReactorNet::eval(doublereal t, doublereal* y,
                       doublereal* ydot, doublereal* p)
 {
@@ -193,6 +355,255 @@ double ReactorNet::sensitivity(size_t k, size_t p)
     return m_integ->sensitivity(k, m_sensIndex[p])/m_integ->solution(k);
 }
 
+void ReactorNet::adjointSensitivities(double tf, const vector_fp& dgdy,
+                                      vector_fp& sens)
+{
+    checkAdjoint("ReactorNet::adjointSensitivities");
+    if (!m_init) {
+        initialize();
+    }
+    if (dgdy.size() != m_nv) {
+        throw CanteraError("ReactorNet::adjointSensitivities",
+            "Expected {} coefficients, but got {}.", m_nv, dgdy.size());
+    }
+    startAdjoint();
+    vector_fp lambda(dgdy);
+    try {
+        m_integ->integrate(tf);
+        m_time = tf;
+        solveAdjoint(tf, lambda, sens);
+    } catch (...) {
+        m_integ->setAdjoint(false);
+        updateState(m_integ->solution());
+        setNeedsReinit();
+        throw;
+    }
+}
+
+double ReactorNet::adjointEventSensitivities(double tmax, size_t k,
+                                            double value, vector_fp& sens)
+{
+    checkAdjoint("ReactorNet::adjointEventSensitivities");
+    if (!m_init) {
+        initialize();
+    }
+    if (k >= m_nv) {
+        throw IndexError("ReactorNet::adjointEventSensitivities",
+                         "component", k, m_nv-1);
+    }
+    startAdjoint();
+    double* y = m_integ->solution();
+    if (y[k] == value) {
+        throw CanteraError("ReactorNet::adjointEventSensitivities",
+            "Component {} is already equal to {} at t = {}", k, value, m_time);
+    }
+    try {
+        double t_event, rate;
+        while (true) {
+            double tprev = m_time;
+            double yprev = y[k];
+            m_time = m_integ->step(tmax);
+            if ((y[k] - value) * (yprev - value) <= 0) {
+                rate = (y[k] - yprev) / (m_time - tprev);
+                t_event = tprev + (value - yprev) / rate;
+                break;
+            } else if (m_time >= tmax) {
+                throw CanteraError("ReactorNet::adjointEventSensitivities",
+                    "Component {} did not reach {} by t = {}",
+                    k, value, tmax);
+            }
+        }
+        vector_fp lambda(m_nv, 0.0);
+        lambda[k] = 1.0;
+        solveAdjoint(t_event, lambda, sens);
+        for (size_t i = 0; i < sens.size(); i++) {
+            sens[i] /= -rate;
+        }
+        return t_event;
+    } catch (...) {
+        m_integ->setAdjoint(false);
+        updateState(m_integ->solution());
+        setNeedsReinit();
+        throw;
+    }
+}
+
+void ReactorNet::startAdjoint()
+{
+    m_adjJac.resize(m_nv, m_nv);
+    m_adjY.clear();
+    m_adjYdot.resize(m_nv);
+    m_adjParams.assign(m_ntotpar, 1.0);
+    m_integ->setAdjoint(true);
+    m_integ->reinitialize(m_time, *this);
+    m_integrator_init = true;
+}
+
+void ReactorNet::checkAdjoint(const std::string& method)
+{
+    for (size_t n = 0; n < m_reactors.size(); n++) {
+        if (m_reactors[n]->hasRhsFunction()) {
+            throw CanteraError(method, "Adjoint sensitivity analysis is not "
+                "supported for reactors with a user-defined function set "
+                "using Reactor::setRhsFunction (reactor {})", n);
+        }
+    }
+}
+
+void ReactorNet::solveAdjoint(double tB0, vector_fp& lambda, vector_fp& sens)
+{
+    sens.assign(nAdjointParams(), 0.0);
+    m_integ->integrateAdjoint(tB0, lambda.data(), sens.data());
+    m_integ->setAdjoint(false);
+
+    // The backward integration changes the state of the reactors and the
+    // internal state of the integrator
+    updateState(m_integ->solution());
+    setNeedsReinit();
+}
+
+void ReactorNet::evalAdjoint(double t, double* y, const double* lambda,
+                             double* lambdaDot)
+{
+    // The integrator evaluates the adjoint equations at the same point many
+    // times (e.g. to compute their Jacobian), so the Jacobian of the network
+    // is only re-evaluated when the point changes
+    if (m_adjY.size() != m_nv || t != m_adjTime ||
+        !std::equal(y, y + m_nv, m_adjY.begin())) {
+        m_adjY.assign(y, y + m_nv);
+        m_adjTime = t;
+        eval(t, m_adjY.data(), m_adjYdot.data(), m_adjParams.data());
+        for (size_t n = 0; n < m_nv; n++) {
+            // Unlike evalJacobian, the perturbations are not reduced along
+            // with the integrator tolerances, since the perturbed values of
+            // variables such as the temperature of a Reactor are only
+            // computed to within round-off error.
+            double ysave = m_adjY[n];
+            double dy = std::max(m_atol[n], 1e-15) +
+                        fabs(ysave) * std::max(m_rtol, 1e-9);
+            m_adjY[n] = ysave + dy;
+            dy = m_adjY[n] - ysave;
+            eval(t, m_adjY.data(), m_ydot.data(), m_adjParams.data());
+            for (size_t m = 0; m < m_nv; m++) {
+                m_adjJac(m, n) = (m_ydot[m] - m_adjYdot[m]) / dy;
+            }
+            m_adjY[n] = ysave;
+        }
+    }
+    for (size_t j = 0; j < m_nv; j++) {
+        const double* col = m_adjJac.ptrColumn(j);
+        double sum = 0.0;
+        for (size_t i = 0; i < m_nv; i++) {
+            sum += col[i] * lambda[i];
+        }
+        lambdaDot[j] = -sum;
+    }
+}
+
+void ReactorNet::evalAdjointGradient(double t, double* y, const double* lambda,
+                                     double* grad)
+{
+    updateState(y);
+    for (size_t n = 0; n < m_reactors.size(); n++) {
+        m_reactors[n]->evalReactionGradient(lambda + m_start[n],
+                                            grad + m_adjStart[n]);
+    }
+}
+
+void ReactorNet::setTabulation(double tol, double maxMemory)
+{
+    if (tol < 0.0) {
+        throw CanteraError("ReactorNet::setTabulation",
+                           "Tolerance must be non-negative");
+    } else if (tol == 0.0) {
+        m_isat.reset();
+        return;
+    } else if (m_reactors.size() != 1) {
+        throw CanteraError("ReactorNet::setTabulation",
+            "Tabulation requires a network containing a single reactor");
+    }
+    size_t nsp = m_reactors[0]->contents().nSpecies();
+    m_isat.reset(new IsatTable(nsp + 3, nsp + 2, tol, maxMemory));
+}
+
+void ReactorNet::advanceTabulated(double dt)
+{
+    if (m_reactors.size() != 1) {
+        throw CanteraError("ReactorNet::advanceTabulated",
+            "Tabulation requires a network containing a single reactor");
+    }
+    Reactor& r = *m_reactors[0];
+    if (r.nWalls() || r.nInlets() || r.nOutlets()) {
+        throw CanteraError("ReactorNet::advanceTabulated",
+            "Tabulation cannot be used for reactors with walls or flow "
+            "devices");
+    } else if (!m_accumulators.empty()) {
+        throw CanteraError("ReactorNet::advanceTabulated",
+            "Tabulation cannot be used with reaction path accumulators");
+    } else if (dt <= 0.0) {
+        throw CanteraError("ReactorNet::advanceTabulated",
+                           "Time step must be positive");
+    }
+    ThermoPhase& thermo = r.contents();
+    size_t nx = thermo.nSpecies() + 3;
+    size_t nf = thermo.nSpecies() + 2;
+    m_isatX.resize(nx);
+    m_isatF.resize(nf);
+    r.restoreState();
+    m_isatX[0] = log(thermo.temperature());
+    m_isatX[1] = log(thermo.pressure());
+    m_isatX[2] = log(dt);
+    thermo.getMassFractions(&m_isatX[3]);
+
+    if (!m_isat) {
+        evalTabulationMapping(m_isatX.data(), m_isatF.data());
+    } else if (!m_isat->retrieve(m_isatX.data(), m_isatF.data())) {
+        evalTabulationMapping(m_isatX.data(), m_isatF.data());
+        if (!m_isat->grow(m_isatX.data(), m_isatF.data())) {
+            // Evaluate the gradient of the mapping by forward differences.
+            // The perturbation balances the truncation error against the
+            // error of the integration.
+            double dx = sqrt(std::max(m_rtol,
+                                      std::numeric_limits<double>::epsilon()));
+            m_isatA.resize(nf * nx);
+            vector_fp xp = m_isatX;
+            vector_fp fp(nf);
+            for (size_t j = 0; j < nx; j++) {
+                xp[j] += dx;
+                evalTabulationMapping(xp.data(), fp.data());
+                for (size_t i = 0; i < nf; i++) {
+                    m_isatA[i*nx + j] = (fp[i] - m_isatF[i]) / dx;
+                }
+                xp[j] = m_isatX[j];
+            }
+            m_isat->add(m_isatX.data(), m_isatF.data(), m_isatA.data());
+        }
+    }
+
+    thermo.setMassFractions(&m_isatF[2]);
+    thermo.setState_TP(exp(m_isatF[0]), exp(m_isatF[1]));
+    r.syncState();
+    m_time += dt;
+    m_integrator_init = false;
+}
+
+void ReactorNet::evalTabulationMapping(const double* x, double* f)
+{
+    Reactor& r = *m_reactors[0];
+    ThermoPhase& thermo = r.contents();
+    thermo.setMassFractions(x + 3);
+    thermo.setState_TP(exp(x[0]), exp(x[1]));
+    r.syncState();
+    double t0 = m_time;
+    m_integrator_init = false;
+    advance(t0 + exp(x[2]));
+    m_time = t0;
+    r.restoreState();
+    f[0] = log(thermo.temperature());
+    f[1] = log(thermo.pressure());
+    thermo.getMassFractions(f + 2);
+}
+
 void ReactorNet::evalJacobian(doublereal t, doublereal* y,
                               doublereal* ydot, doublereal* p, Array2D* j)
 {
@@ -219,6 +630,680 @@ void ReactorNet::evalJacobian(doublereal t, doublereal* y,
     }
 }
 
+void ReactorNet::initBlockJacobian()
+{
+    size_t nr = m_reactors.size();
+    m_reactorIndex.clear();
+    for (size_t n = 0; n < nr; n++) {
+        m_reactorIndex[m_reactors[n]] = n;
+    }
+
+    m_lowerBlocks.assign(nr, {});
+    m_dependents.assign(nr, {});
+    m_diagLoc.resize(nr);
+    size_t ndiag = 0, nlower = 0;
+    for (size_t n = 0; n < nr; n++) {
+        Reactor& r = *m_reactors[n];
+        size_t nv = m_start[n+1] - m_start[n];
+        m_diagLoc[n] = ndiag;
+        ndiag += nv * nv;
+
+        // Reactors whose state affects the governing equations of reactor n
+        vector<size_t> coupled;
+        for (size_t i = 0; i < r.nWalls(); i++) {
+            Wall& w = r.wall(i);
+            const ReactorBase* other = (&w.left() == &r) ? &w.right() : &w.left();
+            if (m_reactorIndex.count(other)) {
+                coupled.push_back(m_reactorIndex[other]);
+            }
+        }
+        for (size_t i = 0; i < r.nInlets(); i++) {
+            addFlowDeviceCoupling(r.inlet(i), coupled);
+        }
+        for (size_t i = 0; i < r.nOutlets(); i++) {
+            addFlowDeviceCoupling(r.outlet(i), coupled);
+        }
+        sort(coupled.begin(), coupled.end());
+        coupled.erase(unique(coupled.begin(), coupled.end()), coupled.end());
+
+        for (size_t m : coupled) {
+            if (m < n) {
+                m_lowerBlocks[n].emplace_back(m, nlower);
+                m_dependents[m].push_back(n);
+                nlower += nv * (m_start[m+1] - m_start[m]);
+            }
+        }
+    }
+    m_jacDiag.assign(ndiag, 0.0);
+    m_precDiag.assign(ndiag, 0.0);
+    m_jacLower.assign(nlower, 0.0);
+    m_precPivots.assign(m_nv, 0);
+    m_yjac.resize(m_nv);
+    m_ydot0.resize(m_nv);
+}
+
+void ReactorNet::addFlowDeviceCoupling(FlowDevice& dev, vector<size_t>& coupled)
+{
+    // The flow rate through a PressureController also depends on the flow
+    // rate through its master flow device
+    vector<FlowDevice*> devices{&dev};
+    while (true) {
+        auto pc = dynamic_cast<PressureController*>(devices.back());
+        if (!pc || !pc->master() || std::find(devices.begin(), devices.end(),
+                                              pc->master()) != devices.end()) {
+            break;
+        }
+        devices.push_back(pc->master());
+    }
+    for (FlowDevice* d : devices) {
+        const ReactorBase* ends[] = {&d->in(), &d->out()};
+        for (const ReactorBase* r : ends) {
+            if (m_reactorIndex.count(r)) {
+                coupled.push_back(m_reactorIndex[r]);
+            }
+        }
+    }
+}
+
+void ReactorNet::evalBlockJacobian(double t, double* y)
+{
+    copy(y, y + m_nv, m_yjac.begin());
+    double* yy = m_yjac.data();
+
+    // evaluate the unperturbed ydot, using the nominal values of the
+    // sensitivity parameters
+    updateState(yy);
+    for (size_t n = 0; n < m_reactors.size(); n++) {
+        m_reactors[n]->evalEqs(t, yy + m_start[n], &m_ydot0[m_start[n]], 0);
+    }
+
+    for (size_t m = 0; m < m_reactors.size(); m++) {
+        size_t nv = m_start[m+1] - m_start[m];
+        for (size_t j = 0; j < nv; j++) {
+            // perturb variable j of reactor m
+            size_t k = m_start[m] + j;
+            double ysave = yy[k];
+            double dy = jacobianPerturbation(k, ysave);
+            yy[k] = ysave + dy;
+            dy = yy[k] - ysave;
+            m_reactors[m]->updateState(yy + m_start[m]);
+
+            // diagonal block
+            m_reactors[m]->evalEqs(t, yy + m_start[m], &m_ydot[m_start[m]], 0);
+            double* col = &m_jacDiag[m_diagLoc[m] + j*nv];
+            for (size_t i = 0; i < nv; i++) {
+                col[i] = (m_ydot[m_start[m] + i] - m_ydot0[m_start[m] + i]) / dy;
+            }
+
+            // blocks for the reactors which depend on reactor m
+            for (size_t n : m_dependents[m]) {
+                size_t nvn = m_start[n+1] - m_start[n];
+                m_reactors[n]->evalEqs(t, yy + m_start[n],
+                                       &m_ydot[m_start[n]], 0);
+                for (const auto& block : m_lowerBlocks[n]) {
+                    if (block.first != m) {
+                        continue;
+                    }
+                    col = &m_jacLower[block.second + j*nvn];
+                    for (size_t i = 0; i < nvn; i++) {
+                        col[i] = (m_ydot[m_start[n] + i] -
+                                  m_ydot0[m_start[n] + i]) / dy;
+                    }
+                }
+            }
+            yy[k] = ysave;
+        }
+        m_reactors[m]->updateState(yy + m_start[m]);
+    }
+}
+
+double ReactorNet::jacobianPerturbation(size_t k, double y) const
+{
+    if (m_steadyScale.empty()) {
+        return m_atol[k] + fabs(y)*m_rtol;
+    } else {
+        return sqrt(std::numeric_limits<double>::epsilon()) *
+               std::max(fabs(y), m_steadyScale[k]);
+    }
+}
+
+void ReactorNet::factorBlockJacobian(double rdt)
+{
+    for (size_t n = 0; n < m_reactors.size(); n++) {
+        int nv = static_cast<int>(m_start[n+1] - m_start[n]);
+        if (nv == 0) {
+            continue;
+        }
+        double* M = &m_precDiag[m_diagLoc[n]];
+        const double* J = &m_jacDiag[m_diagLoc[n]];
+        for (int i = 0; i < nv*nv; i++) {
+            M[i] = -J[i];
+        }
+        for (int i = 0; i < nv; i++) {
+            M[i*(nv+1)] += rdt;
+        }
+        applySteadyConstraints(M, m_start[n], nv);
+        int info = 0;
+        ct_dgetrf(nv, nv, M, nv, &m_precPivots[m_start[n]], info);
+        if (info != 0) {
+            throw CanteraError("ReactorNet::factorBlockJacobian",
+                "Jacobian block for reactor {} is singular.", n);
+        }
+    }
+}
+
+void ReactorNet::solveBlockJacobian(double* x)
+{
+    // Block forward substitution: x_n = M_nn^-1 (b_n + sum(J_nm x_m))
+    for (size_t n = 0; n < m_reactors.size(); n++) {
+        size_t nv = m_start[n+1] - m_start[n];
+        if (nv == 0) {
+            continue;
+        }
+        double* xn = x + m_start[n];
+        for (const auto& block : m_lowerBlocks[n]) {
+            size_t m = block.first;
+            const double* J = &m_jacLower[block.second];
+            const double* xm = x + m_start[m];
+            for (size_t j = 0; j < m_start[m+1] - m_start[m]; j++) {
+                for (size_t i = 0; i < nv; i++) {
+                    xn[i] += J[i + j*nv] * xm[j];
+                }
+            }
+        }
+        int info = 0;
+        ct_dgetrs(ctlapack::NoTranspose, nv, 1, &m_precDiag[m_diagLoc[n]], nv,
+                  &m_precPivots[m_start[n]], xn, nv, info);
+    }
+}
+
+bool ReactorNet::setupPreconditioner(double t, double* y, double gamma,
+                                     bool jacOk)
+{
+    if (m_linearSolverType != "gmres") {
+        throw CanteraError("ReactorNet::setupPreconditioner",
+            "The preconditioner is only used with the 'gmres' linear solver.");
+    }
+    if (!jacOk) {
+        evalBlockJacobian(t, y);
+    }
+    // P = I - gamma*J = gamma * (I/gamma - J)
+    m_gamma = gamma;
+    factorBlockJacobian(1.0 / gamma);
+    return !jacOk;
+}
+
+void ReactorNet::solvePreconditioner(const double* r, double* z)
+{
+    copy(r, r + m_nv, z);
+    solveBlockJacobian(z);
+    for (size_t i = 0; i < m_nv; i++) {
+        z[i] /= m_gamma;
+    }
+}
+
+void ReactorNet::setSteadyTimeStepping(int maxSteps, double dt0)
+{
+    if (dt0 <= 0.0) {
+        throw CanteraError("ReactorNet::setSteadyTimeStepping",
+                           "The initial time step must be positive.");
+    }
+    m_steadyMaxSteps = maxSteps;
+    m_steadyDt0 = dt0;
+}
+
+void ReactorNet::applySteadyConstraints(double* M, size_t i0, size_t n)
+{
+    if (m_steadyFixed.empty()) {
+        return;
+    }
+    for (size_t i = 0; i < n; i++) {
+        if (!std::isnan(m_steadyFixed[i0 + i])) {
+            for (size_t j = 0; j < n; j++) {
+                M[i + j*n] = 0.0;
+            }
+            M[i*(n+1)] = 1.0;
+        }
+    }
+    for (const auto& surf : m_steadySurfaces) {
+        if (surf.first < i0 || surf.first >= i0 + n) {
+            continue;
+        }
+        size_t i = surf.first - i0;
+        for (size_t j = 0; j < n; j++) {
+            M[i + j*n] = 0.0;
+        }
+        for (size_t j = i; j < i + surf.second; j++) {
+            M[i + j*n] = 1.0;
+        }
+    }
+}
+
+void ReactorNet::evalSteadyRates(double* y, double* ydot)
+{
+    updateState(y);
+    for (size_t n = 0; n < m_reactors.size(); n++) {
+        m_reactors[n]->evalEqs(m_time, y + m_start[n], ydot + m_start[n], 0);
+    }
+    checkFinite("ydot", ydot, m_nv);
+}
+
+void ReactorNet::evalSteadyJacobian(double* y)
+{
+    m_steadyStats.jacobianEvals++;
+    m_steadyJacAge = 0;
+    if (m_linearSolverType == "gmres") {
+        evalBlockJacobian(m_time, y);
+        return;
+    }
+    vector_fp ydot0(m_nv), ydot1(m_nv);
+    evalSteadyRates(y, ydot0.data());
+    for (size_t j = 0; j < m_nv; j++) {
+        double ysave = y[j];
+        double dy = jacobianPerturbation(j, ysave);
+        y[j] = ysave + dy;
+        dy = y[j] - ysave;
+        evalSteadyRates(y, ydot1.data());
+        for (size_t i = 0; i < m_nv; i++) {
+            (*m_steadyJac)(i, j) = (ydot1[i] - ydot0[i]) / dy;
+        }
+        y[j] = ysave;
+    }
+    updateState(y);
+}
+
+void ReactorNet::factorSteadyJacobian(double rdt)
+{
+    if (m_linearSolverType == "gmres") {
+        factorBlockJacobian(rdt);
+        return;
+    }
+    int n = static_cast<int>(m_nv);
+    double* M = m_steadyLU->ptrColumn(0);
+    const double* J = m_steadyJac->ptrColumn(0);
+    for (size_t i = 0; i < m_nv*m_nv; i++) {
+        M[i] = -J[i];
+    }
+    for (size_t i = 0; i < m_nv; i++) {
+        M[i*(m_nv+1)] += rdt;
+    }
+    applySteadyConstraints(M, 0, m_nv);
+    int info = 0;
+    ct_dgetrf(n, n, M, n, m_steadyLU->ipiv().data(), info);
+    if (info != 0) {
+        throw CanteraError("ReactorNet::factorSteadyJacobian",
+                           "Jacobian is singular.");
+    }
+}
+
+bool ReactorNet::steadyNewtonStep(double* y, const double* yprev, double rdt,
+                                  double* step)
+{
+    try {
+        evalSteadyRates(y, step);
+    } catch (CanteraError&) {
+        return false;
+    }
+    // Right hand side is -R(y), where R(y) = rdt*(y - yprev) - ydot
+    for (size_t i = 0; i < m_nv; i++) {
+        step[i] -= rdt * (y[i] - yprev[i]);
+        if (!std::isnan(m_steadyFixed[i])) {
+            step[i] = m_steadyFixed[i] - y[i];
+        }
+    }
+    for (const auto& surf : m_steadySurfaces) {
+        double sum = 0.0;
+        for (size_t i = surf.first; i < surf.first + surf.second; i++) {
+            sum += y[i];
+        }
+        step[surf.first] = 1.0 - sum;
+    }
+
+    if (m_linearSolverType == "gmres") {
+        solveBlockJacobian(step);
+    } else {
+        int n = static_cast<int>(m_nv);
+        int info = 0;
+        ct_dgetrs(ctlapack::NoTranspose, n, 1, m_steadyLU->ptrColumn(0), n,
+                  m_steadyLU->ipiv().data(), step, n, info);
+    }
+    return true;
+}
+
+double ReactorNet::steadyNorm(const double* y, const double* step) const
+{
+    double sum = 0.0;
+    for (size_t i = 0; i < m_nv; i++) {
+        double ewt = m_rtol * fabs(y[i]) + m_atol[i];
+        sum += (step[i] / ewt) * (step[i] / ewt);
+    }
+    return sqrt(sum / m_nv);
+}
+
+bool ReactorNet::steadyNewton(double* y, const double* yprev, double rdt,
+                              int loglevel)
+{
+    const int maxIterations = 50;
+    const int maxJacAge = 5;
+    const int NDAMP = 7; // maximum number of damping steps
+    const double DampFactor = sqrt(2.0);
+
+    vector_fp step0(m_nv), step1(m_nv), y1(m_nv);
+
+    // If the iteration fails, the Jacobian evaluated at the rejected iterate
+    // must not be reused
+    auto fail = [&]() {
+        m_steadyJacAge = maxJacAge;
+        return false;
+    };
+
+    // Evaluate (if needed) and factor the Jacobian. Returns false if the
+    // Jacobian could not be evaluated or is singular.
+    auto updateJacobian = [&](bool eval) {
+        try {
+            if (eval) {
+                evalSteadyJacobian(y);
+            }
+            factorSteadyJacobian(rdt);
+            return true;
+        } catch (CanteraError& err) {
+            if (loglevel > 1) {
+                writelog("    Jacobian evaluation failed: {}\n",
+                         err.getMessage());
+            }
+            return false;
+        }
+    };
+
+    if (!updateJacobian(m_steadyJacAge >= maxJacAge)) {
+        return fail();
+    }
+    for (int iter = 0; iter < maxIterations; iter++) {
+        m_steadyStats.newtonIterations++;
+        if (!steadyNewtonStep(y, yprev, rdt, step0.data())) {
+            return fail();
+        }
+        double s0 = steadyNorm(y, step0.data());
+
+        // Limit the step so that positive variables decrease by at most half
+        double fbound = 1.0;
+        for (size_t i = 0; i < m_nv; i++) {
+            if (m_steadyLower[i] == 0.0 && step0[i] < -0.5 * y[i]) {
+                fbound = std::min(fbound, -0.5 * y[i] / step0[i]);
+            }
+        }
+
+        // Damped step: accept the first damping factor which reduces the
+        // norm of the following (undamped) step
+        bool accepted = false;
+        double s1 = 0.0;
+        double damp = fbound;
+        for (int m = 0; m < NDAMP; m++) {
+            // Other variables are clipped at their lower bounds
+            for (size_t i = 0; i < m_nv; i++) {
+                y1[i] = std::max(y[i] + damp * step0[i], m_steadyLower[i]);
+            }
+            if (steadyNewtonStep(y1.data(), yprev, rdt, step1.data())) {
+                s1 = steadyNorm(y1.data(), step1.data());
+                if (s1 < 1.0 || s1 < s0) {
+                    accepted = true;
+                    break;
+                }
+            }
+            damp /= DampFactor;
+        }
+        if (loglevel > 1) {
+            writelog("    Newton iteration {:3d}: |step| = {:10.3e}, "
+                     "damping = {:9.3e}, |next step| = {:10.3e}{}\n",
+                     iter, s0, damp, s1, accepted ? "" : " (rejected)");
+        }
+
+        if (accepted) {
+            copy(y1.begin(), y1.end(), y);
+            m_steadyStats.stepNorm = s1;
+            m_steadyJacAge++;
+            if (s1 < 1.0) {
+                return true;
+            } else if (m_steadyJacAge >= maxJacAge && !updateJacobian(true)) {
+                return fail();
+            }
+        } else if (m_steadyJacAge > 0) {
+            // Try again with a new Jacobian
+            if (!updateJacobian(true)) {
+                return fail();
+            }
+        } else {
+            return fail();
+        }
+    }
+    return fail();
+}
+
+void ReactorNet::solveSteady(int loglevel)
+{
+    if (!m_init) {
+        initialize();
+    }
+    for (size_t n = 0; n < m_reactors.size(); n++) {
+        if (m_reactors[n]->nInlets() == 0 && m_reactors[n]->nOutlets() == 0) {
+            throw CanteraError("ReactorNet::solveSteady", "Reactor '{}' has "
+                "no inlets or outlets, so its steady state is not unique.",
+                m_reactors[n]->name());
+        }
+    }
+    m_steadyStats = SteadyStateStats();
+    vector_fp y(m_nv), ynew(m_nv), ydot(m_nv);
+    getState(y.data());
+    if (m_linearSolverType != "gmres") {
+        m_steadyJac.reset(new DenseMatrix(m_nv, m_nv));
+        m_steadyLU.reset(new DenseMatrix(m_nv, m_nv));
+    }
+
+    // Bounds and scales for each variable, and the location of the surface
+    // coverages. Mass fractions and coverages may become slightly negative.
+    m_steadyLower.assign(m_nv, -1.0e-5);
+    m_steadyScale.assign(m_nv, 1.0);
+    m_steadySurfaces.clear();
+    for (size_t n = 0; n < m_reactors.size(); n++) {
+        Reactor& r = *m_reactors[n];
+        for (const char* name : {"mass", "volume", "temperature"}) {
+            size_t k = r.componentIndex(name);
+            if (k != npos) {
+                m_steadyLower[m_start[n] + k] = 0.0;
+                m_steadyScale[m_start[n] + k] = y[m_start[n] + k];
+            }
+        }
+        for (const char* name : {"int_energy", "enthalpy"}) {
+            size_t k = r.componentIndex(name);
+            if (k != npos) {
+                m_steadyLower[m_start[n] + k] = -BigNumber;
+                m_steadyScale[m_start[n] + k] = std::max(
+                    fabs(y[m_start[n] + k]), 1.0);
+            }
+        }
+        for (const auto& range : r.surfaceCoverageRanges()) {
+            m_steadySurfaces.emplace_back(m_start[n] + range.first,
+                                          range.second);
+        }
+    }
+
+    try {
+        // Hold fixed the variables whose time derivatives do not depend on
+        // the state of the network
+        m_steadyFixed.assign(m_nv, NAN);
+        evalSteadyJacobian(y.data());
+        evalSteadyRates(y.data(), ydot.data());
+        for (size_t n = 0; n < m_reactors.size(); n++) {
+            size_t nv = m_start[n+1] - m_start[n];
+            for (size_t i = 0; i < nv; i++) {
+                size_t k = m_start[n] + i;
+                bool zero = true;
+                if (m_linearSolverType == "gmres") {
+                    for (size_t j = 0; j < nv; j++) {
+                        zero &= (m_jacDiag[m_diagLoc[n] + i + j*nv] == 0.0);
+                    }
+                    for (const auto& block : m_lowerBlocks[n]) {
+                        size_t m = block.first;
+                        for (size_t j = 0; j < m_start[m+1] - m_start[m]; j++) {
+                            zero &= (m_jacLower[block.second + i + j*nv] == 0.0);
+                        }
+                    }
+                } else {
+                    for (size_t j = 0; j < m_nv; j++) {
+                        zero &= ((*m_steadyJac)(k, j) == 0.0);
+                    }
+                }
+                if (!zero) {
+                    continue;
+                } else if (ydot[k] != 0.0) {
+                    throw CanteraError("ReactorNet::solveSteady",
+                        "Component {} of reactor '{}' changes at a constant "
+                        "rate, so there is no steady state.", i,
+                        m_reactors[n]->name());
+                }
+                m_steadyFixed[k] = y[k];
+            }
+        }
+
+        double dt = m_steadyDt0;
+        int nsteps = 0;
+        while (true) {
+            m_steadyStats.steadyAttempts++;
+            if (loglevel > 0) {
+                writelog("Attempt {} to solve the steady-state problem\n",
+                         m_steadyStats.steadyAttempts);
+            }
+            ynew = y;
+            if (steadyNewton(ynew.data(), y.data(), 0.0, loglevel)) {
+                y = ynew;
+                if (loglevel > 0) {
+                    writelog("Converged after {} Newton iterations\n",
+                             m_steadyStats.newtonIterations);
+                }
+                break;
+            } else if (nsteps >= m_steadyMaxSteps) {
+                throw CanteraError("ReactorNet::solveSteady",
+                    "Failed to converge after {} pseudo-transient time steps.",
+                    nsteps);
+            }
+
+            // Take backward Euler time steps to move closer to the steady
+            // state. The time step is doubled after each successful step and
+            // halved after each failed step.
+            for (int i = 0; i < 10 && nsteps < m_steadyMaxSteps; i++) {
+                nsteps++;
+                ynew = y;
+                if (steadyNewton(ynew.data(), y.data(), 1.0 / dt, loglevel)) {
+                    y = ynew;
+                    m_steadyStats.timeSteps++;
+                    if (loglevel > 0) {
+                        writelog("  Time step {:3d}: dt = {:10.3e}\n",
+                                 m_steadyStats.timeSteps, dt);
+                    }
+                    dt *= 2.0;
+                } else {
+                    if (loglevel > 0) {
+                        writelog("  Time step failed: dt = {:10.3e}\n", dt);
+                    }
+                    dt *= 0.5;
+                }
+            }
+        }
+    } catch (...) {
+        updateState(y.data());
+        m_steadyFixed.clear();
+        m_steadyScale.clear();
+        m_steadySurfaces.clear();
+        setNeedsReinit();
+        throw;
+    }
+
+    evalSteadyRates(y.data(), ydot.data());
+    m_steadyStats.residual = 0.0;
+    for (size_t k = 0; k < m_nv; k++) {
+        m_steadyStats.residual = std::max(m_steadyStats.residual,
+                                          fabs(ydot[k]));
+    }
+    m_steadyFixed.clear();
+    m_steadyScale.clear();
+    m_steadySurfaces.clear();
+    setNeedsReinit();
+}
+
+std::string ReactorNet::checkpoint()
+{
+    if (!m_init) {
+        initialize();
+    } else if (!m_integrator_init) {
+        reinitialize();
+    }
+    uint32_t header[2] = {checkpointMagic, checkpointVersion};
+    size_t np = m_integ->nSensParams();
+    uint64_t sizes[3] = {m_reactors.size(), m_nv, np};
+    double values[2] = {m_time, m_integ->currentStepSize()};
+
+    std::string data;
+    data.reserve(sizeof(header) + sizeof(sizes)
+                 + sizeof(double) * (2 + m_nv * (np + 1)));
+    writeBinary(data, header, 2);
+    writeBinary(data, sizes, 3);
+    writeBinary(data, values, 2);
+    writeBinary(data, m_integ->solution(), m_nv);
+    vector_fp yS(m_nv);
+    for (size_t p = 0; p < np; p++) {
+        for (size_t k = 0; k < m_nv; k++) {
+            yS[k] = m_integ->sensitivity(k, p);
+        }
+        writeBinary(data, yS.data(), m_nv);
+    }
+    return data;
+}
+
+void ReactorNet::restore(const std::string& data)
+{
+    if (!m_init) {
+        initialize();
+    }
+    size_t pos = 0;
+    uint32_t header[2];
+    readBinary(data, pos, header, 2);
+    if (header[0] != checkpointMagic) {
+        throw CanteraError("ReactorNet::restore",
+                           "Data is not a reactor network checkpoint");
+    } else if (header[1] != checkpointVersion) {
+        throw CanteraError("ReactorNet::restore",
+                           "Unsupported checkpoint version {}", header[1]);
+    }
+    uint64_t sizes[3];
+    readBinary(data, pos, sizes, 3);
+    size_t np = m_integ->nSensParams();
+    if (sizes[0] != m_reactors.size() || sizes[1] != m_nv || sizes[2] != np) {
+        throw CanteraError("ReactorNet::restore", "Checkpoint for a network "
+            "with {} reactors, {} equations and {} sensitivity parameters "
+            "does not match this network ({}, {}, {})", sizes[0], sizes[1],
+            sizes[2], m_reactors.size(), m_nv, np);
+    }
+    double values[2];
+    readBinary(data, pos, values, 2);
+    vector_fp y(m_nv), yS(m_nv * np);
+    readBinary(data, pos, y.data(), m_nv);
+    readBinary(data, pos, yS.data(), m_nv * np);
+    if (pos != data.size()) {
+        throw CanteraError("ReactorNet::restore",
+                           "Unexpected data at end of checkpoint");
+    }
+
+    m_time = values[0];
+    updateState(y.data());
+    m_integ->setInitialStepSize(values[1]);
+    m_integ->reinitialize(m_time, *this);
+    m_integ->setInitialStepSize(m_initialStep);
+    if (np) {
+        m_integ->setInitialSensitivities(yS.data());
+    }
+    m_integrator_init = true;
+}
+
 void ReactorNet::updateState(doublereal* y)
 {
     checkFinite("y", y, m_nv);
@@ -3,6 +3,7 @@
 #include "cantera/thermo/ThermoFactory.h"
 #include "cantera/thermo/IdealGasPhase.h"
 #include "cantera/equil/MultiPhase.h"
+#include "cantera/equil/ChemEquil.h"
 #include "cantera/base/global.h"
 #include "cantera/base/utilities.h"
 
@@ -295,6 +296,38 @@ TEST_F(PropertyPairs, ChemEquil_UV) { check_UV("element_potential"); }
 // TEST_F(PropertyPairs, MultiPhase_UV) { check_UV("gibbs"); } // not implemented
 TEST_F(PropertyPairs, VcsNonideal_UV) { check_UV("vcs"); }
 
+// Test for a sweep of equilibrium calculations where each calculation is
+// started from the solution of the previous one
+TEST_F(GriEquilibriumTest, ChemEquilContinuation)
+{
+    ChemEquil E(gas);
+    E.options.contin = true;
+    for (int i = 0; i < 10; i++) {
+        double phi = 0.6 + 0.1 * i;
+        vector_fp X0(gas.nSpecies(), 0.0);
+        X0[gas.speciesIndex("CH4")] = phi;
+        X0[gas.speciesIndex("O2")] = 2.0;
+        X0[gas.speciesIndex("N2")] = 7.52;
+        gas.setState_TPX(300, 1e5, &X0[0]);
+        save_elemental_mole_fractions();
+        gas.equilibrate("HP", "element_potential", 1e-9);
+        double T1 = gas.temperature();
+        gas.getMoleFractions(&X[0]);
+        vector_fp X1 = X;
+
+        gas.setState_TPX(300, 1e5, &X0[0]);
+        double h0 = gas.enthalpy_mass();
+        EXPECT_EQ(0, E.equilibrate(gas, "HP"));
+        EXPECT_NEAR(h0, gas.enthalpy_mass(), 1e-3);
+        EXPECT_NEAR(T1, gas.temperature(), 1e-5);
+        gas.getMoleFractions(&X[0]);
+        for (size_t k = 0; k < gas.nSpecies(); k++) {
+            EXPECT_NEAR(X1[k], X[k], 1e-9);
+        }
+        check();
+    }
+}
+
 int main(int argc, char** argv)
 {
     printf("Running main() from equil_gas.cpp\n");
@@ -0,0 +1,181 @@
+#include "gtest/gtest.h"
+#include "cantera/numerics/IsatTable.h"
+#include "cantera/base/ctexceptions.h"
+
+using namespace Cantera;
+
+class IsatTableTest : public testing::Test
+{
+public:
+    // A smooth nonlinear mapping from R^3 to R^2, and its gradient
+    static void f(const double* x, double* y) {
+        y[0] = sin(x[0]) + x[1] * x[2];
+        y[1] = exp(0.5 * x[1]) - x[2];
+    }
+
+    static void gradient(const double* x, double* A) {
+        A[0] = cos(x[0]);
+        A[1] = x[2];
+        A[2] = x[1];
+        A[3] = 0.0;
+        A[4] = 0.5 * exp(0.5 * x[1]);
+        A[5] = -1.0;
+    }
+
+    // Query the table using the standard ISAT procedure
+    static void query(IsatTable& table, const double* x, double* y) {
+        if (!table.retrieve(x, y)) {
+            f(x, y);
+            if (!table.grow(x, y)) {
+                double A[6];
+                gradient(x, A);
+                table.add(x, y, A);
+            }
+        }
+    }
+};
+
+TEST_F(IsatTableTest, empty)
+{
+    IsatTable table(3, 2);
+    EXPECT_EQ(table.nInputs(), (size_t) 3);
+    EXPECT_EQ(table.nOutputs(), (size_t) 2);
+    EXPECT_EQ(table.nRecords(), (size_t) 0);
+    double x[3] = {0.1, 0.2, 0.3};
+    double y[2];
+    EXPECT_FALSE(table.retrieve(x, y));
+    EXPECT_FALSE(table.grow(x, y));
+    EXPECT_EQ(table.stats().queries, (size_t) 1);
+    EXPECT_EQ(table.stats().retrieves, (size_t) 0);
+}
+
+TEST_F(IsatTableTest, retrieve_and_grow)
+{
+    IsatTable table(3, 2, 1e-3);
+    double x0[3] = {0.1, 0.2, 0.3};
+    double y0[2], A[6], y[2], yexact[2];
+    f(x0, y0);
+    gradient(x0, A);
+    table.add(x0, y0, A);
+    EXPECT_EQ(table.nRecords(), (size_t) 1);
+
+    // Within the initial ellipsoid of accuracy
+    double x1[3] = {0.1001, 0.2, 0.3};
+    ASSERT_TRUE(table.retrieve(x1, y));
+    f(x1, yexact);
+    EXPECT_NEAR(y[0], yexact[0], 1e-3);
+    EXPECT_NEAR(y[1], yexact[1], 1e-3);
+
+    // Outside of the initial EOA, but still accurate
+    double x2[3] = {0.11, 0.2, 0.3};
+    EXPECT_FALSE(table.retrieve(x2, y));
+    f(x2, y);
+    EXPECT_TRUE(table.grow(x2, y));
+    EXPECT_TRUE(table.retrieve(x2, y));
+    EXPECT_EQ(table.nRecords(), (size_t) 1);
+
+    // Points between x0 and x2 are now also within the EOA
+    double x3[3] = {0.105, 0.2, 0.3};
+    EXPECT_TRUE(table.retrieve(x3, y));
+
+    // Too far away for the linear approximation to be accurate
+    double x4[3] = {0.5, 0.2, 0.3};
+    EXPECT_FALSE(table.retrieve(x4, y));
+    f(x4, y);
+    EXPECT_FALSE(table.grow(x4, y));
+
+    const IsatStats& stats = table.stats();
+    EXPECT_EQ(stats.queries, (size_t) 5);
+    EXPECT_EQ(stats.retrieves, (size_t) 3);
+    EXPECT_EQ(stats.grows, (size_t) 1);
+    EXPECT_EQ(stats.adds, (size_t) 1);
+}
+
+TEST_F(IsatTableTest, accuracy)
+{
+    double tol = 1e-4;
+    IsatTable table(3, 2, tol);
+    double x[3], y[2], yexact[2];
+    double maxErr = 0.0;
+    for (int i = 0; i < 4000; i++) {
+        // Points along a trajectory, revisited several times
+        double s = 0.01 * (i % 400);
+        x[0] = s;
+        x[1] = 0.5 * sin(s);
+        x[2] = 1.0 - 0.2 * s;
+        query(table, x, y);
+        f(x, yexact);
+        maxErr = std::max(maxErr, hypot(y[0] - yexact[0], y[1] - yexact[1]));
+    }
+    const IsatStats& stats = table.stats();
+    EXPECT_EQ(stats.queries, (size_t) 4000);
+    EXPECT_EQ(stats.queries, stats.retrieves + stats.grows + stats.adds);
+    EXPECT_EQ(table.nRecords(), stats.adds);
+    EXPECT_GT(stats.retrieves, (size_t) 3000);
+    // Errors may somewhat exceed the tolerance since the EOAs are only
+    // estimates of the region of accuracy
+    EXPECT_LT(maxErr, 10 * tol);
+}
+
+TEST_F(IsatTableTest, memory_limit)
+{
+    IsatTable table(3, 2, 1e-4);
+    double x[3] = {0.0, 0.0, 0.0};
+    double y[2], A[6];
+    // Determine the size of a single record
+    f(x, y);
+    gradient(x, A);
+    table.add(x, y, A);
+    double recordSize = table.memory() * 1e-6;
+    table.setMaxMemory(3.5 * recordSize);
+    EXPECT_EQ(table.maxRecords(), (size_t) 3);
+
+    for (int i = 1; i < 6; i++) {
+        x[0] = 0.5 * i;
+        f(x, y);
+        gradient(x, A);
+        table.add(x, y, A);
+    }
+    EXPECT_EQ(table.nRecords(), (size_t) 3);
+    EXPECT_EQ(table.stats().evictions, (size_t) 3);
+
+    // The most recently added records are still in the table
+    for (int i = 3; i < 6; i++) {
+        x[0] = 0.5 * i;
+        EXPECT_TRUE(table.retrieve(x, y));
+        EXPECT_NEAR(y[0], sin(x[0]), 1e-14);
+    }
+    for (int i = 0; i < 3; i++) {
+        x[0] = 0.5 * i;
+        EXPECT_FALSE(table.retrieve(x, y));
+    }
+
+    // Using a record moves it to the front of the queue
+    x[0] = 1.5;
+    table.retrieve(x, y);
+    x[0] = 3.5;
+    f(x, y);
+    gradient(x, A);
+    table.add(x, y, A);
+    x[0] = 1.5;
+    EXPECT_TRUE(table.retrieve(x, y));
+    x[0] = 2.0;
+    EXPECT_FALSE(table.retrieve(x, y));
+
+    table.setMaxMemory(1.5 * recordSize);
+    EXPECT_EQ(table.nRecords(), (size_t) 1);
+    x[0] = 1.5;
+    EXPECT_TRUE(table.retrieve(x, y));
+
+    table.clear();
+    EXPECT_EQ(table.nRecords(), (size_t) 0);
+    EXPECT_FALSE(table.retrieve(x, y));
+}
+
+TEST_F(IsatTableTest, invalid)
+{
+    EXPECT_THROW(IsatTable(0, 2), CanteraError);
+    EXPECT_THROW(IsatTable(3, 2, 0.0), CanteraError);
+    IsatTable table(3, 2);
+    EXPECT_THROW(table.setTolerance(-1.0), CanteraError);
+}
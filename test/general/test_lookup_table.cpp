@@ -0,0 +1,82 @@
+#include "gtest/gtest.h"
+#include "cantera/numerics/LookupTable.h"
+#include "cantera/base/ctexceptions.h"
+
+using namespace Cantera;
+
+class LookupTableTest : public testing::Test
+{
+public:
+    LookupTableTest()
+        : axes{{0.0, 1.0, 3.0}, {-1.0, 0.0, 0.5, 2.0}}
+    {
+        // Two variables which are linear in each coordinate, so that
+        // multilinear interpolation is exact
+        for (double x0 : axes[0]) {
+            for (double x1 : axes[1]) {
+                data.push_back(f0(x0, x1));
+                data.push_back(f1(x0, x1));
+            }
+        }
+    }
+
+    static double f0(double x0, double x1) {
+        return 2.0 + 3.0 * x0 - x1 + 0.5 * x0 * x1;
+    }
+
+    static double f1(double x0, double x1) {
+        return x0 - 4.0 * x1;
+    }
+
+    std::vector<vector_fp> axes;
+    vector_fp data;
+};
+
+TEST_F(LookupTableTest, grid_points)
+{
+    LookupTable table(axes, 2, data.data());
+    EXPECT_EQ(table.nDim(), (size_t) 2);
+    EXPECT_EQ(table.nVars(), (size_t) 2);
+    vector_fp y(2);
+    for (double x0 : axes[0]) {
+        for (double x1 : axes[1]) {
+            double x[] = {x0, x1};
+            table.interpolate(x, y.data());
+            EXPECT_DOUBLE_EQ(f0(x0, x1), y[0]);
+            EXPECT_DOUBLE_EQ(f1(x0, x1), y[1]);
+        }
+    }
+}
+
+TEST_F(LookupTableTest, interpolate)
+{
+    LookupTable table(axes, 2, data.data());
+    vector_fp x{0.3, -0.7, 2.9, 1.9, 1.0, 0.25, 0.5, 0.0};
+    size_t vars[] = {1, 0};
+    vector_fp y(8);
+    table.interpolate(4, x.data(), 2, vars, y.data());
+    for (size_t i = 0; i < 4; i++) {
+        EXPECT_NEAR(f1(x[2*i], x[2*i+1]), y[2*i], 1e-13);
+        EXPECT_NEAR(f0(x[2*i], x[2*i+1]), y[2*i+1], 1e-13);
+    }
+}
+
+TEST_F(LookupTableTest, clip)
+{
+    LookupTable table(axes, 2, data.data());
+    double x[] = {-1.0, 5.0};
+    vector_fp y(2);
+    table.interpolate(x, y.data());
+    EXPECT_DOUBLE_EQ(f0(0.0, 2.0), y[0]);
+    EXPECT_DOUBLE_EQ(f1(0.0, 2.0), y[1]);
+}
+
+TEST_F(LookupTableTest, errors)
+{
+    axes[1][2] = -0.5;
+    EXPECT_THROW(LookupTable(axes, 2, data.data()), CanteraError);
+    axes[1].resize(1);
+    EXPECT_THROW(LookupTable(axes, 2, data.data()), CanteraError);
+    axes.clear();
+    EXPECT_THROW(LookupTable(axes, 2, data.data()), CanteraError);
+}
@@ -484,3 +484,56 @@ TEST_F(KineticsAddSpecies, add_species_err_first)
     ASSERT_EQ((size_t) 1, kin.nReactions());
     check_rates(1, "O:0.001, H2:0.1, H:0.005, OH:0.02, AR:0.88");
 }
+
+TEST_F(KineticsAddSpecies, add_reaction_state_cache)
+{
+    // Rates saved before a reaction is added must not be used afterwards
+    kin.setStateCacheSize(3);
+    for (auto s : {"AR", "O", "H2", "H", "OH", "O2", "H2O", "H2O2", "HO2"}) {
+        p.addSpecies(species[s]);
+    }
+    std::string X = "O:0.01, H2:0.1, H:0.02, OH:0.03, O2:0.4, AR:0.3, "
+                    "H2O2:0.03, HO2:0.01";
+    kin.addReaction(reactions[0]);
+    check_rates(1, X);
+    p.setState_TPX(1000, 5*OneAtm, X);
+    vector_fp k(1);
+    kin.getFwdRateConstants(k.data());
+
+    for (size_t i = 1; i < 5; i++) {
+        kin.addReaction(reactions[i]);
+    }
+    check_rates(5, X);
+}
+
+TEST_F(KineticsAddSpecies, modify_thermo_state_cache)
+{
+    // Reverse rate constants saved before the species thermo data are
+    // modified must not be used afterwards
+    for (auto s : {"AR", "O", "H2", "H", "OH", "O2", "H2O", "H2O2", "HO2"}) {
+        p.addSpecies(species[s]);
+    }
+    for (size_t i = 0; i < 5; i++) {
+        kin.addReaction(reactions[i]);
+    }
+    kin.setStateCacheSize(3);
+    std::string X = "O:0.01, H2:0.1, H:0.02, OH:0.03, O2:0.4, AR:0.3, "
+                    "H2O2:0.03, HO2:0.01";
+    vector_fp k0(5), k(5), k_ref(5);
+    p.setState_TPX(1200, 5*OneAtm, X);
+    kin.getRevRateConstants(k0.data());
+    p.setState_TPX(1000, 5*OneAtm, X);
+    kin.getRevRateConstants(k.data());
+
+    int kOH = static_cast<int>(p.speciesIndex("OH"));
+    p.modifyOneHf298SS(kOH, p.Hf298SS(kOH) + 1e7);
+    p.setState_TPX(1200, 5*OneAtm, X);
+    kin.getRevRateConstants(k.data());
+    kin.invalidateCache();
+    kin.getRevRateConstants(k_ref.data());
+    for (size_t i = 0; i < 5; i++) {
+        EXPECT_DOUBLE_EQ(k_ref[i], k[i]) << "i = " << i;
+    }
+    // reaction 0 (O + H2 <=> H + OH) is affected by the change
+    EXPECT_GT(std::abs(k[0] - k0[0]), 1e-3 * k0[0]);
+}
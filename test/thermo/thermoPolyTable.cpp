@@ -0,0 +1,157 @@
+#include "gtest/gtest.h"
+#include "cantera/thermo/ThermoPolyTable.h"
+#include "cantera/thermo/NasaPoly2.h"
+#include "cantera/thermo/ShomatePoly.h"
+#include "cantera/IdealGasMix.h"
+#include "thermo_data.h"
+
+namespace Cantera
+{
+
+// Check that the table gives the same results as the individual
+// parameterizations, which are stored at position `index[i]` in the output
+class ThermoPolyTableTest : public testing::Test
+{
+public:
+    void add(size_t k, SpeciesThermoInterpType* stit) {
+        if (!table) {
+            table.reset(new ThermoPolyTable(stit->reportType()));
+        }
+        stits.emplace_back(stit);
+        index.push_back(k);
+        table->add(k, *stit);
+    }
+
+    void check(double T) {
+        size_t nk = *std::max_element(index.begin(), index.end()) + 1;
+        vector_fp cp_R(nk, -1.0), h_RT(nk, -1.0), s_R(nk, -1.0);
+        table->update(T, &cp_R[0], &h_RT[0], &s_R[0]);
+        for (size_t i = 0; i < stits.size(); i++) {
+            double cp, h, s;
+            stits[i]->updatePropertiesTemp(T, &cp, &h, &s);
+            size_t k = index[i];
+            EXPECT_DOUBLE_EQ(cp, cp_R[k]) << k << ", " << T;
+            EXPECT_DOUBLE_EQ(h, h_RT[k]) << k << ", " << T;
+            EXPECT_DOUBLE_EQ(s, s_R[k]) << k << ", " << T;
+        }
+        // Elements not corresponding to a species in the table are unchanged
+        for (size_t k = 0; k < nk; k++) {
+            if (std::find(index.begin(), index.end(), k) == index.end()) {
+                EXPECT_EQ(-1.0, cp_R[k]);
+                EXPECT_EQ(-1.0, h_RT[k]);
+                EXPECT_EQ(-1.0, s_R[k]);
+            }
+        }
+    }
+
+    std::unique_ptr<ThermoPolyTable> table;
+    std::vector<std::unique_ptr<SpeciesThermoInterpType>> stits;
+    std::vector<size_t> index;
+};
+
+TEST_F(ThermoPolyTableTest, NasaPoly2)
+{
+    add(0, new NasaPoly2(200, 3500, 101325, h2o_nasa_coeffs));
+    add(1, new NasaPoly2(200, 3500, 101325, h2_nasa_coeffs));
+    add(2, new NasaPoly2(200, 3500, 101325, o2_nasa_coeffs));
+    add(3, new NasaPoly2(200, 3500, 101325, oh_nasa_coeffs));
+    // Cross the midpoint temperature in both directions
+    for (double T : {300.0, 999.0, 1000.0, 1001.0, 2500.0, 1000.0, 500.0}) {
+        check(T);
+    }
+}
+
+TEST_F(ThermoPolyTableTest, ShomatePoly2_noncontiguous)
+{
+    add(3, new ShomatePoly2(200, 6000, 101325, co_shomate_coeffs));
+    add(1, new ShomatePoly2(200, 6000, 101325, co2_shomate_coeffs));
+    for (double T : {300.0, 1250.0, 1300.0, 1350.0, 4000.0, 800.0}) {
+        check(T);
+    }
+}
+
+TEST_F(ThermoPolyTableTest, replace)
+{
+    add(0, new ShomatePoly2(200, 6000, 101325, co_shomate_coeffs));
+    add(1, new ShomatePoly2(200, 6000, 101325, co2_shomate_coeffs));
+    check(1000.0);
+    stits[0].reset(new ShomatePoly2(200, 6000, 101325, co2_shomate_coeffs));
+    table->replace(0, *stits[0]);
+    check(1000.0);
+    EXPECT_THROW(table->replace(2, *stits[0]), CanteraError);
+    NasaPoly2 nasa(200, 3500, 101325, h2_nasa_coeffs);
+    EXPECT_THROW(table->replace(0, nasa), CanteraError);
+}
+
+TEST(ThermoPolyTable, unsupported)
+{
+    EXPECT_FALSE(ThermoPolyTable::supports(CONSTANT_CP));
+    EXPECT_THROW(ThermoPolyTable(CONSTANT_CP), CanteraError);
+}
+
+// Compare the results from GeneralSpeciesThermo::update, which uses the
+// packed tables, with the results for each individual species
+void checkPhaseThermo(ThermoPhase& phase, const vector_fp& temperatures)
+{
+    size_t nsp = phase.nSpecies();
+    SpeciesThermo& spthermo = phase.speciesThermo();
+    vector_fp cp_R(nsp), h_RT(nsp), s_R(nsp);
+    vector_fp cp_R1(nsp), h_RT1(nsp), s_R1(nsp);
+    for (double T : temperatures) {
+        spthermo.update(T, &cp_R[0], &h_RT[0], &s_R[0]);
+        for (size_t k = 0; k < nsp; k++) {
+            spthermo.update_one(k, T, &cp_R1[0], &h_RT1[0], &s_R1[0]);
+            EXPECT_DOUBLE_EQ(cp_R1[k], cp_R[k]);
+            EXPECT_DOUBLE_EQ(h_RT1[k], h_RT[k]);
+            EXPECT_DOUBLE_EQ(s_R1[k], s_R[k]);
+        }
+    }
+}
+
+TEST(ThermoPolyTable, GeneralSpeciesThermo_nasa7)
+{
+    IdealGasMix gas("gri30.xml", "gri30");
+    checkPhaseThermo(gas, {300.0, 1000.0, 1000.01, 2000.0, 400.0, 3000.0});
+}
+
+TEST(ThermoPolyTable, GeneralSpeciesThermo_nasa9)
+{
+    IdealGasMix gas("../data/gasNASA9.xml", "nasa9");
+    checkPhaseThermo(gas, {300.0, 1000.0, 1001.0, 5999.0, 6000.0, 7000.0,
+                           500.0});
+}
+
+TEST(ThermoPolyTable, modifyOneHf298)
+{
+    IdealGasMix gas("h2o2.cti", "ohmech");
+    size_t k = gas.speciesIndex("H2O");
+    double h298 = gas.Hf298SS(k);
+    gas.modifyOneHf298SS(k, h298 - 1e7);
+    vector_fp cp_R(gas.nSpecies()), h_RT(gas.nSpecies()), s_R(gas.nSpecies());
+    gas.speciesThermo().update(298.15, &cp_R[0], &h_RT[0], &s_R[0]);
+    EXPECT_NEAR(h298 - 1e7, h_RT[k] * GasConstant * 298.15,
+                1e-6 * std::abs(h298));
+    checkPhaseThermo(gas, {300.0, 1500.0});
+}
+
+TEST_F(ThermoPolyTableTest, multiple_temperatures)
+{
+    add(0, new NasaPoly2(200, 3500, 101325, h2o_nasa_coeffs));
+    add(2, new NasaPoly2(200, 3500, 101325, o2_nasa_coeffs));
+    vector_fp T{300.0, 1500.0, 800.0};
+    size_t stride = 4;
+    vector_fp cp_R(T.size() * stride), h_RT(cp_R.size()), s_R(cp_R.size());
+    table->update(T.size(), &T[0], stride, &cp_R[0], &h_RT[0], &s_R[0]);
+    for (size_t j = 0; j < T.size(); j++) {
+        for (size_t i = 0; i < stits.size(); i++) {
+            double cp, h, s;
+            stits[i]->updatePropertiesTemp(T[j], &cp, &h, &s);
+            size_t k = j * stride + index[i];
+            EXPECT_DOUBLE_EQ(cp, cp_R[k]);
+            EXPECT_DOUBLE_EQ(h, h_RT[k]);
+            EXPECT_DOUBLE_EQ(s, s_R[k]);
+        }
+    }
+}
+
+}